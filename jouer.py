@@ -6,6 +6,7 @@ Ce script lance directement la partie avec génération aléatoire
 des pièces et plateau refactorisé.
 """
 
+import argparse
 import sys
 import os
 
@@ -15,8 +16,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.domaine.services.logger_tetris import logger_tetris
 from src.domaine.exceptions.exception_audio import ExceptionAudio
 
-def main():
+def main(arguments=None):
     """Lance la partie de Tetris."""
+    parser = argparse.ArgumentParser(description="Partie de Tetris")
+    parser.add_argument('--enregistrer', metavar='FICHIER', default=None,
+                        help="Enregistre la partie dans un replay (voir rejouer_tetris.py)")
+    parser.add_argument('--profil', metavar='FICHIER', default=None,
+                        help="Exporte le profil des frames en CSV (F3 : afficher, F4 : exporter)")
+    options = parser.parse_args(arguments)
+    
     logger_tetris.info("🚀 Lancement de Tetris...")
     logger_tetris.info("🏗️ Architecture hexagonale respectée")
     logger_tetris.info("🎮 Contrôles : Flèches, Space, P (pause), M (mute), R (restart)")
@@ -31,7 +39,8 @@ def main():
             # Importer et lancer la partie avec architecture hexagonale
             from partie_tetris import PartieTetris
             
-            partie = PartieTetris()
+            partie = PartieTetris(chemin_enregistrement=options.enregistrer,
+                                  chemin_profil=options.profil)
             partie.jouer()
             break  # Si on arrive ici, le jeu s'est terminé normalement
             
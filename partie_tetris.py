@@ -8,18 +8,27 @@ Architecture hexagonale respectée :
 """
 
 import pygame
+import random
 import sys
 import os
 import time
+from typing import Optional
 
 # Ajouter le répertoire parent au path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.domaine.services.moteur_partie import MoteurPartie
 from src.adapters.entree.gestionnaire_partie import GestionnairePartie
+from src.adapters.entree.controleur_replay import ControleurReplay
 from src.adapters.sortie.affichage_partie import AffichagePartie
 from src.adapters.sortie.audio_partie import AudioPartie
 from src.domaine.services.logger_tetris import logger_tetris
+from src.domaine.services.replay_partie import EnregistreurPartie, LecteurReplay, Replay
+from src.domaine.services.ordonnanceur_frames import OrdonnanceurFrames
+from src.domaine.services.profileur_frames import ProfileurFrames
+
+# Fichier CSV du profil des frames exporté par F4 (si aucun chemin n'est donné)
+CHEMIN_PROFIL_DEFAUT = "profil_frames.csv"
 
 
 class PartieTetris:
@@ -32,22 +41,68 @@ class PartieTetris:
     - Affichage : AffichagePartie (adaptateur de sortie)
     """
     
-    def __init__(self):
+    # Mode repos (pause, game over) : attente maximale d'une entrée avant
+    # de reboucler, l'écran figé n'étant redessiné que s'il a changé
+    DELAI_REVEIL_REPOS_MS = 500
+    
+    def __init__(self, chemin_enregistrement: Optional[str] = None,
+                 replay: Optional[Replay] = None, vitesse_replay: float = 1.0,
+                 chemin_profil: Optional[str] = None,
+                 fps_affichage: Optional[float] = OrdonnanceurFrames.FPS_AFFICHAGE_DEFAUT):
+        """
+        Args:
+            chemin_enregistrement: Fichier où enregistrer le replay de la partie
+            replay: Replay à regarder en temps réel (remplace le clavier)
+            vitesse_replay: Facteur d'accélération de la relecture
+            chemin_profil: Fichier CSV où exporter le profil des frames (F4 et fin de partie)
+            fps_affichage: Cadence maximale du rendu (None : non plafonnée, la simulation
+                reste à 60 pas par seconde)
+        """
         # Adaptateurs - Infrastructure
         self.audio = AudioPartie()
+        self.affichage = AffichagePartie()
+        self.chemin_enregistrement = chemin_enregistrement
+        self.fps_affichage = fps_affichage
         
-        # Cœur métier - Domaine (avec injection de dépendance audio)
-        self.moteur = MoteurPartie(audio=self.audio)
+        # Horloge monotone unique : gravité, touches, replay et cadence des frames
+        self.horloge = time.perf_counter
+        self.enregistreur: Optional[EnregistreurPartie] = None
         
-        # Autres adaptateurs
-        self.affichage = AffichagePartie()
-        self.gestionnaire = GestionnairePartie()
+        if replay is not None:
+            # Relecture : même générateur, gravité et touches lues dans le flux
+            self.moteur = MoteurPartie(audio=self.audio, horloge=self.horloge,
+                                       generateur=replay.creer_generateur())
+            self.moteur.en_pause = replay.en_pause_initiale
+            self.gestionnaire = ControleurReplay(LecteurReplay(replay, self.moteur), vitesse_replay)
+            self.gravite_automatique = False
+            # Le replay avance seul, même en pause : pas de mode repos
+            self.mode_repos = False
+        else:
+            # Cœur métier - Domaine (avec injection de dépendance audio)
+            # Une graine explicite rend la partie enregistrable
+            graine = random.randrange(1 << 32) if chemin_enregistrement else None
+            self.moteur = MoteurPartie(audio=self.audio, horloge=self.horloge, graine=graine)
+            self.gestionnaire = GestionnairePartie()
+            self.gravite_automatique = True
+            self.mode_repos = True
+            
+            # Configuration des délais optimisés pour le gameplay
+            self.gestionnaire.configurer_delais_repetition(
+                delai_initial=0.2,  # Plus rapide pour le jeu réel
+                delai_repetition=0.12
+            )
+            
+            if chemin_enregistrement:
+                self.enregistreur = EnregistreurPartie(self.moteur, self.gestionnaire, self.horloge())
         
-        # Configuration des délais optimisés pour le gameplay
-        self.gestionnaire.configurer_delais_repetition(
-            delai_initial=0.2,  # Plus rapide pour le jeu réel
-            delai_repetition=0.12
-        )
+        # Profil des frames : F3 affiche les centiles, F4 exporte le CSV
+        self.chemin_profil = chemin_profil
+        self.profileur = ProfileurFrames()
+        self.affichage.profileur = self.profileur
+        self.gestionnaire.raccourcis[pygame.K_F3] = self.affichage.basculer_profil
+        self.gestionnaire.raccourcis[pygame.K_F4] = self.exporter_profil
+        # Fenêtre réexposée : l'affichage repeint tout l'écran
+        self.gestionnaire.affichage = self.affichage
         
         logger_tetris.info("🚀 Partie complète de Tetris initialisée !")
         logger_tetris.info("🏗️ Architecture hexagonale respectée :")
@@ -62,6 +117,12 @@ class PartieTetris:
         logger_tetris.info("   ⏱️ Chute automatique avec accélération")
         logger_tetris.info("   🎵 Système audio intégré")
     
+    def exporter_profil(self) -> None:
+        """Exporte en CSV les durées de phase des dernières frames."""
+        chemin = self.chemin_profil or CHEMIN_PROFIL_DEFAUT
+        nb_frames = self.profileur.exporter_csv(chemin)
+        logger_tetris.info("⏱️ Profil de %d frames exporté : %s", nb_frames, chemin)
+    
     def jouer(self):
         """Lance la partie principale."""
         # Initialiser l'affichage
@@ -74,7 +135,10 @@ class PartieTetris:
         else:
             logger_tetris.warning("⚠️ Impossible de lancer la musique (fichier manquant ?)")
         
-        horloge = pygame.time.Clock()
+        # Seul point d'attente de la boucle : la cadence du rendu
+        ordonnanceur = OrdonnanceurFrames(fps_affichage=self.fps_affichage, horloge=self.horloge)
+        self.affichage.ordonnanceur = ordonnanceur
+        profileur = self.profileur
         actif = True
         
         logger_tetris.info("\n" + "="*60)
@@ -86,29 +150,50 @@ class PartieTetris:
         
         try:
             while actif:
-                temps_actuel = time.time()
+                profileur.debut_frame()
+                nb_pas = ordonnanceur.demarrer_frame()
+                temps_actuel = ordonnanceur.temps
                 
                 # Mise à jour du jeu - CHUTE AUTOMATIQUE D'ABORD
-                if not self.moteur.en_pause and not self.moteur.jeu_termine:
-                    # Chute automatique AVANT les événements utilisateur
-                    self.moteur.mettre_a_jour_chute_automatique()
+                if self.gravite_automatique and nb_pas:
+                    # Gravité comptée en pas fixes (rattrapés si la frame a pris du retard),
+                    # AVANT les événements utilisateur
+                    self.moteur.avancer(nb_pas)
+                profileur.marquer('gravite')
                 
                 # Traiter les événements via l'adaptateur d'entrée
                 actif = self.gestionnaire.traiter_evenements(self.moteur, temps_actuel)
+                profileur.marquer('evenements')
                 
                 # Répétition des touches (après les événements principaux)
                 if not self.moteur.en_pause and not self.moteur.jeu_termine:
                     self.gestionnaire.mettre_a_jour_repetitions(self.moteur, temps_actuel)
+                profileur.marquer('repetitions')
                 
                 # Affichage via l'adaptateur de sortie
                 self.affichage.dessiner(self.moteur)
+                profileur.marquer('dessin')
                 
-                # Synchroniser les horloges pour le calcul du FPS
-                horloge.tick(60)
-                if self.affichage.horloge_fps:
-                    self.affichage.horloge_fps.tick(60)
+                if self.mode_repos and (self.moteur.en_pause or self.moteur.jeu_termine):
+                    # Mode repos : frame figée, on dort jusqu'à la prochaine entrée
+                    self.gestionnaire.attendre_evenement(self.DELAI_REVEIL_REPOS_MS)
+                    ordonnanceur.reprendre()
+                    # Frame passée endormie : rien à profiler
+                    profileur.abandonner_frame()
+                else:
+                    # Attente de la frame suivante (cadence du rendu)
+                    ordonnanceur.attendre_frame()
+                    profileur.marquer('attente')
+                    profileur.fin_frame()
         
         finally:
+            # Sauvegarde du replay, même après une erreur (rapport de bug)
+            if self.enregistreur is not None:
+                self.enregistreur.terminer().sauvegarder(self.chemin_enregistrement)
+                logger_tetris.info("💾 Replay enregistré : %s", self.chemin_enregistrement)
+            if self.chemin_profil:
+                self.exporter_profil()
+            
             # Nettoyage des ressources
             self.affichage.nettoyer()
             self.moteur.fermer()  # Nettoie l'audio
\ No newline at end of file
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Relecture des replays Tetris enregistrés avec `jouer.py --enregistrer`.
+
+Par défaut, le replay est rejoué headless à vitesse maximale (plusieurs
+fois si demandé, pour reproduire un rapport de bug) et l'état final est
+affiché avec le facteur d'accélération par rapport au temps réel.
+Avec --temps-reel, la partie est regardée dans la fenêtre pygame.
+Avec --aller-a, seul l'état à l'instant demandé est reconstruit, à partir
+de l'image clé la plus proche.
+
+Usage :
+    python rejouer_tetris.py partie.trpl
+    python rejouer_tetris.py partie.trpl --repetitions 100 --json
+    python rejouer_tetris.py partie.trpl --aller-a 1800
+    python rejouer_tetris.py ancienne.trpl --indexer
+    python rejouer_tetris.py partie.trpl --temps-reel --vitesse 2
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.domaine.services.replay_partie import LecteurReplay, Replay
+
+
+def rejouer_headless(replay: Replay, repetitions: int = 1) -> Dict:
+    """
+    Rejoue un replay headless et mesure la vitesse de relecture.
+
+    Args:
+        replay: Replay à relire
+        repetitions: Nombre de relectures (l'état final doit être identique)
+
+    Returns:
+        Dictionnaire sérialisable de l'état final et des mesures
+    """
+    etats_finaux = set()
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        moteur = LecteurReplay.rejouer_headless(replay)
+        stats = moteur.stats
+        etat = (stats.score, stats.lignes_completees, stats.pieces_placees,
+                frozenset(moteur.plateau.positions_occupees))
+        etats_finaux.add(etat)
+    duree = (time.perf_counter() - debut) / repetitions
+
+    return {
+        'graine': replay.graine,
+        'evenements': len(replay.evenements),
+        'score': stats.score,
+        'lignes': stats.lignes_completees,
+        'pieces': stats.pieces_placees,
+        'termine': moteur.est_game_over(),
+        'deterministe': len(etats_finaux) == 1,
+        'duree_partie': replay.duree_ms / 1000,
+        'duree_relecture': duree,
+        'acceleration': replay.duree_ms / 1000 / duree if duree else 0.0,
+    }
+
+
+def aller_a(replay: Replay, secondes: float) -> Dict:
+    """
+    Reconstruit l'état du replay à un instant donné.
+
+    Args:
+        replay: Replay à relire
+        secondes: Instant visé depuis le début de la partie
+
+    Returns:
+        Dictionnaire sérialisable de l'état et du coût du déplacement
+    """
+    lecteur = LecteurReplay(replay, LecteurReplay.creer_moteur(replay))
+    debut = time.perf_counter()
+    simules = lecteur.aller_au_temps(secondes * 1000)
+    duree = time.perf_counter() - debut
+
+    stats = lecteur.moteur.stats
+    return {
+        'temps': secondes,
+        'position': lecteur.position,
+        'evenements_simules': simules,
+        'images_cles': len(replay.images_cles),
+        'score': stats.score,
+        'lignes': stats.lignes_completees,
+        'pieces': stats.pieces_placees,
+        'duree_deplacement': duree,
+    }
+
+
+def _formater_resultat(resultat: Dict) -> str:
+    """Bloc lisible pour une relecture."""
+    return "\n".join([
+        f"Graine             : {resultat['graine']}",
+        f"Événements         : {resultat['evenements']}",
+        f"Score / lignes     : {resultat['score']} / {resultat['lignes']}",
+        f"Pièces             : {resultat['pieces']}",
+        f"Partie terminée    : {'oui' if resultat['termine'] else 'non'}",
+        f"Déterministe       : {'oui' if resultat['deterministe'] else 'NON'}",
+        f"Durée de la partie : {resultat['duree_partie']:.1f} s",
+        f"Relecture          : {resultat['duree_relecture'] * 1000:.2f} ms "
+        f"(x{resultat['acceleration']:.0f} par rapport au temps réel)",
+    ])
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande de la relecture."""
+    parser = argparse.ArgumentParser(description="Relecture d'un replay Tetris")
+    parser.add_argument('fichier', help="Fichier replay (.trpl)")
+    parser.add_argument('--repetitions', type=int, default=1,
+                        help="Nombre de relectures headless")
+    parser.add_argument('--temps-reel', action='store_true',
+                        help="Regarder la partie dans la fenêtre pygame")
+    parser.add_argument('--vitesse', type=float, default=1.0,
+                        help="Facteur d'accélération de la relecture en temps réel")
+    parser.add_argument('--aller-a', type=float, default=None, metavar='SECONDES',
+                        help="Reconstruire seulement l'état à cet instant")
+    parser.add_argument('--indexer', action='store_true',
+                        help="Recalculer les images clés et réécrire le fichier")
+    parser.add_argument('--json', action='store_true', help="Résultat en JSON")
+    options = parser.parse_args(arguments)
+
+    replay = Replay.charger(options.fichier)
+
+    if options.indexer:
+        replay.indexer()
+        replay.sauvegarder(options.fichier)
+        print(f"{len(replay.images_cles)} image(s) clé(s) écrite(s) dans {options.fichier}")
+        return 0
+
+    if options.aller_a is not None:
+        resultat = aller_a(replay, options.aller_a)
+        print(json.dumps(resultat) if options.json else
+              f"t={resultat['temps']:.1f} s  position={resultat['position']}  "
+              f"score={resultat['score']}  lignes={resultat['lignes']}  pieces={resultat['pieces']}  "
+              f"({resultat['evenements_simules']} événements simulés en "
+              f"{resultat['duree_deplacement'] * 1000:.2f} ms)")
+        return 0
+
+    if options.temps_reel:
+        from partie_tetris import PartieTetris
+
+        PartieTetris(replay=replay, vitesse_replay=options.vitesse).jouer()
+        return 0
+
+    resultat = rejouer_headless(replay, options.repetitions)
+    print(json.dumps(resultat) if options.json else _formater_resultat(resultat))
+    return 0 if resultat['deterministe'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
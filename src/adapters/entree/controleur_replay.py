@@ -0,0 +1,65 @@
+"""
+Adaptateur d'entrée pygame pour regarder un replay en temps réel.
+
+Remplace le clavier par le flux du replay : à chaque image, les
+événements dont la date est passée sont appliqués au moteur. Seules la
+fermeture de la fenêtre, Échap et les raccourcis (profileur...) sont
+lus au clavier.
+"""
+
+import pygame
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from src.adapters.entree.gestionnaire_partie import EVENEMENTS_EXPOSITION
+from src.domaine.services.replay_partie import LecteurReplay
+from src.ports.entree.controleur_jeu import ControleurJeu
+
+if TYPE_CHECKING:
+    from src.adapters.sortie.affichage_partie import AffichagePartie
+    from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class ControleurReplay(ControleurJeu):
+    """Contrôleur qui rejoue un replay au rythme de l'horloge réelle."""
+
+    def __init__(self, lecteur: LecteurReplay, vitesse: float = 1.0):
+        """
+        Initialise le contrôleur.
+
+        Args:
+            lecteur: Lecteur positionné sur le replay à regarder
+            vitesse: Facteur d'accélération (2.0 : deux fois plus vite)
+        """
+        self.lecteur = lecteur
+        self.vitesse = vitesse
+        self._temps_debut: Optional[float] = None
+        # Touches pygame hors jeu : action appelée à l'appui
+        self.raccourcis: Dict[int, Callable[[], None]] = {}
+        # Affichage à invalider quand la fenêtre est réexposée
+        self.affichage: Optional['AffichagePartie'] = None
+
+    def traiter_evenements(self, moteur: 'MoteurPartie', temps_actuel: float) -> bool:
+        """
+        Applique les événements échus du replay.
+
+        Returns:
+            bool: False si la fenêtre est fermée ou Échap pressé
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return False
+            if event.type == pygame.KEYDOWN and event.key in self.raccourcis:
+                self.raccourcis[event.key]()
+            if event.type in EVENEMENTS_EXPOSITION and self.affichage is not None:
+                self.affichage.invalider()
+
+        if self._temps_debut is None:
+            self._temps_debut = temps_actuel
+        self.lecteur.appliquer_jusqu_a((temps_actuel - self._temps_debut) * 1000 * self.vitesse)
+        return True
+
+    def mettre_a_jour_repetitions(self, moteur: 'MoteurPartie', temps_actuel: float) -> None:
+        """Les répétitions sont déjà dans le flux du replay."""
+        pass
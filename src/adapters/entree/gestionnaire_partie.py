@@ -2,22 +2,33 @@
 Adaptateur d'entrée pygame pour contrôler la partie de Tetris.
 
 Implémentation concrète utilisant pygame pour la gestion des événements.
+
+En mode repos (pause, game over), attendre_evenement() bloque sur
+pygame.event.wait au lieu de sonder la file à chaque frame. Quitter la
+fenêtre en pleine partie la met en pause, comme un appui sur P (donc
+enregistré dans les replays).
+
+L'affichage ne redessine que les zones modifiées : quand la fenêtre est
+réexposée (restaurée, découverte), son contenu a pu être perdu et
+l'affichage branché est invalidé pour repeindre tout l'écran.
 """
 
 import pygame
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
-from src.domaine.services.gestionnaire_evenements import GestionnaireEvenements, TypeEvenement, ToucheClavier
-from src.domaine.services.commandes.commandes_partie import (
-    CommandePlacerPiecePartie, CommandeChuteRapidePartie, CommandeDeplacerGauchePartie,
-    CommandeDeplacerDroitePartie, CommandeTournerPartie
+from src.domaine.services.gestionnaire_evenements import (
+    GestionnaireEvenements, TypeEvenement, ToucheClavier, creer_commandes_partie
 )
 from src.ports.entree.controleur_jeu import ControleurJeu
 
 if TYPE_CHECKING:
+    from src.adapters.sortie.affichage_partie import AffichagePartie
     from src.domaine.services.moteur_partie import MoteurPartie
 
+# Événements après lesquels le contenu de la fenêtre doit être entièrement redessiné
+EVENEMENTS_EXPOSITION = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE)
+
 
 def convertir_touche_pygame(touche_pygame: int) -> str:
     """Convertit une touche pygame en nom de touche pour le gestionnaire."""
@@ -37,23 +48,19 @@ def convertir_touche_pygame(touche_pygame: int) -> str:
 class GestionnairePartie(GestionnaireEvenements, ControleurJeu):
     """Gestionnaire d'événements pygame pour la partie complète."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Touches pygame hors jeu (profileur...) : action appelée à l'appui,
+        # sans passer par les touches logiques ni par les replays
+        self.raccourcis: Dict[int, Callable[[], None]] = {}
+        # Événement qui a réveillé attendre_evenement(), traité à la frame suivante
+        self._evenement_en_attente: Optional[pygame.event.Event] = None
+        # Affichage à invalider quand la fenêtre est réexposée
+        self.affichage: Optional['AffichagePartie'] = None
+    
     def _creer_commandes(self):
         """Crée le mapping des commandes pour la partie."""
-        from src.domaine.services.commandes import (
-            CommandeDescendre, CommandePause, CommandeBasculerMute
-        )
-        from src.domaine.services.commandes.commande_redemarrer import CommandeRedemarrer
-        
-        return {
-            ToucheClavier.GAUCHE: CommandeDeplacerGauchePartie(),
-            ToucheClavier.DROITE: CommandeDeplacerDroitePartie(),
-            ToucheClavier.ROTATION: CommandeTournerPartie(),
-            ToucheClavier.CHUTE_RAPIDE: CommandeDescendre(),
-            ToucheClavier.CHUTE_INSTANTANEE: CommandeChuteRapidePartie(),
-            ToucheClavier.PAUSE: CommandePause(),
-            ToucheClavier.MUTE: CommandeBasculerMute(),
-            ToucheClavier.RESTART: CommandeRedemarrer(),  # Ajout commande restart
-        }
+        return creer_commandes_partie()
     
     def traiter_evenements(self, moteur: 'MoteurPartie', temps_actuel: float) -> bool:
         """
@@ -62,10 +69,28 @@ class GestionnairePartie(GestionnaireEvenements, ControleurJeu):
         Returns:
             bool: True si le jeu doit continuer, False pour quitter
         """
-        for event in pygame.event.get():
+        evenements = pygame.event.get()
+        if self._evenement_en_attente is not None:
+            evenements.insert(0, self._evenement_en_attente)
+            self._evenement_en_attente = None
+        
+        for event in evenements:
             if event.type == pygame.QUIT:
                 return False
             
+            elif event.type in EVENEMENTS_EXPOSITION:
+                if self.affichage is not None:
+                    self.affichage.invalider()
+            
+            elif event.type == pygame.WINDOWFOCUSLOST and not moteur.en_pause and not moteur.jeu_termine:
+                # Fenêtre quittée en pleine partie : pause, comme un appui sur P
+                for type_evenement in (TypeEvenement.CLAVIER_APPUI, TypeEvenement.CLAVIER_RELACHE):
+                    self.traiter_evenement_clavier("p", type_evenement, moteur, temps_actuel)
+                moteur.basculer_pause()
+            
+            elif event.type == pygame.KEYDOWN and event.key in self.raccourcis:
+                self.raccourcis[event.key]()
+            
             elif event.type == pygame.KEYDOWN:
                 nom_touche = convertir_touche_pygame(event.key)
                 if nom_touche:
@@ -92,6 +117,24 @@ class GestionnairePartie(GestionnaireEvenements, ControleurJeu):
         
         return True
     
+    def attendre_evenement(self, delai_ms: int) -> None:
+        """
+        Bloque jusqu'au prochain événement pygame ou l'expiration du délai.
+        
+        Rend la main immédiatement si la file n'est pas vide. L'événement
+        reçu est gardé pour le prochain traiter_evenements(), avant ceux
+        arrivés entre-temps : l'ordre des événements est conservé.
+        
+        Args:
+            delai_ms: Attente maximale en millisecondes
+        """
+        if self._evenement_en_attente is not None:
+            return
+        evenement = pygame.event.wait(delai_ms)
+        if evenement.type != pygame.NOEVENT:
+            # Copie : pygame peut réutiliser les attributs de l'événement reçu
+            self._evenement_en_attente = pygame.event.Event(evenement.type, evenement.dict)
+    
     def mettre_a_jour_repetitions(self, moteur: 'MoteurPartie', temps_actuel: float) -> None:
         """Met à jour les répétitions des touches."""
         self.mettre_a_jour_repetition(moteur, temps_actuel)
@@ -0,0 +1,131 @@
+"""
+Adaptateur d'entrée : joueur automatique heuristique.
+
+Implémente le port ControleurJeu sans clavier : pour chaque nouvelle
+pièce, il énumère les placements atteignables, choisit le meilleur
+selon l'EvaluateurPlacements et rejoue le chemin d'entrées sur le
+MoteurPartie.
+
+Deux rythmes :
+- instantané : une pièce entière jouée (et posée) par appel, pour les
+  parties headless à vitesse maximale
+- temps réel : quelques mouvements par appel, la gravité du moteur
+  faisant le reste ; le plan est recalculé si la pièce a bougé sans lui
+
+Les plans déjà calculés sont retrouvés dans une TableTransposition
+indexée par la clé Zobrist du moteur (plateau et pièce active).
+"""
+
+import time
+from typing import TYPE_CHECKING, Deque, Optional, Tuple
+from collections import deque
+
+from src.domaine.services.enumerateur_placements import EnumerateurPlacements, Mouvement
+from src.domaine.services.evaluateur_placements import EvaluateurPlacements
+from src.domaine.services.table_transposition import TableTransposition
+from src.ports.entree.controleur_jeu import ControleurJeu
+
+if TYPE_CHECKING:
+    from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class JoueurAutomatique(ControleurJeu):
+    """Contrôleur qui joue seul à partir de l'heuristique de placement."""
+
+    def __init__(self, evaluateur: Optional[EvaluateurPlacements] = None,
+                 instantane: bool = True, mouvements_par_appel: int = 1,
+                 table: Optional[TableTransposition] = None):
+        """
+        Initialise le joueur automatique.
+
+        Args:
+            evaluateur: Évaluateur des placements (défaut : poids usuels)
+            instantane: True pour jouer et poser une pièce entière par appel
+            mouvements_par_appel: Mouvements joués par appel en mode temps réel
+            table: Plans déjà calculés par clé Zobrist (défaut : table propre au joueur)
+        """
+        self.evaluateur = evaluateur if evaluateur is not None else EvaluateurPlacements()
+        self.enumerateur = EnumerateurPlacements()
+        self.instantane = instantane
+        self.mouvements_par_appel = mouvements_par_appel
+        self.table = table if table is not None else TableTransposition()
+
+        self._plan: Deque[Mouvement] = deque()
+        self._version_attendue: Optional[int] = None
+
+        # Mesures de débit
+        self.nb_decisions = 0
+        self.duree_decisions = 0.0
+
+    @property
+    def placements_par_seconde(self) -> float:
+        """Placements évalués par seconde de réflexion (énumération comprise)."""
+        if self.duree_decisions == 0:
+            return 0.0
+        return self.evaluateur.nb_evaluations / self.duree_decisions
+
+    def traiter_evenements(self, moteur: 'MoteurPartie', temps_actuel: float) -> bool:
+        """
+        Joue la pièce active selon le plan courant.
+
+        Returns:
+            bool: False une fois la partie terminée, True sinon
+        """
+        if moteur.est_game_over():
+            return False
+        if moteur.en_pause or not moteur.piece_active:
+            return True
+
+        if self._version_attendue != moteur.version_piece:
+            self._planifier(moteur)
+
+        if self.instantane:
+            self._jouer_plan(moteur, len(self._plan))
+            moteur.chute_rapide()
+            moteur.placer_piece_et_generer_nouvelle()
+            self._version_attendue = None
+        else:
+            self._jouer_plan(moteur, self.mouvements_par_appel)
+            self._version_attendue = moteur.version_piece
+
+        return not moteur.est_game_over()
+
+    def mettre_a_jour_repetitions(self, moteur: 'MoteurPartie', temps_actuel: float) -> None:
+        """Aucune touche maintenue : rien à répéter."""
+        pass
+
+    def _planifier(self, moteur: 'MoteurPartie') -> None:
+        """Choisit le meilleur placement depuis l'état courant de la pièce active."""
+        cle = moteur.cle_zobrist
+        chemin = self.table.obtenir(cle)
+        if chemin is None:
+            chemin = self._calculer_chemin(moteur)
+            self.table.enregistrer(cle, chemin)
+        self._plan = deque(chemin)
+
+    def _calculer_chemin(self, moteur: 'MoteurPartie') -> Tuple[Mouvement, ...]:
+        """Énumère et évalue les placements, puis retourne le chemin du meilleur."""
+        debut = time.perf_counter()
+        placements = self.enumerateur.enumerer_depuis(moteur.plateau, moteur.piece_active)
+        meilleur = self.evaluateur.choisir(moteur.plateau, placements)
+        self.duree_decisions += time.perf_counter() - debut
+        self.nb_decisions += 1
+
+        # Les descentes finales sont remplacées par une chute rapide
+        chemin = list(meilleur.chemin) if meilleur else []
+        while chemin and chemin[-1] is Mouvement.DESCENTE:
+            chemin.pop()
+        return tuple(chemin)
+
+    def _jouer_plan(self, moteur: 'MoteurPartie', nombre: int) -> None:
+        """Joue jusqu'à `nombre` mouvements du plan, puis la chute rapide si le plan est fini."""
+        for _ in range(min(nombre, len(self._plan))):
+            mouvement = self._plan.popleft()
+            if mouvement is Mouvement.ROTATION:
+                moteur.tourner_piece_active()
+            else:
+                delta_x, delta_y, _ = mouvement.value
+                moteur.deplacer_piece_active(delta_x, delta_y)
+
+        if not self._plan and not self.instantane:
+            moteur.chute_rapide()
@@ -2,25 +2,65 @@
 Adaptateur d'affichage pygame pour la partie de Tetris.
 
 Implémentation concrète utilisant pygame pour l'affichage.
+
+Rendu incrémental : l'écran est découpé en zones (en-tête, FPS, plateau,
+statistiques, pièce suivante, contrôles). Une zone n'est redessinée que
+si sa signature (l'état qu'elle affiche) a changé, et seules les cellules
+modifiées du plateau sont redessinées. Les rectangles modifiés sont
+ensuite envoyés à l'écran avec pygame.display.update(rects).
+
+Profil des frames : quand un ProfileurFrames est branché et le profil
+activé (basculer_profil), la zone des contrôles affiche les centiles
+p50/p95/p99 de chaque phase de la boucle et le graphe des dernières
+durées de frame. Elle n'est redessinée que toutes les
+FRAMES_PAR_RAFRAICHISSEMENT_PROFIL frames.
 """
 
 import pygame
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from src.domaine.entites.piece import TypePiece
 from src.ports.sortie.affichage_jeu import AffichageJeu
+from src.adapters.sortie.cache_surfaces import CacheSurfaces
 from src.domaine.services.logger_tetris import logger_tetris
 
 if TYPE_CHECKING:
     from src.domaine.services.moteur_partie import MoteurPartie
+    from src.domaine.services.ordonnanceur_frames import OrdonnanceurFrames
+    from src.domaine.services.profileur_frames import ProfileurFrames
 
 
 class AffichagePartie(AffichageJeu):
     """Affichage complet pour la partie de Tetris utilisant pygame."""
     
+    # Le profil n'est redessiné que toutes les N frames (lisible et peu coûteux)
+    FRAMES_PAR_RAFRAICHISSEMENT_PROFIL = 30
+    
+    # Budget d'une frame à 60 FPS, en nanosecondes
+    BUDGET_FRAME_NS = 1_000_000_000 // 60
+    
     def __init__(self):
         self.initialise = False
-        self.horloge_fps = None  # Pour calculer le FPS
+        # Ordonnanceur de la boucle de jeu, source du FPS affiché
+        self.ordonnanceur: Optional['OrdonnanceurFrames'] = None
+        
+        # État du rendu incrémental
+        self._redessiner_tout = True
+        self._signatures: Dict[str, object] = {}
+        self._cellules_affichees: Optional[Dict[Tuple[int, int], Tuple[int, int, int]]] = None
+        self._superposition_affichee = None
+        
+        # Cellules figées du plateau, recalculées seulement quand sa version change
+        self._plateau_indexe = None
+        self._version_plateau_indexee = -1
+        self._cellules_plateau: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        
+        # Surfaces pré-rendues (grille, cellules, textes)
+        self._cache = CacheSurfaces()
+        
+        # Profil des frames (remplace l'aide des contrôles quand il est affiché)
+        self.profileur: Optional['ProfileurFrames'] = None
+        self.afficher_profil = False
         
     def initialiser(self) -> None:
         """Initialise l'affichage pygame."""
@@ -46,6 +86,8 @@ class AffichagePartie(AffichageJeu):
         
         self.ecran = pygame.display.set_mode((largeur_totale, hauteur_totale))
         pygame.display.set_caption("Tetris")
+        # Les sprites seront recréés convertis au format de cet écran
+        self._cache.vider()
         
         # Couleurs
         self.noir = (0, 0, 0)
@@ -89,45 +131,179 @@ class AffichagePartie(AffichageJeu):
         self.zone_jeu_y = self.marge + 40
         self.zone_interface_x = self.zone_jeu_x + self.largeur_jeu + self.marge
         
-        # Initialiser l'horloge pour le calcul du FPS
-        self.horloge_fps = pygame.time.Clock()
+        # Zones de rendu incrémental (chaque zone est redessinée indépendamment)
+        self._zones = {
+            'entete': pygame.Rect(0, 0, self.zone_interface_x, self.zone_jeu_y),
+            'fps': pygame.Rect(self.zone_interface_x, 0,
+                               largeur_totale - self.zone_interface_x, self.zone_jeu_y),
+            # Le plateau inclut les marges latérales : les messages peuvent déborder de la grille
+            'plateau': pygame.Rect(0, self.zone_jeu_y, self.zone_interface_x, self.hauteur_jeu),
+            'statistiques': pygame.Rect(self.zone_interface_x, self.zone_jeu_y,
+                                        largeur_totale - self.zone_interface_x, 300),
+            'suivante': pygame.Rect(self.zone_interface_x, self.zone_jeu_y + 300,
+                                    largeur_totale - self.zone_interface_x, 120),
+            'controles': pygame.Rect(self.zone_interface_x, self.zone_jeu_y + 420,
+                                     largeur_totale - self.zone_interface_x,
+                                     hauteur_totale - self.zone_jeu_y - 420),
+        }
+        
+        self.invalider()
         
         self.initialise = True
         logger_tetris.info("🖥️ Interface graphique initialisée")
     
     def dessiner(self, moteur: 'MoteurPartie') -> None:
-        """Dessine l'interface complète du jeu."""
+        """
+        Dessine l'interface du jeu de manière incrémentale.
+        
+        Seules les zones dont l'état a changé depuis la frame précédente
+        sont redessinées puis envoyées à l'écran. Une frame sans changement
+        ne touche pas l'écran.
+        """
         if not self.initialise:
             self.initialiser()
-            
-        # Fond
-        self.ecran.fill(self.noir)
         
-        # Titre
-        titre = "                 TETRIS"
-        texte_titre = self.police_titre.render(titre, True, self.blanc)
-        self.ecran.blit(texte_titre, (self.marge, 5))
+        zones_modifiees: List[pygame.Rect] = []
+        
+        if self._redessiner_tout:
+            self.ecran.fill(self.noir)
+            self._signatures.clear()
+            self._cellules_affichees = None
+            zones_modifiees.append(self.ecran.get_rect())
+            self._redessiner_tout = False
+        
+        # Les messages sont consommés une seule fois par frame
+        messages = moteur.obtenir_messages()
         
-        # Zone de jeu principale
-        self._dessiner_plateau(moteur)
-        self._dessiner_piece_active(moteur)
+        # En-tête : titre et indicateur de mute
+        self._mettre_a_jour_zone('entete', self._signature_mute(moteur),
+                                 lambda: self._dessiner_entete(moteur), zones_modifiees)
+        
+        # Zone de jeu principale (cellules modifiées ou plateau complet)
+        self._mettre_a_jour_plateau(moteur, messages, zones_modifiees)
         
         # Interface latérale
-        self._dessiner_statistiques(moteur)
-        self._dessiner_piece_suivante(moteur)
-        self._dessiner_controles()
+        stats = moteur.stats
+        signature_stats = (stats.score, stats.niveau, stats.lignes_completees,
+                           stats.pieces_placees, tuple(stats.pieces_par_type.values()))
+        self._mettre_a_jour_zone('statistiques', signature_stats,
+                                 lambda: self._dessiner_statistiques(moteur), zones_modifiees)
+        
+        suivante = moteur.piece_suivante
+        signature_suivante = None if not suivante else (
+            suivante.type_piece, tuple((pos.x, pos.y) for pos in suivante.positions))
+        self._mettre_a_jour_zone('suivante', signature_suivante,
+                                 lambda: self._dessiner_piece_suivante(moteur), zones_modifiees)
+        
+        if self.afficher_profil and self.profileur is not None:
+            signature_profil = ('profil', self.profileur.nb_frames // self.FRAMES_PAR_RAFRAICHISSEMENT_PROFIL)
+            self._mettre_a_jour_zone('controles', signature_profil, self._dessiner_profil, zones_modifiees)
+        else:
+            self._mettre_a_jour_zone('controles', True, self._dessiner_controles, zones_modifiees)
         
-        # Messages et état
-        self._dessiner_messages(moteur)
-        self._dessiner_etat_jeu(moteur)
+        # FPS en temps réel (redessiné seulement si la valeur affichée change)
+        self._mettre_a_jour_zone('fps', self._texte_fps(), self._dessiner_fps, zones_modifiees)
         
-        # Indicateur de mute (en dernier pour qu'il soit au-dessus de tout)
-        self._dessiner_indicateur_mute(moteur)
+        if zones_modifiees:
+            pygame.display.update(zones_modifiees)
+    
+    def basculer_profil(self) -> None:
+        """Affiche ou masque le profil des frames à la place de l'aide des contrôles."""
+        self.afficher_profil = not self.afficher_profil
+    
+    def invalider(self) -> None:
+        """Force le redessin complet de l'écran à la prochaine frame."""
+        self._redessiner_tout = True
+    
+    def _mettre_a_jour_zone(self, nom: str, signature: object,
+                            dessiner_zone: Callable[[], None],
+                            zones_modifiees: List[pygame.Rect]) -> None:
+        """
+        Redessine une zone si sa signature a changé depuis la dernière frame.
+        
+        Args:
+            nom: Nom de la zone dans self._zones
+            signature: Valeur comparable résumant ce que la zone affiche
+            dessiner_zone: Fonction qui dessine le contenu de la zone
+            zones_modifiees: Liste des rectangles à envoyer à l'écran
+        """
+        if nom in self._signatures and self._signatures[nom] == signature:
+            return
         
-        # FPS en temps réel (en dernier pour qu'il soit toujours visible)
-        self._dessiner_fps()
+        self._signatures[nom] = signature
+        zone = self._zones[nom]
+        self.ecran.fill(self.noir, zone)
+        dessiner_zone()
+        zones_modifiees.append(zone)
+    
+    def _mettre_a_jour_plateau(self, moteur: 'MoteurPartie', messages: list,
+                               zones_modifiees: List[pygame.Rect]) -> None:
+        """
+        Redessine le plateau : cellule par cellule, ou en entier si une
+        superposition (message, pause, game over) apparaît, change ou recouvre
+        des cellules modifiées.
+        """
+        cellules = self._calculer_cellules(moteur)
+        superposition = self._signature_superposition(moteur, messages)
+        
+        if (self._cellules_affichees is None
+                or superposition != self._superposition_affichee
+                or (superposition is not None and cellules != self._cellules_affichees)):
+            zone = self._zones['plateau']
+            self.ecran.fill(self.noir, zone)
+            self._dessiner_plateau(moteur)
+            self._dessiner_piece_active(moteur)
+            self._dessiner_messages(messages)
+            self._dessiner_etat_jeu(moteur)
+            zones_modifiees.append(zone)
+        else:
+            anciennes = self._cellules_affichees
+            for cle in anciennes.keys() | cellules.keys():
+                couleur = cellules.get(cle)
+                if anciennes.get(cle) != couleur:
+                    zones_modifiees.append(self._dessiner_cellule(cle[0], cle[1], couleur))
+        
+        self._cellules_affichees = cellules
+        self._superposition_affichee = superposition
+    
+    def _calculer_cellules(self, moteur: 'MoteurPartie') -> Dict[Tuple[int, int], Tuple[int, int, int]]:
+        """Retourne la couleur de chaque cellule visible occupée (placée ou pièce active)."""
+        plateau = moteur.plateau
+        if plateau is not self._plateau_indexe or plateau.version != self._version_plateau_indexee:
+            self._cellules_plateau = {(pos.x, pos.y): self.gris_place
+                                      for pos in plateau.positions_occupees if pos.y >= 0}
+            self._plateau_indexe = plateau
+            self._version_plateau_indexee = plateau.version
+        
+        cellules = dict(self._cellules_plateau)
+        if moteur.piece_active:
+            couleur = self.couleurs_pieces.get(moteur.piece_active.type_piece, self.blanc)
+            for pos in moteur.piece_active.positions:
+                if pos.y >= 0:
+                    cellules[(pos.x, pos.y)] = couleur
+        return cellules
+    
+    def _signature_superposition(self, moteur: 'MoteurPartie', messages: list) -> Optional[tuple]:
+        """Résume les textes superposés au plateau (None si aucun)."""
+        etat = ('GAME OVER' if moteur.jeu_termine else 'PAUSE' if moteur.en_pause
+                else 'MENU' if moteur.afficher_menu else None)
+        if etat is None and not messages:
+            return None
+        return etat, tuple(messages[-3:])
+    
+    def _signature_mute(self, moteur: 'MoteurPartie') -> bool:
+        """Retourne l'état mute affiché par l'en-tête."""
+        audio = moteur.obtenir_audio()
+        return bool(audio and hasattr(audio, 'obtenir_etat_mute') and audio.obtenir_etat_mute())
+    
+    def _dessiner_entete(self, moteur: 'MoteurPartie') -> None:
+        """Dessine le titre et l'indicateur de mute."""
+        titre = "                 TETRIS"
+        texte_titre = self._cache.texte(self.police_titre, titre, self.blanc)
+        self.ecran.blit(texte_titre, (self.marge, 5))
         
-        pygame.display.flip()
+        # Indicateur de mute (au-dessus du titre)
+        self._dessiner_indicateur_mute(moteur)
     
     def _dessiner_indicateur_mute(self, moteur: 'MoteurPartie') -> None:
         """Dessine l'indicateur visuel de mute dans l'interface."""
@@ -161,7 +337,7 @@ class AffichagePartie(AffichageJeu):
             
             # Texte "MUTE"
             texte_mute = "MUTE"
-            rendu_mute = self.police_normale.render(texte_mute, True, self.blanc)
+            rendu_mute = self._cache.texte(self.police_normale, texte_mute, self.blanc)
             
             # Centrer le texte dans l'indicateur
             largeur_texte = rendu_mute.get_width()
@@ -174,29 +350,39 @@ class AffichagePartie(AffichageJeu):
     def nettoyer(self) -> None:
         """Nettoie les ressources pygame."""
         if self.initialise:
+            self._cache.vider()
             pygame.quit()
             self.initialise = False
     
+    def _dessiner_cellule(self, colonne: int, ligne: int,
+                          couleur: Optional[Tuple[int, int, int]] = None) -> pygame.Rect:
+        """
+        Dessine une cellule de la grille, vide ou remplie d'une couleur.
+        
+        Returns:
+            Le rectangle écran de la cellule
+        """
+        x = self.zone_jeu_x + colonne * self.taille_cellule
+        y = self.zone_jeu_y + ligne * self.taille_cellule
+        
+        if couleur is None:
+            sprite = self._cache.cellule(self.gris_fonce, self.taille_cellule, 1, self.gris)
+        else:
+            sprite = self._cache.cellule(couleur, self.taille_cellule, 2, self.blanc)
+        
+        return self.ecran.blit(sprite, (x, y))
+    
     def _dessiner_plateau(self, moteur: 'MoteurPartie') -> None:
         """Dessine la grille et les pièces placées."""
-        # Grille de base
-        for ligne in range(self.hauteur_plateau):
-            for colonne in range(self.largeur_plateau):
-                x = self.zone_jeu_x + colonne * self.taille_cellule
-                y = self.zone_jeu_y + ligne * self.taille_cellule
-                
-                rect = pygame.Rect(x, y, self.taille_cellule, self.taille_cellule)
-                pygame.draw.rect(self.ecran, self.gris_fonce, rect)
-                pygame.draw.rect(self.ecran, self.gris, rect, 1)
+        # Grille de base (pré-rendue une seule fois)
+        fond = self._cache.fond_grille(self.largeur_plateau, self.hauteur_plateau,
+                                       self.taille_cellule, self.gris_fonce, self.gris)
+        self.ecran.blit(fond, (self.zone_jeu_x, self.zone_jeu_y))
         
         # Pièces placées (masquer la zone invisible)
         for position in moteur.plateau.positions_occupees:
             if position.y >= 0:  # Masquage de la zone invisible pour les pièces placées
-                x = self.zone_jeu_x + position.x * self.taille_cellule
-                y = self.zone_jeu_y + position.y * self.taille_cellule
-                rect = pygame.Rect(x, y, self.taille_cellule, self.taille_cellule)
-                pygame.draw.rect(self.ecran, self.gris_place, rect)
-                pygame.draw.rect(self.ecran, self.blanc, rect, 2)
+                self._dessiner_cellule(position.x, position.y, self.gris_place)
     
     def _dessiner_piece_active(self, moteur: 'MoteurPartie') -> None:
         """Dessine la pièce actuellement contrôlée."""
@@ -208,11 +394,7 @@ class AffichagePartie(AffichageJeu):
         # Ne dessiner que les positions visibles (y >= 0) pour masquer la zone invisible
         for pos in moteur.piece_active.positions:
             if pos.y >= 0:  # Masquage de la zone invisible
-                x = self.zone_jeu_x + pos.x * self.taille_cellule
-                y = self.zone_jeu_y + pos.y * self.taille_cellule
-                rect = pygame.Rect(x, y, self.taille_cellule, self.taille_cellule)
-                pygame.draw.rect(self.ecran, couleur, rect)
-                pygame.draw.rect(self.ecran, self.blanc, rect, 2)
+                self._dessiner_cellule(pos.x, pos.y, couleur)
     
     def _dessiner_statistiques(self, moteur: 'MoteurPartie') -> None:
         """Dessine les statistiques de la partie."""
@@ -220,7 +402,7 @@ class AffichagePartie(AffichageJeu):
         y = self.zone_jeu_y
         
         # Titre
-        titre = self.police_normale.render("STATISTIQUES", True, self.blanc)
+        titre = self._cache.texte(self.police_normale, "STATISTIQUES", self.blanc)
         self.ecran.blit(titre, (x, y))
         y += 35
         
@@ -231,15 +413,18 @@ class AffichagePartie(AffichageJeu):
             f"Niveau: {stats.niveau}",
             f"Lignes: {stats.lignes_completees}",
             f"Pièces: {stats.pieces_placees}",
-            "",
-            "Pièces utilisées:"
         ]
         
         for texte in textes_stats:
-            if texte:
-                rendu = self.police_petite.render(texte, True, self.blanc)
-                self.ecran.blit(rendu, (x, y))
+            # Texte variable : rendu direct, sans remplir le cache des textes
+            rendu = self.police_petite.render(texte, True, self.blanc)
+            self.ecran.blit(rendu, (x, y))
             y += 20
+        y += 20
+        
+        rendu = self._cache.texte(self.police_petite, "Pièces utilisées:", self.blanc)
+        self.ecran.blit(rendu, (x, y))
+        y += 20
         
         # Statistiques par pièce
         for type_piece, count in stats.pieces_par_type.items():
@@ -258,7 +443,7 @@ class AffichagePartie(AffichageJeu):
         y = self.zone_jeu_y + 300  # Augmenté de 280 à 300 pour plus d'espace
         
         # Titre
-        titre = self.police_normale.render("SUIVANTE", True, self.blanc)
+        titre = self._cache.texte(self.police_normale, "SUIVANTE", self.blanc)
         self.ecran.blit(titre, (x, y))
         y += 30
         
@@ -278,16 +463,14 @@ class AffichagePartie(AffichageJeu):
         for pos in moteur.piece_suivante.positions:
             rect_x = offset_x + pos.x * taille_preview
             rect_y = offset_y + pos.y * taille_preview
-            rect = pygame.Rect(rect_x, rect_y, taille_preview, taille_preview)
-            pygame.draw.rect(self.ecran, couleur, rect)
-            pygame.draw.rect(self.ecran, self.blanc, rect, 1)
+            self.ecran.blit(self._cache.cellule(couleur, taille_preview, 1, self.blanc), (rect_x, rect_y))
     
     def _dessiner_controles(self) -> None:
         """Dessine l'aide des contrôles."""
         x = self.zone_interface_x
         y = self.zone_jeu_y + 420  # Augmenté de 400 à 420 pour plus d'espace avec la pièce suivante
         
-        titre = self.police_normale.render("CONTROLES", True, self.blanc)
+        titre = self._cache.texte(self.police_normale, "CONTROLES", self.blanc)
         self.ecran.blit(titre, (x, y))
         y += 25
         
@@ -302,18 +485,52 @@ class AffichagePartie(AffichageJeu):
         ]
         
         for controle in controles:
-            rendu = self.police_monospace.render(controle, True, self.blanc)
+            rendu = self._cache.texte(self.police_monospace, controle, self.blanc)
             self.ecran.blit(rendu, (x, y))
             y += 16
     
-    def _dessiner_messages(self, moteur: 'MoteurPartie') -> None:
-        """Dessine les messages temporaires."""
-        messages = moteur.obtenir_messages()
+    def _dessiner_profil(self) -> None:
+        """Dessine les centiles de chaque phase et le graphe des durées de frame."""
+        profileur = self.profileur
+        zone = self._zones['controles']
+        x = zone.x
+        y = zone.y
+        
+        titre = self._cache.texte(self.police_normale, "PROFIL (ms)", self.blanc)
+        self.ecran.blit(titre, (x, y))
+        y += 25
         
+        lignes = ["phase          p50    p95    p99"]
+        for phase, (p50, p95, p99) in profileur.resume().items():
+            lignes.append(f"{phase:<12} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        for ligne in lignes:
+            # Texte variable : rendu direct, sans remplir le cache des textes
+            rendu = self.police_monospace.render(ligne, True, self.blanc)
+            self.ecran.blit(rendu, (x, y))
+            y += 16
+        
+        # Graphe : une barre de 2 pixels par frame (temps de travail, attente
+        # exclue), échelle de deux budgets
+        graphe = pygame.Rect(x, y + 4, zone.width - 10, zone.bottom - y - 8)
+        if graphe.height <= 0:
+            return
+        durees = profileur.durees()[-(graphe.width // 2):]
+        echelle = graphe.height / (2 * self.BUDGET_FRAME_NS)
+        for i, duree in enumerate(durees):
+            hauteur = min(graphe.height, max(1, int(duree * echelle)))
+            couleur = self.vert if duree <= self.BUDGET_FRAME_NS * 1.5 else self.rouge
+            self.ecran.fill(couleur, (graphe.x + 2 * i, graphe.bottom - hauteur, 2, hauteur))
+        
+        # Ligne du budget (16,7 ms à 60 FPS)
+        y_budget = graphe.bottom - int(self.BUDGET_FRAME_NS * echelle)
+        pygame.draw.line(self.ecran, self.jaune, (graphe.x, y_budget), (graphe.right, y_budget))
+    
+    def _dessiner_messages(self, messages: list) -> None:
+        """Dessine les messages temporaires (déjà retirés du moteur)."""
         if messages:
             y = self.zone_jeu_y + self.hauteur_jeu // 2
             for message in messages[-3:]:  # Maximum 3 messages
-                rendu = self.police_normale.render(message, True, self.jaune)
+                rendu = self._cache.texte(self.police_normale, message, self.jaune)
                 largeur_texte = rendu.get_width()
                 x = self.zone_jeu_x + (self.largeur_jeu - largeur_texte) // 2
                 
@@ -341,7 +558,7 @@ class AffichagePartie(AffichageJeu):
         else:
             return
         
-        rendu = self.police_titre.render(texte, True, couleur)
+        rendu = self._cache.texte(self.police_titre, texte, couleur)
         largeur_texte = rendu.get_width()
         x = self.zone_jeu_x + (self.largeur_jeu - largeur_texte) // 2
         y = self.zone_jeu_y + self.hauteur_jeu // 2 - 50
@@ -355,16 +572,22 @@ class AffichagePartie(AffichageJeu):
         
         self.ecran.blit(rendu, (x, y))
 
+    def _texte_fps(self) -> str:
+        """Retourne le texte du FPS tel qu'il est affiché."""
+        if not self.initialise or not self.ordonnanceur:
+            return ""
+        return f"FPS: {self.ordonnanceur.fps:.1f}"
+    
     def _dessiner_fps(self) -> None:
         """Dessine le FPS en temps réel dans le coin supérieur droit."""
-        if not self.initialise or not self.horloge_fps:
+        if not self.initialise or not self.ordonnanceur:
             return
             
         # Calculer le FPS actuel
-        fps_actuel = self.horloge_fps.get_fps()
+        fps_actuel = self.ordonnanceur.fps
         
         # Formater le texte du FPS
-        texte_fps = f"FPS: {fps_actuel:.1f}"
+        texte_fps = self._texte_fps()
         
         # Choisir la couleur selon le FPS
         if fps_actuel >= 55:
@@ -374,7 +597,7 @@ class AffichagePartie(AffichageJeu):
         else:
             couleur_fps = (255, 0, 0)  # Rouge pour FPS faible
         
-        # Rendre le texte
+        # Rendre le texte (variable : rendu direct, sans remplir le cache des textes)
         rendu_fps = self.police_monospace.render(texte_fps, True, couleur_fps)
         
         # Position dans le coin supérieur droit
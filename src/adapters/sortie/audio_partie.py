@@ -3,11 +3,15 @@ Adaptateur Audio - Implémentation pygame pour la musique et les effets sonores.
 
 Cet adaptateur implémente l'interface AudioJeu en utilisant pygame.mixer
 pour la gestion de la musique de fond et des effets sonores.
+
+Les effets sonores de assets/audio/sfx sont préchargés à l'initialisation
+(banque de sons) : chaque effet est décodé une seule fois et joué depuis
+la mémoire sur son propre canal réservé, sans accès disque en cours de jeu.
 """
 
 import pygame
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from src.ports.sortie.audio_jeu import AudioJeu
 from src.domaine.services.logger_tetris import logger_tetris
 from src.domaine.exceptions.exception_audio import ExceptionAudio
@@ -21,9 +25,21 @@ class AudioPartie(AudioJeu):
     - Lecture de musique de fond en boucle
     - Gestion du volume
     - Contrôle de la lecture (pause/reprendre/arrêt)
-    - Effets sonores (future extension)
+    - Effets sonores préchargés (banque de sons et canaux réservés)
     """
     
+    # Racine du projet : audio_partie.py est dans src/adapters/sortie/
+    RACINE_PROJET = Path(__file__).parent.parent.parent.parent
+    
+    # Répertoire des effets sonores préchargés (relatif à la racine du projet)
+    REPERTOIRE_EFFETS = "assets/audio/sfx"
+    
+    # Extensions des fichiers préchargés
+    EXTENSIONS_EFFETS = (".wav", ".ogg")
+    
+    # Canaux du mixer laissés libres en plus des canaux réservés aux effets
+    CANAUX_LIBRES = 8
+    
     def __init__(self) -> None:
         """Initialise l'adaptateur audio."""
         self._initialise = False
@@ -32,6 +48,10 @@ class AudioPartie(AudioJeu):
         self._est_mute = False  # État de mute
         self._volume_avant_mute = 0.7  # Volume à restaurer après unmute
         
+        # Banque de sons : chemin relatif (ex: "assets/audio/sfx/rotate.wav") -> son décodé
+        self._banque_effets: Dict[str, 'pygame.mixer.Sound'] = {}
+        self._canaux_effets: Dict[str, 'pygame.mixer.Channel'] = {}
+        
     def initialiser(self) -> None:
         """
         Initialise le système audio pygame.
@@ -56,6 +76,8 @@ class AudioPartie(AudioJeu):
             self._initialise = True
             logger_tetris.info("[AUDIO] Système audio initialisé avec succès")
             
+            self._precharger_effets_sonores()
+            
         except pygame.error as e:
             logger_tetris.error(f"[ERROR] Erreur lors de l'initialisation audio: {e}")
             self._initialise = False
@@ -65,6 +87,43 @@ class AudioPartie(AudioJeu):
             self._initialise = False
             raise ExceptionAudio(f"Échec initialisation audio inattendu: {e}")
     
+    def _precharger_effets_sonores(self) -> None:
+        """
+        Décode tous les effets sonores du répertoire des effets et leur réserve un canal.
+        
+        Un fichier illisible est ignoré (avec un avertissement) : il sera
+        chargé depuis le disque, comme avant, s'il est joué.
+        """
+        repertoire = self.RACINE_PROJET / self.REPERTOIRE_EFFETS
+        if not repertoire.is_dir():
+            logger_tetris.warning(f"[WARNING] Répertoire des effets sonores introuvable: {repertoire}")
+            return
+        
+        for fichier in sorted(repertoire.iterdir()):
+            if fichier.suffix.lower() not in self.EXTENSIONS_EFFETS:
+                continue
+            cle = f"{self.REPERTOIRE_EFFETS}/{fichier.name}"
+            try:
+                self._banque_effets[cle] = pygame.mixer.Sound(str(fichier))
+            except pygame.error as e:
+                logger_tetris.warning(f"[WARNING] Effet sonore non préchargé {fichier.name}: {e}")
+        
+        # Un canal réservé par effet : un effet rejoué coupe sa propre occurrence
+        # précédente, jamais la musique ni les autres effets
+        nb_effets = len(self._banque_effets)
+        if pygame.mixer.get_num_channels() < nb_effets + self.CANAUX_LIBRES:
+            pygame.mixer.set_num_channels(nb_effets + self.CANAUX_LIBRES)
+        pygame.mixer.set_reserved(nb_effets)
+        self._canaux_effets = {cle: pygame.mixer.Channel(index)
+                               for index, cle in enumerate(self._banque_effets)}
+        
+        logger_tetris.debug(f"[SFX] {nb_effets} effet(s) sonore(s) préchargé(s)")
+    
+    @staticmethod
+    def _cle_effet(chemin_fichier: str) -> str:
+        """Normalise un chemin d'effet sonore en clé de la banque de sons."""
+        return chemin_fichier.replace("\\", "/")
+    
     def jouer_musique(self, chemin_fichier: str, volume: float = 0.7, boucle: bool = True) -> None:
         """
         Joue la musique de fond depuis un fichier.
@@ -214,25 +273,34 @@ class AudioPartie(AudioJeu):
             raise ExceptionAudio("Système audio non initialisé pour effet sonore")
             
         try:
-            # Construire le chemin absolu
-            # audio_partie.py est dans src/adapters/sortie/, donc 4 remontées pour la racine
-            chemin_complet = Path(__file__).parent.parent.parent.parent / chemin_fichier
+            cle = self._cle_effet(chemin_fichier)
+            effet = self._banque_effets.get(cle)
             
-            if not chemin_complet.exists():
-                logger_tetris.error(f"[ERROR] Fichier effet sonore introuvable: {chemin_complet}")
-                raise ExceptionAudio(f"Fichier effet sonore introuvable: {chemin_fichier}")
-            
-            # Charger et jouer l'effet sonore
-            effet = pygame.mixer.Sound(str(chemin_complet))
+            if effet is None:
+                # Effet non préchargé : chargement depuis le disque, gardé en banque ensuite
+                chemin_complet = self.RACINE_PROJET / chemin_fichier
+                
+                if not chemin_complet.exists():
+                    logger_tetris.error(f"[ERROR] Fichier effet sonore introuvable: {chemin_complet}")
+                    raise ExceptionAudio(f"Fichier effet sonore introuvable: {chemin_fichier}")
+                
+                effet = pygame.mixer.Sound(str(chemin_complet))
+                self._banque_effets[cle] = effet
             
             # Respecter le mute : si musique est mutée, muter les effets aussi
             volume_effectif = volume if not self._est_mute else 0.0
             effet.set_volume(volume_effectif)
             
-            effet.play()
+            # Jouer depuis la mémoire, sur le canal réservé de l'effet s'il en a un
+            canal = self._canaux_effets.get(cle)
+            if canal is not None:
+                canal.play(effet)
+            else:
+                effet.play()
             
-            status_mute = " (MUTE)" if self._est_mute else ""
-            logger_tetris.debug(f"[SFX] Effet sonore joué: {chemin_complet.name} - Volume: {int(volume_effectif * 100)}%{status_mute}")
+            if logger_tetris.debug_actif:
+                logger_tetris.debug("[SFX] Effet sonore joué: %s - Volume: %d%%%s", cle,
+                                    int(volume_effectif * 100), " (MUTE)" if self._est_mute else "")
             return True
             
         except pygame.error as e:
@@ -280,4 +348,7 @@ class AudioPartie(AudioJeu):
             finally:
                 self._initialise = False
                 self._musique_chargee = False
+                # Les sons décodés sont liés au mixer fermé
+                self._banque_effets.clear()
+                self._canaux_effets.clear()
                 logger_tetris.debug("[CLEANUP] Système audio nettoyé")
@@ -0,0 +1,132 @@
+"""
+Cache des surfaces pygame pré-rendues pour l'affichage.
+
+Évite de redessiner à chaque frame ce qui ne change jamais :
+- Fond de grille du plateau, un par (dimensions, taille, couleurs)
+- Sprites de cellules, un par (couleur, taille, épaisseur de bordure)
+- Textes rendus, dans un cache LRU indexé par (police, texte, couleur)
+
+Une frame devient ainsi une série de blits. La grille et les cellules
+sont converties au format de l'écran dès leur création (une fois la
+fenêtre ouverte) : leurs blits n'ont plus de conversion de pixels à faire.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+Couleur = Tuple[int, int, int]
+
+
+class CacheSurfaces:
+    """
+    Cache des surfaces réutilisées d'une frame à l'autre.
+
+    Les surfaces retournées sont partagées : elles doivent être
+    blittées, jamais modifiées par l'appelant.
+    """
+
+    # Nombre maximal de textes rendus conservés (les moins récents sont évincés)
+    TAILLE_CACHE_TEXTES = 256
+
+    def __init__(self, taille_cache_textes: int = TAILLE_CACHE_TEXTES):
+        """
+        Initialise des caches vides.
+
+        Args:
+            taille_cache_textes: Nombre maximal de textes rendus conservés
+        """
+        self._taille_cache_textes = taille_cache_textes
+        self._textes: 'OrderedDict[Tuple[pygame.font.Font, str, Couleur], pygame.Surface]' = OrderedDict()
+        self._cellules: Dict[Tuple[Couleur, int, int, Couleur], pygame.Surface] = {}
+        self._fonds_grille: Dict[Tuple[int, int, int, Couleur, Couleur], pygame.Surface] = {}
+
+    def texte(self, police: 'pygame.font.Font', texte: str, couleur: Couleur) -> pygame.Surface:
+        """
+        Retourne le rendu d'un texte, rendu une seule fois tant qu'il reste en cache.
+
+        Args:
+            police: Police pygame utilisée
+            texte: Texte à rendre
+            couleur: Couleur RGB du texte (antialiasé, fond transparent)
+
+        Returns:
+            Surface du texte rendu
+        """
+        cle = (police, texte, couleur)
+        surface = self._textes.get(cle)
+        if surface is not None:
+            self._textes.move_to_end(cle)
+            return surface
+
+        surface = police.render(texte, True, couleur)
+        self._textes[cle] = surface
+        if len(self._textes) > self._taille_cache_textes:
+            self._textes.popitem(last=False)
+        return surface
+
+    def cellule(self, couleur: Couleur, taille: int, bordure: int,
+                couleur_bordure: Couleur) -> pygame.Surface:
+        """
+        Retourne le sprite d'une cellule pleine avec sa bordure.
+
+        Args:
+            couleur: Couleur de remplissage
+            taille: Côté de la cellule en pixels
+            bordure: Épaisseur de la bordure en pixels
+            couleur_bordure: Couleur de la bordure
+
+        Returns:
+            Surface carrée de la cellule
+        """
+        cle = (couleur, taille, bordure, couleur_bordure)
+        surface = self._cellules.get(cle)
+        if surface is None:
+            surface = pygame.Surface((taille, taille))
+            rect = surface.get_rect()
+            pygame.draw.rect(surface, couleur, rect)
+            pygame.draw.rect(surface, couleur_bordure, rect, bordure)
+            surface = self._convertir(surface)
+            self._cellules[cle] = surface
+        return surface
+
+    def fond_grille(self, colonnes: int, lignes: int, taille: int,
+                    couleur_fond: Couleur, couleur_grille: Couleur) -> pygame.Surface:
+        """
+        Retourne le fond de grille complet du plateau (rendu au premier appel avec ces arguments).
+
+        Args:
+            colonnes: Nombre de colonnes du plateau
+            lignes: Nombre de lignes du plateau
+            taille: Côté d'une cellule en pixels
+            couleur_fond: Couleur de fond des cellules vides
+            couleur_grille: Couleur des lignes de la grille
+
+        Returns:
+            Surface de la grille vide
+        """
+        cle = (colonnes, lignes, taille, couleur_fond, couleur_grille)
+        surface = self._fonds_grille.get(cle)
+        if surface is None:
+            cellule_vide = self.cellule(couleur_fond, taille, 1, couleur_grille)
+            surface = pygame.Surface((colonnes * taille, lignes * taille))
+            for ligne in range(lignes):
+                for colonne in range(colonnes):
+                    surface.blit(cellule_vide, (colonne * taille, ligne * taille))
+            surface = self._convertir(surface)
+            self._fonds_grille[cle] = surface
+        return surface
+
+    @staticmethod
+    def _convertir(surface: pygame.Surface) -> pygame.Surface:
+        """Convertit une surface opaque au format de l'écran, s'il est ouvert."""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert()
+
+    def vider(self) -> None:
+        """Vide tous les caches (les surfaces sont liées à l'affichage courant)."""
+        self._textes.clear()
+        self._cellules.clear()
+        self._fonds_grille.clear()
@@ -5,6 +5,11 @@ Les entités représentent les concepts centraux de Tetris :
 - Position : Value Object pour les coordonnées
 - Piece : Entité représentant une pièce de Tetris
 - Plateau : Entité représentant l'aire de jeu
+- PlateauBitboard : Plateau stocké avec un masque de bits par ligne
+- PlateauLot : N plateaux dans un tableau NumPy (opérations vectorisées)
+- JournalChangements : Version et journal borné des changements d'état
+- InstantanePartie : Capture immuable et compacte de l'état d'une partie
+- Zobrist : Clés 64 bits des cellules et des états de pièce
 
 RÈGLES :
 - Immutable quand possible (Value Objects)
@@ -14,7 +19,15 @@ RÈGLES :
 """
 
 from .position import Position
-from .piece import Piece, TypePiece
+from .piece import EtatPiece, Piece, TypePiece
 from .plateau import Plateau
+from .plateau_bitboard import PlateauBitboard
+from .plateau_lot import PlateauLot
+from .journal_changements import Changement, JournalChangements, TypeChangement
+from .instantane_partie import InstantanePartie, compacter_piece, decompacter_piece
+from .zobrist import cle_cellule, cle_ligne, cle_piece
 
-__all__ = ['Position', 'Piece', 'TypePiece', 'Plateau']
+__all__ = ['Position', 'EtatPiece', 'Piece', 'TypePiece', 'Plateau', 'PlateauBitboard', 'PlateauLot',
+           'Changement', 'JournalChangements', 'TypeChangement',
+           'InstantanePartie', 'compacter_piece', 'decompacter_piece',
+           'cle_cellule', 'cle_ligne', 'cle_piece']
@@ -13,9 +13,17 @@ from ..pieces import *
 
 # Importer la fabrique après l'enregistrement des pièces
 from .fabrique_pieces import FabriquePieces
+from .generateurs_pieces import (
+    GenerateurPieces, GenerateurClassique, GenerateurSac7, FilePieces, EtatGenerateur
+)
 
 __all__ = [
     'FabriquePieces',
+    'GenerateurPieces',
+    'GenerateurClassique',
+    'GenerateurSac7',
+    'FilePieces',
+    'EtatGenerateur',
     'RegistrePieces', 
     'piece_tetris',
 ]
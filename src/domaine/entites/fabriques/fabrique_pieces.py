@@ -14,10 +14,13 @@ Exemple d'usage :
     fabrique = FabriquePieces()
     piece_i = fabrique.creer(TypePiece.I)
     piece_aleatoire = fabrique.creer_aleatoire()
+
+L'ordre des pièces d'une partie relève des générateurs (generateurs_pieces) :
+la fabrique ne fait que les instancier.
 """
 
 import random
-from typing import List
+from typing import List, Optional
 from ..piece import Piece, TypePiece
 from .registre_pieces import RegistrePieces
 
@@ -41,10 +44,16 @@ class FabriquePieces:
     Y_SPAWN_DEFAUT = -3  # Zone invisible : 3 lignes au-dessus du plateau visible
     
     
-    def __init__(self):
-        """Initialise la fabrique en utilisant le registre des pièces."""
+    def __init__(self, generateur: Optional[random.Random] = None):
+        """
+        Initialise la fabrique en utilisant le registre des pièces.
+        
+        Args:
+            generateur: Générateur aléatoire dédié (seedé pour une partie
+                reproductible). Par défaut, le générateur global du module random.
+        """
         # Plus besoin de mapping manuel ! Le registre gère tout
-        pass
+        self._generateur = generateur if generateur is not None else random
     
     def creer(self, type_piece: TypePiece, 
               x_pivot: int = None, y_pivot: int = None) -> Piece:
@@ -87,12 +96,13 @@ class FabriquePieces:
         Raises:
             ValueError: Si aucune pièce n'est enregistrée
         """
-        types_disponibles = list(RegistrePieces.obtenir_types_supportes())
+        # Ordre stable et mis en cache par le registre (pas de copie à chaque pièce)
+        types_disponibles = RegistrePieces.obtenir_types_ordonnes()
         
         if not types_disponibles:
             raise ValueError("Aucune pièce enregistrée dans le registre")
         
-        type_choisi = random.choice(types_disponibles)
+        type_choisi = self._generateur.choice(types_disponibles)
         return self.creer(type_choisi, x_pivot, y_pivot)
     
     def obtenir_types_supportes(self) -> List[TypePiece]:
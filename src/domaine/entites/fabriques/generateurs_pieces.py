@@ -0,0 +1,186 @@
+"""
+Générateurs de pièces - Strategy Pattern pour l'ordre d'apparition des pièces.
+
+Chaque générateur possède son propre random.Random seedé : une partie
+ne dépend plus du générateur global du module random et se rejoue à
+l'identique à partir de sa graine (replays, benchmarks, tournois).
+
+Politiques disponibles :
+- GenerateurClassique : tirage uniforme indépendant à chaque pièce
+- GenerateurSac7 : les 7 pièces mélangées dans un sac, vidé avant d'être rempli
+
+La FilePieces tire les types à l'avance dans une file d'aperçu de
+profondeur N, que les planificateurs peuvent lire sans rien reconstruire.
+
+Exemple d'usage :
+    file = FilePieces(GenerateurSac7(graine=42), profondeur=5)
+    prochains = file.apercu()        # 5 prochains types, sans les consommer
+    type_piece = file.tirer()        # consomme le premier et remplit la file
+"""
+
+import random
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..piece import TypePiece
+from .registre_pieces import RegistrePieces
+
+
+class EtatGenerateur(NamedTuple):
+    """État complet d'un générateur : état du random.Random et types encore en réserve."""
+    aleatoire: Any
+    reserve: Tuple[TypePiece, ...] = ()
+
+
+class GenerateurPieces(ABC):
+    """
+    Interface des politiques de génération des types de pièces.
+
+    Le générateur ne crée pas les pièces (rôle de FabriquePieces) :
+    il décide seulement de l'ordre des types.
+    """
+
+    def __init__(self, graine: Optional[int] = None):
+        """
+        Initialise le générateur avec son propre générateur aléatoire.
+
+        Args:
+            graine: Graine de la partie (None : graine tirée par le système)
+        """
+        self.graine = graine
+        self._aleatoire = random.Random(graine)
+
+    @staticmethod
+    def _types_disponibles() -> Tuple[TypePiece, ...]:
+        """Types enregistrés, dans l'ordre stable de déclaration de TypePiece."""
+        types = RegistrePieces.obtenir_types_ordonnes()
+        if not types:
+            raise ValueError("Aucune pièce enregistrée dans le registre")
+        return types
+
+    @abstractmethod
+    def suivant(self) -> TypePiece:
+        """Retourne le type de la prochaine pièce."""
+        pass
+
+    def obtenir_etat(self) -> EtatGenerateur:
+        """Capture l'état du générateur (reprise exacte de la suite des tirages)."""
+        return EtatGenerateur(self._aleatoire.getstate())
+
+    def restaurer_etat(self, etat: EtatGenerateur) -> None:
+        """Reprend la suite des tirages à un état capturé par obtenir_etat()."""
+        self._aleatoire.setstate(etat.aleatoire)
+
+
+class GenerateurClassique(GenerateurPieces):
+    """Tirage uniforme et indépendant parmi les types supportés."""
+
+    def suivant(self) -> TypePiece:
+        """Retourne un type tiré au hasard, sans mémoire des tirages précédents."""
+        return self._aleatoire.choice(self._types_disponibles())
+
+
+class GenerateurSac7(GenerateurPieces):
+    """
+    Générateur « 7-bag » : chaque sac contient une pièce de chaque type.
+
+    Le sac est mélangé puis vidé avant d'être rempli à nouveau, ce qui
+    garantit au plus 12 pièces entre deux pièces du même type.
+    """
+
+    def __init__(self, graine: Optional[int] = None):
+        """
+        Initialise le générateur avec un sac vide.
+
+        Args:
+            graine: Graine de la partie (None : graine tirée par le système)
+        """
+        super().__init__(graine)
+        self._sac: List[TypePiece] = []
+
+    def suivant(self) -> TypePiece:
+        """Retourne le prochain type du sac, en mélangeant un nouveau sac si besoin."""
+        if not self._sac:
+            self._sac = list(self._types_disponibles())
+            self._aleatoire.shuffle(self._sac)
+            self._sac.reverse()  # pop() en fin de liste rend l'ordre mélangé
+        return self._sac.pop()
+
+    def obtenir_etat(self) -> EtatGenerateur:
+        """Capture l'état du random.Random et le contenu du sac en cours."""
+        return EtatGenerateur(self._aleatoire.getstate(), tuple(self._sac))
+
+    def restaurer_etat(self, etat: EtatGenerateur) -> None:
+        """Reprend la suite des tirages, sac en cours compris."""
+        super().restaurer_etat(etat)
+        self._sac = list(etat.reserve)
+
+
+class FilePieces:
+    """
+    File d'aperçu des prochains types de pièces, remplie à l'avance.
+
+    La file contient toujours `profondeur` types tirés du générateur :
+    chaque tirage consomme le premier et en ajoute un nouveau à la fin.
+    """
+
+    # Nombre de prochaines pièces connues par défaut
+    PROFONDEUR_DEFAUT = 5
+
+    def __init__(self, generateur: GenerateurPieces, profondeur: int = PROFONDEUR_DEFAUT):
+        """
+        Initialise la file et la remplit.
+
+        Args:
+            generateur: Politique de génération utilisée
+            profondeur: Nombre de types connus à l'avance (0 : aucun aperçu)
+
+        Raises:
+            ValueError: Si la profondeur est négative
+        """
+        if profondeur < 0:
+            raise ValueError(f"Profondeur d'aperçu invalide : {profondeur}")
+
+        self.generateur = generateur
+        self.profondeur = profondeur
+        self._file: deque = deque(generateur.suivant() for _ in range(profondeur))
+
+    def tirer(self) -> TypePiece:
+        """
+        Consomme le prochain type et complète la file.
+
+        Returns:
+            Type de la prochaine pièce
+        """
+        if not self._file:
+            return self.generateur.suivant()
+        self._file.append(self.generateur.suivant())
+        return self._file.popleft()
+
+    def apercu(self, nombre: Optional[int] = None) -> Tuple[TypePiece, ...]:
+        """
+        Retourne les prochains types sans les consommer.
+
+        Args:
+            nombre: Nombre de types voulus (défaut : toute la file)
+
+        Returns:
+            Tuple des prochains types, le plus proche en premier
+        """
+        if nombre is None or nombre >= len(self._file):
+            return tuple(self._file)
+        return tuple(self._file)[:nombre]
+
+    def restaurer(self, types: Iterable[TypePiece]) -> None:
+        """
+        Remplace le contenu de la file (restauration d'un état capturé avec apercu()).
+
+        Args:
+            types: Prochains types, le plus proche en premier
+        """
+        self._file = deque(types)
+
+    def __len__(self) -> int:
+        """Nombre de types actuellement dans la file."""
+        return len(self._file)
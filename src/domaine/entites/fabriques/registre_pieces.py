@@ -5,13 +5,17 @@ Ce registre permet aux pièces de s'auto-enregistrer et simplifie
 l'ajout de nouvelles pièces sans modifier la fabrique principale.
 """
 
-from typing import Dict, Type, Set, TypeVar, Callable
-from ..piece import Piece, TypePiece
+from typing import Dict, Optional, Type, Set, Tuple, TypeVar, Callable
+from ..piece import EtatPiece, Piece, TypePiece
+from ..position import Position
 from ...services.logger_tetris import logger_tetris
 
 # Type générique pour le décorateur
 T = TypeVar('T', bound=Type[Piece])
 
+# Offsets (dx, dy) des 4 cellules d'une orientation, relatifs au pivot
+Forme = Tuple[Tuple[int, int], ...]
+
 
 def piece_tetris(type_piece: TypePiece) -> Callable[[T], T]:
     """
@@ -35,6 +39,91 @@ def piece_tetris(type_piece: TypePiece) -> Callable[[T], T]:
     return decorateur
 
 
+class TableFormes:
+    """
+    Table précalculée des formes d'un type de pièce.
+    
+    Associe chaque orientation aux offsets de ses cellules par rapport
+    au pivot. Les positions absolues sont mémorisées par
+    (orientation, x_pivot, y_pivot) : une rotation ou un déplacement
+    ne crée donc plus de nouveaux objets Position après le premier passage.
+    
+    La jupe de chaque orientation (offset dy le plus bas de chaque colonne dx)
+    est aussi précalculée, pour les calculs de distance de chute.
+    """
+    
+    def __init__(self, type_piece: TypePiece, formes: Tuple[Forme, ...]):
+        """
+        Initialise la table à partir des formes déclarées par la pièce.
+        
+        Args:
+            type_piece: Type de pièce décrit par la table
+            formes: Offsets des cellules pour chaque orientation (ordre horaire)
+            
+        Raises:
+            ValueError: Si aucune forme n'est fournie ou si une forme n'a pas 4 cellules
+        """
+        if not formes or any(len(forme) != 4 for forme in formes):
+            raise ValueError(
+                f"Formes invalides pour la pièce {type_piece.value} : "
+                f"4 cellules attendues par orientation"
+            )
+        
+        self.type_piece = type_piece
+        self.formes = tuple(tuple(forme) for forme in formes)
+        self.nb_orientations = len(self.formes)
+        self.jupes = tuple(self._calculer_jupe(forme) for forme in self.formes)
+        self._etats: Dict[Tuple[int, int, int], EtatPiece] = {}
+    
+    @staticmethod
+    def _calculer_jupe(forme: Forme) -> Forme:
+        """Retourne les couples (dx, dy le plus bas) d'une forme, triés par colonne."""
+        jupe: Dict[int, int] = {}
+        for dx, dy in forme:
+            if dx not in jupe or dy > jupe[dx]:
+                jupe[dx] = dy
+        return tuple(sorted(jupe.items()))
+    
+    def obtenir(self, orientation: int, x_pivot: int, y_pivot: int) -> Tuple[Position, Tuple[Position, ...]]:
+        """
+        Retourne le pivot et les positions d'une orientation autour d'un pivot.
+        
+        Args:
+            orientation: Index de l'orientation
+            x_pivot: Position X du pivot
+            y_pivot: Position Y du pivot
+            
+        Returns:
+            Tuple (position_pivot, positions des 4 cellules)
+        """
+        etat = self.etat(orientation, x_pivot, y_pivot)
+        return etat.position_pivot, etat.positions
+    
+    def etat(self, orientation: int, x_pivot: int, y_pivot: int) -> EtatPiece:
+        """
+        Retourne l'état (partagé) d'une orientation autour d'un pivot.
+        
+        Args:
+            orientation: Index de l'orientation
+            x_pivot: Position X du pivot
+            y_pivot: Position Y du pivot
+            
+        Returns:
+            EtatPiece mémorisé pour (orientation, x_pivot, y_pivot)
+        """
+        cle = (orientation, x_pivot, y_pivot)
+        etat = self._etats.get(cle)
+        if etat is None:
+            etat = EtatPiece(
+                orientation,
+                Position(x_pivot, y_pivot),
+                tuple(Position(x_pivot + dx, y_pivot + dy)
+                      for dx, dy in self.formes[orientation])
+            )
+            self._etats[cle] = etat
+        return etat
+
+
 class RegistrePieces:
     """
     Registry Pattern pour l'enregistrement automatique des pièces.
@@ -45,20 +134,32 @@ class RegistrePieces:
     
     _pieces_enregistrees: Dict[TypePiece, Type[Piece]] = {}
     _types_supportes: Set[TypePiece] = set()
+    _tables_formes: Dict[TypePiece, TableFormes] = {}
+    _types_ordonnes: Optional[Tuple[TypePiece, ...]] = None  # Cache, invalidé à chaque enregistrement
     
     @classmethod
     def enregistrer_piece(cls, type_piece: TypePiece, classe_piece: Type[Piece]) -> None:
         """
         Enregistrer une nouvelle classe de pièce.
         
+        Si la classe déclare ses FORMES, la table de formes est construite
+        une seule fois ici et partagée par toutes les instances.
+        
         Args:
             type_piece: Le type de pièce (TypePiece.I, TypePiece.O, etc.)
             classe_piece: La classe concrète qui implémente cette pièce
         """
         cls._pieces_enregistrees[type_piece] = classe_piece
         cls._types_supportes.add(type_piece)
+        cls._types_ordonnes = None
+        
+        formes = getattr(classe_piece, 'FORMES', None)
+        if formes:
+            table = TableFormes(type_piece, formes)
+            cls._tables_formes[type_piece] = table
+            classe_piece._table_formes = table
         # Note: Emoji remplacé par texte pour compatibilité Windows
-        logger_tetris.debug(f"[REGISTRY] Pièce enregistrée : {type_piece.value} -> {classe_piece.__name__}")
+        logger_tetris.debug("[REGISTRY] Pièce enregistrée : %s -> %s", type_piece.value, classe_piece.__name__)
     
     @classmethod
     def obtenir_classe_piece(cls, type_piece: TypePiece) -> Type[Piece]:
@@ -83,11 +184,46 @@ class RegistrePieces:
         
         return cls._pieces_enregistrees[type_piece]
     
+    @classmethod
+    def obtenir_table_formes(cls, type_piece: TypePiece) -> TableFormes:
+        """
+        Obtenir la table de formes précalculée d'un type de pièce.
+        
+        Args:
+            type_piece: Le type de pièce recherché
+            
+        Returns:
+            La table (type, orientation) -> offsets relatifs au pivot
+            
+        Raises:
+            ValueError: Si aucune table n'est enregistrée pour ce type
+        """
+        if type_piece not in cls._tables_formes:
+            raise ValueError(f"Aucune table de formes pour la pièce : {type_piece.value}")
+        
+        return cls._tables_formes[type_piece]
+    
     @classmethod
     def obtenir_types_supportes(cls) -> Set[TypePiece]:
         """Obtenir tous les types de pièces supportés."""
         return cls._types_supportes.copy()
     
+    @classmethod
+    def obtenir_types_ordonnes(cls) -> Tuple[TypePiece, ...]:
+        """
+        Obtenir les types supportés dans l'ordre stable de déclaration de TypePiece.
+        
+        Un set d'Enum n'a pas d'ordre reproductible d'un processus à l'autre :
+        les tirages seedés doivent utiliser cet ordre. Le tuple est calculé
+        une seule fois puis partagé jusqu'au prochain enregistrement.
+        
+        Returns:
+            Tuple des types supportés
+        """
+        if cls._types_ordonnes is None:
+            cls._types_ordonnes = tuple(t for t in TypePiece if t in cls._types_supportes)
+        return cls._types_ordonnes
+    
     @classmethod
     def est_type_supporte(cls, type_piece: TypePiece) -> bool:
         """Vérifier si un type de pièce est supporté."""
@@ -98,6 +234,8 @@ class RegistrePieces:
         """Réinitialiser le registre (utile pour les tests)."""
         cls._pieces_enregistrees.clear()
         cls._types_supportes.clear()
+        cls._tables_formes.clear()
+        cls._types_ordonnes = None
     
     @classmethod
     def statistiques(cls) -> str:
@@ -0,0 +1,83 @@
+"""
+InstantanePartie - Capture immuable et compacte de l'état d'une partie
+
+Produit par MoteurPartie.capturer() et relu par MoteurPartie.restaurer() :
+- plateau : un entier par ligne (bit x = cellule occupée), en tuples
+- pièces : type, orientation et pivot compactés dans un seul entier
+- file d'aperçu, état du générateur, statistiques : tuples
+
+Aucun objet mutable n'est partagé avec le moteur : un instantané peut être
+conservé, comparé ou restauré plusieurs fois (rollback réseau, recherche
+de coups, points de reprise après plantage).
+
+Exemple d'usage :
+    instantane = moteur.capturer()
+    moteur.chute_rapide()
+    moteur.restaurer(instantane)  # retour exact à l'état capturé
+"""
+
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+
+from .piece import TypePiece
+
+if TYPE_CHECKING:
+    from .fabriques.generateurs_pieces import EtatGenerateur
+
+
+# Types dans l'ordre de déclaration (l'indice fait partie du codage compact)
+TYPES_PIECES: Tuple[TypePiece, ...] = tuple(TypePiece)
+_INDICES_TYPES = {type_piece: indice for indice, type_piece in enumerate(TYPES_PIECES)}
+
+# Décalage des coordonnées du pivot, pour coder les valeurs négatives sur 6 bits
+_DECALAGE_PIVOT = 16
+
+
+class PieceCompacte(NamedTuple):
+    """Pièce décompactée : type, orientation et pivot."""
+    type_piece: TypePiece
+    orientation: int
+    x: int
+    y: int
+
+
+def compacter_piece(type_piece: TypePiece, orientation: int, x: int, y: int) -> int:
+    """
+    Code une pièce dans un entier : type (3 bits), orientation (2 bits), x et y (6 bits chacun).
+
+    Args:
+        type_piece: Type de la pièce
+        orientation: Index de l'orientation dans la table de formes
+        x: Position X du pivot
+        y: Position Y du pivot (négative en zone invisible)
+
+    Returns:
+        Entier positif représentant la pièce
+    """
+    return (_INDICES_TYPES[type_piece] | (orientation << 3)
+            | ((x + _DECALAGE_PIVOT) << 5) | ((y + _DECALAGE_PIVOT) << 11))
+
+
+def decompacter_piece(code: int) -> PieceCompacte:
+    """Inverse de compacter_piece."""
+    return PieceCompacte(TYPES_PIECES[code & 0b111], (code >> 3) & 0b11,
+                         ((code >> 5) & 0b111111) - _DECALAGE_PIVOT,
+                         ((code >> 11) & 0b111111) - _DECALAGE_PIVOT)
+
+
+class InstantanePartie(NamedTuple):
+    """État complet d'une partie à un instant donné (immuable)."""
+    lignes: Tuple[int, ...]
+    lignes_invisibles: Tuple[Tuple[int, int], ...]
+    piece_active: Optional[int]
+    piece_suivante: Optional[TypePiece]
+    file_pieces: Tuple[TypePiece, ...]
+    generateur: 'EtatGenerateur'
+    # score, lignes complétées, pièces placées, niveau
+    statistiques: Tuple[int, int, int, int]
+    # pièces placées par type, dans l'ordre de TYPES_PIECES
+    pieces_par_type: Tuple[int, ...]
+    en_pause: bool
+    jeu_termine: bool
+    intervalle_chute: float
+    ticks: int
+    ticks_depuis_chute: int
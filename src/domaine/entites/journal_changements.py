@@ -0,0 +1,98 @@
+"""
+JournalChangements - Version monotone et historique borné des changements d'état
+
+Chaque modification enregistrée incrémente la version et ajoute un
+Changement au journal. Un consommateur (rendu, statistiques, évaluation
+mémorisée) retient la dernière version traitée :
+- même version : rien n'a changé, aucun recalcul
+- version plus récente : depuis(version) donne les changements à appliquer
+- None : la version est sortie du journal, tout recalculer
+
+Exemple d'usage :
+    changements = plateau.journal.depuis(version_vue)
+    if changements is None:
+        recalculer_tout()
+    for changement in changements or ():
+        appliquer(changement)
+    version_vue = plateau.version
+"""
+
+from collections import deque
+from enum import Enum
+from typing import Any, List, NamedTuple, Optional
+
+
+class TypeChangement(Enum):
+    """Nature d'un changement journalisé."""
+    CELLULES_AJOUTEES = "cellules_ajoutees"  # donnees : positions figées
+    LIGNES_SUPPRIMEES = "lignes_supprimees"  # donnees : numéros des lignes supprimées
+    PIECE_APPARUE = "piece_apparue"          # donnees : EtatPiece de la nouvelle pièce
+    PIECE_DEPLACEE = "piece_deplacee"        # donnees : EtatPiece après le mouvement
+    PLATEAU_REMPLACE = "plateau_remplace"    # donnees : None (contenu entièrement remplacé)
+
+
+class Changement(NamedTuple):
+    """Un changement d'état, daté par la version qu'il a produite."""
+    version: int
+    type_changement: TypeChangement
+    donnees: Any
+
+
+class JournalChangements:
+    """
+    Compteur de version et journal borné des derniers changements.
+
+    Les changements les plus anciens sont oubliés au-delà de taille_max :
+    la mémoire reste constante quelle que soit la durée de la partie.
+    """
+
+    # Nombre de changements conservés par défaut
+    TAILLE_MAX_DEFAUT = 256
+
+    def __init__(self, taille_max: int = TAILLE_MAX_DEFAUT):
+        """
+        Initialise un journal vide à la version 0.
+
+        Args:
+            taille_max: Nombre maximal de changements conservés
+        """
+        self._version = 0
+        self._changements: deque = deque(maxlen=taille_max)
+
+    @property
+    def version(self) -> int:
+        """Version courante (nombre total de changements enregistrés)."""
+        return self._version
+
+    def enregistrer(self, type_changement: TypeChangement, donnees: Any = None) -> int:
+        """
+        Enregistre un changement et incrémente la version.
+
+        Args:
+            type_changement: Nature du changement
+            donnees: Détail du changement (voir TypeChangement)
+
+        Returns:
+            Nouvelle version
+        """
+        self._version += 1
+        self._changements.append(Changement(self._version, type_changement, donnees))
+        return self._version
+
+    def depuis(self, version: int) -> Optional[List[Changement]]:
+        """
+        Retourne les changements postérieurs à une version, du plus ancien au plus récent.
+
+        Args:
+            version: Dernière version connue du consommateur
+
+        Returns:
+            Liste des changements (vide si rien n'a changé), ou None si
+            certains changements ne sont plus dans le journal
+        """
+        if version == self._version:
+            return []
+        nb_manquants = self._version - version
+        if nb_manquants < 0 or nb_manquants > len(self._changements):
+            return None
+        return list(self._changements)[-nb_manquants:]
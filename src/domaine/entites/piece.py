@@ -15,7 +15,8 @@ Architecture : Template Method + Factory Method patterns
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+import copy
+from typing import List, NamedTuple, Tuple
 
 from .position import Position
 
@@ -42,6 +43,18 @@ class TypePiece(Enum):
     L = "L"
 
 
+class EtatPiece(NamedTuple):
+    """
+    État candidat d'une pièce (orientation, pivot et positions), sans la modifier.
+    
+    Pour une pièce enregistrée, les états sont partagés par la table de
+    formes : les tester n'alloue aucune Position.
+    """
+    orientation: int
+    position_pivot: Position
+    positions: Tuple[Position, ...]
+
+
 @dataclass
 class Piece(ABC):
     """
@@ -60,6 +73,12 @@ class Piece(ABC):
     positions: List[Position]
     position_pivot: Position
     
+    # Orientation courante (index dans la table de formes du type de pièce)
+    _orientation = 0
+    
+    # Table de formes précalculée, injectée par RegistrePieces à l'enregistrement
+    _table_formes = None
+    
     @property
     @abstractmethod
     def type_piece(self) -> TypePiece:
@@ -86,10 +105,18 @@ class Piece(ABC):
         
         Contrairement aux Value Objects, les Entities mutent leur état.
         
+        Pour une pièce enregistrée, les positions sont lues dans la table de
+        formes (orientation + nouveau pivot) au lieu d'être recalculées.
+        
         Args:
             delta_x: Déplacement horizontal
             delta_y: Déplacement vertical
         """
+        if self._table_formes is not None:
+            pivot = self.position_pivot
+            self._placer_selon_table(self._orientation, pivot.x + delta_x, pivot.y + delta_y)
+            return
+        
         nouvelles_positions = []
         for position in self.positions:
             nouvelle_position = position.deplacer(delta_x, delta_y)
@@ -98,6 +125,84 @@ class Piece(ABC):
         self.positions = nouvelles_positions
         self.position_pivot = self.position_pivot.deplacer(delta_x, delta_y)
     
+    def _placer_selon_table(self, orientation: int, x_pivot: int, y_pivot: int) -> None:
+        """
+        Positionne la pièce à partir de la table de formes précalculée.
+        
+        Args:
+            orientation: Index de l'orientation dans la table
+            x_pivot: Position X du pivot
+            y_pivot: Position Y du pivot
+        """
+        self.appliquer_etat(self._table_formes.etat(orientation, x_pivot, y_pivot))
+    
+    def etat_apres(self, delta_x: int = 0, delta_y: int = 0, rotation: int = 0) -> EtatPiece:
+        """
+        Calcule l'état qu'aurait la pièce après un mouvement, sans la modifier.
+        
+        Permet de vérifier un mouvement avant de l'appliquer
+        (plateau.peut_placer_positions(etat.positions)), puis de ne
+        valider que les mouvements légaux avec appliquer_etat().
+        
+        Args:
+            delta_x: Déplacement horizontal
+            delta_y: Déplacement vertical
+            rotation: Nombre de quarts de tour horaires
+            
+        Returns:
+            État candidat de la pièce
+        """
+        table = self._table_formes
+        if table is not None:
+            pivot = self.position_pivot
+            orientation = (self._orientation + rotation) % table.nb_orientations
+            return table.etat(orientation, pivot.x + delta_x, pivot.y + delta_y)
+        
+        # Pièce sans table de formes : simuler le mouvement sur une copie
+        essai = copy.deepcopy(self)
+        for _ in range(rotation):
+            essai.tourner()
+        essai.deplacer(delta_x, delta_y)
+        return EtatPiece(essai._orientation, essai.position_pivot, tuple(essai.positions))
+    
+    def appliquer_etat(self, etat: EtatPiece) -> None:
+        """
+        Applique un état calculé par etat_apres() (mutation de l'Entity).
+        
+        Args:
+            etat: État à appliquer
+        """
+        self._orientation = etat.orientation
+        self.position_pivot = etat.position_pivot
+        self.positions = list(etat.positions)
+    
+    def _tourner_selon_table(self) -> None:
+        """Passe à l'orientation suivante de la table (rotation horaire)."""
+        orientation = (self._orientation + 1) % self._table_formes.nb_orientations
+        pivot = self.position_pivot
+        self._placer_selon_table(orientation, pivot.x, pivot.y)
+    
+    def obtenir_jupe(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Retourne la jupe de la pièce : la cellule la plus basse de chaque colonne.
+        
+        Lue dans la jupe précalculée de l'orientation courante pour une pièce
+        enregistrée, recalculée à partir des positions sinon.
+        
+        Returns:
+            Couples (x, y le plus bas), un par colonne occupée par la pièce
+        """
+        if self._table_formes is not None:
+            pivot = self.position_pivot
+            return tuple((pivot.x + dx, pivot.y + dy)
+                         for dx, dy in self._table_formes.jupes[self._orientation])
+        
+        jupe = {}
+        for position in self.positions:
+            if position.x not in jupe or position.y > jupe[position.x]:
+                jupe[position.x] = position.y
+        return tuple(sorted(jupe.items()))
+    
     @abstractmethod 
     def tourner(self) -> None:
         """
@@ -27,6 +27,15 @@ class PieceI(Piece):
     - 2 orientations : horizontal ↔ vertical
     - Pivot : centre de la ligne
     """
+
+    # Table des formes (offsets relatifs au pivot), dans l'ordre de rotation.
+    # Construite une seule fois par RegistrePieces à l'enregistrement.
+    FORMES = (
+        # 0 - Horizontal : ████ (pivot en 2e position)
+        ((-1, 0), (0, 0), (1, 0), (2, 0)),
+        # 1 - Vertical : █ (pivot en 2e position, de haut en bas)
+        ((0, -1), (0, 0), (0, 1), (0, 2)),
+    )
     
     @property
     def type_piece(self) -> TypePiece:
@@ -53,6 +62,7 @@ class PieceI(Piece):
         
         instance.positions = positions_initiales
         instance.position_pivot = position_pivot
+        instance._orientation = 0  # 0=Horizontal, 1=Vertical
         
         return instance
     
@@ -80,59 +90,9 @@ class PieceI(Piece):
         """
         Rotation PieceI : alterne entre horizontal et vertical.
         
-        Horizontal → Vertical : Positions autour du pivot
-        Vertical → Horizontal : Retour à la position horizontale
-        
-        Logique :
-        - Détecte orientation actuelle
-        - Calcule nouvelles positions autour du pivot
-        - Met à jour les positions (Entity behavior)
-        """
-        if self._est_horizontal():
-            self._devenir_vertical()
-        else:
-            self._devenir_horizontal()
-    
-    def _est_horizontal(self) -> bool:
-        """
-        Détermine si la pièce est en orientation horizontale.
-        
-        Returns:
-            True si horizontal (même y pour toutes positions)
-        """
-        y_premier = self.positions[0].y
-        return all(pos.y == y_premier for pos in self.positions)
-    
-    def _devenir_vertical(self) -> None:
-        """
-        Transforme la pièce en orientation verticale.
-        
-        Calcule 4 positions en colonne autour du pivot :
-        [pivot.x, pivot.y-1], [pivot.x, pivot.y] (le pivot), [pivot.x, pivot.y+1], [pivot.x, pivot.y+2]
-        """
-        x_pivot = self.position_pivot.x
-        y_pivot = self.position_pivot.y
+        Horizontal → Vertical → Horizontal → ...
         
-        self.positions = [
-            Position(x_pivot, y_pivot - 1),  # [pivot.x, pivot.y-1]
-            Position(x_pivot, y_pivot),      # [pivot.x, pivot.y] (le pivot de la pièce)
-            Position(x_pivot, y_pivot + 1),  # [pivot.x, pivot.y+1]
-            Position(x_pivot, y_pivot + 2)   # [pivot.x, pivot.y+2]
-        ]
-    
-    def _devenir_horizontal(self) -> None:
+        Les positions sont lues dans la table FORMES autour du pivot
+        (Entity behavior : mutation de l'état de la pièce).
         """
-        Transforme la pièce en orientation horizontale.
-        
-        Calcule 4 positions en ligne autour du pivot :
-        [pivot.x-1, pivot.y], [pivot.x, pivot.y] (le pivot), [pivot.x+1, pivot.y], [pivot.x+2, pivot.y]
-        """
-        x_pivot = self.position_pivot.x
-        y_pivot = self.position_pivot.y
-        
-        self.positions = [
-            Position(x_pivot - 1, y_pivot),  # [pivot.x-1, pivot.y]
-            Position(x_pivot, y_pivot),      # [pivot.x, pivot.y] (le pivot de la pièce)
-            Position(x_pivot + 1, y_pivot),  # [pivot.x+1, pivot.y]
-            Position(x_pivot + 2, y_pivot)   # [pivot.x+2, pivot.y]
-        ]
+        self._tourner_selon_table()
@@ -30,6 +30,25 @@ class PieceJ(Piece):
     - Factory Method (méthode creer)
     - Registry Pattern (auto-enregistrement)
     """
+
+    # Table des formes (offsets relatifs au pivot), dans l'ordre de rotation.
+    # Construite une seule fois par RegistrePieces à l'enregistrement.
+    FORMES = (
+        # 0 - Nord (J classique) : █
+        #                          ███
+        ((-1, -1), (-1, 0), (0, 0), (1, 0)),
+        # 1 - Est : ██
+        #           █
+        #           █
+        ((0, -1), (0, 0), (0, 1), (1, -1)),
+        # 2 - Sud : ███
+        #             █
+        ((-1, 0), (0, 0), (1, 0), (1, 1)),
+        # 3 - Ouest :  █
+        #              █
+        #             ██
+        ((0, -1), (0, 0), (0, 1), (-1, 1)),
+    )
     
     def __init__(self):
         """Constructeur appelé par le factory method."""
@@ -92,76 +111,7 @@ class PieceJ(Piece):
         Rotation de la pièce J (4 orientations).
         
         Nord → Est → Sud → Ouest → Nord → ...
-        """
-        self._orientation = (self._orientation + 1) % 4
-        
-        if self._orientation == 0:
-            self._devenir_nord()
-        elif self._orientation == 1:
-            self._devenir_est()
-        elif self._orientation == 2:
-            self._devenir_sud()
-        else:  # self._orientation == 3
-            self._devenir_ouest()
-
-    def _devenir_nord(self) -> None:
-        """
-        Passage en orientation Nord (J classique).
         
-        Configuration Nord autour du pivot (doit correspondre aux positions initiales) :
-        █     ← [pivot.x-1, pivot.y-1]
-        ███   ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (le pivot de la pièce), [pivot.x+1, pivot.y]
+        Simple changement d'index dans la table FORMES autour du pivot fixe.
         """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y - 1),  # Haut-gauche
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # Gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x + 1, self.position_pivot.y)       # Droite
-        ]
-
-    def _devenir_est(self) -> None:
-        """
-        Passage en orientation Est (J vers la droite).
-        
-        Configuration Est autour du pivot :
-        ██    ← [pivot.x, pivot.y-1] et [pivot.x+1, pivot.y-1]
-        █     ← [pivot.x, pivot.y] (le pivot de la pièce)
-        █     ← [pivot.x, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut (pivot vertical)
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y + 1),      # Bas (pivot vertical)
-            Position(self.position_pivot.x + 1, self.position_pivot.y - 1)   # Extension haut-droite
-        ]
-
-    def _devenir_sud(self) -> None:
-        """
-        Passage en orientation Sud (J inversé / L normal).
-        
-        Configuration Sud autour du pivot :
-        ███   ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (le pivot de la pièce), [pivot.x+1, pivot.y]
-          █   ← [pivot.x+1, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # Coude-gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Coude-centre (pivot)
-            Position(self.position_pivot.x + 1, self.position_pivot.y),      # Coude-droite
-            Position(self.position_pivot.x + 1, self.position_pivot.y + 1)   # Bas-droite
-        ]
-
-    def _devenir_ouest(self) -> None:
-        """
-        Passage en orientation Ouest (J vers la gauche).
-        
-        Configuration Ouest autour du pivot :
-         █     ← [pivot.x, pivot.y-1]
-         █     ← [pivot.x, pivot.y] (le pivot de la pièce)  
-        ██     ← [pivot.x-1, pivot.y+1] et [pivot.x, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut (pivot vertical)
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y + 1),      # Bas (pivot vertical)
-            Position(self.position_pivot.x - 1, self.position_pivot.y + 1)   # Extension bas-gauche
-        ]
+        self._tourner_selon_table()
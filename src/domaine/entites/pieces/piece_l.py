@@ -32,6 +32,25 @@ class PieceL(Piece):
     - Factory Method (méthode creer)
     - Registry Pattern (auto-enregistrement)
     """
+
+    # Table des formes (offsets relatifs au pivot), dans l'ordre de rotation.
+    # Construite une seule fois par RegistrePieces à l'enregistrement.
+    FORMES = (
+        # 0 - Nord (L classique) :   █
+        #                          ███
+        ((1, -1), (0, 0), (-1, 0), (1, 0)),
+        # 1 - Est : █
+        #           █
+        #           ██
+        ((0, -1), (0, 0), (0, 1), (1, 1)),
+        # 2 - Sud : ███
+        #           █
+        ((-1, 1), (0, 0), (1, 0), (-1, 0)),
+        # 3 - Ouest : ██
+        #              █
+        #              █
+        ((-1, -1), (0, 0), (0, -1), (0, 1)),
+    )
     
     def __init__(self):
         """Constructeur appelé par le factory method."""
@@ -93,77 +112,8 @@ class PieceL(Piece):
         Rotation de la pièce L (4 orientations).
         
         Nord → Est → Sud → Ouest → Nord
-        Chaque rotation se fait autour du pivot fixe.
-        """
-        self._orientation = (self._orientation + 1) % 4
-        
-        if self._orientation == 0:
-            self._devenir_nord()
-        elif self._orientation == 1:
-            self._devenir_est()
-        elif self._orientation == 2:
-            self._devenir_sud()
-        else:  # self._orientation == 3
-            self._devenir_ouest()
-
-    def _devenir_nord(self) -> None:
-        """
-        Passage en orientation Nord (L classique).
         
-        Configuration Nord autour du pivot :
-          █  ← [pivot.x+1, pivot.y-1]
-        ███  ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (pivot), [pivot.x+1, pivot.y]
+        Chaque rotation se fait autour du pivot fixe, par simple changement
+        d'index dans la table FORMES.
         """
-        self.positions = [
-            Position(self.position_pivot.x + 1, self.position_pivot.y - 1),  # Haut-droite
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # Gauche
-            Position(self.position_pivot.x + 1, self.position_pivot.y)       # Droite
-        ]
-
-    def _devenir_est(self) -> None:
-        """
-        Passage en orientation Est (L vers la droite).
-        
-        Configuration Est autour du pivot :
-        █   ← [pivot.x, pivot.y-1]
-        █   ← [pivot.x, pivot.y] (pivot)
-        ██  ← [pivot.x, pivot.y+1] et [pivot.x+1, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y + 1),      # Bas
-            Position(self.position_pivot.x + 1, self.position_pivot.y + 1)   # Bas-droite
-        ]
-
-    def _devenir_sud(self) -> None:
-        """
-        Passage en orientation Sud (L inversé).
-        
-        Configuration Sud autour du pivot :
-        ███  ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (pivot), [pivot.x+1, pivot.y]
-          █  ← [pivot.x-1, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y + 1),  # Bas-gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x + 1, self.position_pivot.y),      # Droite
-            Position(self.position_pivot.x - 1, self.position_pivot.y)       # Gauche
-        ]
-
-    def _devenir_ouest(self) -> None:
-        """
-        Passage en orientation Ouest (L vers la gauche).
-        
-        Configuration Ouest autour du pivot :
-        ██  ← [pivot.x-1, pivot.y-1] et [pivot.x, pivot.y-1]
-         █  ← [pivot.x, pivot.y] (pivot)
-         █  ← [pivot.x, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y - 1),  # Haut-gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut
-            Position(self.position_pivot.x, self.position_pivot.y + 1)       # Bas
-        ]
+        self._tourner_selon_table()
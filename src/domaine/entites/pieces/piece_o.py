@@ -26,6 +26,13 @@ class PieceO(Piece):
     - Pivot : coin supérieur gauche du carré
     - Démontre polymorphisme avec rotation no-op
     """
+
+    # Table des formes (offsets relatifs au pivot) : une seule orientation.
+    FORMES = (
+        # 0 - Carré : ██ (pivot = coin supérieur gauche)
+        #             ██
+        ((0, 0), (1, 0), (0, 1), (1, 1)),
+    )
     
     @property
     def type_piece(self) -> TypePiece:
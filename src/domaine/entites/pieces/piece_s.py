@@ -28,6 +28,18 @@ class PieceS(Piece):
     - Factory Method (méthode creer)
     - Registry Pattern (auto-enregistrement)
     """
+
+    # Table des formes (offsets relatifs au pivot), dans l'ordre de rotation.
+    # Construite une seule fois par RegistrePieces à l'enregistrement.
+    FORMES = (
+        # 0 - Horizontal :  ██
+        #                  ██
+        ((0, -1), (1, -1), (-1, 0), (0, 0)),
+        # 1 - Vertical : █
+        #                ██
+        #                 █
+        ((0, -1), (0, 0), (1, 0), (1, 1)),
+    )
     
     def __init__(self):
         """Constructeur appelé par le factory method."""
@@ -54,7 +66,7 @@ class PieceS(Piece):
         
         instance.positions = positions_initiales
         instance.position_pivot = position_pivot
-        instance._est_vertical = False
+        instance._orientation = 0  # 0=Horizontal, 1=Vertical
         
         return instance
 
@@ -91,40 +103,4 @@ class PieceS(Piece):
         
         Horizontal → Vertical → Horizontal → ...
         """
-        if self._est_vertical:
-            self._devenir_horizontal()
-        else:
-            self._devenir_vertical()
-        
-        self._est_vertical = not self._est_vertical
-
-    def _devenir_vertical(self) -> None:
-        """
-        Passage en orientation verticale.
-        
-        Configuration verticale autour du pivot :
-        █     ← [pivot.x, pivot.y-1]
-        ██    ← [pivot.x, pivot.y] (le pivot de la pièce) et [pivot.x+1, pivot.y]
-         █    ← [pivot.x+1, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # [pivot.x, pivot.y-1]
-            Position(self.position_pivot.x, self.position_pivot.y),          # [pivot.x, pivot.y] (le pivot de la pièce)
-            Position(self.position_pivot.x + 1, self.position_pivot.y),      # [pivot.x+1, pivot.y]
-            Position(self.position_pivot.x + 1, self.position_pivot.y + 1)   # [pivot.x+1, pivot.y+1]
-        ]
-
-    def _devenir_horizontal(self) -> None:
-        """
-        Passage en orientation horizontale.
-        
-        Configuration horizontale autour du pivot :
-         ██   ← [pivot.x, pivot.y-1] et [pivot.x+1, pivot.y-1]
-        ██    ← [pivot.x-1, pivot.y] et [pivot.x, pivot.y] (le pivot de la pièce)
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # [pivot.x, pivot.y-1]
-            Position(self.position_pivot.x + 1, self.position_pivot.y - 1),  # [pivot.x+1, pivot.y-1]  
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # [pivot.x-1, pivot.y]
-            Position(self.position_pivot.x, self.position_pivot.y)           # [pivot.x, pivot.y] (le pivot de la pièce)
-        ]
+        self._tourner_selon_table()
@@ -8,7 +8,7 @@ La PieceT a 4 orientations possibles :
 - Ouest : T vers la gauche (branche vers la droite)
 
 🔧 REFACTORING : Architecture harmonisée avec PieceJ et PieceL
-- Utilisation des méthodes _devenir_xxx() au lieu de _obtenir_positions_pour_orientation()
+- Orientations décrites par la table FORMES (offsets relatifs au pivot)
 - Suppression des coordonnées absolues complexes (_x_pivot_absolu, _y_pivot_absolu)
 - Architecture simple et cohérente avec les autres pièces
 """
@@ -22,6 +22,25 @@ from ..fabriques.registre_pieces import piece_tetris
 @piece_tetris(TypePiece.T)
 class PieceT(Piece):
     """Pièce en T avec 4 orientations possibles."""
+
+    # Table des formes (offsets relatifs au pivot), dans l'ordre de rotation horaire.
+    # Construite une seule fois par RegistrePieces à l'enregistrement.
+    FORMES = (
+        # 0 - Nord (T normal) :   █
+        #                        ███
+        ((-1, 0), (0, 0), (1, 0), (0, -1)),
+        # 1 - Ouest (branche vers la droite) : █
+        #                                      ██
+        #                                      █
+        ((0, -1), (0, 0), (0, 1), (1, 0)),
+        # 2 - Sud (T inversé) : ███
+        #                        █
+        ((-1, 0), (0, 0), (1, 0), (0, 1)),
+        # 3 - Est (branche vers la gauche) :  █
+        #                                    ██
+        #                                     █
+        ((0, -1), (0, 0), (0, 1), (-1, 0)),
+    )
     
     def __init__(self):
         """Constructeur privé - utiliser PieceT.creer() à la place."""
@@ -83,76 +102,7 @@ class PieceT(Piece):
         Rotation de la pièce T (4 orientations) - SENS HORAIRE.
         
         Nord → Ouest → Sud → Est → Nord → ...
-        """
-        self._orientation = (self._orientation + 1) % 4
-        
-        if self._orientation == 0:
-            self._devenir_nord()
-        elif self._orientation == 1:
-            self._devenir_ouest()  # HORAIRE : Nord → Ouest
-        elif self._orientation == 2:
-            self._devenir_sud()
-        else:  # self._orientation == 3
-            self._devenir_est()    # HORAIRE : Sud → Est
-
-    def _devenir_nord(self) -> None:
-        """
-        Passage en orientation Nord (T normal).
         
-        Configuration Nord autour du pivot :
-          █   ← [pivot.x, pivot.y-1] (branche vers le haut)
-         ███   ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (le pivot), [pivot.x+1, pivot.y]
+        Simple changement d'index dans la table FORMES autour du pivot fixe.
         """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # Gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x + 1, self.position_pivot.y),      # Droite
-            Position(self.position_pivot.x, self.position_pivot.y - 1)       # Branche vers le haut
-        ]
-
-    def _devenir_est(self) -> None:
-        """
-        Passage en orientation Est (T vers la droite).
-        
-        Configuration Est autour du pivot :
-         █    ← [pivot.x, pivot.y-1]
-        ██    ← [pivot.x-1, pivot.y] et [pivot.x, pivot.y] (le pivot)
-         █    ← [pivot.x, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y + 1),      # Bas
-            Position(self.position_pivot.x - 1, self.position_pivot.y)       # Branche vers la gauche
-        ]
-
-    def _devenir_sud(self) -> None:
-        """
-        Passage en orientation Sud (T inversé).
-        
-        Configuration Sud autour du pivot :
-         ███   ← [pivot.x-1, pivot.y], [pivot.x, pivot.y] (le pivot), [pivot.x+1, pivot.y]
-          █    ← [pivot.x, pivot.y+1] (branche vers le bas)
-        """
-        self.positions = [
-            Position(self.position_pivot.x - 1, self.position_pivot.y),      # Gauche
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x + 1, self.position_pivot.y),      # Droite
-            Position(self.position_pivot.x, self.position_pivot.y + 1)       # Branche vers le bas
-        ]
-
-    def _devenir_ouest(self) -> None:
-        """
-        Passage en orientation Ouest (T vers la gauche).
-        
-        Configuration Ouest autour du pivot :
-        █     ← [pivot.x, pivot.y-1]
-        ██    ← [pivot.x, pivot.y] (le pivot) et [pivot.x+1, pivot.y]
-        █     ← [pivot.x, pivot.y+1]
-        """
-        self.positions = [
-            Position(self.position_pivot.x, self.position_pivot.y - 1),      # Haut
-            Position(self.position_pivot.x, self.position_pivot.y),          # Pivot
-            Position(self.position_pivot.x, self.position_pivot.y + 1),      # Bas
-            Position(self.position_pivot.x + 1, self.position_pivot.y)       # Branche vers la droite
-        ]
+        self._tourner_selon_table()
@@ -11,14 +11,55 @@ Responsabilités :
 - Placer les pièces
 - Détecter et supprimer les lignes complètes
 - Faire descendre les lignes au-dessus
+- Tenir à jour l'index des sommets de colonnes et du remplissage des lignes
+- Versionner et journaliser ses changements (cellules ajoutées, lignes supprimées)
+- Tenir à jour sa clé Zobrist (XOR des clés des cellules occupées)
 """
 
-from typing import List, Set, Optional
+from typing import Iterable, List, Set, Optional, Tuple
 from .position import Position
 from .piece import Piece, TypePiece
+from .journal_changements import JournalChangements, TypeChangement
+from .zobrist import cle_cellule
 from ..exceptions.exception_collision import ExceptionCollision
 
 
+class _CellulesOccupees(set):
+    """
+    Ensemble des cellules occupées qui se marque comme modifié à chaque mutation.
+
+    Le plateau tient son index à jour lui-même ; une modification faite
+    directement sur l'ensemble (tests, outils) lève le marqueur et l'index
+    est reconstruit à la lecture suivante.
+    """
+
+    def __init__(self, cellules: Iterable[Position] = ()):
+        super().__init__(cellules)
+        self.modifiees = False
+
+    def _mutation(methode):
+        def enveloppe(self, *args):
+            self.modifiees = True
+            return methode(self, *args)
+        enveloppe.__name__ = methode.__name__
+        return enveloppe
+
+    add = _mutation(set.add)
+    discard = _mutation(set.discard)
+    remove = _mutation(set.remove)
+    pop = _mutation(set.pop)
+    clear = _mutation(set.clear)
+    update = _mutation(set.update)
+    difference_update = _mutation(set.difference_update)
+    intersection_update = _mutation(set.intersection_update)
+    symmetric_difference_update = _mutation(set.symmetric_difference_update)
+    __ior__ = _mutation(set.__ior__)
+    __iand__ = _mutation(set.__iand__)
+    __isub__ = _mutation(set.__isub__)
+    __ixor__ = _mutation(set.__ixor__)
+    del _mutation
+
+
 class Plateau:
     """
     Plateau de jeu Tetris avec grille 10×20.
@@ -51,13 +92,49 @@ class Plateau:
         if self.largeur <= 0 or self.hauteur <= 0:
             raise ValueError(f"Dimensions invalides: {self.largeur}x{self.hauteur}")
         
-        self._positions_occupees: Set[Position] = set()
+        self._positions_occupees = _CellulesOccupees()
+        
+        # Index incrémental, mis à jour au placement et reconstruit après suppression de lignes :
+        # - plus petit y occupé de chaque colonne (hauteur si la colonne est vide)
+        # - nombre de cellules occupées de chaque ligne visible
+        # (une modification directe de _positions_occupees le fait reconstruire)
+        self._sommets: List[int] = [self.hauteur] * self.largeur
+        self._remplissage: List[int] = [0] * self.hauteur
+        
+        # Version et journal borné des changements, pour les caches des consommateurs
+        self.journal = JournalChangements()
+        
+        # Clé Zobrist de l'occupation, mise à jour par XOR à chaque cellule figée
+        self._cle_zobrist = 0
+    
+    @property
+    def version(self) -> int:
+        """Version du plateau, incrémentée à chaque changement journalisé."""
+        return self.journal.version
+    
+    @property
+    def cle_zobrist(self) -> int:
+        """Clé 64 bits de l'occupation : deux plateaux de même contenu ont la même clé."""
+        self._verifier_index()
+        return self._cle_zobrist
     
     @property
     def positions_occupees(self) -> Set[Position]:
         """Retourne les positions actuellement occupées (lecture seule)."""
         return self._positions_occupees.copy()
     
+    @property
+    def hauteurs_colonnes(self) -> Tuple[int, ...]:
+        """Retourne la hauteur de chaque colonne (0 = colonne vide), de gauche à droite."""
+        self._verifier_index()
+        return tuple(self.hauteur - sommet for sommet in self._sommets)
+    
+    @property
+    def remplissage_lignes(self) -> Tuple[int, ...]:
+        """Retourne le nombre de cellules occupées de chaque ligne visible, de haut en bas."""
+        self._verifier_index()
+        return tuple(self._remplissage)
+    
     def est_position_valide(self, position: Position) -> bool:
         """
         Vérifie si une position est dans les limites du plateau.
@@ -103,7 +180,118 @@ class Plateau:
         Returns:
             True si la pièce peut être placée, False sinon
         """
-        return all(self.est_position_libre(pos) for pos in piece.positions)
+        return self.peut_placer_positions(piece.positions)
+    
+    def peut_placer_positions(self, positions: Iterable[Position]) -> bool:
+        """
+        Vérifie si des positions candidates sont toutes libres.
+        
+        Sert à tester un mouvement avant de l'appliquer (voir Piece.etat_apres).
+        
+        Args:
+            positions: Positions à vérifier
+            
+        Returns:
+            True si toutes les positions sont libres, False sinon
+        """
+        return all(self.est_position_libre(pos) for pos in positions)
+    
+    def distance_de_chute(self, piece: Piece) -> int:
+        """
+        Calcule de combien de lignes la pièce peut descendre avant de toucher.
+        
+        Utilise la jupe de la pièce (cellule la plus basse de chaque colonne)
+        et le sommet de chaque colonne : O(largeur de la pièce) au lieu d'un
+        test de collision complet par ligne descendue. Seule une colonne dont
+        la pièce est déjà sous le sommet (surplomb) est parcourue cellule par cellule.
+        
+        Args:
+            piece: Pièce à faire tomber (supposée à une position valide)
+            
+        Returns:
+            Nombre de lignes de chute possibles (0 si la pièce est posée)
+        """
+        self._verifier_index()
+        jupe = piece.obtenir_jupe()
+        # Borne sans plafond : une pièce au-dessus du plateau (y < 0) tombe jusqu'au fond
+        distance = self.hauteur - min(y_bas for _, y_bas in jupe) - 1
+        for x, y_bas in jupe:
+            if not 0 <= x < self.largeur or y_bas >= self.hauteur:
+                return 0
+            sommet = self._sommets[x]
+            if y_bas < sommet:
+                distance_colonne = sommet - y_bas - 1
+            else:
+                # Pièce sous un surplomb : chercher la première cellule occupée dessous
+                y = y_bas + 1
+                while y < self.hauteur and self.est_position_libre(Position(x, y)):
+                    y += 1
+                distance_colonne = y - y_bas - 1
+            if distance_colonne < distance:
+                distance = distance_colonne
+        return distance
+    
+    def _indexer_cellule(self, x: int, y: int) -> None:
+        """Ajoute une cellule occupée à l'index des sommets et du remplissage."""
+        if 0 <= x < self.largeur and y < self.hauteur:
+            if y < self._sommets[x]:
+                self._sommets[x] = y
+            if y >= 0:
+                self._remplissage[y] += 1
+    
+    def _reconstruire_index(self) -> None:
+        """Recalcule entièrement l'index (et la clé Zobrist) à partir des cellules occupées."""
+        self._sommets = [self.hauteur] * self.largeur
+        self._remplissage = [0] * self.hauteur
+        cle = 0
+        for position in self._positions_occupees:
+            self._indexer_cellule(position.x, position.y)
+            cle ^= cle_cellule(position.x, position.y)
+        self._cle_zobrist = cle
+        self._positions_occupees.modifiees = False
+    
+    def _verifier_index(self) -> None:
+        """Reconstruit l'index si les cellules ont été modifiées sans passer par le plateau."""
+        if self._positions_occupees.modifiees:
+            self._reconstruire_index()
+    
+    def obtenir_masques(self) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, int], ...]]:
+        """
+        Retourne l'occupation en masques de bits (bit x de la ligne y = cellule (x, y) occupée).
+        
+        Returns:
+            (masques des lignes visibles de haut en bas,
+             couples (y, masque) non vides de la zone invisible, par y croissant)
+        """
+        lignes = [0] * self.hauteur
+        invisibles = {}
+        for position in self._positions_occupees:
+            if position.y >= 0:
+                lignes[position.y] |= 1 << position.x
+            else:
+                invisibles[position.y] = invisibles.get(position.y, 0) | (1 << position.x)
+        return tuple(lignes), tuple(sorted(invisibles.items()))
+    
+    def charger_masques(self, lignes: Iterable[int],
+                        lignes_invisibles: Iterable[Tuple[int, int]] = ()) -> None:
+        """
+        Remplace tout le contenu du plateau (restauration d'un état enregistré).
+        
+        Args:
+            lignes: Masques des lignes visibles, de haut en bas
+            lignes_invisibles: Couples (y, masque) de la zone invisible
+        """
+        positions = set()
+        for y, ligne in list(lignes_invisibles) + list(enumerate(lignes)):
+            x = 0
+            while ligne:
+                if ligne & 1:
+                    positions.add(Position(x, y))
+                ligne >>= 1
+                x += 1
+        self._positions_occupees = _CellulesOccupees(positions)
+        self._reconstruire_index()
+        self.journal.enregistrer(TypeChangement.PLATEAU_REMPLACE)
     
     def placer_piece_et_supprimer_lignes(self, piece: Piece) -> int:
         """
@@ -123,9 +311,14 @@ class Plateau:
             return -1
         
         # Opération atomique
-        # 1. Placer la pièce
+        # 1. Placer la pièce (et l'indexer)
+        self._verifier_index()
         for position in piece.positions:
             self._positions_occupees.add(position)
+            self._indexer_cellule(position.x, position.y)
+            self._cle_zobrist ^= cle_cellule(position.x, position.y)
+        self._positions_occupees.modifiees = False
+        self.journal.enregistrer(TypeChangement.CELLULES_AJOUTEES, tuple(piece.positions))
         
         # 2. Détecter et supprimer immédiatement les lignes complètes
         lignes_completes = self.obtenir_lignes_completes()
@@ -141,17 +334,10 @@ class Plateau:
         Returns:
             Liste des numéros de lignes complètes, triée par ordre croissant
         """
-        lignes_completes = []
-        
-        # Vérifier chaque ligne de haut en bas
-        for y in range(self.hauteur):
-            positions_ligne = [Position(x, y) for x in range(self.largeur)]
-            
-            # Si toutes les positions de la ligne sont occupées
-            if all(pos in self._positions_occupees for pos in positions_ligne):
-                lignes_completes.append(y)
-        
-        return lignes_completes
+        # Une ligne est complète quand son compteur de remplissage atteint la largeur
+        self._verifier_index()
+        largeur = self.largeur
+        return [y for y, remplissage in enumerate(self._remplissage) if remplissage == largeur]
     
     def supprimer_lignes(self, numeros_lignes: List[int]) -> int:
         """
@@ -192,7 +378,9 @@ class Plateau:
             nouvelles_positions.add(nouvelle_pos)
         
         # 3. Remplacer toutes les positions par les nouvelles
-        self._positions_occupees = nouvelles_positions
+        self._positions_occupees = _CellulesOccupees(nouvelles_positions)
+        self._reconstruire_index()
+        self.journal.enregistrer(TypeChangement.LIGNES_SUPPRIMEES, tuple(sorted(lignes_a_supprimer)))
         
         return len(numeros_lignes)
     
@@ -0,0 +1,301 @@
+"""
+PlateauBitboard - Moteur de stockage du plateau par masques de bits
+
+Variante de Plateau où chaque ligne de la grille est un entier :
+le bit x de la ligne y vaut 1 si la cellule (x, y) est occupée.
+
+Avantages par rapport au stockage Set[Position] :
+- Ligne complète : une seule comparaison avec le masque plein
+- Suppression de lignes : un simple découpage de liste
+- Aucune création d'objets Position pendant la détection des lignes
+- Clé Zobrist mise à jour ligne par ligne (seules les lignes déplacées sont rehachées)
+
+L'API publique est identique à celle de Plateau (peut_placer_piece,
+placer_piece_et_supprimer_lignes, positions_occupees...), ce qui permet
+d'utiliser l'un ou l'autre moteur de manière interchangeable.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+from .position import Position
+from .piece import Piece
+from .plateau import Plateau
+from .journal_changements import TypeChangement
+from .zobrist import cle_cellule, cle_ligne
+
+
+class PlateauBitboard(Plateau):
+    """
+    Plateau de jeu Tetris stocké sous forme d'un entier par ligne.
+
+    Pattern utilisé :
+    - Strategy (moteur de stockage alternatif de Plateau)
+    - Entity (gère son propre état)
+
+    La zone invisible (y < 0) est conservée dans un dictionnaire séparé,
+    car elle n'est utilisée que lorsqu'une pièce se fige au-dessus du plateau.
+    """
+
+    def __init__(self, largeur: int = None, hauteur: int = None):
+        """
+        Initialise un plateau vide avec une ligne entière à 0 par rangée.
+
+        Args:
+            largeur: Largeur du plateau (défaut: 10 - standard Tetris)
+            hauteur: Hauteur du plateau (défaut: 20 - standard Tetris)
+        """
+        super().__init__(largeur, hauteur)
+
+        # Masque d'une ligne complète (largeur bits à 1)
+        self._masque_plein = (1 << self.largeur) - 1
+
+        # Lignes visibles : index y -> masque des colonnes occupées
+        self._lignes: List[int] = [0] * self.hauteur
+
+        # Lignes de la zone invisible (y < 0), rarement utilisées
+        self._lignes_invisibles: Dict[int, int] = {}
+
+    @property
+    def positions_occupees(self) -> Set[Position]:
+        """Retourne les positions actuellement occupées (reconstruites à partir des bits)."""
+        positions = set()
+        for y, ligne in self._iterer_lignes_non_vides():
+            x = 0
+            while ligne:
+                if ligne & 1:
+                    positions.add(Position(x, y))
+                ligne >>= 1
+                x += 1
+        return positions
+
+    @property
+    def lignes(self) -> Tuple[int, ...]:
+        """Retourne les masques des lignes visibles (lecture seule, de haut en bas)."""
+        return tuple(self._lignes)
+
+    def _iterer_lignes_non_vides(self):
+        """Itère sur les couples (y, masque) non vides, zone invisible comprise."""
+        for y in sorted(self._lignes_invisibles):
+            if self._lignes_invisibles[y]:
+                yield y, self._lignes_invisibles[y]
+        for y, ligne in enumerate(self._lignes):
+            if ligne:
+                yield y, ligne
+
+    def _obtenir_ligne(self, y: int) -> int:
+        """Retourne le masque de la ligne y (zone invisible comprise)."""
+        if y >= 0:
+            return self._lignes[y]
+        return self._lignes_invisibles.get(y, 0)
+
+    def est_position_libre(self, position: Position) -> bool:
+        """
+        Vérifie si une position est libre (dans les limites et non occupée).
+
+        Même règle que Plateau : y négatif autorisé (zone invisible).
+
+        Args:
+            position: Position à vérifier
+
+        Returns:
+            True si la position est libre, False sinon
+        """
+        x, y = position.x, position.y
+        if not (0 <= x < self.largeur and y < self.hauteur):
+            return False
+        return not (self._obtenir_ligne(y) >> x) & 1
+
+    def peut_placer_piece(self, piece: Piece) -> bool:
+        """
+        Vérifie si une pièce peut être placée à sa position actuelle.
+
+        Args:
+            piece: Pièce à vérifier
+
+        Returns:
+            True si la pièce peut être placée, False sinon
+        """
+        return self.peut_placer_positions(piece.positions)
+
+    def peut_placer_positions(self, positions: Iterable[Position]) -> bool:
+        """
+        Vérifie si des positions candidates sont toutes libres.
+
+        Args:
+            positions: Positions à vérifier
+
+        Returns:
+            True si toutes les positions sont libres, False sinon
+        """
+        largeur = self.largeur
+        hauteur = self.hauteur
+        lignes = self._lignes
+        for position in positions:
+            x, y = position.x, position.y
+            if x < 0 or x >= largeur or y >= hauteur:
+                return False
+            ligne = lignes[y] if y >= 0 else self._lignes_invisibles.get(y, 0)
+            if (ligne >> x) & 1:
+                return False
+        return True
+
+    def placer_piece_et_supprimer_lignes(self, piece: Piece) -> int:
+        """
+        Opération atomique : place une pièce et supprime immédiatement les lignes complètes.
+
+        Seules les lignes touchées par la pièce peuvent devenir complètes,
+        la détection ne vérifie donc que celles-ci.
+
+        Args:
+            piece: Pièce à placer
+
+        Returns:
+            Nombre de lignes supprimées si placement réussi, -1 si échec de placement
+        """
+        if not self.peut_placer_piece(piece):
+            return -1
+
+        # 1. Placer la pièce (un OR par cellule) et l'indexer
+        lignes_touchees = set()
+        for position in piece.positions:
+            y = position.y
+            self._indexer_cellule(position.x, y)
+            self._cle_zobrist ^= cle_cellule(position.x, y)
+            if y >= 0:
+                self._lignes[y] |= 1 << position.x
+                lignes_touchees.add(y)
+            else:
+                self._lignes_invisibles[y] = self._lignes_invisibles.get(y, 0) | (1 << position.x)
+        self.journal.enregistrer(TypeChangement.CELLULES_AJOUTEES, tuple(piece.positions))
+
+        # 2. Détecter et supprimer les lignes complètes parmi les lignes touchées
+        lignes_completes = [y for y in sorted(lignes_touchees)
+                            if self._lignes[y] == self._masque_plein]
+        if lignes_completes:
+            return self.supprimer_lignes(lignes_completes)
+
+        return 0
+
+    def obtenir_lignes_completes(self) -> List[int]:
+        """
+        Retourne la liste des numéros de lignes complètes (y-coordonnées).
+
+        Returns:
+            Liste des numéros de lignes complètes, triée par ordre croissant
+        """
+        plein = self._masque_plein
+        return [y for y, ligne in enumerate(self._lignes) if ligne == plein]
+
+    def supprimer_lignes(self, numeros_lignes: List[int]) -> int:
+        """
+        Supprime les lignes spécifiées et fait descendre les lignes au-dessus.
+
+        Les lignes restantes sont conservées dans l'ordre et précédées
+        d'autant de lignes vides que de lignes supprimées.
+
+        Args:
+            numeros_lignes: Liste des numéros de lignes à supprimer
+
+        Returns:
+            Nombre de lignes supprimées
+        """
+        if not numeros_lignes:
+            return 0
+
+        lignes_a_supprimer = set(numeros_lignes)
+        nb_lignes = len(lignes_a_supprimer)
+
+        # Seules les lignes jusqu'à la plus basse supprimée changent : leur clé est refaite
+        y_max = max(lignes_a_supprimer)
+        cle_avant = self._cle_lignes_jusqu_a(y_max)
+
+        restantes = [ligne for y, ligne in enumerate(self._lignes)
+                     if y not in lignes_a_supprimer]
+        self._lignes = [0] * nb_lignes + restantes
+
+        # La zone invisible descend aussi, toutes les lignes supprimées étant en dessous
+        if self._lignes_invisibles:
+            invisibles = self._lignes_invisibles
+            self._lignes_invisibles = {}
+            for y, ligne in invisibles.items():
+                nouveau_y = y + nb_lignes
+                if nouveau_y >= 0:
+                    self._lignes[nouveau_y] |= ligne
+                elif ligne:
+                    self._lignes_invisibles[nouveau_y] = ligne
+
+        self._cle_zobrist ^= cle_avant ^ self._cle_lignes_jusqu_a(y_max)
+        self._reconstruire_index()
+        self.journal.enregistrer(TypeChangement.LIGNES_SUPPRIMEES, tuple(sorted(lignes_a_supprimer)))
+        return nb_lignes
+
+    def _cle_lignes_jusqu_a(self, y_max: int) -> int:
+        """XOR des clés des lignes non vides d'ordonnée au plus y_max, zone invisible comprise."""
+        cle = 0
+        for y, ligne in self._iterer_lignes_non_vides():
+            if y > y_max:
+                break
+            cle ^= cle_ligne(y, ligne)
+        return cle
+
+    def _reconstruire_index(self) -> None:
+        """Recalcule l'index à partir des masques, en descendant jusqu'à trouver chaque sommet."""
+        self._sommets = [self.hauteur] * self.largeur
+        self._remplissage = [bin(ligne).count("1") for ligne in self._lignes]
+
+        colonnes_restantes = self._masque_plein
+        for y, ligne in self._iterer_lignes_non_vides():
+            nouvelles = ligne & colonnes_restantes
+            while nouvelles:
+                bit = nouvelles & -nouvelles
+                self._sommets[bit.bit_length() - 1] = y
+                nouvelles ^= bit
+            colonnes_restantes &= ~ligne
+            if not colonnes_restantes:
+                break
+
+    def _verifier_index(self) -> None:
+        """Les masques ne sont modifiés que par le plateau : l'index est toujours à jour."""
+
+    def obtenir_masques(self) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, int], ...]]:
+        """Retourne les masques visibles et les couples (y, masque) de la zone invisible."""
+        invisibles = tuple((y, ligne) for y, ligne in sorted(self._lignes_invisibles.items()) if ligne)
+        return tuple(self._lignes), invisibles
+
+    def charger_masques(self, lignes: Iterable[int],
+                        lignes_invisibles: Iterable[Tuple[int, int]] = ()) -> None:
+        """Remplace tout le contenu du plateau par des masques (copie directe des lignes)."""
+        self._lignes = list(lignes)
+        self._lignes_invisibles = dict(lignes_invisibles)
+        self._cle_zobrist = self._cle_lignes_jusqu_a(self.hauteur)
+        self._reconstruire_index()
+        self.journal.enregistrer(TypeChangement.PLATEAU_REMPLACE)
+
+    def est_vide(self) -> bool:
+        """
+        Vérifie si le plateau est vide.
+
+        Returns:
+            True si le plateau est vide, False sinon
+        """
+        return not any(self._lignes) and not any(self._lignes_invisibles.values())
+
+    def est_ligne_superieure_occupee(self) -> bool:
+        """
+        Vérifie si la ligne supérieure (y=0) contient des positions occupées.
+
+        Returns:
+            True si la ligne supérieure est occupée, False sinon
+        """
+        return self._lignes[0] != 0
+
+    def __str__(self) -> str:
+        """
+        Représentation textuelle du plateau pour debug.
+
+        Returns:
+            Chaîne représentant le plateau ('.' = vide, '█' = occupé)
+        """
+        return "\n".join(
+            "".join("█" if (ligne >> x) & 1 else "." for x in range(self.largeur))
+            for ligne in self._lignes
+        )
@@ -0,0 +1,260 @@
+"""
+PlateauLot - N plateaux Tetris stockés dans un seul tableau NumPy
+
+Contrepartie vectorisée de PlateauBitboard : chaque plateau est une
+ligne d'un tableau (N, hauteur) de masques de bits, le bit x de la
+ligne y valant 1 si la cellule (x, y) est occupée.
+
+Chaque opération (collision, distance de chute, placement, détection
+et suppression des lignes complètes) s'applique aux N plateaux en un
+seul appel NumPy, sans boucle Python sur les parties.
+
+Les pièces sont décrites par leur index de type (ordre de TYPES_PIECES),
+leur orientation et la position de leur pivot, et leurs cellules sont
+lues dans les tables de formes du RegistrePieces.
+
+NumPy est une dépendance optionnelle : le module s'importe sans elle,
+mais la création d'un PlateauLot lève ImportError.
+"""
+
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+from .piece import TypePiece
+
+
+# Ordre stable des types de pièces : l'index d'un type dans ce tuple
+# est la valeur utilisée dans les tableaux de types du lot.
+TYPES_PIECES: Tuple[TypePiece, ...] = tuple(TypePiece)
+
+# Nombre maximal d'orientations d'une pièce (T, J, L)
+NB_ORIENTATIONS_MAX = 4
+
+
+def construire_table_offsets() -> 'np.ndarray':
+    """
+    Construit la table des offsets de toutes les pièces.
+
+    Les pièces ayant moins de 4 orientations (O, I, S, Z) voient leurs
+    formes répétées cycliquement, si bien que l'orientation k d'un lot
+    vaut toujours l'orientation k % nb_orientations de la pièce.
+
+    Returns:
+        Tableau (nb_types, 4, 4, 2) des offsets (dx, dy) relatifs au pivot
+    """
+    # Import local : le paquet fabriques importe les services (logger)
+    from .fabriques import RegistrePieces
+
+    offsets = np.zeros((len(TYPES_PIECES), NB_ORIENTATIONS_MAX, 4, 2), dtype=np.int16)
+    for index_type, type_piece in enumerate(TYPES_PIECES):
+        table = RegistrePieces.obtenir_table_formes(type_piece)
+        for orientation in range(NB_ORIENTATIONS_MAX):
+            offsets[index_type, orientation] = table.formes[orientation % table.nb_orientations]
+    return offsets
+
+
+class PlateauLot:
+    """
+    Lot de N plateaux de même taille, manipulés de manière vectorisée.
+
+    Pattern utilisé :
+    - Entity (gère son propre état)
+
+    Mêmes règles que Plateau : les bords gauche, droit et bas bloquent
+    les pièces, la zone au-dessus du plateau (y < 0) est libre.
+    Une cellule figée en zone invisible n'est pas stockée : c'est
+    l'appelant (MoteurLot) qui la traite comme un game over.
+    """
+
+    def __init__(self, nb_plateaux: int, largeur: int = 10, hauteur: int = 20):
+        """
+        Initialise N plateaux vides.
+
+        Args:
+            nb_plateaux: Nombre de plateaux du lot
+            largeur: Largeur de chaque plateau (défaut: 10 - standard Tetris)
+            hauteur: Hauteur de chaque plateau (défaut: 20 - standard Tetris)
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+            ValueError: Si la largeur ne tient pas dans un masque de 63 bits
+        """
+        if np is None:
+            raise ImportError("NumPy est requis pour PlateauLot : pip install numpy")
+        if largeur > 63:
+            raise ValueError(f"Largeur trop grande pour un masque de bits : {largeur}")
+
+        self.nb_plateaux = nb_plateaux
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.masque_plein = (1 << largeur) - 1
+
+        # Masques des lignes : lignes[i, y] = colonnes occupées de la ligne y du plateau i
+        self.lignes = np.zeros((nb_plateaux, hauteur), dtype=np.int64)
+
+        # Offsets des cellules de chaque (type, orientation)
+        self._offsets = construire_table_offsets()
+        self._colonnes = np.arange(largeur, dtype=np.int64)
+        self._indices = np.arange(nb_plateaux)
+
+    def reinitialiser(self, masque: Optional['np.ndarray'] = None) -> None:
+        """
+        Vide les plateaux sélectionnés.
+
+        Args:
+            masque: Booléens (N,) des plateaux à vider (tous si None)
+        """
+        if masque is None:
+            self.lignes[:] = 0
+        else:
+            self.lignes[masque] = 0
+
+    def obtenir_cellules(self, types: 'np.ndarray', orientations: 'np.ndarray',
+                         x_pivots: 'np.ndarray', y_pivots: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Calcule les cellules absolues d'une pièce par plateau.
+
+        Args:
+            types: Index de type (N,) dans TYPES_PIECES
+            orientations: Orientations (N,)
+            x_pivots: Positions X des pivots (N,)
+            y_pivots: Positions Y des pivots (N,)
+
+        Returns:
+            Tuple (xs, ys) de deux tableaux (N, 4)
+        """
+        offsets = self._offsets[types, orientations % NB_ORIENTATIONS_MAX]
+        xs = np.asarray(x_pivots)[:, None] + offsets[:, :, 0]
+        ys = np.asarray(y_pivots)[:, None] + offsets[:, :, 1]
+        return xs, ys
+
+    def collisions(self, types: 'np.ndarray', orientations: 'np.ndarray',
+                   x_pivots: 'np.ndarray', y_pivots: 'np.ndarray') -> 'np.ndarray':
+        """
+        Vérifie, pour chaque plateau, si la pièce donnée est en collision.
+
+        Args:
+            types: Index de type (N,) dans TYPES_PIECES
+            orientations: Orientations (N,)
+            x_pivots: Positions X des pivots (N,)
+            y_pivots: Positions Y des pivots (N,)
+
+        Returns:
+            Booléens (N,) : True si la pièce sort du plateau ou chevauche une cellule
+        """
+        xs, ys = self.obtenir_cellules(types, orientations, x_pivots, y_pivots)
+        hors_limites = (xs < 0) | (xs >= self.largeur) | (ys >= self.hauteur)
+
+        lignes = self.lignes[self._indices[:, None], np.clip(ys, 0, self.hauteur - 1)]
+        occupees = ((lignes >> np.clip(xs, 0, self.largeur - 1)) & 1).astype(bool) & (ys >= 0)
+
+        return (hors_limites | occupees).any(axis=1)
+
+    def distances_de_chute(self, types: 'np.ndarray', orientations: 'np.ndarray',
+                           x_pivots: 'np.ndarray', y_pivots: 'np.ndarray') -> 'np.ndarray':
+        """
+        Calcule de combien de lignes chaque pièce peut descendre.
+
+        Pour chaque cellule, cherche la première cellule occupée (ou le fond)
+        sous elle dans sa colonne ; la distance est le minimum sur les 4 cellules.
+        La pièce est supposée être à une position valide (sans collision).
+
+        Args:
+            types: Index de type (N,) dans TYPES_PIECES
+            orientations: Orientations (N,)
+            x_pivots: Positions X des pivots (N,)
+            y_pivots: Positions Y des pivots (N,)
+
+        Returns:
+            Entiers (N,) : nombre de lignes de chute jusqu'au contact
+        """
+        xs, ys = self.obtenir_cellules(types, orientations, x_pivots, y_pivots)
+        hauteur = self.hauteur
+
+        # Occupation des colonnes des 4 cellules : (N, 4, hauteur)
+        colonnes = (self.lignes[:, None, :] >> np.clip(xs, 0, self.largeur - 1)[:, :, None]) & 1
+        rangees = np.arange(hauteur)
+        obstacles = colonnes.astype(bool) & (rangees[None, None, :] > ys[:, :, None])
+
+        # Premier obstacle sous chaque cellule (le fond si aucun)
+        premier = np.where(obstacles.any(axis=2), obstacles.argmax(axis=2), hauteur)
+
+        return (premier - 1 - ys).min(axis=1)
+
+    def placer(self, types: 'np.ndarray', orientations: 'np.ndarray',
+               x_pivots: 'np.ndarray', y_pivots: 'np.ndarray',
+               masque: Optional['np.ndarray'] = None) -> 'np.ndarray':
+        """
+        Fige une pièce par plateau (sans vérification de collision).
+
+        Args:
+            types: Index de type (N,) dans TYPES_PIECES
+            orientations: Orientations (N,)
+            x_pivots: Positions X des pivots (N,)
+            y_pivots: Positions Y des pivots (N,)
+            masque: Booléens (N,) des plateaux concernés (tous si None)
+
+        Returns:
+            Booléens (N,) : True si une cellule de la pièce est restée en zone invisible
+        """
+        xs, ys = self.obtenir_cellules(types, orientations, x_pivots, y_pivots)
+        actifs = np.ones(self.nb_plateaux, dtype=bool) if masque is None else np.asarray(masque)
+
+        visibles = (ys >= 0) & actifs[:, None]
+        plateaux = np.broadcast_to(self._indices[:, None], ys.shape)
+        np.bitwise_or.at(self.lignes, (plateaux[visibles], ys[visibles]),
+                         np.int64(1) << xs[visibles])
+
+        return ((ys < 0) & actifs[:, None]).any(axis=1)
+
+    def lignes_completes(self) -> 'np.ndarray':
+        """
+        Détecte les lignes complètes de tous les plateaux.
+
+        Returns:
+            Booléens (N, hauteur) : True pour chaque ligne complète
+        """
+        return self.lignes == self.masque_plein
+
+    def supprimer_lignes_completes(self) -> 'np.ndarray':
+        """
+        Supprime les lignes complètes de tous les plateaux et fait descendre le reste.
+
+        Un tri stable place les lignes complètes en tête de chaque plateau
+        en conservant l'ordre des autres, puis les lignes de tête sont vidées.
+
+        Returns:
+            Entiers (N,) : nombre de lignes supprimées par plateau
+        """
+        completes = self.lignes_completes()
+        nb_lignes = completes.sum(axis=1)
+        if not nb_lignes.any():
+            return nb_lignes
+
+        ordre = np.argsort(~completes, axis=1, kind='stable')
+        self.lignes = np.take_along_axis(self.lignes, ordre, axis=1)
+        self.lignes[np.arange(self.hauteur)[None, :] < nb_lignes[:, None]] = 0
+
+        return nb_lignes
+
+    def hauteurs_colonnes(self) -> 'np.ndarray':
+        """
+        Calcule la hauteur de chaque colonne de chaque plateau.
+
+        Returns:
+            Entiers (N, largeur) : 0 pour une colonne vide, hauteur si pleine en haut
+        """
+        cellules = ((self.lignes[:, :, None] >> self._colonnes) & 1).astype(bool)
+        premiere = np.where(cellules.any(axis=1), cellules.argmax(axis=1), self.hauteur)
+        return self.hauteur - premiere
+
+    def __str__(self) -> str:
+        """Représentation textuelle du premier plateau pour debug."""
+        return "\n".join(
+            "".join("█" if (int(ligne) >> x) & 1 else "." for x in range(self.largeur))
+            for ligne in self.lignes[0]
+        ) if self.nb_plateaux else ""
@@ -0,0 +1,108 @@
+"""
+Zobrist - Clés de hachage 64 bits des cellules et des états de pièce
+
+Chaque cellule (x, y) et chaque état de pièce (type, orientation, pivot)
+reçoit une clé pseudo-aléatoire de 64 bits. La clé d'une position est le
+XOR des clés de ses éléments : elle se met à jour par XOR à chaque
+changement (cellule figée, pièce déplacée) au lieu d'être recalculée.
+
+Les clés sont dérivées de façon déterministe des coordonnées (fonction de
+mélange SplitMix64) : elles ne dépendent ni de l'ordre de création ni des
+dimensions du plateau, et sont identiques d'une exécution à l'autre.
+
+Exemple d'usage :
+    cle = plateau.cle_zobrist ^ cle_piece(TypePiece.T, 0, 5, 1)
+    evaluation = table.obtenir(cle)
+"""
+
+from typing import Dict, List, Tuple
+
+from .instantane_partie import compacter_piece
+from .piece import TypePiece
+
+_MASQUE_64 = (1 << 64) - 1
+
+# Décalage des coordonnées et domaine des pièces (clés distinctes de celles des cellules)
+_DECALAGE_COORDONNEE = 1 << 15
+_DOMAINE_PIECE = 1 << 40
+
+_cles_cellules: Dict[Tuple[int, int], int] = {}
+_tables_octets: Dict[Tuple[int, int], List[int]] = {}
+
+
+def _melanger(valeur: int) -> int:
+    """Fonction de mélange SplitMix64 : entier vers clé 64 bits bien répartie."""
+    z = (valeur + 0x9E3779B97F4A7C15) & _MASQUE_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASQUE_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASQUE_64
+    return z ^ (z >> 31)
+
+
+def cle_cellule(x: int, y: int) -> int:
+    """
+    Clé de la cellule (x, y), zone invisible (y < 0) comprise.
+
+    Args:
+        x: Colonne de la cellule
+        y: Ligne de la cellule
+
+    Returns:
+        Clé 64 bits
+    """
+    cle = _cles_cellules.get((x, y))
+    if cle is None:
+        cle = _melanger(((y + _DECALAGE_COORDONNEE) << 16) | (x + _DECALAGE_COORDONNEE))
+        _cles_cellules[(x, y)] = cle
+    return cle
+
+
+def _table_octet(y: int, indice: int) -> List[int]:
+    """Clés des 256 valeurs d'un octet de la ligne y (colonnes 8*indice à 8*indice+7)."""
+    table = _tables_octets.get((y, indice))
+    if table is None:
+        table = [0] * 256
+        for octet in range(1, 256):
+            bit = octet & -octet
+            table[octet] = table[octet ^ bit] ^ cle_cellule(8 * indice + bit.bit_length() - 1, y)
+        _tables_octets[(y, indice)] = table
+    return table
+
+
+def cle_ligne(y: int, masque: int) -> int:
+    """
+    Clé d'une ligne entière : XOR des clés de ses cellules occupées.
+
+    Calculée octet par octet du masque (une consultation de table par octet).
+
+    Args:
+        y: Numéro de la ligne
+        masque: Masque des colonnes occupées (bit x = cellule (x, y))
+
+    Returns:
+        Clé 64 bits (0 pour une ligne vide)
+    """
+    cle = 0
+    indice = 0
+    while masque:
+        octet = masque & 0xFF
+        if octet:
+            cle ^= _table_octet(y, indice)[octet]
+        masque >>= 8
+        indice += 1
+    return cle
+
+
+def cle_piece(type_piece: TypePiece, orientation: int, x: int, y: int) -> int:
+    """
+    Clé d'un état de pièce.
+
+    Args:
+        type_piece: Type de la pièce
+        orientation: Index de l'orientation
+        x: Position X du pivot
+        y: Position Y du pivot
+
+    Returns:
+        Clé 64 bits
+    """
+    return _melanger(_DOMAINE_PIECE | compacter_piece(type_piece, orientation, x, y))
@@ -6,7 +6,13 @@ naturellement dans les entités.
 
 Services disponibles :
 - Commandes : Command Pattern pour les actions de jeu
+- HistoriqueCommandes : Annulation / rétablissement bornés des commandes
 - GestionnaireEvenements : Gestion des inputs et contrôles
+- HorlogeSimulee : Temps contrôlé pour les parties headless
+- MoteurLot : N parties jouées en parallèle (NumPy)
+- OrdonnanceurFrames : Pas de simulation fixe et cadence du rendu
+- ProfileurFrames : Durées des phases de la boucle de jeu (centiles, CSV)
+- TableTransposition : Cache LRU indexé par clé Zobrist
 
 RÈGLES :
 - Services sans état (stateless) ou avec état géré explicitement
@@ -18,7 +24,8 @@ RÈGLES :
 from .commandes import (
     Commande, MoteurJeu,
     CommandeDeplacerGauche, CommandeDeplacerDroite, CommandeDescendre,
-    CommandeChuteRapide, CommandeTourner, CommandePause
+    CommandeChuteRapide, CommandeTourner, CommandePause,
+    HistoriqueCommandes
 )
 
 from .gestionnaire_evenements import (
@@ -26,10 +33,18 @@ from .gestionnaire_evenements import (
     ConfigurationControles
 )
 
+from .horloge_simulee import HorlogeSimulee
+from .moteur_lot import MoteurLot
+from .ordonnanceur_frames import OrdonnanceurFrames
+from .profileur_frames import ProfileurFrames
+from .table_transposition import TableTransposition
+
 __all__ = [
     'Commande', 'MoteurJeu',
     'CommandeDeplacerGauche', 'CommandeDeplacerDroite', 'CommandeDescendre',
     'CommandeChuteRapide', 'CommandeTourner', 'CommandePause', 'CommandeAfficherMenu',
+    'HistoriqueCommandes',
     'GestionnaireEvenements', 'TypeEvenement', 'ToucheClavier',
-    'ConfigurationControles'
+    'ConfigurationControles',
+    'HorlogeSimulee', 'MoteurLot', 'OrdonnanceurFrames', 'ProfileurFrames', 'TableTransposition'
 ]
@@ -11,3 +11,5 @@ from .commandes_partie import (
     CommandeDeplacerGauchePartie, CommandeDeplacerDroitePartie,
     CommandeTournerPartie
 )
+
+from .historique_commandes import HistoriqueCommandes
@@ -7,7 +7,7 @@ que le joueur peut effectuer sur les pièces et le jeu.
 Avantages du Command Pattern :
 - Séparation des inputs et des actions
 - Facilite l'ajout de nouvelles commandes
-- Permet l'historique et l'annulation (futur)
+- Permet l'historique et l'annulation (voir HistoriqueCommandes)
 - Testabilité des actions individuellement
 """
 
@@ -135,39 +135,14 @@ class CommandeChuteRapide(Commande):
         piece = moteur.obtenir_piece_active()
         plateau = moteur.obtenir_plateau()
         
-        # Vérifier d'abord si la pièce peut descendre au moins une fois
-        positions_originales = piece.positions.copy()
-        pivot_original = piece.position_pivot
-        
-        piece.deplacer(0, 1)
-        peut_descendre_initialement = plateau.peut_placer_piece(piece)
+        # Distance de chute calculée en une fois (sommets des colonnes et jupe de la pièce)
+        nb_lignes_descendues = plateau.distance_de_chute(piece)
         
-        # Restaurer position originale complètement
-        piece._positions = positions_originales
-        piece.position_pivot = pivot_original
-        
-        if not peut_descendre_initialement:
+        if nb_lignes_descendues == 0:
             # Lever ExceptionCollision selon les directives
             raise ExceptionCollision("Impossible d'effectuer une chute rapide - pièce bloquée")
         
-        nb_lignes_descendues = 0
-        
-        while True:
-            # Sauvegarder la position actuelle
-            positions_actuelles = piece.positions.copy()
-            pivot_actuel = piece.position_pivot
-            
-            # Essayer de descendre
-            piece.deplacer(0, 1)
-            
-            # Vérifier si le déplacement est valide
-            if plateau.peut_placer_piece(piece):
-                nb_lignes_descendues += 1
-            else:
-                # Annuler le dernier déplacement et arrêter
-                piece._positions = positions_actuelles
-                piece.position_pivot = pivot_actuel
-                break
+        piece.deplacer(0, nb_lignes_descendues)
         
         # Placer la pièce définitivement
         moteur.placer_piece_definitivement()
@@ -184,20 +159,14 @@ class CommandeTourner(Commande):
         piece = moteur.obtenir_piece_active()
         plateau = moteur.obtenir_plateau()
         
-        # Sauvegarder l'état actuel (positions seulement)
-        positions_originales = piece.positions.copy()
-        
-        # Essayer la rotation
-        piece.tourner()
-        
-        # Vérifier si la rotation est valide
-        if plateau.peut_placer_piece(piece):
-            return True
-        else:
-            # Annuler la rotation en restaurant les positions originales
-            piece.positions = positions_originales
+        # Vérifier la rotation avant toute mutation (positions et orientation)
+        etat = piece.etat_apres(rotation=1)
+        if not plateau.peut_placer_positions(etat.positions):
             # Lever ExceptionCollision selon les directives
             raise ExceptionCollision("Impossible de tourner la pièce")
+        
+        piece.appliquer_etat(etat)
+        return True
 
 
 class CommandePause(Commande):
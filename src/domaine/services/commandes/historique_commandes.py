@@ -0,0 +1,161 @@
+"""
+Historique des commandes - Annulation et rétablissement bornés
+
+Chaque commande exécutée à travers l'historique est précédée d'un
+InstantanePartie : annuler() restaure l'état d'avant la commande,
+retablir() celui d'après. Les commandes n'ont donc pas besoin d'inverse.
+
+Les instantanés successifs partagent leur structure : un champ inchangé
+(lignes du plateau, file d'aperçu, état du générateur...) réutilise
+l'objet de l'instantané précédent, et une ligne déjà présente réutilise
+l'entier de l'instantané précédent. Un déplacement de pièce ne coûte que
+le petit tuple de l'instantané ; la mémoire reste plate sur des milliers
+de coups, et bornée par taille_max.
+
+Exemple d'usage :
+    historique = HistoriqueCommandes(moteur)
+    historique.executer(CommandeTournerPartie())
+    historique.annuler()   # la pièce revient dans son orientation d'origine
+    historique.retablir()
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Optional
+
+from ...entites.instantane_partie import InstantanePartie
+from .commandes_base import Commande
+
+if TYPE_CHECKING:
+    from ..moteur_partie import MoteurPartie
+
+
+# Champs réutilisés tels quels quand ils sont égaux à ceux de l'instantané précédent
+_CHAMPS_PARTAGES = ('lignes_invisibles', 'file_pieces', 'generateur',
+                    'statistiques', 'pieces_par_type')
+
+
+class HistoriqueCommandes:
+    """Piles d'annulation et de rétablissement des commandes exécutées sur un moteur."""
+
+    # Nombre de commandes annulables par défaut
+    TAILLE_MAX_DEFAUT = 1000
+
+    def __init__(self, moteur: 'MoteurPartie', taille_max: int = TAILLE_MAX_DEFAUT):
+        """
+        Initialise un historique vide.
+
+        Args:
+            moteur: Moteur sur lequel les commandes sont exécutées
+            taille_max: Nombre maximal de commandes annulables (les plus anciennes sont oubliées)
+        """
+        self.moteur = moteur
+        self._annulations: Deque[InstantanePartie] = deque(maxlen=taille_max)
+        self._retablissements: Deque[InstantanePartie] = deque(maxlen=taille_max)
+        self._dernier: Optional[InstantanePartie] = None
+
+    @property
+    def peut_annuler(self) -> bool:
+        """True si une commande peut être annulée."""
+        return bool(self._annulations)
+
+    @property
+    def peut_retablir(self) -> bool:
+        """True si une commande annulée peut être rétablie."""
+        return bool(self._retablissements)
+
+    def executer(self, commande: Commande) -> bool:
+        """
+        Exécute une commande et l'enregistre si elle a changé l'état de la partie.
+
+        Une commande qui lève une exception (ExceptionCollision...) n'est pas
+        enregistrée ; l'exception est propagée à l'appelant.
+
+        Args:
+            commande: Commande à exécuter
+
+        Returns:
+            Résultat de commande.execute()
+        """
+        avant = self._capturer()
+        resultat = commande.execute(self.moteur)
+        apres = self._capturer()
+
+        if apres != avant:
+            self._annulations.append(avant)
+            self._retablissements.clear()
+        return resultat
+
+    def annuler(self) -> bool:
+        """
+        Remet la partie dans l'état d'avant la dernière commande enregistrée.
+
+        Returns:
+            False si rien n'est à annuler, True sinon
+        """
+        if not self._annulations:
+            return False
+        self._retablissements.append(self._capturer())
+        self._restaurer(self._annulations.pop())
+        return True
+
+    def retablir(self) -> bool:
+        """
+        Rejoue la dernière commande annulée (restauration de l'état qui la suivait).
+
+        Returns:
+            False si rien n'est à rétablir, True sinon
+        """
+        if not self._retablissements:
+            return False
+        self._annulations.append(self._capturer())
+        self._restaurer(self._retablissements.pop())
+        return True
+
+    def vider(self) -> None:
+        """Oublie toutes les commandes enregistrées."""
+        self._annulations.clear()
+        self._retablissements.clear()
+        self._dernier = None
+
+    def _restaurer(self, instantane: InstantanePartie) -> None:
+        """Restaure un instantané, qui devient la référence du partage."""
+        self.moteur.restaurer(instantane)
+        self._dernier = instantane
+
+    def _capturer(self) -> InstantanePartie:
+        """Capture l'état du moteur en partageant la structure du dernier instantané."""
+        instantane = self.moteur.capturer()
+        reference = self._dernier
+        if reference is not None:
+            instantane = _partager(instantane, reference)
+        self._dernier = instantane
+        return instantane
+
+
+def _partager(instantane: InstantanePartie, reference: InstantanePartie) -> InstantanePartie:
+    """
+    Retourne un instantané égal à `instantane` qui réutilise les objets égaux de `reference`.
+
+    Args:
+        instantane: Instantané fraîchement capturé
+        reference: Instantané précédent
+
+    Returns:
+        Instantané partageant la structure de la référence
+    """
+    remplacements = {}
+    for champ in _CHAMPS_PARTAGES:
+        ancien = getattr(reference, champ)
+        if getattr(instantane, champ) == ancien:
+            remplacements[champ] = ancien
+
+    # Lignes : tuple entier réutilisé, ou à défaut chaque ligne déjà présente
+    # (même descendue par une suppression de lignes)
+    lignes, anciennes = instantane.lignes, reference.lignes
+    if lignes == anciennes:
+        remplacements['lignes'] = anciennes
+    else:
+        existantes = {ligne: ligne for ligne in anciennes}
+        remplacements['lignes'] = tuple(existantes.get(ligne, ligne) for ligne in lignes)
+
+    return instantane._replace(**remplacements)
@@ -0,0 +1,166 @@
+"""
+Énumérateur des placements atteignables d'une pièce.
+
+Service du domaine qui, pour un plateau et un type de pièce, retourne
+toutes les positions de repos finales atteignables avec les mouvements
+du jeu (gauche, droite, rotation, descente) et le chemin d'entrées
+qui y mène.
+
+Parcours en largeur sur les états (orientation, x_pivot, y_pivot) :
+- chaque état est identifié par une clé entière compacte
+- les états visités et les états bloqués ne sont testés qu'une fois
+- les positions sont lues dans la table de formes partagée (aucune
+  pièce n'est créée ni modifiée pendant le parcours)
+
+Exemple d'usage :
+    enumerateur = EnumerateurPlacements()
+    for placement in enumerateur.enumerer(plateau, TypePiece.T):
+        print(placement.positions, placement.chemin)
+"""
+
+from collections import deque
+from enum import Enum
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.fabriques.registre_pieces import RegistrePieces
+from src.domaine.entites.piece import EtatPiece, Piece, TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.position import Position
+
+
+class Mouvement(Enum):
+    """Entrées disponibles, avec leur effet (delta_x, delta_y, quarts de tour)."""
+    GAUCHE = (-1, 0, 0)
+    DROITE = (1, 0, 0)
+    ROTATION = (0, 0, 1)
+    DESCENTE = (0, 1, 0)
+
+
+class Placement(NamedTuple):
+    """Position de repos atteignable et entrées qui y mènent depuis l'apparition."""
+    etat: EtatPiece
+    chemin: Tuple[Mouvement, ...]
+
+    @property
+    def positions(self) -> Tuple[Position, ...]:
+        """Cellules occupées par la pièce une fois posée."""
+        return self.etat.positions
+
+
+class EnumerateurPlacements:
+    """
+    Génère les coups possibles d'une pièce sur un plateau.
+
+    Le plateau n'est jamais modifié : seules ses méthodes de test
+    de collision (peut_placer_positions) sont utilisées.
+    """
+
+    # Position d'apparition des pièces utilisée par MoteurPartie
+    X_APPARITION = 5
+    Y_APPARITION = 1
+
+    # Marge autour du plateau pour les pivots (les cellules restent dans le plateau)
+    _MARGE_X = 4
+
+    # Ordre d'exploration : à longueur égale, les chemins préfèrent les déplacements
+    _MOUVEMENTS = (Mouvement.GAUCHE, Mouvement.DROITE, Mouvement.ROTATION, Mouvement.DESCENTE)
+
+    def __init__(self):
+        """Initialise l'énumérateur et sa fabrique de pièces d'apparition."""
+        self._fabrique = FabriquePieces()
+
+    def enumerer(self, plateau: Plateau, type_piece: TypePiece,
+                 x_pivot: int = X_APPARITION, y_pivot: int = Y_APPARITION) -> List[Placement]:
+        """
+        Retourne les placements atteignables par une pièce qui apparaît.
+
+        Args:
+            plateau: Plateau sur lequel la pièce tombe
+            type_piece: Type de la pièce
+            x_pivot: Position X d'apparition
+            y_pivot: Position Y d'apparition
+
+        Returns:
+            Un placement par ensemble de cellules final distinct,
+            avec le plus court chemin d'entrées (liste vide si la pièce
+            ne peut pas apparaître)
+        """
+        piece = self._fabrique.creer(type_piece, x_pivot, y_pivot)
+        return self.enumerer_depuis(plateau, piece)
+
+    def enumerer_depuis(self, plateau: Plateau, piece: Piece) -> List[Placement]:
+        """
+        Retourne les placements atteignables depuis l'état courant d'une pièce.
+
+        Args:
+            plateau: Plateau sur lequel la pièce tombe
+            piece: Pièce de départ (non modifiée)
+
+        Returns:
+            Placements atteignables, dans l'ordre de découverte
+        """
+        depart = piece.etat_apres()
+        if not plateau.peut_placer_positions(depart.positions):
+            return []
+
+        table = RegistrePieces.obtenir_table_formes(piece.type_piece)
+        nb_orientations = table.nb_orientations
+        largeur_cles = plateau.largeur + 2 * self._MARGE_X
+        marge_x = self._MARGE_X
+
+        def cle(orientation: int, x: int, y: int) -> int:
+            return (y * largeur_cles + x + marge_x) * nb_orientations + orientation
+
+        cle_depart = cle(depart.orientation, depart.position_pivot.x, depart.position_pivot.y)
+        parents: Dict[int, Optional[Tuple[int, Mouvement]]] = {cle_depart: None}
+        bloques: Set[int] = set()
+        cellules_vues: Set[frozenset] = set()
+        placements: List[Placement] = []
+
+        file = deque([depart])
+        while file:
+            etat = file.popleft()
+            pivot = etat.position_pivot
+            cle_etat = cle(etat.orientation, pivot.x, pivot.y)
+
+            for mouvement in self._MOUVEMENTS:
+                delta_x, delta_y, rotation = mouvement.value
+                orientation = (etat.orientation + rotation) % nb_orientations
+                x, y = pivot.x + delta_x, pivot.y + delta_y
+                cle_voisin = cle(orientation, x, y)
+                if cle_voisin in parents:
+                    continue
+
+                legal = cle_voisin not in bloques
+                if legal:
+                    voisin = table.etat(orientation, x, y)
+                    legal = plateau.peut_placer_positions(voisin.positions)
+
+                if legal:
+                    parents[cle_voisin] = (cle_etat, mouvement)
+                    file.append(voisin)
+                    continue
+
+                bloques.add(cle_voisin)
+                if mouvement is Mouvement.DESCENTE:
+                    # Impossible de descendre : position de repos
+                    cellules = frozenset((p.x, p.y) for p in etat.positions)
+                    if cellules not in cellules_vues:
+                        cellules_vues.add(cellules)
+                        placements.append(Placement(etat, self._reconstruire_chemin(parents, cle_etat)))
+
+        return placements
+
+    @staticmethod
+    def _reconstruire_chemin(parents: Dict[int, Optional[Tuple[int, Mouvement]]],
+                             cle_etat: int) -> Tuple[Mouvement, ...]:
+        """Remonte les parents depuis un état jusqu'à l'état de départ."""
+        chemin = []
+        parent = parents[cle_etat]
+        while parent is not None:
+            cle_etat, mouvement = parent
+            chemin.append(mouvement)
+            parent = parents[cle_etat]
+        chemin.reverse()
+        return tuple(chemin)
@@ -0,0 +1,179 @@
+"""
+Évaluateur heuristique des placements d'une pièce.
+
+Note chaque placement candidat (voir EnumerateurPlacements) par une
+combinaison linéaire des caractéristiques classiques du plateau obtenu :
+- hauteur agrégée : somme des hauteurs de colonnes
+- lignes complétées par le placement
+- trous : cellules vides sous le sommet de leur colonne
+- bosses : somme des écarts de hauteur entre colonnes voisines
+
+Les caractéristiques sont calculées de façon incrémentale : l'état du
+plateau (sommets, trous par colonne, remplissage des lignes) est lu une
+seule fois par décision, puis chaque placement ne met à jour que les
+colonnes touchées par la pièce. Seuls les placements qui complètent des
+lignes reconstruisent le plateau résultant, en masques de bits.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from src.domaine.entites.plateau import Plateau
+from .enumerateur_placements import Placement
+
+
+class PoidsHeuristique(NamedTuple):
+    """Poids des caractéristiques (valeurs usuelles optimisées par algorithme génétique)."""
+    hauteur_agregee: float = -0.510066
+    lignes: float = 0.760666
+    trous: float = -0.35663
+    bosses: float = -0.184483
+
+
+class CaracteristiquesPlacement(NamedTuple):
+    """Caractéristiques du plateau obtenu après un placement."""
+    hauteur_agregee: int
+    lignes: int
+    trous: int
+    bosses: int
+
+
+class _EtatPlateau:
+    """Résumé du plateau lu une fois par décision, partagé par tous les placements."""
+
+    def __init__(self, plateau: Plateau):
+        self.largeur = plateau.largeur
+        self.hauteur = plateau.hauteur
+        self.masque_plein = (1 << self.largeur) - 1
+
+        self.masques = [0] * self.hauteur
+        for position in plateau.positions_occupees:
+            if 0 <= position.y < self.hauteur and 0 <= position.x < self.largeur:
+                self.masques[position.y] |= 1 << position.x
+
+        self.remplissage = plateau.remplissage_lignes
+        self.sommets = [self.hauteur - h for h in plateau.hauteurs_colonnes]
+        self.trous = [self._compter_trous(x) for x in range(self.largeur)]
+        self.total_trous = sum(self.trous)
+        self.total_hauteur = sum(self.hauteur - sommet for sommet in self.sommets)
+
+    def _compter_trous(self, x: int) -> int:
+        """Nombre de cellules vides sous le sommet de la colonne x."""
+        bit = 1 << x
+        return sum(1 for y in range(max(0, self.sommets[x] + 1), self.hauteur)
+                   if not self.masques[y] & bit)
+
+
+class EvaluateurPlacements:
+    """
+    Choisit le meilleur placement selon une heuristique linéaire.
+
+    Compte les placements évalués (nb_evaluations) pour mesurer le débit.
+    """
+
+    def __init__(self, poids: PoidsHeuristique = PoidsHeuristique()):
+        """
+        Initialise l'évaluateur.
+
+        Args:
+            poids: Poids des caractéristiques
+        """
+        self.poids = poids
+        self.nb_evaluations = 0
+
+    def choisir(self, plateau: Plateau, placements: Sequence[Placement]) -> Optional[Placement]:
+        """
+        Retourne le placement de meilleure note (le premier en cas d'égalité).
+
+        Args:
+            plateau: Plateau avant le placement (non modifié)
+            placements: Placements candidats
+
+        Returns:
+            Meilleur placement, ou None s'il n'y a aucun candidat
+        """
+        if not placements:
+            return None
+
+        etat = _EtatPlateau(plateau)
+        meilleur, meilleure_note = None, None
+        for placement in placements:
+            note = self.noter(self._caracteristiques(etat, placement))
+            if meilleure_note is None or note > meilleure_note:
+                meilleur, meilleure_note = placement, note
+        return meilleur
+
+    def caracteristiques(self, plateau: Plateau, placements: Sequence[Placement]) -> List[CaracteristiquesPlacement]:
+        """
+        Calcule les caractéristiques de chaque placement candidat.
+
+        Args:
+            plateau: Plateau avant les placements (non modifié)
+            placements: Placements candidats
+
+        Returns:
+            Caractéristiques, dans l'ordre des placements
+        """
+        etat = _EtatPlateau(plateau)
+        return [self._caracteristiques(etat, placement) for placement in placements]
+
+    def noter(self, caracteristiques: CaracteristiquesPlacement) -> float:
+        """Combinaison linéaire des caractéristiques par les poids."""
+        poids = self.poids
+        return (poids.hauteur_agregee * caracteristiques.hauteur_agregee
+                + poids.lignes * caracteristiques.lignes
+                + poids.trous * caracteristiques.trous
+                + poids.bosses * caracteristiques.bosses)
+
+    def _caracteristiques(self, etat: _EtatPlateau, placement: Placement) -> CaracteristiquesPlacement:
+        """Caractéristiques du plateau après placement, mises à jour colonne par colonne."""
+        self.nb_evaluations += 1
+
+        colonnes: Dict[int, List[int]] = {}
+        cellules_par_ligne: Dict[int, int] = {}
+        for position in placement.positions:
+            colonnes.setdefault(position.x, []).append(position.y)
+            if position.y >= 0:
+                cellules_par_ligne[position.y] = cellules_par_ligne.get(position.y, 0) + 1
+
+        lignes = sum(1 for y, nombre in cellules_par_ligne.items()
+                     if etat.remplissage[y] + nombre == etat.largeur)
+        if lignes:
+            return self._caracteristiques_apres_lignes(etat, placement, lignes)
+
+        sommets = list(etat.sommets)
+        trous = etat.total_trous
+        for x, ys in colonnes.items():
+            sommet = etat.sommets[x]
+            nouveau_sommet = min(sommet, min(ys))
+            # Cellules de la pièce sous le sommet : trous comblés
+            trous -= sum(1 for y in ys if y > sommet)
+            # Cellules vides entre la pièce et l'ancien sommet : trous créés
+            if nouveau_sommet < sommet:
+                trous += (sommet - nouveau_sommet - 1) - sum(1 for y in ys if nouveau_sommet < y < sommet)
+            sommets[x] = nouveau_sommet
+
+        hauteur_agregee = etat.total_hauteur + sum(etat.sommets[x] - sommets[x] for x in colonnes)
+        bosses = sum(abs(sommets[x] - sommets[x + 1]) for x in range(etat.largeur - 1))
+        return CaracteristiquesPlacement(hauteur_agregee, 0, trous, bosses)
+
+    @staticmethod
+    def _caracteristiques_apres_lignes(etat: _EtatPlateau, placement: Placement,
+                                       lignes: int) -> CaracteristiquesPlacement:
+        """Caractéristiques calculées sur le plateau reconstruit (placement qui complète des lignes)."""
+        masques = list(etat.masques)
+        for position in placement.positions:
+            if position.y >= 0:
+                masques[position.y] |= 1 << position.x
+        restantes = [masque for masque in masques if masque != etat.masque_plein]
+        masques = [0] * (etat.hauteur - len(restantes)) + restantes
+
+        hauteurs = []
+        trous = 0
+        for x in range(etat.largeur):
+            bit = 1 << x
+            sommet = next((y for y in range(etat.hauteur) if masques[y] & bit), etat.hauteur)
+            hauteurs.append(etat.hauteur - sommet)
+            trous += sum(1 for y in range(sommet + 1, etat.hauteur) if not masques[y] & bit)
+
+        bosses = sum(abs(hauteurs[x] - hauteurs[x + 1]) for x in range(etat.largeur - 1))
+        return CaracteristiquesPlacement(sum(hauteurs), lignes, trous, bosses)
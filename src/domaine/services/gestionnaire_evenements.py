@@ -9,14 +9,23 @@ Architecture :
 - Command Pattern pour les actions
 - Configuration flexible des contrôles
 - Support multi-plateforme
+
+Répétition des touches (DAS/ARR) : chaque touche maintenue a sa date de
+prochaine répétition, d'abord delai_initial après l'appui puis tous les
+delai_repetition. Une mise à jour déclenche toutes les répétitions échues
+depuis la précédente, quelle que soit la cadence des frames ; les dates
+sont rangées dans un tas, seules les touches échues sont visitées.
 """
 
+import heapq
+import itertools
 from enum import Enum
-from typing import Dict, Optional, List, Callable
+from typing import Dict, Optional, List, Callable, Tuple
 from .commandes import (
     Commande, CommandeDeplacerGauche, CommandeDeplacerDroite,
     CommandeDescendre, CommandeChuteRapide, CommandeTournerPartie,
-    CommandePause, CommandeBasculerMute, MoteurJeu
+    CommandePause, CommandeBasculerMute, MoteurJeu,
+    CommandeChuteRapidePartie, CommandeDeplacerGauchePartie, CommandeDeplacerDroitePartie
 )
 # Import des exceptions du domaine selon les directives
 from ..exceptions.exception_collision import ExceptionCollision
@@ -74,6 +83,25 @@ class ConfigurationControles:
         return cls.MAPPING_DEFAUT.copy()
 
 
+def creer_commandes_partie() -> Dict[ToucheClavier, Commande]:
+    """
+    Commandes de la partie complète (déplacements délégués au MoteurPartie).
+
+    Partagées par l'adaptateur pygame et la relecture des replays, pour
+    qu'une partie rejouée exécute exactement les mêmes commandes.
+    """
+    return {
+        ToucheClavier.GAUCHE: CommandeDeplacerGauchePartie(),
+        ToucheClavier.DROITE: CommandeDeplacerDroitePartie(),
+        ToucheClavier.ROTATION: CommandeTournerPartie(),
+        ToucheClavier.CHUTE_RAPIDE: CommandeDescendre(),
+        ToucheClavier.CHUTE_INSTANTANEE: CommandeChuteRapidePartie(),
+        ToucheClavier.PAUSE: CommandePause(),
+        ToucheClavier.MUTE: CommandeBasculerMute(),
+        ToucheClavier.RESTART: CommandeRedemarrer(),
+    }
+
+
 class GestionnaireEvenements:
     """
     Gestionnaire principal des événements d'entrée.
@@ -85,23 +113,79 @@ class GestionnaireEvenements:
     - Gérer la répétition des touches
     """
     
-    def __init__(self, mapping_touches: Optional[Dict[str, ToucheClavier]] = None):
+    # Retard au-delà duquel les répétitions manquées ne sont pas rattrapées
+    # (pause, blocage) : une seule est émise et le rythme repart de là
+    RETARD_MAX_REPETITION = 0.25
+    
+    def __init__(self, mapping_touches: Optional[Dict[str, ToucheClavier]] = None,
+                 commandes: Optional[Dict[ToucheClavier, Commande]] = None):
         """
         Initialise le gestionnaire avec un mapping de touches.
         
         Args:
             mapping_touches: Mapping personnalisé des touches (optionnel)
+            commandes: Commandes associées aux touches logiques (optionnel)
         """
         self._mapping_touches = mapping_touches or ConfigurationControles.obtenir_mapping_defaut()
-        self._commandes: Dict[ToucheClavier, Commande] = self._creer_commandes()
+        self._commandes: Dict[ToucheClavier, Commande] = commandes or self._creer_commandes()
         self._touches_repetables = {
             ToucheClavier.GAUCHE, ToucheClavier.DROITE, ToucheClavier.CHUTE_RAPIDE
         }
         
-        # Gestion de la répétition (délais optimisés pour le gameplay)
+        # Gestion de la répétition (délais optimisés pour le gameplay) :
+        # date de la prochaine répétition de chaque touche maintenue, et tas
+        # (date, ordre, touche) ; une entrée dont la date n'est plus celle de
+        # la touche (relâchée, replanifiée) est ignorée
         self._touches_maintenues: Dict[ToucheClavier, float] = {}
+        self._echeances: List[Tuple[float, int, ToucheClavier]] = []
+        self._ordre_echeances = itertools.count()
         self._delai_repetition = 0.12  # 120ms entre les répétitions (plus rapide)
         self._delai_initial = 0.20     # 200ms avant la première répétition (plus court)
+        
+        # Observateurs des touches traitées (enregistrement des replays)
+        self._observateurs: List[Callable[[ToucheClavier, TypeEvenement, float], None]] = []
+    
+    def ajouter_observateur(self, observateur: Callable[[ToucheClavier, TypeEvenement, float], None]) -> None:
+        """
+        Abonne un observateur aux touches logiques traitées.
+        
+        L'observateur reçoit (touche, type d'événement, temps) pour chaque
+        appui et relâche, et un CLAVIER_MAINTENU à chaque répétition exécutée.
+        
+        Args:
+            observateur: Fonction appelée pour chaque événement
+        """
+        self._observateurs.append(observateur)
+    
+    def _notifier(self, touche: ToucheClavier, type_evenement: TypeEvenement, temps_actuel: float) -> None:
+        """Transmet un événement aux observateurs."""
+        for observateur in self._observateurs:
+            observateur(touche, type_evenement, temps_actuel)
+    
+    def executer_touche(self, touche: ToucheClavier, moteur: MoteurJeu) -> bool:
+        """
+        Exécute la commande d'une touche logique, sans gestion de répétition.
+        
+        Args:
+            touche: Touche logique
+            moteur: Instance du moteur de jeu
+            
+        Returns:
+            True si la commande a été exécutée, False sinon (collision comprise)
+        """
+        commande = self._commandes.get(touche)
+        if not commande:
+            return False
+        return self._executer(commande, moteur)
+    
+    @staticmethod
+    def _executer(commande: Commande, moteur: MoteurJeu) -> bool:
+        """Exécute une commande, une collision comptant comme un échec silencieux."""
+        try:
+            return commande.execute(moteur)
+        except ExceptionCollision:
+            # Action impossible (collision) - traiter silencieusement selon les directives
+            return False
     
     def _creer_commandes(self) -> Dict[ToucheClavier, Commande]:
         """Crée le mapping entre touches logiques et commandes."""
@@ -144,6 +228,9 @@ class GestionnaireEvenements:
             return False
         
         # Traiter selon le type d'événement
+        if type_evenement != TypeEvenement.CLAVIER_MAINTENU:
+            self._notifier(touche_logique, type_evenement, temps_actuel)
+        
         if type_evenement == TypeEvenement.CLAVIER_APPUI:
             return self._traiter_appui(touche_logique, commande, moteur, temps_actuel)
         elif type_evenement == TypeEvenement.CLAVIER_RELACHE:
@@ -161,14 +248,10 @@ class GestionnaireEvenements:
         """Traite l'appui initial d'une touche."""
         # Marquer la touche comme maintenue si répétable
         if touche in self._touches_repetables:
-            self._touches_maintenues[touche] = temps_actuel
+            self._planifier_repetition(touche, temps_actuel + self._delai_initial)
         
         # Exécuter la commande immédiatement avec gestion des exceptions de collision
-        try:
-            return commande.execute(moteur)
-        except ExceptionCollision:
-            # Action impossible (collision) - traiter silencieusement selon les directives
-            return False
+        return self._executer(commande, moteur)
     
     def _traiter_relache(self, touche: ToucheClavier) -> bool:
         """Traite le relâchement d'une touche."""
@@ -183,27 +266,37 @@ class GestionnaireEvenements:
                          commande: Commande, 
                          moteur: MoteurJeu,
                          temps_actuel: float) -> bool:
-        """Traite une touche maintenue (répétition)."""
+        """
+        Traite une touche maintenue : émet toutes ses répétitions échues.
+        
+        Returns:
+            True si au moins une répétition a été exécutée
+        """
         # Vérifier si la touche est répétable et maintenue
         if touche not in self._touches_repetables or touche not in self._touches_maintenues:
             return False
         
-        temps_debut = self._touches_maintenues[touche]
-        temps_ecoule = temps_actuel - temps_debut
+        echeance = self._touches_maintenues[touche]
+        if echeance > temps_actuel:
+            return False
+        if temps_actuel - echeance > self.RETARD_MAX_REPETITION:
+            echeance = temps_actuel
         
-        # Vérifier si assez de temps s'est écoulé pour répéter
-        if temps_ecoule >= self._delai_initial:
-            # Calculer si on doit répéter maintenant
-            temps_depuis_initial = temps_ecoule - self._delai_initial
-            if temps_depuis_initial % self._delai_repetition < 0.016:  # ~60 FPS
-                # Exécuter avec gestion des exceptions de collision
-                try:
-                    return commande.execute(moteur)
-                except ExceptionCollision:
-                    # Action impossible (collision) - traiter silencieusement
-                    return False
+        # Rattrapage : une répétition par délai écoulé depuis la dernière mise à jour
+        execute = False
+        while echeance <= temps_actuel:
+            self._notifier(touche, TypeEvenement.CLAVIER_MAINTENU, temps_actuel)
+            # Exécuter avec gestion des exceptions de collision
+            execute = self._executer(commande, moteur) or execute
+            echeance += self._delai_repetition
         
-        return False
+        self._planifier_repetition(touche, echeance)
+        return execute
+    
+    def _planifier_repetition(self, touche: ToucheClavier, echeance: float) -> None:
+        """Enregistre la date de la prochaine répétition d'une touche maintenue."""
+        self._touches_maintenues[touche] = echeance
+        heapq.heappush(self._echeances, (echeance, next(self._ordre_echeances), touche))
     
     def mettre_a_jour_repetition(self, moteur: MoteurJeu, temps_actuel: float) -> List[bool]:
         """
@@ -218,7 +311,12 @@ class GestionnaireEvenements:
         """
         resultats = []
         
-        for touche in list(self._touches_maintenues.keys()):
+        # Seules les touches dont la répétition est échue sont visitées
+        echeances = self._echeances
+        while echeances and echeances[0][0] <= temps_actuel:
+            echeance, _, touche = heapq.heappop(echeances)
+            if self._touches_maintenues.get(touche) != echeance:
+                continue  # Touche relâchée ou replanifiée depuis
             commande = self._commandes.get(touche)
             if commande:
                 resultat = self._traiter_maintenu(touche, commande, moteur, temps_actuel)
@@ -234,7 +332,12 @@ class GestionnaireEvenements:
         Args:
             delai_initial: Délai avant la première répétition (secondes)
             delai_repetition: Délai entre les répétitions (secondes)
+            
+        Raises:
+            ValueError: Si le délai entre les répétitions n'est pas positif
         """
+        if delai_repetition <= 0:
+            raise ValueError(f"Délai de répétition invalide: {delai_repetition}")
         self._delai_initial = delai_initial
         self._delai_repetition = delai_repetition
     
@@ -264,6 +367,7 @@ class GestionnaireEvenements:
     def reinitialiser_touches_maintenues(self) -> None:
         """Remet à zéro toutes les touches maintenues (utile en cas de pause)."""
         self._touches_maintenues.clear()
+        self._echeances.clear()
     
     def statistiques(self) -> str:
         """Retourne des statistiques sur le gestionnaire."""
@@ -0,0 +1,45 @@
+"""
+Horloge simulée pour les parties sans affichage (headless).
+
+Remplace time.perf_counter() dans MoteurPartie : le temps n'avance que lorsqu'on
+le demande explicitement, ce qui permet de simuler une partie complète
+aussi vite que le processeur le permet, de façon déterministe.
+"""
+
+
+class HorlogeSimulee:
+    """
+    Horloge injectable dont le temps est contrôlé par l'appelant.
+
+    S'utilise comme une fonction sans argument (compatible avec time.perf_counter) :
+        horloge = HorlogeSimulee()
+        moteur = MoteurPartie(horloge=horloge)
+        horloge.avancer(1.0)  # Une seconde de jeu s'écoule instantanément
+    """
+
+    def __init__(self, temps_initial: float = 0.0):
+        """
+        Initialise l'horloge.
+
+        Args:
+            temps_initial: Temps de départ en secondes
+        """
+        self.temps = temps_initial
+
+    def __call__(self) -> float:
+        """Retourne le temps simulé actuel en secondes."""
+        return self.temps
+
+    def avancer(self, duree: float) -> None:
+        """
+        Fait avancer le temps simulé.
+
+        Args:
+            duree: Durée à ajouter en secondes (doit être positive)
+
+        Raises:
+            ValueError: Si la durée est négative
+        """
+        if duree < 0:
+            raise ValueError(f"Durée négative interdite pour l'horloge simulée : {duree}")
+        self.temps += duree
@@ -3,6 +3,11 @@ Service de logging pour Tetris utilisant la librairie standard Python logging.
 
 Ce service remplace les print() par un système de logging configurable,
 similaire à Log4J en Java, permettant d'activer/désactiver les logs debug.
+
+Formatage paresseux : les arguments sont passés à part, à la manière de
+logging (logger_tetris.debug("[DICE] Pièce: %s", type_piece)), et le message
+n'est formaté que s'il est réellement émis. Sur les chemins chauds, le test
+bon marché `if logger_tetris.debug_actif:` évite même d'évaluer les arguments.
 """
 
 import logging
@@ -19,6 +24,11 @@ class LoggerTetris:
     - Mode debug activable/désactivable 
     - Format personnalisé pour les messages Tetris
     - Compatible avec les patterns existants [GAME], [DICE], etc.
+    - Formatage paresseux des messages (arguments séparés, style %)
+    
+    Attributs:
+        debug_actif: True si les messages debug sont émis (lecture seule,
+            à tester avant de construire un message coûteux)
     """
     
     def __init__(self, nom_logger: str = "tetris"):
@@ -35,7 +45,8 @@ class LoggerTetris:
         if not self._logger.handlers:
             self._configurer_handler()
         
-        self._mode_debug = False  # Debug activé par défaut
+        self.debug_actif = False  # Debug désactivé par défaut
+        self._niveau = logging.DEBUG  # Niveau minimal émis (reflet du niveau du logger)
     
     def _configurer_handler(self) -> None:
         """Configure le handler pour l'affichage des logs."""
@@ -58,12 +69,12 @@ class LoggerTetris:
         Args:
             actif: True pour activer debug, False pour désactiver TOUS les logs
         """
-        self._mode_debug = actif
+        self.debug_actif = actif
         if actif:
-            self._logger.setLevel(logging.DEBUG)
+            self._changer_niveau(logging.DEBUG)
         else:
             # Désactiver TOUS les logs comme demandé par l'utilisateur
-            self._logger.setLevel(logging.CRITICAL + 1)  # Plus haut que CRITICAL
+            self._changer_niveau(logging.CRITICAL + 1)  # Plus haut que CRITICAL
     
     def set_silent_mode(self, actif: bool) -> None:
         """
@@ -74,14 +85,19 @@ class LoggerTetris:
             actif: True pour activer mode silencieux, False pour mode normal
         """
         if actif:
-            self._logger.setLevel(logging.ERROR)
-            self._mode_debug = False
+            self._changer_niveau(logging.ERROR)
+            self.debug_actif = False
         else:
             # Restaurer le mode normal
-            if self._mode_debug:
-                self._logger.setLevel(logging.DEBUG)
+            if self.debug_actif:
+                self._changer_niveau(logging.DEBUG)
             else:
-                self._logger.setLevel(logging.INFO)
+                self._changer_niveau(logging.INFO)
+    
+    def _changer_niveau(self, niveau: int) -> None:
+        """Change le niveau du logger et son reflet local utilisé par est_actif()."""
+        self._niveau = niveau
+        self._logger.setLevel(niveau)
     
     def is_debug_enabled(self) -> bool:
         """
@@ -90,44 +106,62 @@ class LoggerTetris:
         Returns:
             True si debug activé, False sinon
         """
-        return self._mode_debug
+        return self.debug_actif
+    
+    def est_actif(self, niveau: int = logging.DEBUG) -> bool:
+        """
+        Vérifie, sans rien formater, si un message de ce niveau serait émis.
+        
+        Args:
+            niveau: Niveau logging (logging.DEBUG, logging.INFO...)
+            
+        Returns:
+            True si un message de ce niveau serait affiché
+        """
+        if niveau <= logging.DEBUG:
+            return self.debug_actif
+        return niveau >= self._niveau
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         Log un message de debug (affiché seulement si debug activé).
         
         Args:
-            message: Message à logger
+            message: Message à logger (avec des %s si args est fourni)
+            *args: Arguments formatés dans le message seulement s'il est émis
         """
-        if self._mode_debug:
-            self._logger.debug(message)
+        if self.debug_actif:
+            self._logger.debug(message, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """
         Log un message d'information (toujours affiché).
         
         Args:
-            message: Message à logger
+            message: Message à logger (avec des %s si args est fourni)
+            *args: Arguments formatés dans le message seulement s'il est émis
         """
-        self._logger.info(message)
+        self._logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """
         Log un message d'avertissement (toujours affiché).
         
         Args:
-            message: Message à logger
+            message: Message à logger (avec des %s si args est fourni)
+            *args: Arguments formatés dans le message seulement s'il est émis
         """
-        self._logger.warning(message)
+        self._logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """
         Log un message d'erreur (toujours affiché).
         
         Args:
-            message: Message à logger
+            message: Message à logger (avec des %s si args est fourni)
+            *args: Arguments formatés dans le message seulement s'il est émis
         """
-        self._logger.error(message)
+        self._logger.error(message, *args)
 
 
 # Instance globale du logger (pattern Singleton simplifié)
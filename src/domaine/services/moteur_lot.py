@@ -0,0 +1,169 @@
+"""
+MoteurLot - N parties Tetris jouées simultanément
+
+Contrepartie vectorisée de MoteurPartie pour l'entraînement et
+l'évaluation de politiques de placement sur des milliers de parties.
+
+Chaque appel à placer() joue un coup dans toutes les parties en cours :
+la politique choisit une orientation et une colonne par partie, la pièce
+active tombe jusqu'au contact (chute rapide), se fige, les lignes
+complètes disparaissent et la pièce suivante apparaît. Tous ces calculs
+sont faits par PlateauLot en appels NumPy, sans boucle sur les parties.
+
+Règles reprises de MoteurPartie :
+- Apparition des pièces comme FabriquePieces.creer(type, 5, 1), orientation 0
+- Score de chute rapide : lignes descendues x niveau
+- Score des lignes : 100/300/500/800 x niveau, niveau = lignes // 10 + 1
+- Game over si une pièce se fige en zone invisible ou ne peut apparaître
+
+Différence : un coup dont la position de départ est en collision
+(orientation ou colonne impossible) termine la partie concernée.
+"""
+
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+from ..entites.plateau_lot import PlateauLot, TYPES_PIECES
+
+
+class MoteurLot:
+    """
+    Moteur de N parties avancées en parallèle, coup par coup.
+
+    Les états sont des tableaux (N,) indexés par partie : types_actifs,
+    types_suivants, score, lignes_completees, pieces_placees, niveau,
+    termine, et pieces_par_type (N, nb_types).
+    """
+
+    # Position d'apparition des pièces (comme MoteurPartie)
+    X_SPAWN = 5
+    Y_SPAWN = 1
+
+    # Points par nombre de lignes supprimées simultanément (x niveau)
+    POINTS_LIGNES = (0, 100, 300, 500, 800)
+
+    def __init__(self, nb_parties: int, graine: Optional[int] = None,
+                 largeur: int = 10, hauteur: int = 20):
+        """
+        Initialise N parties avec une première pièce active et une pièce suivante.
+
+        Args:
+            nb_parties: Nombre de parties jouées en parallèle
+            graine: Graine du générateur de pièces (lot reproductible)
+            largeur: Largeur des plateaux
+            hauteur: Hauteur des plateaux
+
+        Raises:
+            ImportError: Si NumPy n'est pas installé
+        """
+        self.plateaux = PlateauLot(nb_parties, largeur, hauteur)
+        self.nb_parties = nb_parties
+        self.graine = graine
+        self._generateur = np.random.default_rng(graine)
+        self._points_lignes = np.array(self.POINTS_LIGNES, dtype=np.int64)
+        self._zeros = np.zeros(nb_parties, dtype=np.int64)
+
+        # Pivot d'apparition de chaque type (chaque pièce place son pivot différemment)
+        # Import local : le paquet fabriques importe les services (logger)
+        from ..entites.fabriques.fabrique_pieces import FabriquePieces
+        fabrique = FabriquePieces()
+        pivots = [fabrique.creer(t, x_pivot=self.X_SPAWN, y_pivot=self.Y_SPAWN).position_pivot
+                  for t in TYPES_PIECES]
+        self._x_spawn = np.array([p.x for p in pivots], dtype=np.int64)
+        self._y_spawn = np.array([p.y for p in pivots], dtype=np.int64)
+
+        self.types_actifs = np.zeros(nb_parties, dtype=np.int64)
+        self.types_suivants = np.zeros(nb_parties, dtype=np.int64)
+        self.score = np.zeros(nb_parties, dtype=np.int64)
+        self.lignes_completees = np.zeros(nb_parties, dtype=np.int64)
+        self.pieces_placees = np.zeros(nb_parties, dtype=np.int64)
+        self.niveau = np.ones(nb_parties, dtype=np.int64)
+        self.pieces_par_type = np.zeros((nb_parties, len(TYPES_PIECES)), dtype=np.int64)
+        self.termine = np.zeros(nb_parties, dtype=bool)
+
+        self.reinitialiser()
+
+    def reinitialiser(self, masque: Optional['np.ndarray'] = None) -> None:
+        """
+        Redémarre les parties sélectionnées (plateau vide, statistiques à zéro).
+
+        Args:
+            masque: Booléens (N,) des parties à redémarrer (toutes si None)
+        """
+        if masque is None:
+            masque = np.ones(self.nb_parties, dtype=bool)
+        masque = np.asarray(masque, dtype=bool)
+
+        self.plateaux.reinitialiser(masque)
+        self.score[masque] = 0
+        self.lignes_completees[masque] = 0
+        self.pieces_placees[masque] = 0
+        self.niveau[masque] = 1
+        self.pieces_par_type[masque] = 0
+        self.termine[masque] = False
+
+        nb = int(masque.sum())
+        self.types_actifs[masque] = self._tirer_types(nb)
+        self.types_suivants[masque] = self._tirer_types(nb)
+
+    def _tirer_types(self, nb: int) -> 'np.ndarray':
+        """Tire nb types de pièces uniformément."""
+        return self._generateur.integers(0, len(TYPES_PIECES), size=nb)
+
+    def placer(self, orientations: 'np.ndarray', colonnes: 'np.ndarray') -> 'np.ndarray':
+        """
+        Joue un coup dans chaque partie en cours.
+
+        Args:
+            orientations: Orientation choisie pour la pièce active (N,)
+            colonnes: Position X du pivot choisie (N,), la pièce partant
+                de la hauteur d'apparition de son type
+
+        Returns:
+            Entiers (N,) : lignes supprimées par le coup (0 pour les parties terminées)
+        """
+        orientations = np.asarray(orientations, dtype=np.int64)
+        colonnes = np.asarray(colonnes, dtype=np.int64)
+        types = self.types_actifs
+        y_depart = self._y_spawn[types]
+        en_cours = ~self.termine
+
+        # 1. Coups impossibles dès la position de départ
+        bloques = self.plateaux.collisions(types, orientations, colonnes, y_depart) & en_cours
+        jouables = en_cours & ~bloques
+
+        # 2. Chute rapide jusqu'au contact puis placement
+        distances = self.plateaux.distances_de_chute(types, orientations, colonnes, y_depart)
+        distances = np.where(jouables, distances, 0)
+        debordes = self.plateaux.placer(types, orientations, colonnes,
+                                        y_depart + distances, masque=jouables)
+        self.score += distances * self.niveau
+
+        # 3. Lignes complètes (les parties terminées n'en ont aucune nouvelle)
+        nb_lignes = self.plateaux.supprimer_lignes_completes()
+        self.score += self._points_lignes[nb_lignes] * self.niveau
+        self.lignes_completees += nb_lignes
+        self.niveau = self.lignes_completees // 10 + 1
+
+        # 4. Statistiques et pièce suivante
+        self.pieces_placees += jouables
+        self.pieces_par_type[np.arange(self.nb_parties), types] += jouables
+        self.types_actifs = np.where(jouables, self.types_suivants, self.types_actifs)
+        self.types_suivants = np.where(jouables, self._tirer_types(self.nb_parties), self.types_suivants)
+
+        # 5. Game over : coup bloqué, pièce figée hors du plateau, ou apparition impossible
+        apparition_impossible = self.plateaux.collisions(
+            self.types_actifs, self._zeros,
+            self._x_spawn[self.types_actifs], self._y_spawn[self.types_actifs]
+        )
+        self.termine |= bloques | debordes | (jouables & apparition_impossible)
+
+        return nb_lignes
+
+    def tous_termines(self) -> bool:
+        """Vérifie si toutes les parties du lot sont terminées."""
+        return bool(self.termine.all())
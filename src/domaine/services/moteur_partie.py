@@ -5,15 +5,24 @@ Service du domaine qui orchestre la logique métier du jeu.
 """
 
 import time
-from typing import Optional
+from typing import Callable, List, Optional, Tuple, Type
 
 from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
-from src.domaine.entites.piece import Piece
-from src.domaine.entites.position import Position
+from src.domaine.entites.fabriques.generateurs_pieces import (
+    FilePieces, GenerateurClassique, GenerateurPieces
+)
+from src.domaine.entites.instantane_partie import (
+    InstantanePartie, TYPES_PIECES, compacter_piece, decompacter_piece
+)
+from src.domaine.entites.journal_changements import JournalChangements, TypeChangement
+from src.domaine.entites.piece import EtatPiece, Piece, TypePiece
 from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.zobrist import cle_piece
 from src.domaine.entites.statistiques.statistiques_jeu import StatistiquesJeu
 from src.domaine.exceptions.exception_audio import ExceptionAudio
 from src.ports.sortie.audio_jeu import AudioJeu
+from .horloge_simulee import HorlogeSimulee
 from .logger_tetris import logger_tetris
 
 
@@ -23,17 +32,42 @@ class MoteurPartie:
     
     [TARGET] FONCTIONNALITÉS :
     - Plateau refactorisé 10x20
-    - Génération aléatoire des pièces
+    - Génération des pièces seedée (politique classique ou 7-bag) avec file d'aperçu
     - Détection automatique des lignes complètes
     - Score et statistiques
     - Système de pause
+    - Mode headless : horloge injectable et avance par ticks fixes
     """
     
-    def __init__(self, audio: Optional[AudioJeu] = None):
+    # Durée d'un tick de simulation (60 ticks par seconde)
+    DUREE_TICK = 1 / 60
+    
+    # Nombre de prochaines pièces connues à l'avance (pièce suivante comprise)
+    PROFONDEUR_APERCU = 5
+    
+    def __init__(self, audio: Optional[AudioJeu] = None,
+                 classe_plateau: Type[Plateau] = Plateau,
+                 horloge: Optional[Callable[[], float]] = None,
+                 graine: Optional[int] = None,
+                 generateur: Optional[GenerateurPieces] = None,
+                 profondeur_apercu: int = PROFONDEUR_APERCU):
+        # Moteur de stockage du plateau (Plateau ou PlateauBitboard)
+        self._classe_plateau = classe_plateau
+        
+        # Source monotone du temps (time.perf_counter en jeu réel, HorlogeSimulee en headless)
+        self._horloge = horloge if horloge is not None else time.perf_counter
+        
         # Plateau principal (10x20 standard Tetris)
-        self.plateau = Plateau(10, 20)
+        self.plateau = self._classe_plateau(10, 20)
+        
+        # Générateur de la partie (son propre random seedé : partie reproductible)
+        # et file des prochains types, remplie à l'avance pour l'aperçu
+        if generateur is None:
+            generateur = GenerateurClassique(graine)
+        self.graine = generateur.graine
+        self.file_pieces = FilePieces(generateur, max(0, profondeur_apercu - 1))
         
-        # Fabrique pour générer les pièces
+        # Fabrique pour instancier les pièces tirées
         self.fabrique = FabriquePieces()
         
         # Pièce actuellement contrôlée
@@ -42,6 +76,12 @@ class MoteurPartie:
         # Prochaine pièce (preview)
         self.piece_suivante: Optional[Piece] = None
         
+        # Version et journal des états de la pièce active (apparition, mouvements)
+        self.journal_piece = JournalChangements()
+        
+        # Clé Zobrist de l'état de la pièce active, mise à jour avec son journal
+        self._cle_piece = 0
+        
         # États du jeu
         self.en_pause = True  # Démarrer en pause par défaut selon les directives
         self.jeu_termine = False
@@ -54,15 +94,23 @@ class MoteurPartie:
         self.audio = audio
         
         # Timer pour la chute automatique
-        self.derniere_chute = time.time()
+        self.derniere_chute = self._horloge()
         self.intervalle_chute = 1.0  # 1 seconde au début
         
+        # Compteurs de la simulation par ticks fixes (mode headless)
+        self.ticks = 0
+        self._ticks_depuis_chute = 0
+        
+        # Observateurs des chutes automatiques (enregistrement des replays)
+        self._observateurs_chute: List[Callable[[float], None]] = []
+        
         # Messages à afficher
         self.messages = []
         
-        logger_tetris.debug(f"[GAME] Partie Tetris initialisée")
-        logger_tetris.debug(f"[ROUND_PUSHPIN] Plateau: {self.plateau.largeur}x{self.plateau.hauteur}")
-        logger_tetris.debug(f"[DICE] Types de pièces disponibles: {len(self.fabrique.obtenir_types_supportes())}")
+        if logger_tetris.debug_actif:
+            logger_tetris.debug("[GAME] Partie Tetris initialisée")
+            logger_tetris.debug("[ROUND_PUSHPIN] Plateau: %dx%d", self.plateau.largeur, self.plateau.hauteur)
+            logger_tetris.debug("[DICE] Types de pièces disponibles: %d", len(self.fabrique.obtenir_types_supportes()))
         
         # Initialiser l'audio si disponible
         if self.audio:
@@ -73,6 +121,26 @@ class MoteurPartie:
         self._generer_piece_suivante()
         self._faire_descendre_piece_suivante()
     
+    @classmethod
+    def creer_headless(cls, graine: Optional[int] = None,
+                       generateur: Optional[GenerateurPieces] = None) -> 'MoteurPartie':
+        """
+        Crée un moteur sans audio ni horloge réelle, prêt à être avancé par ticks.
+        
+        Utilise le PlateauBitboard et une HorlogeSimulee, et démarre hors pause.
+        
+        Args:
+            graine: Graine du générateur de pièces (partie reproductible)
+            generateur: Politique de génération (défaut : classique seedée par graine)
+            
+        Returns:
+            Moteur prêt pour avancer(n_ticks)
+        """
+        moteur = cls(audio=None, classe_plateau=PlateauBitboard,
+                     horloge=HorlogeSimulee(), graine=graine, generateur=generateur)
+        moteur.en_pause = False
+        return moteur
+    
     def obtenir_piece_active(self) -> Optional[Piece]:
         """Retourne la pièce actuellement contrôlée."""
         return self.piece_active
@@ -85,6 +153,42 @@ class MoteurPartie:
         """Retourne les statistiques de la partie."""
         return self.stats
     
+    @property
+    def version_piece(self) -> int:
+        """Version de l'état de la pièce active, incrémentée à chaque apparition ou mouvement."""
+        return self.journal_piece.version
+    
+    @property
+    def cle_zobrist(self) -> int:
+        """
+        Clé 64 bits de la position : plateau et état de la pièce active.
+        
+        Deux suites d'entrées menant au même plateau avec la même pièce au même
+        endroit donnent la même clé (index des tables de transposition).
+        """
+        return self.plateau.cle_zobrist ^ self._cle_piece
+    
+    def _journaliser_piece(self, type_changement: TypeChangement, etat: EtatPiece) -> None:
+        """Journalise un nouvel état de la pièce active et met à jour sa clé Zobrist."""
+        self.journal_piece.enregistrer(type_changement, etat)
+        self._cle_piece = cle_piece(self.piece_active.type_piece, etat.orientation,
+                                    etat.position_pivot.x, etat.position_pivot.y)
+    
+    def apercu_pieces(self, nombre: Optional[int] = None) -> Tuple[TypePiece, ...]:
+        """
+        Retourne les types des prochaines pièces, sans rien consommer.
+        
+        Args:
+            nombre: Nombre de types voulus (défaut : tout l'aperçu)
+            
+        Returns:
+            Tuple des prochains types, en commençant par la pièce suivante
+        """
+        apercu = self.file_pieces.apercu()
+        if self.piece_suivante:
+            apercu = (self.piece_suivante.type_piece,) + apercu
+        return apercu if nombre is None else apercu[:nombre]
+    
     def basculer_menu(self) -> None:
         """Bascule l'affichage du menu."""
         self.afficher_menu = not self.afficher_menu
@@ -102,22 +206,17 @@ class MoteurPartie:
         if not self.piece_active or self.en_pause or self.jeu_termine:
             return False
         
-        # Sauvegarder l'état
-        positions_orig = self.piece_active.positions.copy()
-        pivot_orig = Position(self.piece_active.position_pivot.x, self.piece_active.position_pivot.y)
-        
-        # Essayer le déplacement
-        self.piece_active.deplacer(delta_x, delta_y)
-        
-        # Vérifier si c'est valide
-        if self.plateau.peut_placer_piece(self.piece_active):
-            logger_tetris.debug(f"[ROUND_PUSHPIN] Déplacement réussi: {self.piece_active.type_piece.value} -> {self.piece_active.positions}")
-            return True
-        else:
-            # Annuler le déplacement
-            self.piece_active.positions = positions_orig
-            self.piece_active.position_pivot = pivot_orig
+        # Vérifier le mouvement avant toute mutation : seul un mouvement légal est appliqué
+        etat = self.piece_active.etat_apres(delta_x, delta_y)
+        if not self.plateau.peut_placer_positions(etat.positions):
             return False
+        
+        self.piece_active.appliquer_etat(etat)
+        self._journaliser_piece(TypeChangement.PIECE_DEPLACEE, etat)
+        if logger_tetris.debug_actif:
+            logger_tetris.debug("[ROUND_PUSHPIN] Déplacement réussi: %s -> %s",
+                                self.piece_active.type_piece.value, self.piece_active.positions)
+        return True
     
     def faire_descendre_piece(self) -> bool:
         """Fait descendre la pièce active d'une ligne si possible."""
@@ -128,69 +227,39 @@ class MoteurPartie:
         if not self.piece_active or self.en_pause or self.jeu_termine:
             return False
         
-        # Sauvegarder l'état complet
-        positions_orig = self.piece_active.positions.copy()
-        orientation_orig = getattr(self.piece_active, '_orientation', None)
-        est_vertical_orig = getattr(self.piece_active, '_est_vertical', None)  # Pour pièces S/Z
-        position_pivot_orig = getattr(self.piece_active, 'position_pivot', None)  # Pour pièces T/J/L/I
-        x_pivot_absolu_orig = getattr(self.piece_active, '_x_pivot_absolu', None)  # Pour pièce T
-        y_pivot_absolu_orig = getattr(self.piece_active, '_y_pivot_absolu', None)  # Pour pièce T
+        # Vérifier la rotation avant toute mutation
+        etat = self.piece_active.etat_apres(rotation=1)
+        if not self.plateau.peut_placer_positions(etat.positions):
+            return False
         
-        # Essayer la rotation
-        self.piece_active.tourner()
+        self.piece_active.appliquer_etat(etat)
+        self._journaliser_piece(TypeChangement.PIECE_DEPLACEE, etat)
+        if logger_tetris.debug_actif:
+            logger_tetris.debug("[ROTATE] Rotation réussie: %s -> %s",
+                                self.piece_active.type_piece.value, self.piece_active.positions)
         
-        # Vérifier si c'est valide
-        if self.plateau.peut_placer_piece(self.piece_active):
-            logger_tetris.debug(f"[ROTATE] Rotation réussie: {self.piece_active.type_piece.value} -> {self.piece_active.positions}")
-            
-            # Jouer le son de rotation si audio disponible
-            if self.audio:
-                try:
-                    self.audio.jouer_effet_sonore("assets/audio/sfx/rotate.wav", volume=1.0)
-                except ExceptionAudio as e:
-                    logger_tetris.debug(f"[AUDIO] Son rotation non joué: {e}")
-                    # Le jeu continue sans son
-            
-            return True
-        else:
-            # Annuler la rotation complètement - RESTAURATION COMPLÈTE
-            self.piece_active.positions = positions_orig
-            if orientation_orig is not None:
-                self.piece_active._orientation = orientation_orig
-            if est_vertical_orig is not None:
-                self.piece_active._est_vertical = est_vertical_orig  # Restaurer état S/Z
-            if position_pivot_orig is not None:
-                self.piece_active.position_pivot = position_pivot_orig  # Restaurer pivot T/J/L/I
-            if x_pivot_absolu_orig is not None:
-                self.piece_active._x_pivot_absolu = x_pivot_absolu_orig  # Restaurer coord absolue T
-            if y_pivot_absolu_orig is not None:
-                self.piece_active._y_pivot_absolu = y_pivot_absolu_orig  # Restaurer coord absolue T
-            return False
+        # Jouer le son de rotation si audio disponible
+        if self.audio:
+            try:
+                self.audio.jouer_effet_sonore("assets/audio/sfx/rotate.wav", volume=1.0)
+            except ExceptionAudio as e:
+                logger_tetris.debug("[AUDIO] Son rotation non joué: %s", e)
+                # Le jeu continue sans son
+        
+        return True
     
     def chute_rapide(self) -> bool:
         """Chute rapide : descend la pièce jusqu'au contact."""
         if not self.piece_active or self.en_pause or self.jeu_termine:
             return False
         
-        nb_lignes = 0
-        
-        while True:
-            positions_orig = self.piece_active.positions.copy()
-            pivot_orig = Position(self.piece_active.position_pivot.x, self.piece_active.position_pivot.y)
-            
-            # Essayer de descendre
-            self.piece_active.deplacer(0, 1)
-            
-            if self.plateau.peut_placer_piece(self.piece_active):
-                nb_lignes += 1
-            else:
-                # Remettre à la position précédente et arrêter
-                self.piece_active.positions = positions_orig
-                self.piece_active.position_pivot = pivot_orig
-                break
+        # Distance de chute en O(largeur de la pièce) grâce à l'index du plateau
+        nb_lignes = self.plateau.distance_de_chute(self.piece_active)
         
         if nb_lignes > 0:
-            logger_tetris.debug(f"[FAST_DROP] Chute rapide: {nb_lignes} lignes -> {self.piece_active.positions}")
+            self.piece_active.deplacer(0, nb_lignes)
+            self._journaliser_piece(TypeChangement.PIECE_DEPLACEE, self.piece_active.etat_apres())
+            logger_tetris.debug("[FAST_DROP] Chute rapide: %d lignes -> %s", nb_lignes, self.piece_active.positions)
             # Ajouter des points pour la chute rapide
             self.stats.score += nb_lignes * self.stats.niveau
         
@@ -216,12 +285,14 @@ class MoteurPartie:
                     self.audio.jouer_effet_sonore("assets/audio/sfx/game-over.wav", volume=1.0)
                     logger_tetris.info("🔊 Son de Game Over joué")
                 except ExceptionAudio as e:
-                    logger_tetris.debug(f"[AUDIO] Son game over non joué: {e}")
+                    logger_tetris.debug("[AUDIO] Son game over non joué: %s", e)
                     # Le jeu continue sans son
             
             return False
         
-        logger_tetris.debug(f"[ROUND_PUSHPIN] Pièce {self.piece_active.type_piece.value} placée: {self.piece_active.positions}")
+        if logger_tetris.debug_actif:
+            logger_tetris.debug("[ROUND_PUSHPIN] Pièce %s placée: %s",
+                                self.piece_active.type_piece.value, self.piece_active.positions)
         
         # Traitement des lignes supprimées
         if nb_lignes_supprimees > 0:
@@ -234,10 +305,10 @@ class MoteurPartie:
                         self.audio.jouer_effet_sonore("assets/audio/sfx/tetris.wav", volume=1.0)
                         logger_tetris.info("🎵 Son TETRIS joué ! (4 lignes éliminées)")
                     except ExceptionAudio as e:
-                        logger_tetris.debug(f"[AUDIO] Son tetris non joué: {e}")
+                        logger_tetris.debug("[AUDIO] Son tetris non joué: %s", e)
                         # Le jeu continue sans son
             
-            logger_tetris.debug(f"[PARTY] {nb_lignes_supprimees} ligne(s) complétée(s) ! Score: {self.stats.score}")
+            logger_tetris.debug("[PARTY] %d ligne(s) complétée(s) ! Score: %d", nb_lignes_supprimees, self.stats.score)
             
             # Jouer le son de gain de niveau si nécessaire
             if niveau_a_change:
@@ -245,9 +316,9 @@ class MoteurPartie:
                     try:
                         self.audio.jouer_effet_sonore("assets/audio/sfx/gained-a-new-level.wav", volume=1.0)
                     except ExceptionAudio as e:
-                        logger_tetris.debug(f"[AUDIO] Son gain niveau non joué: {e}")
+                        logger_tetris.debug("[AUDIO] Son gain niveau non joué: %s", e)
                         # Le message de niveau s'affiche quand même
-                    logger_tetris.info(f"🎉 NIVEAU UP ! Nouveau niveau: {self.stats.niveau}")
+                    logger_tetris.info("🎉 NIVEAU UP ! Nouveau niveau: %d", self.stats.niveau)
             
             # Accélérer le jeu selon le niveau
             self.intervalle_chute = max(0.1, 1.0 - (self.stats.niveau - 1) * 0.1)
@@ -270,30 +341,120 @@ class MoteurPartie:
         if self.en_pause or self.jeu_termine or not self.piece_active:
             return
         
-        temps_actuel = time.time()
+        temps_actuel = self._horloge()
         
         if temps_actuel - self.derniere_chute >= self.intervalle_chute:
-            # Essayer de faire descendre la pièce
-            if not self.deplacer_piece_active(0, 1):
-                # La pièce ne peut plus descendre
-                
-                # CORRECTION : Vérifier si c'est un game over (pièce bloquée dès le spawn)
-                # Une pièce en zone invisible qui ne peut pas descendre = game over
-                if any(pos.y < 0 for pos in self.piece_active.positions):
-                    # Pièce encore en zone invisible et ne peut pas descendre = Game Over
-                    self.jeu_termine = True
-                    logger_tetris.error("💀 GAME OVER ! La pièce ne peut pas descendre de la zone invisible.")
-                    return
-                
-                # Sinon, placement normal
-                self.placer_piece_et_generer_nouvelle()
+            if not self._appliquer_chute_automatique():
+                return
             
             self.derniere_chute = temps_actuel
     
+    def avancer(self, n_ticks: int = 1) -> int:
+        """
+        Avance la partie de n_ticks pas de temps fixes (mode headless, ou pas
+        accumulés par l'OrdonnanceurFrames de la boucle de jeu).
+        
+        La gravité est comptée en ticks (DUREE_TICK) plutôt qu'en temps réel :
+        les ticks sans chute sont sautés d'un coup, si bien qu'une partie
+        complète se simule aussi vite que le processeur le permet.
+        Si l'horloge est une HorlogeSimulee, elle avance du même temps.
+        
+        Args:
+            n_ticks: Nombre de ticks à simuler
+            
+        Returns:
+            Nombre de ticks réellement simulés (moins si la partie se termine)
+        """
+        if self.en_pause or self.jeu_termine or not self.piece_active:
+            return 0
+        
+        ticks_simules = 0
+        while ticks_simules < n_ticks and not self.jeu_termine:
+            ticks_par_chute = max(1, round(self.intervalle_chute / self.DUREE_TICK))
+            # Intervalle raccourci (montée de niveau) sous le temps déjà écoulé : chute au tick suivant
+            manquants = max(1, ticks_par_chute - self._ticks_depuis_chute)
+            restants = n_ticks - ticks_simules
+            
+            if manquants > restants:
+                # Pas de chute avant la fin de la période demandée
+                self._ticks_depuis_chute += restants
+                self._avancer_horloge_simulee(restants)
+                ticks_simules += restants
+                break
+            
+            # Sauter directement au tick de la prochaine chute
+            self._avancer_horloge_simulee(manquants)
+            ticks_simules += manquants
+            self._ticks_depuis_chute = 0
+            self._appliquer_chute_automatique()
+            self.derniere_chute = self._horloge()
+        
+        return ticks_simules
+    
+    def ajouter_observateur_chute(self, observateur: Callable[[float], None]) -> None:
+        """
+        Abonne un observateur aux chutes automatiques (ticks de gravité).
+        
+        Args:
+            observateur: Fonction appelée avec le temps de l'horloge à chaque chute
+        """
+        self._observateurs_chute.append(observateur)
+    
+    def appliquer_chute_automatique(self) -> bool:
+        """
+        Applique immédiatement une chute automatique, sans attendre l'intervalle.
+        
+        Utilisé par la relecture des replays, où les ticks de gravité
+        font partie du flux enregistré.
+        
+        Returns:
+            True si une chute a été appliquée sans game over
+        """
+        if self.en_pause or self.jeu_termine or not self.piece_active:
+            return False
+        return self._appliquer_chute_automatique()
+    
+    def _avancer_horloge_simulee(self, n_ticks: int) -> None:
+        """Fait avancer l'horloge simulée (si utilisée) et le compteur de ticks."""
+        self.ticks += n_ticks
+        if isinstance(self._horloge, HorlogeSimulee):
+            self._horloge.avancer(n_ticks * self.DUREE_TICK)
+    
+    def _appliquer_chute_automatique(self) -> bool:
+        """
+        Applique une chute automatique : descente d'une ligne ou placement.
+        
+        CORRECTION BUG GAME OVER : Une pièce en zone invisible qui ne peut
+        pas descendre déclenche le game over au lieu d'être placée.
+        
+        Returns:
+            False si la chute a déclenché un game over, True sinon
+        """
+        for observateur in self._observateurs_chute:
+            observateur(self._horloge())
+        
+        # Essayer de faire descendre la pièce
+        if not self.deplacer_piece_active(0, 1):
+            # La pièce ne peut plus descendre
+            
+            # CORRECTION : Vérifier si c'est un game over (pièce bloquée dès le spawn)
+            # Une pièce en zone invisible qui ne peut pas descendre = game over
+            if any(pos.y < 0 for pos in self.piece_active.positions):
+                # Pièce encore en zone invisible et ne peut pas descendre = Game Over
+                self.jeu_termine = True
+                logger_tetris.error("💀 GAME OVER ! La pièce ne peut pas descendre de la zone invisible.")
+                return False
+            
+            # Sinon, placement normal
+            self.placer_piece_et_generer_nouvelle()
+        
+        return True
+    
     def _generer_piece_suivante(self) -> None:
-        """Génère la prochaine pièce aléatoire."""
-        self.piece_suivante = self.fabrique.creer_aleatoire(x_pivot=5, y_pivot=1)
-        logger_tetris.debug(f"[DICE] Prochaine pièce générée: {self.piece_suivante.type_piece.value}")
+        """Instancie la prochaine pièce à partir de la file d'aperçu."""
+        self.piece_suivante = self.fabrique.creer(self.file_pieces.tirer(), x_pivot=5, y_pivot=1)
+        if logger_tetris.debug_actif:
+            logger_tetris.debug("[DICE] Prochaine pièce générée: %s", self.piece_suivante.type_piece.value)
     
     def _faire_descendre_piece_suivante(self) -> None:
         """
@@ -305,7 +466,10 @@ class MoteurPartie:
         """
         if self.piece_suivante:
             self.piece_active = self.piece_suivante
-            logger_tetris.debug(f"[DOWN_ARROW] Nouvelle pièce active: {self.piece_active.type_piece.value} -> {self.piece_active.positions}")
+            self._journaliser_piece(TypeChangement.PIECE_APPARUE, self.piece_active.etat_apres())
+            if logger_tetris.debug_actif:
+                logger_tetris.debug("[DOWN_ARROW] Nouvelle pièce active: %s -> %s",
+                                    self.piece_active.type_piece.value, self.piece_active.positions)
             
             # CORRECTION : Pas de vérification game over immédiate
             # La pièce va naturellement essayer de descendre via mettre_a_jour_chute_automatique()
@@ -314,12 +478,82 @@ class MoteurPartie:
         # Générer la suivante
         self._generer_piece_suivante()
     
+    def capturer(self) -> InstantanePartie:
+        """
+        Capture l'état complet de la partie dans un instantané immuable.
+        
+        Returns:
+            Instantané à passer à restaurer()
+        """
+        lignes, invisibles = self.plateau.obtenir_masques()
+        piece_active = None
+        if self.piece_active:
+            etat = self.piece_active.etat_apres()
+            piece_active = compacter_piece(self.piece_active.type_piece, etat.orientation,
+                                           etat.position_pivot.x, etat.position_pivot.y)
+        stats = self.stats
+        return InstantanePartie(
+            lignes=lignes,
+            lignes_invisibles=invisibles,
+            piece_active=piece_active,
+            piece_suivante=self.piece_suivante.type_piece if self.piece_suivante else None,
+            file_pieces=self.file_pieces.apercu(),
+            generateur=self.file_pieces.generateur.obtenir_etat(),
+            statistiques=(stats.score, stats.lignes_completees, stats.pieces_placees, stats.niveau),
+            pieces_par_type=tuple(stats.pieces_par_type.get(t, 0) for t in TYPES_PIECES),
+            en_pause=self.en_pause,
+            jeu_termine=self.jeu_termine,
+            intervalle_chute=self.intervalle_chute,
+            ticks=self.ticks,
+            ticks_depuis_chute=self._ticks_depuis_chute,
+        )
+    
+    def restaurer(self, instantane: InstantanePartie) -> None:
+        """
+        Remet la partie dans l'état d'un instantané capturé par capturer().
+        
+        Le plateau et la pièce active sont journalisés comme remplacés :
+        les caches des consommateurs (affichage...) se mettent à jour.
+        
+        Args:
+            instantane: Instantané à restaurer (non modifié, réutilisable)
+        """
+        self.plateau.charger_masques(instantane.lignes, instantane.lignes_invisibles)
+        
+        if instantane.piece_active is None:
+            self.piece_active = None
+            self._cle_piece = 0
+        else:
+            type_piece, orientation, x, y = decompacter_piece(instantane.piece_active)
+            # Le pivot d'une pièce créée n'est pas toujours (x, y) : recaler par déplacement
+            piece = self.fabrique.creer(type_piece, x, y)
+            pivot = piece.position_pivot
+            piece.appliquer_etat(piece.etat_apres(x - pivot.x, y - pivot.y, rotation=orientation))
+            self.piece_active = piece
+            self._journaliser_piece(TypeChangement.PIECE_APPARUE, piece.etat_apres())
+        self.piece_suivante = (self.fabrique.creer(instantane.piece_suivante, x_pivot=5, y_pivot=1)
+                               if instantane.piece_suivante is not None else None)
+        
+        self.file_pieces.restaurer(instantane.file_pieces)
+        self.file_pieces.generateur.restaurer_etat(instantane.generateur)
+        
+        stats = StatistiquesJeu()
+        stats.score, stats.lignes_completees, stats.pieces_placees, stats.niveau = instantane.statistiques
+        stats.pieces_par_type = dict(zip(TYPES_PIECES, instantane.pieces_par_type))
+        self.stats = stats
+        
+        self.en_pause = instantane.en_pause
+        self.jeu_termine = instantane.jeu_termine
+        self.intervalle_chute = instantane.intervalle_chute
+        self.ticks = instantane.ticks
+        self._ticks_depuis_chute = instantane.ticks_depuis_chute
+    
     def basculer_pause(self) -> None:
         """Bascule l'état de pause."""
         self.en_pause = not self.en_pause
         
         # Note : La musique continue même en pause - seule la touche M contrôle le mute/unmute
-        logger_tetris.debug(f"[PAUSE] Pause: {'ON' if self.en_pause else 'OFF'}")
+        logger_tetris.debug("[PAUSE] Pause: %s", "ON" if self.en_pause else "OFF")
     
     def demarrer_musique(self) -> bool:
         """Démarre la musique de fond du jeu."""
@@ -328,7 +562,7 @@ class MoteurPartie:
                 self.audio.jouer_musique("tetris-theme.wav", volume=0.7, boucle=True)
                 return True
             except ExceptionAudio as e:
-                logger_tetris.debug(f"[AUDIO] Musique non démarrée: {e}")
+                logger_tetris.debug("[AUDIO] Musique non démarrée: %s", e)
                 return False  # Le jeu continue sans musique
             except Exception as e:
                 logger_tetris.error(f"❌ Erreur inattendue démarrage musique: {e}")
@@ -380,8 +614,8 @@ class MoteurPartie:
         - L'état de jeu (plus en game over)
         - Les pièces actives
         """
-        # Réinitialiser le plateau
-        self.plateau = Plateau(10, 20)
+        # Vider le plateau sur place : sa version continue de croître (PLATEAU_REMPLACE)
+        self.plateau.charger_masques([0] * self.plateau.hauteur)
         
         # Réinitialiser les statistiques
         self.stats = StatistiquesJeu()
@@ -396,8 +630,10 @@ class MoteurPartie:
         self.piece_suivante = None
         
         # Réinitialiser le timer de chute
-        self.derniere_chute = time.time()
+        self.derniere_chute = self._horloge()
         self.intervalle_chute = 1.0
+        self.ticks = 0
+        self._ticks_depuis_chute = 0
         
         # Vider les messages
         self.messages.clear()
@@ -427,7 +663,7 @@ class MoteurPartie:
                         self.audio.jouer_effet_sonore("assets/audio/sfx/tetris.wav", volume=1.0)
                         logger_tetris.info("🎵 Son TETRIS joué ! (4 lignes éliminées)")
                     except ExceptionAudio as e:
-                        logger_tetris.debug(f"[AUDIO] Son tetris non joué: {e}")
+                        logger_tetris.debug("[AUDIO] Son tetris non joué: %s", e)
                         # Le jeu continue sans son
             
             # Jouer le son de gain de niveau si nécessaire
@@ -436,9 +672,9 @@ class MoteurPartie:
                     try:
                         self.audio.jouer_effet_sonore("assets/audio/sfx/gained-a-new-level.wav", volume=1.0)
                     except ExceptionAudio as e:
-                        logger_tetris.debug(f"[AUDIO] Son gain niveau non joué: {e}")
+                        logger_tetris.debug("[AUDIO] Son gain niveau non joué: %s", e)
                         # Le message de niveau s'affiche quand même
-                    logger_tetris.info(f"🎉 NIVEAU UP ! Nouveau niveau: {self.stats.niveau}")
+                    logger_tetris.info("🎉 NIVEAU UP ! Nouveau niveau: %d", self.stats.niveau)
             
             # Accélérer le jeu selon le niveau
             self.intervalle_chute = max(0.1, 1.0 - (self.stats.niveau - 1) * 0.1)
@@ -0,0 +1,134 @@
+"""
+OrdonnanceurFrames - Pas de simulation fixe et rendu cadencé de la boucle de jeu
+
+En jeu, la boucle ne dort qu'à un seul endroit : attendre_frame(), qui
+cadence le rendu à fps_affichage (ou ne dort pas du tout si le rendu
+n'est pas plafonné, la synchronisation verticale faisant alors la
+cadence). Après une attente hors cadence (mode repos), reprendre()
+repart de l'instant présent.
+
+Le temps réel écoulé entre deux frames est versé dans un accumulateur,
+que demarrer_frame() convertit en pas de simulation de durée fixe : une
+frame en retard rattrape ses pas manqués, et la simulation peut tourner
+plus vite que l'affichage (deux pas par frame à 60 Hz pour un rendu à
+30 FPS). Au-delà de pas_max_par_frame (fenêtre déplacée, débogueur), le
+retard est abandonné plutôt que rattrapé d'un bloc.
+
+Toutes les dates viennent d'une même horloge monotone (time.perf_counter
+par défaut) : un changement de l'heure système ne fausse ni la gravité
+ni la répétition des touches.
+
+Exemple d'usage :
+    ordonnanceur = OrdonnanceurFrames()
+    while actif:
+        moteur.avancer(ordonnanceur.demarrer_frame())
+        affichage.dessiner(moteur)
+        ordonnanceur.attendre_frame()
+"""
+
+import time
+from typing import Callable, Optional
+
+from .moteur_partie import MoteurPartie
+
+
+class OrdonnanceurFrames:
+    """Accumulateur de pas de simulation fixes et cadence du rendu."""
+
+    # Durée d'un pas de simulation : un tick de MoteurPartie
+    PAS_DEFAUT = MoteurPartie.DUREE_TICK
+
+    # Cadence maximale du rendu (None : pas de plafond)
+    FPS_AFFICHAGE_DEFAUT = 60
+
+    # Pas rattrapés au plus par frame, le retard au-delà est abandonné
+    PAS_MAX_PAR_FRAME = 8
+
+    # Poids d'une nouvelle frame dans la moyenne glissante du FPS
+    _LISSAGE_FPS = 0.1
+
+    def __init__(self, pas: float = PAS_DEFAUT,
+                 fps_affichage: Optional[float] = FPS_AFFICHAGE_DEFAUT,
+                 horloge: Callable[[], float] = time.perf_counter,
+                 dormir: Callable[[float], None] = time.sleep,
+                 pas_max_par_frame: int = PAS_MAX_PAR_FRAME):
+        """
+        Initialise l'ordonnanceur, le temps démarrant à l'instant présent.
+
+        Args:
+            pas: Durée d'un pas de simulation en secondes
+            fps_affichage: Cadence maximale du rendu (None : non plafonnée)
+            horloge: Source monotone du temps en secondes
+            dormir: Attente d'une durée en secondes (time.sleep)
+            pas_max_par_frame: Nombre maximal de pas rattrapés par frame
+        """
+        if pas <= 0:
+            raise ValueError(f"Pas de simulation invalide: {pas}")
+        if fps_affichage is not None and fps_affichage <= 0:
+            raise ValueError(f"Cadence d'affichage invalide: {fps_affichage}")
+        self.pas = pas
+        self.duree_frame = None if fps_affichage is None else 1 / fps_affichage
+        self.pas_max_par_frame = pas_max_par_frame
+        self._horloge = horloge
+        self._dormir = dormir
+
+        # Date du début de la frame courante (même horloge que le moteur et les touches)
+        self.temps = horloge()
+        self._accumulateur = 0.0
+        self._echeance_frame = self.temps
+        self._duree_moyenne = 0.0
+        self._compter_fps = True
+
+    @property
+    def fps(self) -> float:
+        """Cadence mesurée du rendu (moyenne glissante), 0 avant la deuxième frame."""
+        return 1 / self._duree_moyenne if self._duree_moyenne > 0 else 0.0
+
+    def demarrer_frame(self) -> int:
+        """
+        Commence une frame : le temps écoulé depuis la précédente est converti en pas.
+
+        Returns:
+            Nombre de pas de simulation à exécuter pendant cette frame
+        """
+        maintenant = self._horloge()
+        ecoule = maintenant - self.temps
+        self.temps = maintenant
+        if ecoule > 0 and self._compter_fps:
+            self._duree_moyenne += (ecoule - self._duree_moyenne) * (
+                self._LISSAGE_FPS if self._duree_moyenne else 1.0)
+        self._compter_fps = True
+
+        self._accumulateur += ecoule
+        # La marge absorbe l'arrondi d'une somme de pas (3 * 1/60 < 0.05)
+        nb_pas = int(self._accumulateur / self.pas + 1e-9)
+        if nb_pas > self.pas_max_par_frame:
+            nb_pas = self.pas_max_par_frame
+            self._accumulateur = 0.0
+        else:
+            self._accumulateur = max(0.0, self._accumulateur - nb_pas * self.pas)
+        return nb_pas
+
+    def reprendre(self) -> None:
+        """
+        Reprend la cadence après une attente hors boucle (mode repos).
+
+        Le temps passé à attendre n'est ni converti en pas de simulation
+        ni compté dans le FPS.
+        """
+        self.temps = self._horloge()
+        self._accumulateur = 0.0
+        self._echeance_frame = self.temps
+        self._compter_fps = False
+
+    def attendre_frame(self) -> None:
+        """Dort jusqu'à l'échéance de la frame suivante (rien si le rendu n'est pas plafonné)."""
+        if self.duree_frame is None:
+            return
+        self._echeance_frame += self.duree_frame
+        restant = self._echeance_frame - self._horloge()
+        if restant > 0:
+            self._dormir(restant)
+        else:
+            # Frame en retard : la cadence repart de maintenant, sans rafale de rendus
+            self._echeance_frame -= restant
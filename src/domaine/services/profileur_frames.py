@@ -0,0 +1,162 @@
+"""
+ProfileurFrames - Durée de chaque phase de la boucle de jeu, frame par frame
+
+La boucle marque la fin de chacune de ses phases (gravité, événements,
+répétitions, dessin, attente) : la durée écoulée depuis la marque
+précédente, mesurée avec time.perf_counter_ns, est écrite dans le tampon
+circulaire de la phase. Seules les TAILLE_DEFAUT dernières frames sont
+conservées : la mémoire est fixe et l'enregistrement ne coûte qu'une
+lecture d'horloge et une écriture dans un tableau par phase.
+
+Les centiles p50/p95/p99 et l'export CSV distinguent une saccade due aux
+entrées, à la simulation ou au rendu, ce que le FPS moyen ne dit pas.
+
+La durée de la frame est le temps de travail : la phase d'attente (sommeil
+du plafond de FPS) n'y est pas comptée, sinon chaque frame plafonnée
+paraîtrait coûter tout le budget. Une frame passée bloquée en mode repos
+est abandonnée plutôt qu'enregistrée.
+
+Exemple d'usage :
+    profileur.debut_frame()
+    moteur.mettre_a_jour_chute_automatique()
+    profileur.marquer('gravite')
+    affichage.dessiner(moteur)
+    profileur.marquer('dessin')
+    profileur.fin_frame()
+"""
+
+import csv
+import time
+from array import array
+from typing import Dict, List, Sequence, TextIO, Tuple, Union
+
+# Phases de la boucle de PartieTetris.jouer, dans leur ordre d'exécution
+PHASES_PARTIE = ('gravite', 'evenements', 'repetitions', 'dessin', 'attente')
+
+# Phase de sommeil jusqu'à la frame suivante, exclue de la durée de la frame
+ATTENTE = 'attente'
+
+# Nom de la durée de travail de la frame (somme des phases hors attente)
+FRAME = 'frame'
+
+
+class ProfileurFrames:
+    """Tampons circulaires des durées de phase des dernières frames."""
+
+    # Nombre de frames conservées par défaut (10 secondes à 60 FPS)
+    TAILLE_DEFAUT = 600
+
+    def __init__(self, phases: Sequence[str] = PHASES_PARTIE, taille: int = TAILLE_DEFAUT):
+        """
+        Initialise des tampons vides.
+
+        Args:
+            phases: Noms des phases, dans leur ordre dans la frame
+            taille: Nombre de frames conservées
+        """
+        if taille <= 0:
+            raise ValueError(f"Taille de tampon invalide: {taille}")
+        self.phases: Tuple[str, ...] = tuple(phases)
+        self.taille = taille
+        self._tampons: Dict[str, array] = {nom: array('q', bytes(8 * taille))
+                                           for nom in self.phases + (FRAME,)}
+        self._tampon_attente = self._tampons.get(ATTENTE)
+        self._index = 0
+        self.nb_frames = 0
+        self._debut_frame = 0
+        self._derniere_marque = 0
+
+    def debut_frame(self) -> None:
+        """Démarre le chronométrage d'une frame (et de sa première phase)."""
+        maintenant = time.perf_counter_ns()
+        self._debut_frame = maintenant
+        self._derniere_marque = maintenant
+
+    def marquer(self, phase: str) -> None:
+        """
+        Termine une phase : le temps écoulé depuis la marque précédente lui est attribué.
+
+        Args:
+            phase: Nom de la phase qui vient de se terminer
+        """
+        maintenant = time.perf_counter_ns()
+        self._tampons[phase][self._index] = maintenant - self._derniere_marque
+        self._derniere_marque = maintenant
+
+    def fin_frame(self) -> None:
+        """Enregistre la durée de travail de la frame et passe à l'emplacement suivant."""
+        duree = self._derniere_marque - self._debut_frame
+        if self._tampon_attente is not None:
+            duree -= self._tampon_attente[self._index]
+        self._tampons[FRAME][self._index] = duree
+        self._index = (self._index + 1) % self.taille
+        self.nb_frames += 1
+
+    def abandonner_frame(self) -> None:
+        """
+        Oublie la frame en cours sans l'enregistrer (ex. frame bloquée en mode repos).
+
+        Les phases déjà marquées restent à l'emplacement courant et seront
+        écrasées par la frame suivante.
+        """
+        self._derniere_marque = self._debut_frame
+
+    def durees(self, phase: str = FRAME) -> List[int]:
+        """
+        Durées conservées d'une phase, de la plus ancienne à la plus récente.
+
+        Args:
+            phase: Nom de la phase, ou FRAME pour la durée de travail de la frame
+
+        Returns:
+            Durées en nanosecondes
+        """
+        tampon = self._tampons[phase]
+        if self.nb_frames < self.taille:
+            return tampon[:self.nb_frames].tolist()
+        return (tampon[self._index:] + tampon[:self._index]).tolist()
+
+    def centiles(self, phase: str = FRAME) -> Tuple[float, float, float]:
+        """
+        Centiles p50, p95 et p99 d'une phase sur les frames conservées.
+
+        Returns:
+            (p50, p95, p99) en millisecondes, (0, 0, 0) sans frame enregistrée
+        """
+        durees = sorted(self.durees(phase))
+        if not durees:
+            return 0.0, 0.0, 0.0
+        dernier = len(durees) - 1
+        return tuple(durees[min(dernier, len(durees) * centile // 100)] / 1e6
+                     for centile in (50, 95, 99))
+
+    def resume(self) -> Dict[str, Tuple[float, float, float]]:
+        """Centiles de chaque phase puis de la frame entière."""
+        return {nom: self.centiles(nom) for nom in self.phases + (FRAME,)}
+
+    def exporter_csv(self, destination: Union[str, TextIO]) -> int:
+        """
+        Exporte les frames conservées en CSV (une ligne par frame, durées en ns).
+
+        Args:
+            destination: Chemin du fichier, ou fichier texte déjà ouvert
+
+        Returns:
+            Nombre de frames exportées
+        """
+        colonnes = self.phases + (FRAME,)
+        series = [self.durees(nom) for nom in colonnes]
+        premiere = self.nb_frames - len(series[0])
+
+        def ecrire(fichier: TextIO) -> None:
+            ecrivain = csv.writer(fichier)
+            ecrivain.writerow(('numero',) + tuple(f"{nom}_ns" for nom in colonnes))
+            for i, ligne in enumerate(zip(*series)):
+                ecrivain.writerow((premiere + i,) + ligne)
+
+        if isinstance(destination, str):
+            with open(destination, 'w', newline='', encoding='utf-8') as fichier:
+                ecrire(fichier)
+        else:
+            ecrire(destination)
+        return len(series[0])
@@ -0,0 +1,539 @@
+"""
+Replays de parties : graine + flux d'entrées horodaté, en binaire compact.
+
+Une partie est entièrement déterminée par la graine de son générateur de
+pièces et par la suite ordonnée de ce qui l'a fait évoluer :
+- les touches logiques traitées par le GestionnaireEvenements
+  (appui, relâche, répétition exécutée)
+- les ticks de gravité (chutes automatiques du MoteurPartie)
+
+Format binaire (version 2) :
+    "TRPL" | version (1 octet) | drapeaux (1 octet) | graine (varint zigzag)
+    | nombre d'événements (varint) | événements
+    | nombre d'images clés (varint) | images clés
+Chaque événement est un seul varint :
+    (delta_ms << 5) | (type << 3) | indice de la touche
+soit 1 octet pour deux événements à moins de 4 ms d'écart et 2 octets
+jusqu'à 512 ms : une session d'une heure tient en quelques dizaines de Ko.
+Les fichiers de version 1 (sans images clés) restent lisibles.
+
+Images clés : tous les INTERVALLE_IMAGES_CLES événements, l'état complet
+du moteur (lignes du plateau en masques de bits, pièces, file d'aperçu,
+StatistiquesJeu, état du générateur aléatoire) est stocké avec la
+position de l'événement qui le suit. Leur index (position, temps, taille)
+est lu au chargement sans décoder les états : un déplacement dans le
+replay restaure l'image clé précédente et ne simule que le reste.
+
+Exemple d'usage :
+    enregistreur = EnregistreurPartie(moteur, gestionnaire, time.perf_counter())
+    ...
+    enregistreur.terminer().sauvegarder("partie.trpl")
+
+    moteur = LecteurReplay.rejouer_headless(Replay.charger("partie.trpl"))
+"""
+
+import struct
+from bisect import bisect_right
+from enum import IntEnum
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+from src.domaine.entites.fabriques.generateurs_pieces import (
+    EtatGenerateur, GenerateurClassique, GenerateurPieces, GenerateurSac7
+)
+from src.domaine.entites.instantane_partie import (
+    InstantanePartie, TYPES_PIECES, compacter_piece, decompacter_piece
+)
+from .gestionnaire_evenements import (
+    GestionnaireEvenements, ToucheClavier, TypeEvenement, creer_commandes_partie
+)
+
+if TYPE_CHECKING:
+    from .moteur_partie import MoteurPartie
+
+
+class TypeEvenementReplay(IntEnum):
+    """Nature d'un événement du flux (2 bits dans le format binaire)."""
+    APPUI = 0
+    RELACHE = 1
+    REPETITION = 2
+    CHUTE = 3
+
+
+class EvenementReplay(NamedTuple):
+    """Un événement du flux, daté en millisecondes depuis le début de la partie."""
+    temps_ms: int
+    type_evenement: TypeEvenementReplay
+    touche: Optional[ToucheClavier] = None
+
+
+class ImageCle(NamedTuple):
+    """État complet du moteur avant l'événement d'indice `position` (encodé, décodé à la demande)."""
+    position: int
+    temps_ms: int
+    donnees: bytes
+
+
+# Correspondances du format binaire (l'ordre fait partie du format)
+_TOUCHES: Tuple[ToucheClavier, ...] = tuple(ToucheClavier)
+_INDICES_TOUCHES = {touche: indice for indice, touche in enumerate(_TOUCHES)}
+_INDICES_TYPES = {type_piece: indice for indice, type_piece in enumerate(TYPES_PIECES)}
+_GENERATEURS = (GenerateurClassique, GenerateurSac7)
+_TYPES_CLAVIER = {
+    TypeEvenement.CLAVIER_APPUI: TypeEvenementReplay.APPUI,
+    TypeEvenement.CLAVIER_RELACHE: TypeEvenementReplay.RELACHE,
+    TypeEvenement.CLAVIER_MAINTENU: TypeEvenementReplay.REPETITION,
+}
+
+
+def _ecrire_varint(tampon: bytearray, valeur: int) -> None:
+    """Ajoute un entier positif en varint (7 bits par octet, poids faibles d'abord)."""
+    while valeur >= 0x80:
+        tampon.append((valeur & 0x7F) | 0x80)
+        valeur >>= 7
+    tampon.append(valeur)
+
+
+def _lire_varint(donnees: bytes, index: int) -> Tuple[int, int]:
+    """Lit un varint à partir d'index ; retourne (valeur, index suivant)."""
+    valeur = decalage = 0
+    while True:
+        if index >= len(donnees):
+            raise ValueError("Replay tronqué : varint incomplet")
+        octet = donnees[index]
+        index += 1
+        valeur |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return valeur, index
+        decalage += 7
+
+
+def _zigzag(valeur: int) -> int:
+    """Entier signé vers entier positif (0, -1, 1, -2... -> 0, 1, 2, 3...)."""
+    return (valeur << 1) ^ (valeur >> 63)
+
+
+def _dezigzag(valeur: int) -> int:
+    """Inverse de _zigzag."""
+    return (valeur >> 1) ^ -(valeur & 1)
+
+
+# État interne du Mersenne Twister (624 mots et l'index) et flottant de gauss()
+_FORMAT_MT = struct.Struct("<625I")
+_FORMAT_REEL = struct.Struct("<d")
+
+
+def _encoder_instantane(instantane: InstantanePartie) -> bytes:
+    """Encode un instantané du moteur (hors compteurs de ticks, inutiles à la relecture)."""
+    tampon = bytearray()
+    _ecrire_varint(tampon, len(instantane.lignes))
+    for ligne in instantane.lignes:
+        _ecrire_varint(tampon, ligne)
+    _ecrire_varint(tampon, len(instantane.lignes_invisibles))
+    for y, ligne in instantane.lignes_invisibles:
+        _ecrire_varint(tampon, _zigzag(y))
+        _ecrire_varint(tampon, ligne)
+
+    # Pièces : 0 si absente, sinon 1 + indice du type, puis orientation et pivot
+    if instantane.piece_active is None:
+        _ecrire_varint(tampon, 0)
+    else:
+        type_piece, orientation, x, y = decompacter_piece(instantane.piece_active)
+        _ecrire_varint(tampon, 1 + _INDICES_TYPES[type_piece])
+        _ecrire_varint(tampon, orientation)
+        _ecrire_varint(tampon, _zigzag(x))
+        _ecrire_varint(tampon, _zigzag(y))
+    suivante = instantane.piece_suivante
+    _ecrire_varint(tampon, 0 if suivante is None else 1 + _INDICES_TYPES[suivante])
+
+    _ecrire_varint(tampon, len(instantane.file_pieces))
+    tampon.extend(_INDICES_TYPES[type_piece] for type_piece in instantane.file_pieces)
+
+    version, interne, gauss = instantane.generateur.aleatoire
+    tampon.append(version)
+    tampon.extend(_FORMAT_MT.pack(*interne))
+    tampon.append(gauss is not None)
+    if gauss is not None:
+        tampon.extend(_FORMAT_REEL.pack(gauss))
+    reserve = instantane.generateur.reserve
+    _ecrire_varint(tampon, len(reserve))
+    tampon.extend(_INDICES_TYPES[type_piece] for type_piece in reserve)
+
+    for valeur in instantane.statistiques + instantane.pieces_par_type:
+        _ecrire_varint(tampon, valeur)
+
+    tampon.append(int(instantane.en_pause) | (int(instantane.jeu_termine) << 1))
+    tampon.extend(_FORMAT_REEL.pack(instantane.intervalle_chute))
+    return bytes(tampon)
+
+
+def _decoder_instantane(donnees: bytes) -> InstantanePartie:
+    """Inverse de _encoder_instantane (compteurs de ticks remis à zéro)."""
+    def lire_varints(nombre: int, index: int) -> Tuple[List[int], int]:
+        valeurs = []
+        for _ in range(nombre):
+            valeur, index = _lire_varint(donnees, index)
+            valeurs.append(valeur)
+        return valeurs, index
+
+    nb_lignes, index = _lire_varint(donnees, 0)
+    lignes, index = lire_varints(nb_lignes, index)
+    nb_invisibles, index = _lire_varint(donnees, index)
+    invisibles, index = lire_varints(2 * nb_invisibles, index)
+
+    code, index = _lire_varint(donnees, index)
+    piece_active = None
+    if code:
+        (orientation, x, y), index = lire_varints(3, index)
+        piece_active = compacter_piece(TYPES_PIECES[code - 1], orientation, _dezigzag(x), _dezigzag(y))
+    code, index = _lire_varint(donnees, index)
+    piece_suivante = TYPES_PIECES[code - 1] if code else None
+
+    taille, index = _lire_varint(donnees, index)
+    file_pieces = tuple(TYPES_PIECES[i] for i in donnees[index:index + taille])
+    index += taille
+
+    version = donnees[index]
+    interne = _FORMAT_MT.unpack_from(donnees, index + 1)
+    index += 1 + _FORMAT_MT.size
+    gauss = None
+    if donnees[index]:
+        gauss = _FORMAT_REEL.unpack_from(donnees, index + 1)[0]
+        index += _FORMAT_REEL.size
+    index += 1
+    taille, index = _lire_varint(donnees, index)
+    reserve = tuple(TYPES_PIECES[i] for i in donnees[index:index + taille])
+    index += taille
+
+    statistiques, index = lire_varints(4 + len(TYPES_PIECES), index)
+    drapeaux = donnees[index]
+
+    return InstantanePartie(
+        lignes=tuple(lignes),
+        lignes_invisibles=tuple((_dezigzag(invisibles[i]), invisibles[i + 1])
+                                for i in range(0, len(invisibles), 2)),
+        piece_active=piece_active,
+        piece_suivante=piece_suivante,
+        file_pieces=file_pieces,
+        generateur=EtatGenerateur((version, interne, gauss), reserve),
+        statistiques=tuple(statistiques[:4]),
+        pieces_par_type=tuple(statistiques[4:]),
+        en_pause=bool(drapeaux & 1),
+        jeu_termine=bool(drapeaux & 2),
+        intervalle_chute=_FORMAT_REEL.unpack_from(donnees, index + 1)[0],
+        ticks=0,
+        ticks_depuis_chute=0,
+    )
+
+
+class Replay:
+    """
+    Partie enregistrée : graine, générateur, état de pause initial et flux d'événements.
+    """
+
+    MAGIQUE = b"TRPL"
+    VERSION = 2
+    VERSIONS_LISIBLES = (1, 2)
+
+    # Nombre d'événements entre deux images clés (borne le coût d'un déplacement)
+    INTERVALLE_IMAGES_CLES = 4096
+
+    def __init__(self, graine: int, generateur: type = GenerateurClassique,
+                 en_pause_initiale: bool = True,
+                 evenements: Optional[List[EvenementReplay]] = None,
+                 images_cles: Optional[List[ImageCle]] = None):
+        """
+        Initialise un replay.
+
+        Args:
+            graine: Graine du générateur de pièces
+            generateur: Classe du générateur (GenerateurClassique ou GenerateurSac7)
+            en_pause_initiale: État de pause du moteur au début de l'enregistrement
+            evenements: Flux d'événements, dans l'ordre d'application
+            images_cles: Images clés, par position croissante (voir indexer())
+
+        Raises:
+            ValueError: Si le générateur n'est pas supporté par le format
+        """
+        if generateur not in _GENERATEURS:
+            raise ValueError(f"Générateur non supporté par les replays : {generateur.__name__}")
+        self.graine = graine
+        self.generateur = generateur
+        self.en_pause_initiale = en_pause_initiale
+        self.evenements: List[EvenementReplay] = evenements if evenements is not None else []
+        self.images_cles: List[ImageCle] = images_cles if images_cles is not None else []
+
+    @property
+    def duree_ms(self) -> int:
+        """Temps du dernier événement, en millisecondes."""
+        return self.evenements[-1].temps_ms if self.evenements else 0
+
+    def creer_generateur(self) -> GenerateurPieces:
+        """Nouveau générateur identique à celui de la partie enregistrée."""
+        return self.generateur(self.graine)
+
+    def en_octets(self) -> bytes:
+        """Sérialise le replay au format binaire."""
+        tampon = bytearray(self.MAGIQUE)
+        tampon.append(self.VERSION)
+        tampon.append(int(self.en_pause_initiale) | (_GENERATEURS.index(self.generateur) << 1))
+        _ecrire_varint(tampon, _zigzag(self.graine))
+        _ecrire_varint(tampon, len(self.evenements))
+
+        temps_precedent = 0
+        for evenement in self.evenements:
+            touche = _INDICES_TOUCHES[evenement.touche] if evenement.touche is not None else 0
+            delta = evenement.temps_ms - temps_precedent
+            _ecrire_varint(tampon, (delta << 5) | (evenement.type_evenement << 3) | touche)
+            temps_precedent = evenement.temps_ms
+
+        _ecrire_varint(tampon, len(self.images_cles))
+        for image in self.images_cles:
+            _ecrire_varint(tampon, image.position)
+            _ecrire_varint(tampon, image.temps_ms)
+            _ecrire_varint(tampon, len(image.donnees))
+            tampon.extend(image.donnees)
+        return bytes(tampon)
+
+    @classmethod
+    def depuis_octets(cls, donnees: bytes) -> 'Replay':
+        """
+        Désérialise un replay.
+
+        Raises:
+            ValueError: Si les données ne sont pas un replay valide
+        """
+        if donnees[:4] != cls.MAGIQUE:
+            raise ValueError("Ce fichier n'est pas un replay Tetris")
+        if len(donnees) < 6 or donnees[4] not in cls.VERSIONS_LISIBLES:
+            raise ValueError(f"Version de replay non supportée : {donnees[4:5].hex()}")
+
+        drapeaux = donnees[5]
+        graine_zigzag, index = _lire_varint(donnees, 6)
+        nb_evenements, index = _lire_varint(donnees, index)
+
+        evenements = []
+        temps = 0
+        for _ in range(nb_evenements):
+            code, index = _lire_varint(donnees, index)
+            temps += code >> 5
+            type_evenement = TypeEvenementReplay((code >> 3) & 0b11)
+            touche = None if type_evenement is TypeEvenementReplay.CHUTE else _TOUCHES[code & 0b111]
+            evenements.append(EvenementReplay(temps, type_evenement, touche))
+
+        images_cles = []
+        if donnees[4] >= 2:
+            nb_images, index = _lire_varint(donnees, index)
+            for _ in range(nb_images):
+                position, index = _lire_varint(donnees, index)
+                temps_ms, index = _lire_varint(donnees, index)
+                taille, index = _lire_varint(donnees, index)
+                if index + taille > len(donnees):
+                    raise ValueError("Replay tronqué : image clé incomplète")
+                images_cles.append(ImageCle(position, temps_ms, donnees[index:index + taille]))
+                index += taille
+
+        return cls(graine=_dezigzag(graine_zigzag),
+                   generateur=_GENERATEURS[drapeaux >> 1],
+                   en_pause_initiale=bool(drapeaux & 1),
+                   evenements=evenements,
+                   images_cles=images_cles)
+
+    def indexer(self, intervalle: int = INTERVALLE_IMAGES_CLES) -> None:
+        """
+        Calcule les images clés en rejouant la partie une fois (headless).
+
+        Args:
+            intervalle: Nombre d'événements entre deux images clés
+        """
+        self.images_cles = []
+        lecteur = LecteurReplay(self, LecteurReplay.creer_moteur(self))
+        for position in range(intervalle, len(self.evenements), intervalle):
+            lecteur.aller_a(position)
+            self.images_cles.append(
+                ImageCle(position, self.evenements[position].temps_ms, _encoder_instantane(lecteur.moteur.capturer())))
+
+    def sauvegarder(self, chemin: str) -> None:
+        """Écrit le replay dans un fichier."""
+        with open(chemin, 'wb') as fichier:
+            fichier.write(self.en_octets())
+
+    @classmethod
+    def charger(cls, chemin: str) -> 'Replay':
+        """Lit un replay depuis un fichier."""
+        with open(chemin, 'rb') as fichier:
+            return cls.depuis_octets(fichier.read())
+
+
+class EnregistreurPartie:
+    """
+    Enregistre une partie en observant le gestionnaire d'événements et le moteur.
+
+    Doit être créé juste après le moteur : la graine seule reconstruit
+    l'état initial, les événements font le reste.
+    """
+
+    def __init__(self, moteur: 'MoteurPartie', gestionnaire: GestionnaireEvenements,
+                 temps_initial: float):
+        """
+        Abonne l'enregistreur aux touches et aux chutes automatiques.
+
+        Args:
+            moteur: Moteur de la partie, dont le générateur est seedé
+            gestionnaire: Gestionnaire des événements clavier
+            temps_initial: Origine des temps (même horloge que les événements)
+
+        Raises:
+            ValueError: Si la partie n'est pas reproductible (graine inconnue)
+        """
+        if moteur.graine is None:
+            raise ValueError("Partie non reproductible : le générateur n'a pas de graine")
+        self.replay = Replay(graine=moteur.graine,
+                             generateur=type(moteur.file_pieces.generateur),
+                             en_pause_initiale=moteur.en_pause)
+        self._temps_initial = temps_initial
+        self._dernier_temps_ms = 0
+
+        gestionnaire.ajouter_observateur(self._sur_touche)
+        moteur.ajouter_observateur_chute(self._sur_chute)
+
+    def _temps_ms(self, temps: float) -> int:
+        """Temps relatif en millisecondes, jamais en arrière (horloge murale)."""
+        self._dernier_temps_ms = max(self._dernier_temps_ms, round((temps - self._temps_initial) * 1000))
+        return self._dernier_temps_ms
+
+    def _sur_touche(self, touche: ToucheClavier, type_evenement: TypeEvenement, temps: float) -> None:
+        """Observateur du gestionnaire d'événements."""
+        self.replay.evenements.append(
+            EvenementReplay(self._temps_ms(temps), _TYPES_CLAVIER[type_evenement], touche))
+
+    def _sur_chute(self, temps: float) -> None:
+        """Observateur des chutes automatiques du moteur."""
+        self.replay.evenements.append(EvenementReplay(self._temps_ms(temps), TypeEvenementReplay.CHUTE))
+
+    def terminer(self) -> Replay:
+        """Retourne le replay enregistré jusqu'ici, indexé par images clés."""
+        self.replay.indexer()
+        return self.replay
+
+
+class LecteurReplay:
+    """
+    Applique le flux d'un replay à un moteur, à la vitesse voulue.
+
+    Le moteur ne doit pas appliquer sa propre gravité : les chutes
+    automatiques font partie du flux enregistré.
+    """
+
+    def __init__(self, replay: Replay, moteur: 'MoteurPartie'):
+        """
+        Initialise la lecture au début du flux.
+
+        Args:
+            replay: Replay à relire
+            moteur: Moteur neuf, créé avec replay.creer_generateur()
+        """
+        self.replay = replay
+        self.moteur = moteur
+        self.position = 0
+        self._gestionnaire = GestionnaireEvenements(commandes=creer_commandes_partie())
+
+        # État de départ (retour en arrière sans image clé) et index des images clés
+        self._etat_initial = moteur.capturer()
+        self._positions_images = [image.position for image in replay.images_cles]
+
+    @classmethod
+    def creer_moteur(cls, replay: Replay) -> 'MoteurPartie':
+        """Moteur headless dans l'état initial de la partie enregistrée."""
+        from .moteur_partie import MoteurPartie
+
+        moteur = MoteurPartie.creer_headless(generateur=replay.creer_generateur())
+        moteur.en_pause = replay.en_pause_initiale
+        return moteur
+
+    @classmethod
+    def rejouer_headless(cls, replay: Replay) -> 'MoteurPartie':
+        """Rejoue tout le replay à vitesse maximale et retourne le moteur final."""
+        lecteur = cls(replay, cls.creer_moteur(replay))
+        lecteur.appliquer_tout()
+        return lecteur.moteur
+
+    @property
+    def termine(self) -> bool:
+        """True une fois tous les événements appliqués."""
+        return self.position >= len(self.replay.evenements)
+
+    def appliquer_jusqu_a(self, temps_ms: float) -> int:
+        """
+        Applique les événements datés jusqu'à temps_ms inclus.
+
+        Returns:
+            Nombre d'événements appliqués
+        """
+        evenements = self.replay.evenements
+        debut = self.position
+        while self.position < len(evenements) and evenements[self.position].temps_ms <= temps_ms:
+            self._appliquer(evenements[self.position])
+            self.position += 1
+        return self.position - debut
+
+    def aller_a(self, position: int) -> int:
+        """
+        Amène le moteur à l'état qui précède l'événement d'indice `position`.
+
+        Restaure l'image clé la plus proche en amont (ou l'état initial) si
+        elle évite de resimuler, puis applique les événements restants.
+
+        Args:
+            position: Nombre d'événements appliqués depuis le début
+
+        Returns:
+            Nombre d'événements simulés pour y arriver
+        """
+        position = max(0, min(position, len(self.replay.evenements)))
+        indice = bisect_right(self._positions_images, position) - 1
+        image = self.replay.images_cles[indice] if indice >= 0 else None
+
+        if image is not None and (position < self.position or image.position > self.position):
+            self.moteur.restaurer(_decoder_instantane(image.donnees))
+            self.position = image.position
+        elif position < self.position:
+            self.moteur.restaurer(self._etat_initial)
+            self.position = 0
+
+        debut = self.position
+        for evenement in self.replay.evenements[debut:position]:
+            self._appliquer(evenement)
+        self.position = position
+        return position - debut
+
+    def aller_au_temps(self, temps_ms: float) -> int:
+        """
+        Amène le moteur à l'état du replay au temps donné (événements datés jusqu'à temps_ms inclus).
+
+        Returns:
+            Nombre d'événements simulés pour y arriver
+        """
+        return self.aller_a(bisect_right(self.replay.evenements, temps_ms, key=lambda e: e.temps_ms))
+
+    def appliquer_tout(self) -> int:
+        """Applique tous les événements restants (vitesse maximale)."""
+        evenements = self.replay.evenements
+        debut = self.position
+        for evenement in evenements[self.position:]:
+            self._appliquer(evenement)
+        self.position = len(evenements)
+        return self.position - debut
+
+    def _appliquer(self, evenement: EvenementReplay) -> None:
+        """Rejoue un événement comme l'a fait la partie enregistrée."""
+        type_evenement = evenement.type_evenement
+        if type_evenement is TypeEvenementReplay.CHUTE:
+            self.moteur.appliquer_chute_automatique()
+        elif type_evenement is TypeEvenementReplay.APPUI:
+            self._gestionnaire.executer_touche(evenement.touche, self.moteur)
+            # Même traitement spécial de P que l'adaptateur pygame
+            if evenement.touche is ToucheClavier.PAUSE:
+                self.moteur.basculer_pause()
+        elif type_evenement is TypeEvenementReplay.REPETITION:
+            self._gestionnaire.executer_touche(evenement.touche, self.moteur)
+        # RELACHE : sans effet sur le moteur (les répétitions sont déjà dans le flux)
@@ -0,0 +1,89 @@
+"""
+TableTransposition - Cache borné (LRU) de résultats indexés par clé Zobrist
+
+Des ordres d'entrées différents mènent souvent à la même position :
+la clé Zobrist (plateau ^ pièce active) l'identifie en O(1), et la table
+retrouve le résultat déjà calculé (plan, évaluation) au lieu de le
+recalculer. Au-delà de taille_max, l'entrée la moins récemment utilisée
+est oubliée : la mémoire reste constante.
+
+Exemple d'usage :
+    plan = table.obtenir(moteur.cle_zobrist)
+    if plan is None:
+        plan = planifier(moteur)
+        table.enregistrer(moteur.cle_zobrist, plan)
+"""
+
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TableTransposition:
+    """Table de transposition à éviction LRU, avec compteurs de succès et d'échecs."""
+
+    # Nombre d'entrées conservées par défaut
+    TAILLE_MAX_DEFAUT = 65536
+
+    def __init__(self, taille_max: int = TAILLE_MAX_DEFAUT):
+        """
+        Initialise une table vide.
+
+        Args:
+            taille_max: Nombre maximal d'entrées conservées
+        """
+        if taille_max <= 0:
+            raise ValueError(f"Taille de table invalide: {taille_max}")
+        self.taille_max = taille_max
+        self._entrees: OrderedDict = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+    def __contains__(self, cle: int) -> bool:
+        """Présence d'une clé, sans la marquer comme utilisée."""
+        return cle in self._entrees
+
+    @property
+    def taux_succes(self) -> float:
+        """Part des consultations ayant trouvé leur clé."""
+        total = self.succes + self.echecs
+        return self.succes / total if total else 0.0
+
+    def obtenir(self, cle: int, defaut: Optional[Any] = None) -> Any:
+        """
+        Retourne la valeur associée à une clé et la marque comme récemment utilisée.
+
+        Args:
+            cle: Clé Zobrist de la position
+            defaut: Valeur retournée si la clé est absente
+
+        Returns:
+            Valeur enregistrée, ou defaut
+        """
+        entrees = self._entrees
+        if cle in entrees:
+            entrees.move_to_end(cle)
+            self.succes += 1
+            return entrees[cle]
+        self.echecs += 1
+        return defaut
+
+    def enregistrer(self, cle: int, valeur: Any) -> None:
+        """
+        Associe une valeur à une clé, en oubliant l'entrée la plus ancienne si la table est pleine.
+
+        Args:
+            cle: Clé Zobrist de la position
+            valeur: Résultat à conserver
+        """
+        entrees = self._entrees
+        entrees[cle] = valeur
+        entrees.move_to_end(cle)
+        if len(entrees) > self.taille_max:
+            entrees.popitem(last=False)
+
+    def vider(self) -> None:
+        """Oublie toutes les entrées (les compteurs sont conservés)."""
+        self._entrees.clear()
@@ -0,0 +1,8 @@
+"""
+Benchmarks des chemins critiques du domaine et du rendu.
+
+Chaque module bench_*.py expose des fonctions bench_*() qui retournent
+une liste de Resultat (voir mesure.py). Ils ne sont pas collectés comme
+tests : ils sont lancés par tests/run_benchmarks.py, qui compare les
+temps à la référence enregistrée (reference.json).
+"""
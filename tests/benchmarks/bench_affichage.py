@@ -0,0 +1,45 @@
+"""
+Benchmarks du rendu pygame, sous le pilote vidéo factice de SDL.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from typing import List
+
+from src.adapters.sortie.affichage_partie import AffichagePartie
+
+from .bench_moteur import creer_moteur_dense
+from .mesure import Resultat, mesurer
+
+# Une frame coûte beaucoup plus qu'une opération du domaine : moins d'itérations
+ITERATIONS_FRAME = 200
+
+
+def bench_dessiner(facteur: float = 1.0) -> List[Resultat]:
+    """Une frame complète (écran invalidé), puis une frame après un déplacement de pièce."""
+    moteur = creer_moteur_dense()
+    moteur.piece_active.deplacer(4, 0)
+    affichage = AffichagePartie()
+    affichage.initialiser()
+    affichage.dessiner(moteur)
+
+    directions = [1]
+
+    def deplacer_piece():
+        if not moteur.deplacer_piece_active(directions[0], 0):
+            directions[0] = -directions[0]
+            moteur.deplacer_piece_active(directions[0], 0)
+
+    iterations = int(ITERATIONS_FRAME * facteur)
+    try:
+        return [
+            mesurer("affichage.dessiner[complet]", lambda: affichage.dessiner(moteur),
+                    preparer=affichage.invalider, iterations=iterations, echauffement=5),
+            mesurer("affichage.dessiner[deplacement]", lambda: affichage.dessiner(moteur),
+                    preparer=deplacer_piece, iterations=iterations, echauffement=5),
+        ]
+    finally:
+        affichage.nettoyer()
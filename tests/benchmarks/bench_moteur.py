@@ -0,0 +1,31 @@
+"""
+Benchmarks du moteur de partie.
+"""
+
+from typing import List
+
+from src.domaine.services.moteur_partie import MoteurPartie
+
+from .bench_plateau import creer_i_vertical, masques_denses
+from .mesure import ITERATIONS_DEFAUT, Resultat, mesurer
+
+# Un seul appel de quelques µs par échantillon (la restauration empêche de les
+# regrouper en lot) : la mesure varie davantage d'une exécution à l'autre
+SEUIL_CHUTE_RAPIDE = 0.5
+
+
+def creer_moteur_dense() -> MoteurPartie:
+    """Moteur headless sur plateau dense, I vertical au-dessus du puits de la colonne 0."""
+    moteur = MoteurPartie.creer_headless(graine=0)
+    moteur.plateau.charger_masques(masques_denses())
+    moteur.piece_active = creer_i_vertical(0, 1)
+    return moteur
+
+
+def bench_chute_rapide(facteur: float = 1.0) -> List[Resultat]:
+    """Chute rapide de 16 lignes jusqu'au fond du puits."""
+    moteur = creer_moteur_dense()
+    instantane = moteur.capturer()
+    return [mesurer("moteur.chute_rapide", moteur.chute_rapide,
+                    preparer=lambda: moteur.restaurer(instantane),
+                    iterations=int(ITERATIONS_DEFAUT * facteur), seuil=SEUIL_CHUTE_RAPIDE)]
@@ -0,0 +1,30 @@
+"""
+Benchmarks des pièces : rotation de chaque type et création par la fabrique.
+"""
+
+from typing import List
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+
+from .mesure import ITERATIONS_DEFAUT, Resultat, mesurer
+
+
+def bench_tourner(facteur: float = 1.0) -> List[Resultat]:
+    """Une rotation horaire, pour chaque classe de pièce."""
+    fabrique = FabriquePieces()
+    resultats = []
+    for type_piece in TypePiece:
+        piece = fabrique.creer(type_piece, x_pivot=5, y_pivot=10)
+        resultats.append(mesurer(f"piece.tourner[{type_piece.value}]", piece.tourner,
+                                 iterations=int(ITERATIONS_DEFAUT * facteur)))
+    return resultats
+
+
+def bench_fabrique_creer(facteur: float = 1.0) -> List[Resultat]:
+    """Création d'une pièce au point d'apparition, comme à chaque nouvelle pièce."""
+    fabrique = FabriquePieces()
+    return [mesurer(f"fabrique.creer[{type_piece.value}]",
+                    lambda type_piece=type_piece: fabrique.creer(type_piece, x_pivot=5, y_pivot=1),
+                    iterations=int(ITERATIONS_DEFAUT * facteur))
+            for type_piece in TypePiece]
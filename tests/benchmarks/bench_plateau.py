@@ -0,0 +1,53 @@
+"""
+Benchmarks du plateau : placement et suppression de lignes sur plateau dense.
+"""
+
+import random
+from typing import List, Tuple
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import Piece, TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+
+from .mesure import ITERATIONS_DEFAUT, Resultat, mesurer
+
+
+def masques_denses(graine: int = 0) -> Tuple[int, ...]:
+    """
+    Plateau 10x20 dense : 6 lignes vides, 10 lignes remplies aux trois quarts,
+    puis 4 lignes pleines sauf la colonne 0 (toujours vide, pour un I vertical).
+    """
+    aleatoire = random.Random(graine)
+    lignes = [0] * 6
+    for _ in range(10):
+        ligne = 0
+        for x in range(1, 10):
+            if aleatoire.random() < 0.75:
+                ligne |= 1 << x
+        lignes.append(ligne)
+    lignes += [0b1111111110] * 4
+    return tuple(lignes)
+
+
+def creer_i_vertical(x: int, y: int) -> Piece:
+    """Pièce I verticale de pivot (x, y) : cellules (x, y - 1) à (x, y + 2)."""
+    piece = FabriquePieces().creer(TypePiece.I, x, y)
+    pivot = piece.position_pivot
+    piece.appliquer_etat(piece.etat_apres(x - pivot.x, y - pivot.y, rotation=1))
+    return piece
+
+
+def bench_placer_piece_et_supprimer_lignes(facteur: float = 1.0) -> List[Resultat]:
+    """Un I vertical complète les 4 lignes du bas d'un plateau dense (Tetris)."""
+    masques = masques_denses()
+    piece = creer_i_vertical(0, 17)
+    resultats = []
+    for classe in (Plateau, PlateauBitboard):
+        plateau = classe(10, 20)
+        resultats.append(mesurer(
+            f"plateau.placer_piece_et_supprimer_lignes[{classe.__name__}]",
+            lambda: plateau.placer_piece_et_supprimer_lignes(piece),
+            preparer=lambda: plateau.charger_masques(masques),
+            iterations=int(ITERATIONS_DEFAUT * facteur)))
+    return resultats
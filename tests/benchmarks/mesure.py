@@ -0,0 +1,186 @@
+"""
+Outils de mesure des benchmarks : chronométrage et comparaison à une référence.
+
+Chaque échantillon est chronométré avec time.perf_counter_ns. Avec une
+préparation (remise du plateau dans son état dense, par exemple), un
+échantillon est un seul appel précédé de la préparation non chronométrée ;
+sans préparation, il regroupe assez d'appels pour durer DUREE_LOT_NS,
+ce qui rend négligeable le coût du chronométrage pour les opérations
+de moins d'une microseconde.
+
+Chaque échantillon est précédé d'un lot de calibration (une charge Python
+fixe) chronométré lui aussi : le rapport des deux durées ne dépend plus
+de la vitesse de la machine à cet instant (fréquence du processeur,
+voisins sur un hôte partagé), qui peut varier du simple au double en
+quelques secondes. La médiane de ces rapports est la valeur comparée à la
+référence ; la médiane en nanosecondes n'est qu'indicative.
+"""
+
+import gc
+import platform
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# Nombre d'appels chronométrés par défaut, et d'appels d'échauffement ignorés
+ITERATIONS_DEFAUT = 2000
+ECHAUFFEMENT_DEFAUT = 50
+
+# Durée visée d'un échantillon d'opérations sans préparation (100 µs)
+DUREE_LOT_NS = 100_000
+
+# Ralentissement toléré de la durée relative avant de signaler une régression (25 %)
+SEUIL_REGRESSION_DEFAUT = 0.25
+
+
+class Resultat(NamedTuple):
+    """
+    Durées d'un benchmark, en nanosecondes par appel (iterations : nombre d'échantillons).
+
+    relatif est la médiane du rapport entre un appel et un appel de calibration() ;
+    seuil est la tolérance propre au benchmark, si le seuil général est trop strict.
+    """
+    nom: str
+    iterations: int
+    mediane_ns: int
+    min_ns: int
+    p95_ns: int
+    relatif: float = 0.0
+    seuil: Optional[float] = None
+
+
+class Regression(NamedTuple):
+    """Benchmark plus lent que sa référence au-delà du seuil (durées relatives)."""
+    nom: str
+    reference: float
+    actuel: float
+
+    @property
+    def ratio(self) -> float:
+        return self.actuel / self.reference
+
+
+def calibration() -> object:
+    """Charge de référence : dictionnaire, tuples et tri, comme le code du domaine."""
+    valeurs = {}
+    for i in range(50):
+        valeurs[i & 7] = (i, i * 2)
+    return sorted(valeurs.values())
+
+
+def environnement() -> Dict[str, str]:
+    """Interpréteur et plateforme de la mesure, enregistrés avec la référence."""
+    return {'python': platform.python_version(), 'machine': platform.machine(),
+            'systeme': platform.system()}
+
+
+def ecarts_environnement(reference: Dict) -> List[str]:
+    """
+    Différences entre l'environnement courant et celui de la référence.
+
+    Returns:
+        Descriptions des écarts (vide si la référence est comparable)
+    """
+    return [f"{cle} {valeur} ≠ {reference.get(cle)}"
+            for cle, valeur in environnement().items() if reference.get(cle) != valeur]
+
+
+def mesurer(nom: str, operation: Callable[[], object],
+            preparer: Optional[Callable[[], object]] = None,
+            iterations: int = ITERATIONS_DEFAUT,
+            echauffement: int = ECHAUFFEMENT_DEFAUT,
+            seuil: Optional[float] = None) -> Resultat:
+    """
+    Chronomètre une opération, ramasse-miettes désactivé.
+
+    Args:
+        nom: Nom du benchmark (clé dans le JSON)
+        operation: Opération chronométrée
+        preparer: Préparation appelée avant chaque opération, hors chronométrage
+        iterations: Nombre d'échantillons chronométrés
+        echauffement: Nombre d'échantillons préalables ignorés
+        seuil: Ralentissement toléré pour ce benchmark (au moins le seuil général)
+
+    Returns:
+        Médiane, minimum et 95e centile des durées, médiane des durées relatives
+    """
+    compteur = time.perf_counter_ns
+    if preparer is None:
+        lot = _calibrer_lot(operation)
+        duree_lot = DUREE_LOT_NS
+    else:
+        # Lot de calibration au moins aussi long qu'un appel (une frame de rendu)
+        lot = 1
+        preparer()
+        debut = compteur()
+        operation()
+        duree_lot = max(DUREE_LOT_NS, compteur() - debut)
+    appels = range(lot)
+    lot_calibration = _calibrer_lot(calibration, duree_lot)
+    appels_calibration = range(lot_calibration)
+    durees: List[int] = []
+    relatives: List[float] = []
+    gc_actif = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(echauffement + iterations):
+            if preparer is not None:
+                preparer()
+            debut = compteur()
+            for _ in appels_calibration:
+                calibration()
+            milieu = compteur()
+            for _ in appels:
+                operation()
+            fin = compteur()
+            if i >= echauffement:
+                durees.append((fin - milieu) // lot)
+                relatives.append((fin - milieu) * lot_calibration / ((milieu - debut) * lot))
+    finally:
+        if gc_actif:
+            gc.enable()
+
+    durees.sort()
+    relatives.sort()
+    return Resultat(nom, iterations, durees[len(durees) // 2], durees[0],
+                    durees[min(len(durees) - 1, len(durees) * 95 // 100)],
+                    relatives[len(relatives) // 2], seuil)
+
+
+def _calibrer_lot(operation: Callable[[], object], duree_ns: int = DUREE_LOT_NS) -> int:
+    """Nombre d'appels consécutifs nécessaires pour atteindre duree_ns."""
+    compteur = time.perf_counter_ns
+    appels = 0
+    debut = compteur()
+    while compteur() - debut < duree_ns:
+        operation()
+        appels += 1
+    return appels
+
+
+def comparer(resultats: List[Resultat], reference: Dict,
+             seuil: float = SEUIL_REGRESSION_DEFAUT) -> List[Regression]:
+    """
+    Compare les durées relatives à celles de la référence.
+
+    Les benchmarks absents de la référence sont ignorés, et rien n'est
+    comparé si la référence vient d'un autre environnement (voir
+    ecarts_environnement) : le coût relatif d'une opération change
+    d'une version de Python à l'autre.
+
+    Args:
+        resultats: Résultats de l'exécution courante
+        reference: Document JSON de référence (environnement et "resultats")
+        seuil: Ralentissement relatif toléré (ou celui du benchmark, s'il est plus large)
+
+    Returns:
+        Benchmarks dont la durée relative dépasse reference * (1 + seuil)
+    """
+    if ecarts_environnement(reference):
+        return []
+    regressions = []
+    for resultat in resultats:
+        attendu = reference.get('resultats', {}).get(resultat.nom)
+        tolerance = seuil if resultat.seuil is None else max(seuil, resultat.seuil)
+        if attendu and resultat.relatif > attendu['relatif'] * (1 + tolerance):
+            regressions.append(Regression(resultat.nom, attendu['relatif'], resultat.relatif))
+    return regressions
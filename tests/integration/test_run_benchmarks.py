@@ -0,0 +1,87 @@
+"""
+Tests d'intégration du runner de benchmarks.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from tests.benchmarks.mesure import Resultat, comparer, environnement, mesurer
+from tests.run_benchmarks import main
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    """Tests de la mesure, de la comparaison et du runner."""
+
+    def test_mesurer_avec_et_sans_preparation(self):
+        """Test : La préparation est appelée avant chaque échantillon (et l'appel d'estimation)."""
+        appels = []
+
+        resultat = mesurer("essai", lambda: None, preparer=lambda: appels.append(1),
+                           iterations=20, echauffement=5)
+
+        self.assertEqual(len(appels), 26)
+        self.assertEqual(resultat.iterations, 20)
+        self.assertLessEqual(resultat.min_ns, resultat.mediane_ns)
+        self.assertLessEqual(resultat.mediane_ns, resultat.p95_ns)
+        self.assertGreater(resultat.relatif, 0)
+        self.assertGreater(mesurer("lot", lambda: sum(range(10)), iterations=20).mediane_ns, 0)
+
+    def test_comparer_au_seuil(self):
+        """Test : Seules les durées relatives au-delà du seuil (ou de celui du benchmark) régressent."""
+        resultats = [Resultat("a", 1, 9000, 1000, 9000, relatif=1.2),
+                     Resultat("b", 1, 1000, 1000, 1000, relatif=1.3),
+                     Resultat("large", 1, 1000, 1000, 1000, relatif=1.4, seuil=0.5),
+                     Resultat("nouveau", 1, 10, 10, 10, relatif=0.1)]
+        reference = dict(environnement(), resultats={
+            "a": {"relatif": 1.0}, "b": {"relatif": 1.0}, "large": {"relatif": 1.0}})
+
+        regressions = comparer(resultats, reference, seuil=0.25)
+
+        self.assertEqual([r.nom for r in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0].ratio, 1.3)
+
+    def test_comparaison_ignoree_pour_un_autre_environnement(self):
+        """Test : Une référence mesurée avec un autre Python n'est pas comparée."""
+        resultats = [Resultat("a", 1, 1000, 1000, 1000, relatif=10.0)]
+        reference = dict(environnement(), python="0.0.0", resultats={"a": {"relatif": 1.0}})
+
+        self.assertEqual(comparer(resultats, reference), [])
+
+    def test_runner_json_et_code_de_sortie(self):
+        """Test : Le runner écrit le JSON et échoue face à une référence bien plus rapide."""
+        with tempfile.TemporaryDirectory() as dossier:
+            sortie = os.path.join(dossier, "resultats.json")
+            reference = os.path.join(dossier, "reference.json")
+            options = ['--filtre', 'tourner[O]', '--facteur', '0.05', '--passages', '1',
+                       '--reference', reference]
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(options + ['--sortie', sortie, '--enregistrer-reference']), 0)
+            with open(sortie, encoding='utf-8') as fichier:
+                document = json.load(fichier)
+            self.assertEqual(list(document['resultats']), ['piece.tourner[O]'])
+
+            document['resultats']['piece.tourner[O]']['relatif'] = 0.001
+            with open(reference, 'w', encoding='utf-8') as fichier:
+                json.dump(document, fichier)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(options), 1)
+
+            document['python'] = "0.0.0"
+            with open(reference, 'w', encoding='utf-8') as fichier:
+                json.dump(document, fichier)
+            with contextlib.redirect_stdout(io.StringIO()) as sortie_console:
+                self.assertEqual(main(options), 0)
+            self.assertIn("comparaison ignorée", sortie_console.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Tests d'intégration du tournoi de parties headless en parallèle.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import unittest
+
+# Ajouter le répertoire racine au path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from tournoi_tetris import jouer_partie_headless, executer_tournoi, agreger_resultats, main
+
+
+class TestTournoiTetris(unittest.TestCase):
+    """Tests du tournoi multi-processus."""
+
+    def test_partie_headless_retourne_les_statistiques(self):
+        """Test : Une partie rend score, lignes, pièces et pièces par type."""
+        resultat = jouer_partie_headless(graine=3)
+
+        self.assertTrue(resultat['termine'])
+        self.assertEqual(resultat['graine'], 3)
+        self.assertEqual(sum(resultat['pieces_par_type'].values()), resultat['pieces'])
+        self.assertEqual(set(resultat['pieces_par_type']), {'I', 'O', 'T', 'S', 'Z', 'J', 'L'})
+
+    def test_parties_jouees_par_le_joueur(self):
+        """Test : Le joueur aléatoire pose ses pièces, différemment selon la graine."""
+        gravite = jouer_partie_headless(graine=3, joueur='gravite')
+        resultats = [jouer_partie_headless(graine=graine, joueur='aleatoire') for graine in range(4)]
+
+        self.assertGreater(resultats[3]['pieces'], gravite['pieces'])
+        self.assertGreater(len({(r['score'], r['pieces']) for r in resultats}), 1)
+        self.assertTrue(all(r['termine'] and r['joueur'] == 'aleatoire' for r in resultats))
+
+    def test_generateur_choisi(self):
+        """Test : Avec le sac de 7, les types posés ne diffèrent jamais de plus d'une pièce."""
+        resultat = jouer_partie_headless(graine=5, generateur='sac7', pieces_max=100)
+
+        self.assertEqual(resultat['generateur'], 'sac7')
+        nombres = resultat['pieces_par_type'].values()
+        self.assertLessEqual(max(nombres) - min(nombres), 1)
+
+    def test_joueur_automatique_reproductible_par_graine(self):
+        """Test : Même graine, même partie de l'IA (hors mesures de temps)."""
+        premier = jouer_partie_headless(graine=4, generateur='sac7', pieces_max=100)
+        second = jouer_partie_headless(graine=4, generateur='sac7', pieces_max=100)
+
+        for cle in ('score', 'lignes', 'pieces', 'placements_evalues'):
+            self.assertEqual(premier[cle], second[cle])
+        self.assertEqual(premier['pieces'], 100)
+        self.assertGreater(premier['lignes'], 0)
+
+    def test_tournoi_parallele_identique_au_sequentiel(self):
+        """Test : Les parties jouées dans le pool sont celles jouées en direct."""
+        graines = range(10, 16)
+
+        resultats = list(executer_tournoi(graines, nb_processus=2, pieces_max=60))
+
+        self.assertEqual(sorted(r['graine'] for r in resultats), list(graines))
+        for resultat in resultats:
+            direct = jouer_partie_headless(resultat['graine'], pieces_max=60)
+            del resultat['duree'], direct['duree']
+            self.assertEqual(resultat, direct)
+
+    def test_agreger_resultats(self):
+        """Test : Le résumé cumule scores et pièces par type."""
+        resultats = [
+            {'score': 10, 'lignes': 0, 'pieces': 2, 'pieces_par_type': {'I': 1, 'O': 1},
+             'placements_evalues': 100, 'duree': 0.5},
+            {'score': 30, 'lignes': 2, 'pieces': 4, 'pieces_par_type': {'I': 4},
+             'placements_evalues': 300, 'duree': 1.5},
+        ]
+
+        resume = agreger_resultats(resultats)
+
+        self.assertEqual(resume['parties'], 2)
+        self.assertEqual((resume['score_min'], resume['score_moyen'], resume['score_max']), (10, 20, 30))
+        self.assertEqual(resume['lignes_moyennes'], 1)
+        self.assertEqual(resume['pieces_par_type'], {'I': 5, 'O': 1})
+        self.assertEqual(resume['placements_par_seconde'], 200)
+        self.assertEqual(resume['parties_par_minute'], 60)
+
+    def test_cli_json_une_ligne_par_partie_puis_resume(self):
+        """Test : La sortie JSON contient K parties puis le résumé."""
+        sortie = io.StringIO()
+        with contextlib.redirect_stdout(sortie):
+            code = main(['--parties', '3', '--processus', '2', '--pieces-max', '50', '--json'])
+
+        lignes = [json.loads(ligne) for ligne in sortie.getvalue().splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual(len(lignes), 4)
+        self.assertEqual(lignes[-1]['resume']['parties'], 3)
+        self.assertGreater(lignes[-1]['resume']['placements_par_seconde'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Runner des benchmarks - Temps des chemins critiques comparés à une référence.
+
+Découvre les fonctions bench_*() des modules tests/benchmarks/bench_*.py,
+les exécute, écrit les résultats en JSON et compare chaque durée relative
+(rapportée à une charge de calibration, voir benchmarks/mesure.py) à
+celle de la référence enregistrée : un ralentissement au-delà du seuil
+est une régression (code de sortie 1). La suite est exécutée plusieurs
+fois et seul le meilleur passage de chaque benchmark est retenu, pour
+écarter les ralentissements passagers de la machine.
+
+Une référence enregistrée avec une autre version de Python ou sur une
+autre plateforme n'est pas comparée : la régénérer avec
+--enregistrer-reference.
+
+Usage :
+    python tests/run_benchmarks.py
+    python tests/run_benchmarks.py --filtre tourner --sortie resultats.json
+    python tests/run_benchmarks.py --seuil 0.10
+    python tests/run_benchmarks.py --enregistrer-reference
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import sys
+from typing import Dict, List, Optional
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tests import benchmarks
+from tests.benchmarks.mesure import (SEUIL_REGRESSION_DEFAUT, Resultat, comparer,
+                                     ecarts_environnement, environnement)
+
+# Exécutions de la suite complète, la meilleure médiane de chaque benchmark est retenue
+PASSAGES_DEFAUT = 3
+
+REFERENCE_DEFAUT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'benchmarks', 'reference.json')
+
+
+def executer_benchmarks(filtre: str = "", facteur: float = 1.0,
+                        passages: int = PASSAGES_DEFAUT) -> List[Resultat]:
+    """
+    Exécute les benchmarks découverts dans tests/benchmarks.
+
+    Args:
+        filtre: Sous-chaîne que le nom du résultat doit contenir
+        facteur: Multiplicateur du nombre d'itérations
+        passages: Nombre d'exécutions de la suite (meilleure durée relative retenue)
+
+    Returns:
+        Résultats retenus par le filtre, dans l'ordre de découverte
+    """
+    fonctions = []
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f"{benchmarks.__name__}.{module_info.name}")
+        fonctions.extend(getattr(module, nom) for nom in sorted(vars(module))
+                         if nom.startswith('bench_') and callable(getattr(module, nom)))
+
+    meilleurs: Dict[str, Resultat] = {}
+    for _ in range(passages):
+        for fonction in fonctions:
+            for resultat in fonction(facteur):
+                meilleur = meilleurs.get(resultat.nom)
+                if filtre in resultat.nom and (meilleur is None or resultat.relatif < meilleur.relatif):
+                    meilleurs[resultat.nom] = resultat
+    return list(meilleurs.values())
+
+
+def en_json(resultats: List[Resultat]) -> Dict:
+    """Document JSON des résultats, avec l'environnement de mesure."""
+    return {
+        **environnement(),
+        'resultats': {r.nom: {'iterations': r.iterations, 'mediane_ns': r.mediane_ns,
+                              'min_ns': r.min_ns, 'p95_ns': r.p95_ns,
+                              'relatif': round(r.relatif, 5)}
+                      for r in resultats},
+    }
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande des benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmarks Tetris")
+    parser.add_argument('--filtre', default="", help="N'exécuter que les benchmarks contenant ce texte")
+    parser.add_argument('--facteur', type=float, default=1.0,
+                        help="Multiplicateur du nombre d'itérations")
+    parser.add_argument('--passages', type=int, default=PASSAGES_DEFAUT,
+                        help="Exécutions de la suite (meilleur passage retenu)")
+    parser.add_argument('--sortie', default=None, help="Fichier JSON des résultats")
+    parser.add_argument('--reference', default=REFERENCE_DEFAUT, help="Fichier JSON de référence")
+    parser.add_argument('--seuil', type=float, default=SEUIL_REGRESSION_DEFAUT,
+                        help="Ralentissement toléré (0.25 = 25 %%)")
+    parser.add_argument('--enregistrer-reference', action='store_true',
+                        help="Écrire les résultats comme nouvelle référence")
+    options = parser.parse_args(arguments)
+
+    print("⏱️  BENCHMARKS - Chemins critiques du domaine et du rendu")
+    print("=" * 78)
+    resultats = executer_benchmarks(options.filtre, options.facteur, options.passages)
+    document = en_json(resultats)
+
+    if options.sortie:
+        with open(options.sortie, 'w', encoding='utf-8') as fichier:
+            json.dump(document, fichier, indent=2)
+    if options.enregistrer_reference:
+        with open(options.reference, 'w', encoding='utf-8') as fichier:
+            json.dump(document, fichier, indent=2)
+            fichier.write("\n")
+        print(f"📝 Référence enregistrée : {options.reference}")
+
+    reference = {}
+    if os.path.exists(options.reference):
+        with open(options.reference, encoding='utf-8') as fichier:
+            reference = json.load(fichier)
+    ecarts = ecarts_environnement(reference) if reference else []
+    if ecarts:
+        print(f"⚠️  Référence d'un autre environnement ({', '.join(ecarts)}) : comparaison ignorée")
+        reference = {}
+    regressions = {r.nom: r for r in comparer(resultats, reference, options.seuil)}
+
+    attendus = reference.get('resultats', {})
+    for resultat in resultats:
+        attendu = attendus.get(resultat.nom)
+        ecart = f"{resultat.relatif / attendu['relatif'] - 1:+7.1%}" if attendu else "      -"
+        statut = "❌" if resultat.nom in regressions else "✅"
+        print(f"{statut} {resultat.nom:<56} {resultat.mediane_ns / 1000:10.2f} µs  {ecart}")
+
+    print("-" * 78)
+    if regressions:
+        print(f"💥 {len(regressions)} régression(s) au-delà de {options.seuil:.0%}")
+        return 1
+    print(f"🎉 Aucune régression au-delà de {options.seuil:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Tests unitaires du rendu incrémental d'AffichagePartie.
+
+Vérifie que seules les zones modifiées sont envoyées à l'écran
+avec pygame.display.update(rects), sous le pilote vidéo SDL « dummy ».
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from src.adapters.sortie.affichage_partie import AffichagePartie
+from src.domaine.services.moteur_partie import MoteurPartie
+from src.domaine.services.profileur_frames import ProfileurFrames
+
+
+class TestAffichagePartieZones(unittest.TestCase):
+    """Tests du suivi des rectangles modifiés."""
+
+    def setUp(self):
+        """Affichage initialisé et moteur hors pause."""
+        self.affichage = AffichagePartie()
+        self.affichage.initialiser()
+        self.moteur = MoteurPartie()
+        self.moteur.en_pause = False
+
+    def tearDown(self):
+        """Libérer pygame."""
+        self.affichage.nettoyer()
+
+    def _dessiner_et_capturer(self):
+        """Dessine une frame et retourne les rectangles envoyés (None si aucun envoi)."""
+        with patch('pygame.display.update') as mock_update, \
+                patch.object(self.affichage, '_texte_fps', return_value="FPS: 60.0"):
+            self.affichage.dessiner(self.moteur)
+        if not mock_update.called:
+            return None
+        return mock_update.call_args[0][0]
+
+    def test_premiere_frame_envoie_tout_l_ecran(self):
+        """Test : La première frame met à jour l'écran complet."""
+        rects = self._dessiner_et_capturer()
+
+        self.assertIn(self.affichage.ecran.get_rect(), rects)
+
+    def test_frame_sans_changement_ne_touche_pas_l_ecran(self):
+        """Test : Une frame identique à la précédente n'appelle pas update."""
+        self._dessiner_et_capturer()
+
+        self.assertIsNone(self._dessiner_et_capturer())
+
+    def test_deplacement_ne_met_a_jour_que_les_cellules_modifiees(self):
+        """Test : Déplacer la pièce redessine seulement quelques cellules du plateau."""
+        self._dessiner_et_capturer()
+        self.moteur.deplacer_piece_active(0, 3)  # Pièce entièrement visible
+
+        self._dessiner_et_capturer()
+        self.moteur.deplacer_piece_active(1, 0)
+        rects = self._dessiner_et_capturer()
+
+        taille = self.affichage.taille_cellule
+        self.assertTrue(0 < len(rects) <= 8)
+        for rect in rects:
+            self.assertEqual(rect.size, (taille, taille))
+
+    def test_pause_redessine_le_plateau_complet(self):
+        """Test : L'apparition du texte PAUSE redessine tout le plateau."""
+        self._dessiner_et_capturer()
+        self.moteur.basculer_pause()
+
+        rects = self._dessiner_et_capturer()
+
+        self.assertEqual(rects, [self.affichage._zones['plateau']])
+
+    def test_statistiques_redessinees_quand_le_score_change(self):
+        """Test : Un changement de score ne met à jour que la zone des statistiques."""
+        self._dessiner_et_capturer()
+        self.moteur.stats.score += 100
+
+        rects = self._dessiner_et_capturer()
+
+        self.assertEqual(rects, [self.affichage._zones['statistiques']])
+
+    def test_invalider_force_un_redessin_complet(self):
+        """Test : invalider() renvoie tout l'écran à la frame suivante."""
+        self._dessiner_et_capturer()
+        self.affichage.invalider()
+
+        rects = self._dessiner_et_capturer()
+
+        self.assertIn(self.affichage.ecran.get_rect(), rects)
+
+    def test_textes_variables_hors_cache(self):
+        """Test : Score et compteurs changeants ne remplissent pas le cache des textes."""
+        self._dessiner_et_capturer()
+        nb_textes = len(self.affichage._cache._textes)
+
+        for score in range(1, 50):
+            self.moteur.stats.score = score
+            self.moteur.stats.pieces_placees = score
+            self._dessiner_et_capturer()
+
+        self.assertEqual(len(self.affichage._cache._textes), nb_textes)
+
+    def test_profil_remplace_les_controles(self):
+        """Test : Le profil des frames est dessiné dans la zone des contrôles."""
+        profileur = ProfileurFrames()
+        for _ in range(5):
+            profileur.debut_frame()
+            for phase in profileur.phases:
+                profileur.marquer(phase)
+            profileur.fin_frame()
+        self.affichage.profileur = profileur
+        self._dessiner_et_capturer()
+
+        self.affichage.basculer_profil()
+        rects = self._dessiner_et_capturer()
+
+        self.assertEqual(rects, [self.affichage._zones['controles']])
+        self.assertIsNone(self._dessiner_et_capturer())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests unitaires de la banque d'effets sonores préchargés d'AudioPartie.
+
+Utilise le pilote audio SDL « dummy » : les sons sont réellement décodés,
+sans périphérique audio.
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from src.adapters.sortie.audio_partie import AudioPartie
+
+
+class TestAudioPartieBanque(unittest.TestCase):
+    """Tests du préchargement et de la lecture depuis la mémoire."""
+
+    def setUp(self):
+        """Initialiser l'audio (préchargement des effets)."""
+        self.audio = AudioPartie()
+        self.audio.initialiser()
+
+    def tearDown(self):
+        """Fermer le mixer."""
+        self.audio.nettoyer()
+
+    def test_initialiser_precharge_tous_les_effets(self):
+        """Test : Chaque fichier de assets/audio/sfx est décodé à l'initialisation."""
+        repertoire = AudioPartie.RACINE_PROJET / AudioPartie.REPERTOIRE_EFFETS
+        attendus = {f"assets/audio/sfx/{f.name}" for f in repertoire.iterdir()
+                    if f.suffix in AudioPartie.EXTENSIONS_EFFETS}
+
+        self.assertEqual(set(self.audio._banque_effets), attendus)
+        self.assertEqual(set(self.audio._canaux_effets), attendus)
+
+    def test_effet_precharge_joue_sans_acces_disque(self):
+        """Test : Jouer un effet préchargé ne décode ni ne teste aucun fichier."""
+        with patch('pygame.mixer.Sound') as mock_sound, \
+                patch('src.adapters.sortie.audio_partie.Path') as mock_path:
+            resultat = self.audio.jouer_effet_sonore("assets/audio/sfx/rotate.wav")
+
+        self.assertTrue(resultat)
+        mock_sound.assert_not_called()
+        mock_path.assert_not_called()
+
+    def test_effet_joue_sur_son_canal_reserve(self):
+        """Test : L'effet est joué sur le canal qui lui est réservé."""
+        self.audio.jouer_effet_sonore("assets/audio/sfx/rotate.wav")
+
+        canal = self.audio._canaux_effets["assets/audio/sfx/rotate.wav"]
+        self.assertIs(canal.get_sound(), self.audio._banque_effets["assets/audio/sfx/rotate.wav"])
+
+    def test_nettoyer_vide_la_banque(self):
+        """Test : Les sons décodés sont libérés avec le mixer."""
+        self.audio.nettoyer()
+
+        self.assertEqual(self.audio._banque_effets, {})
+        self.assertEqual(self.audio._canaux_effets, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests unitaires du cache de surfaces pré-rendues.
+"""
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from src.adapters.sortie.cache_surfaces import CacheSurfaces
+
+
+class TestCacheSurfaces(unittest.TestCase):
+    """Tests du cache de grille, de cellules et de textes."""
+
+    def setUp(self):
+        """Initialiser pygame et un cache vide."""
+        pygame.init()
+        self.cache = CacheSurfaces(taille_cache_textes=2)
+
+    def tearDown(self):
+        """Libérer pygame."""
+        pygame.quit()
+
+    def _police(self):
+        """Police factice qui compte ses rendus."""
+        police = Mock()
+        police.render.side_effect = lambda texte, antialias, couleur: pygame.Surface((len(texte), 1))
+        return police
+
+    def test_texte_rendu_une_seule_fois(self):
+        """Test : Un même (police, texte, couleur) n'est rendu qu'une fois."""
+        police = self._police()
+
+        premier = self.cache.texte(police, "Score: 0", (255, 255, 255))
+        second = self.cache.texte(police, "Score: 0", (255, 255, 255))
+
+        self.assertIs(premier, second)
+        police.render.assert_called_once_with("Score: 0", True, (255, 255, 255))
+
+    def test_texte_lru_evince_le_moins_recent(self):
+        """Test : Au-delà de la capacité, le texte le moins récemment utilisé est rendu à nouveau."""
+        police = self._police()
+        self.cache.texte(police, "A", (0, 0, 0))
+        self.cache.texte(police, "B", (0, 0, 0))
+        self.cache.texte(police, "A", (0, 0, 0))  # A redevient le plus récent
+        self.cache.texte(police, "C", (0, 0, 0))  # Évince B
+
+        self.cache.texte(police, "A", (0, 0, 0))
+        self.assertEqual(police.render.call_count, 3)
+        self.cache.texte(police, "B", (0, 0, 0))
+        self.assertEqual(police.render.call_count, 4)
+
+    def test_cellule_partagee_par_couleur(self):
+        """Test : Un sprite par couleur, avec la bordure dessinée."""
+        rouge = self.cache.cellule((255, 0, 0), 30, 2, (255, 255, 255))
+
+        self.assertIs(rouge, self.cache.cellule((255, 0, 0), 30, 2, (255, 255, 255)))
+        self.assertIsNot(rouge, self.cache.cellule((0, 255, 0), 30, 2, (255, 255, 255)))
+        self.assertEqual(rouge.get_size(), (30, 30))
+        self.assertEqual(tuple(rouge.get_at((0, 0)))[:3], (255, 255, 255))
+        self.assertEqual(tuple(rouge.get_at((15, 15)))[:3], (255, 0, 0))
+
+    def test_fond_grille_rendu_une_seule_fois(self):
+        """Test : Le fond de grille est construit au premier appel puis réutilisé."""
+        fond = self.cache.fond_grille(10, 20, 30, (40, 40, 40), (128, 128, 128))
+
+        self.assertIs(fond, self.cache.fond_grille(10, 20, 30, (40, 40, 40), (128, 128, 128)))
+        self.assertEqual(fond.get_size(), (300, 600))
+        self.assertEqual(tuple(fond.get_at((30, 45)))[:3], (128, 128, 128))
+        self.assertEqual(tuple(fond.get_at((45, 45)))[:3], (40, 40, 40))
+
+    def test_fond_grille_par_arguments(self):
+        """Test : D'autres dimensions ou couleurs donnent un autre fond de grille."""
+        fond = self.cache.fond_grille(10, 20, 30, (40, 40, 40), (128, 128, 128))
+        petit = self.cache.fond_grille(4, 4, 10, (40, 40, 40), (128, 128, 128))
+        clair = self.cache.fond_grille(10, 20, 30, (200, 200, 200), (128, 128, 128))
+
+        self.assertEqual(petit.get_size(), (40, 40))
+        self.assertEqual(tuple(clair.get_at((45, 45)))[:3], (200, 200, 200))
+        self.assertIs(fond, self.cache.fond_grille(10, 20, 30, (40, 40, 40), (128, 128, 128)))
+
+    def test_sprites_convertis_au_format_de_l_ecran(self):
+        """Test : Fenêtre ouverte, cellules et fond de grille sont convertis une seule fois."""
+        ecran = pygame.display.set_mode((10, 10))
+
+        with patch.object(CacheSurfaces, '_convertir', wraps=CacheSurfaces._convertir) as convertir:
+            rouge = self.cache.cellule((255, 0, 0), 30, 2, (255, 255, 255))
+            fond = self.cache.fond_grille(2, 2, 10, (40, 40, 40), (128, 128, 128))
+            self.cache.cellule((255, 0, 0), 30, 2, (255, 255, 255))
+            self.cache.fond_grille(2, 2, 10, (40, 40, 40), (128, 128, 128))
+
+        self.assertEqual(convertir.call_count, 3)  # Cellule, cellule vide, fond
+        self.assertEqual(rouge.get_masks(), ecran.get_masks())
+        self.assertEqual(fond.get_masks(), ecran.get_masks())
+        self.assertEqual(tuple(fond.get_at((5, 5)))[:3], (40, 40, 40))
+
+    def test_vider(self):
+        """Test : vider() oublie toutes les surfaces."""
+        fond = self.cache.fond_grille(2, 2, 10, (40, 40, 40), (128, 128, 128))
+
+        self.cache.vider()
+
+        self.assertIsNot(fond, self.cache.fond_grille(2, 2, 10, (40, 40, 40), (128, 128, 128)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests du mode repos de GestionnairePartie.
+
+Vérifie l'attente bloquante des événements, la mise en pause à la
+perte du focus et l'invalidation de l'affichage quand la fenêtre est
+réexposée, sous le pilote vidéo SDL « dummy ».
+"""
+
+import os
+import unittest
+from unittest.mock import Mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from src.adapters.entree.gestionnaire_partie import GestionnairePartie
+from src.domaine.services.gestionnaire_evenements import ToucheClavier, TypeEvenement
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestGestionnairePartieRepos(unittest.TestCase):
+    """Tests de attendre_evenement et de la perte du focus."""
+
+    def setUp(self):
+        """Fenêtre pygame et file d'événements vide."""
+        pygame.display.init()
+        pygame.display.set_mode((10, 10))
+        pygame.event.clear()
+        self.gestionnaire = GestionnairePartie()
+        self.moteur = MoteurPartie()
+
+    def tearDown(self):
+        """Libérer pygame."""
+        pygame.display.quit()
+
+    def test_attente_expiree_sans_evenement(self):
+        """Test : Sans événement, l'attente rend la main après le délai."""
+        self.gestionnaire.attendre_evenement(10)
+
+        self.assertIsNone(self.gestionnaire._evenement_en_attente)
+        self.assertTrue(self.gestionnaire.traiter_evenements(self.moteur, 0.0))
+
+    def test_evenement_de_reveil_traite_en_premier(self):
+        """Test : L'événement qui réveille est traité avant ceux arrivés ensuite."""
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+        self.gestionnaire.attendre_evenement(10)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+        touches = []
+        self.gestionnaire.ajouter_observateur(lambda touche, type_evenement, temps: touches.append(touche))
+
+        self.gestionnaire.traiter_evenements(self.moteur, 1.0)
+
+        self.assertEqual(touches, [ToucheClavier.GAUCHE, ToucheClavier.DROITE])
+
+    def test_evenements_deja_en_file_pas_d_attente(self):
+        """Test : Avec des événements en file, pas d'attente et l'ordre est conservé."""
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        touches = []
+        self.gestionnaire.ajouter_observateur(lambda touche, type_evenement, temps: touches.append(touche))
+
+        self.gestionnaire.attendre_evenement(10_000)
+
+        self.assertFalse(self.gestionnaire.traiter_evenements(self.moteur, 0.0))
+        self.assertEqual(touches, [ToucheClavier.GAUCHE])
+
+    def test_perte_du_focus_met_la_partie_en_pause(self):
+        """Test : Quitter la fenêtre en pleine partie équivaut à un appui sur P."""
+        self.moteur.en_pause = False
+        evenements = []
+        self.gestionnaire.ajouter_observateur(
+            lambda touche, type_evenement, temps: evenements.append((touche, type_evenement)))
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+
+        self.gestionnaire.traiter_evenements(self.moteur, 0.0)
+
+        self.assertTrue(self.moteur.en_pause)
+        self.assertEqual(evenements, [(ToucheClavier.PAUSE, TypeEvenement.CLAVIER_APPUI),
+                                      (ToucheClavier.PAUSE, TypeEvenement.CLAVIER_RELACHE)])
+
+    def test_perte_du_focus_en_pause_sans_effet(self):
+        """Test : Une partie déjà en pause y reste."""
+        pygame.event.post(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+
+        self.gestionnaire.traiter_evenements(self.moteur, 0.0)
+
+        self.assertTrue(self.moteur.en_pause)
+
+    def test_fenetre_reexposee_invalide_l_affichage(self):
+        """Test : Une fenêtre restaurée ou découverte fait repeindre tout l'écran."""
+        self.gestionnaire.affichage = Mock()
+        for type_evenement in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+            pygame.event.post(pygame.event.Event(type_evenement))
+
+        self.assertTrue(self.gestionnaire.traiter_evenements(self.moteur, 0.0))
+
+        self.assertEqual(self.gestionnaire.affichage.invalider.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
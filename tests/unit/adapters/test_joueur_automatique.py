@@ -0,0 +1,71 @@
+"""
+Tests du joueur automatique (contrôleur sans clavier).
+"""
+
+import unittest
+
+from src.adapters.entree.joueur_automatique import JoueurAutomatique
+from src.domaine.services.moteur_partie import MoteurPartie
+from src.domaine.services.table_transposition import TableTransposition
+from src.ports.entree.controleur_jeu import ControleurJeu
+
+
+class TestJoueurAutomatique(unittest.TestCase):
+    """Tests du pilotage du moteur par l'heuristique."""
+
+    def test_implemente_le_port_controleur(self):
+        """Test : Le joueur automatique remplace le clavier derrière le même port."""
+        self.assertIsInstance(JoueurAutomatique(), ControleurJeu)
+
+    def test_mode_instantane_pose_une_piece_par_appel(self):
+        """Test : Chaque appel pose exactement une pièce et compte les évaluations."""
+        moteur = MoteurPartie.creer_headless(graine=3)
+        joueur = JoueurAutomatique()
+
+        for _ in range(200):
+            self.assertTrue(joueur.traiter_evenements(moteur, 0.0))
+
+        self.assertEqual(moteur.stats.pieces_placees, 200)
+        self.assertGreater(moteur.stats.lignes_completees, 60)
+        self.assertEqual(joueur.nb_decisions, 200)
+        self.assertGreater(joueur.evaluateur.nb_evaluations, 200)
+        self.assertGreater(joueur.placements_par_seconde, 0)
+
+    def test_mode_temps_reel_avec_gravite(self):
+        """Test : En temps réel, le plan survit à la gravité et les pièces sont posées."""
+        moteur = MoteurPartie.creer_headless(graine=5)
+        joueur = JoueurAutomatique(instantane=False, mouvements_par_appel=2)
+
+        for _ in range(2000):
+            self.assertTrue(joueur.traiter_evenements(moteur, 0.0))
+            moteur.avancer(1)
+
+        self.assertGreater(moteur.stats.pieces_placees, 20)
+        self.assertFalse(moteur.est_game_over())
+
+    def test_table_de_transposition_partagee(self):
+        """Test : Une partie rejouée à l'identique retrouve tous ses plans dans la table."""
+        table = TableTransposition()
+        resultats = []
+        for _ in range(2):
+            moteur = MoteurPartie.creer_headless(graine=8)
+            joueur = JoueurAutomatique(table=table)
+            for _ in range(100):
+                joueur.traiter_evenements(moteur, 0.0)
+            resultats.append((joueur.nb_decisions, moteur.capturer()))
+
+        self.assertEqual(resultats[0][0], 100)
+        self.assertEqual(resultats[1][0], 0)
+        self.assertEqual(resultats[0][1], resultats[1][1])
+        self.assertEqual(table.succes, 100)
+
+    def test_partie_terminee(self):
+        """Test : Le contrôleur signale la fin de partie."""
+        moteur = MoteurPartie.creer_headless(graine=1)
+        moteur.jeu_termine = True
+
+        self.assertFalse(JoueurAutomatique().traiter_evenements(moteur, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -134,6 +134,22 @@ class TestExceptionCollisionCommandes(unittest.TestCase):
         except ExceptionCollision:
             self.fail("ExceptionCollision levée pour une rotation valide")
             
+    def test_commande_tourner_bloquee_laisse_la_piece_intacte(self):
+        """Test : Une rotation refusée ne change ni les positions ni l'orientation."""
+        from src.domaine.entites.position import Position
+        piece = self.fabrique.creer(TypePiece.T, x_pivot=5, y_pivot=9)
+        positions_initiales = list(piece.positions)
+        bloquees = [p for p in piece.etat_apres(rotation=1).positions if p not in positions_initiales]
+        self.plateau._positions_occupees.add(bloquees[0])
+        moteur = MoteurTest(self.plateau, piece)
+
+        with self.assertRaises(ExceptionCollision):
+            CommandeTourner().execute(moteur)
+
+        self.assertEqual(piece.positions, positions_initiales)
+        piece.deplacer(0, 0)
+        self.assertEqual(piece.positions, positions_initiales)
+
     def test_commande_deplacer_gauche_avec_plateau_plein(self):
         """Test RED : CommandeDeplacerGauche avec obstacles sur le plateau."""
         # Placer une pièce
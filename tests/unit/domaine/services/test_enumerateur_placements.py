@@ -0,0 +1,86 @@
+"""
+Tests de l'énumérateur des placements atteignables.
+"""
+
+import unittest
+
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.position import Position
+from src.domaine.services.enumerateur_placements import EnumerateurPlacements, Mouvement
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestEnumerateurPlacements(unittest.TestCase):
+    """Tests de la génération des coups."""
+
+    def setUp(self):
+        """Préparer l'énumérateur."""
+        self.enumerateur = EnumerateurPlacements()
+
+    def test_nombre_de_placements_sur_plateau_vide(self):
+        """Test : Nombre de placements distincts connus sur un plateau 10x20 vide."""
+        attendus = {TypePiece.I: 17, TypePiece.O: 9, TypePiece.T: 34, TypePiece.S: 17,
+                    TypePiece.Z: 17, TypePiece.J: 34, TypePiece.L: 34}
+        for classe in (Plateau, PlateauBitboard):
+            for type_piece, nombre in attendus.items():
+                with self.subTest(plateau=classe.__name__, type_piece=type_piece.value):
+                    placements = self.enumerateur.enumerer(classe(10, 20), type_piece)
+                    self.assertEqual(len(placements), nombre)
+
+    def test_placements_au_repos(self):
+        """Test : Chaque placement est légal et ne peut plus descendre."""
+        plateau = Plateau(10, 20)
+        for x in range(0, 10, 2):
+            plateau._positions_occupees.add(Position(x, 19))
+
+        for placement in self.enumerateur.enumerer(plateau, TypePiece.L):
+            positions = placement.positions
+            self.assertTrue(plateau.peut_placer_positions(positions))
+            self.assertFalse(plateau.peut_placer_positions([Position(p.x, p.y + 1) for p in positions]))
+
+    def test_placement_sous_un_surplomb(self):
+        """Test : Une cellule sous un surplomb n'est atteinte qu'en glissant la pièce."""
+        plateau = Plateau(10, 20)
+        for x in range(0, 6):
+            plateau._positions_occupees.add(Position(x, 17))
+
+        cellules = {frozenset((p.x, p.y) for p in placement.positions): placement
+                    for placement in self.enumerateur.enumerer(plateau, TypePiece.O)}
+        sous_surplomb = frozenset({(0, 18), (1, 18), (0, 19), (1, 19)})
+
+        self.assertIn(sous_surplomb, cellules)
+        chemin = cellules[sous_surplomb].chemin
+        self.assertIn(Mouvement.GAUCHE, chemin[chemin.index(Mouvement.DESCENTE):])
+
+    def test_chemin_rejoue_par_le_moteur(self):
+        """Test : Rejouer le chemin avec MoteurPartie mène exactement au placement."""
+        actions = {
+            Mouvement.GAUCHE: lambda moteur: moteur.deplacer_piece_active(-1, 0),
+            Mouvement.DROITE: lambda moteur: moteur.deplacer_piece_active(1, 0),
+            Mouvement.ROTATION: lambda moteur: moteur.tourner_piece_active(),
+            Mouvement.DESCENTE: lambda moteur: moteur.deplacer_piece_active(0, 1),
+        }
+        moteur = MoteurPartie.creer_headless(graine=4)
+        placements = self.enumerateur.enumerer_depuis(moteur.plateau, moteur.piece_active)
+
+        for placement in placements:
+            with self.subTest(positions=placement.positions):
+                essai = MoteurPartie.creer_headless(graine=4)
+                for mouvement in placement.chemin:
+                    self.assertTrue(actions[mouvement](essai))
+                self.assertEqual(sorted(essai.piece_active.positions, key=lambda p: (p.x, p.y)),
+                                 sorted(placement.positions, key=lambda p: (p.x, p.y)))
+
+    def test_apparition_bloquee(self):
+        """Test : Aucun placement si la pièce ne peut pas apparaître."""
+        plateau = Plateau(10, 20)
+        for x in range(10):
+            plateau._positions_occupees.add(Position(x, 1))
+
+        self.assertEqual(self.enumerateur.enumerer(plateau, TypePiece.T), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
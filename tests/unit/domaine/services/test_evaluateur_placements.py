@@ -0,0 +1,79 @@
+"""
+Tests de l'évaluateur heuristique des placements.
+"""
+
+import random
+import unittest
+
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.position import Position
+from src.domaine.services.enumerateur_placements import EnumerateurPlacements
+from src.domaine.services.evaluateur_placements import (
+    CaracteristiquesPlacement, EvaluateurPlacements
+)
+
+
+def caracteristiques_completes(plateau, positions):
+    """Recalcul complet de référence, sans aucun index."""
+    largeur, hauteur = plateau.largeur, plateau.hauteur
+    cellules = {(p.x, p.y) for p in plateau.positions_occupees} | {(p.x, p.y) for p in positions}
+    pleines = [y for y in range(hauteur) if all((x, y) in cellules for x in range(largeur))]
+    restantes = {(x, y + sum(1 for ligne in pleines if ligne > y))
+                 for (x, y) in cellules if y not in pleines}
+
+    hauteurs, trous = [], 0
+    for x in range(largeur):
+        sommet = min((y for (cx, y) in restantes if cx == x), default=hauteur)
+        hauteurs.append(hauteur - sommet)
+        trous += sum(1 for y in range(sommet + 1, hauteur) if (x, y) not in restantes)
+    bosses = sum(abs(hauteurs[x] - hauteurs[x + 1]) for x in range(largeur - 1))
+    return CaracteristiquesPlacement(sum(hauteurs), len(pleines), trous, bosses)
+
+
+class TestEvaluateurPlacements(unittest.TestCase):
+    """Tests des caractéristiques incrémentales et du choix du placement."""
+
+    def setUp(self):
+        """Préparer l'énumérateur et l'évaluateur."""
+        self.enumerateur = EnumerateurPlacements()
+        self.evaluateur = EvaluateurPlacements()
+
+    def test_caracteristiques_incrementales_egales_au_recalcul_complet(self):
+        """Test : Sur des plateaux aléatoires, l'incrémental rejoint le recalcul complet."""
+        aleatoire = random.Random(7)
+        for _ in range(60):
+            plateau = Plateau(10, 20)
+            for y in range(8, 20):
+                for x in range(10):
+                    if aleatoire.random() < 0.6 and y >= aleatoire.randint(6, 19):
+                        plateau._positions_occupees.add(Position(x, y))
+            # Une ligne déjà pleine n'existe pas en jeu
+            for y in range(20):
+                plateau._positions_occupees.discard(Position(aleatoire.randrange(10), y))
+
+            type_piece = aleatoire.choice(list(TypePiece))
+            placements = self.enumerateur.enumerer(plateau, type_piece)
+            for placement, calcule in zip(placements, self.evaluateur.caracteristiques(plateau, placements)):
+                self.assertEqual(calcule, caracteristiques_completes(plateau, placement.positions))
+
+    def test_choisit_le_placement_qui_complete_une_ligne(self):
+        """Test : Une ligne presque pleine est complétée par le I vertical."""
+        plateau = Plateau(10, 20)
+        for y in range(16, 20):
+            for x in range(9):
+                plateau._positions_occupees.add(Position(x, y))
+
+        placements = self.enumerateur.enumerer(plateau, TypePiece.I)
+        meilleur = self.evaluateur.choisir(plateau, placements)
+
+        self.assertEqual({p.x for p in meilleur.positions}, {9})
+        self.assertEqual(self.evaluateur.nb_evaluations, len(placements))
+
+    def test_aucun_placement(self):
+        """Test : Sans candidat, aucun choix."""
+        self.assertIsNone(self.evaluateur.choisir(Plateau(10, 20), []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -265,6 +265,83 @@ class TestGestionRepetition(unittest.TestCase):
         self.assertEqual(len(self.gestionnaire._touches_maintenues), 0)
 
 
+class TestRepetitionDasArr(unittest.TestCase):
+    """Tests de la cadence des répétitions (DAS 100 ms, ARR 50 ms)."""
+
+    def setUp(self):
+        """Gestionnaire à délais courts, répétitions comptées par un observateur."""
+        self.moteur = Mock()
+        self.gestionnaire, self.repetitions = self._creer_gestionnaire()
+
+    def _creer_gestionnaire(self):
+        gestionnaire = GestionnaireEvenements()
+        gestionnaire.configurer_delais_repetition(0.1, 0.05)
+        repetitions = []
+
+        def observer(touche, type_evenement, temps):
+            if type_evenement == TypeEvenement.CLAVIER_MAINTENU:
+                repetitions.append(touche)
+
+        gestionnaire.ajouter_observateur(observer)
+        return gestionnaire, repetitions
+
+    def test_rattrapage_des_repetitions_manquees(self):
+        """Une frame longue émet toutes les répétitions échues depuis la précédente."""
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.0)
+
+        self.assertEqual(self.gestionnaire.mettre_a_jour_repetition(self.moteur, 0.09), [])
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 0.26)  # 0.10, 0.15, 0.20, 0.25
+
+        self.assertEqual(self.repetitions, [ToucheClavier.GAUCHE] * 4)
+
+    def test_cadence_independante_des_fps(self):
+        """Autant de répétitions à 60 qu'à 20 FPS sur la même durée."""
+        comptes = []
+        for fps in (60, 20):
+            gestionnaire, repetitions = self._creer_gestionnaire()
+            gestionnaire.traiter_evenement_clavier("Right", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.0)
+            for i in range(1, int(0.49 * fps) + 1):
+                gestionnaire.mettre_a_jour_repetition(self.moteur, i / fps)
+            gestionnaire.mettre_a_jour_repetition(self.moteur, 0.49)
+            comptes.append(len(repetitions))
+
+        self.assertEqual(comptes, [8, 8])  # 0.10 à 0.45
+
+    def test_relache_arrete_les_repetitions(self):
+        """Une touche relâchée avant son échéance n'est pas répétée."""
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.0)
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_RELACHE, self.moteur, 0.05)
+
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 0.5)
+
+        self.assertEqual(self.repetitions, [])
+
+    def test_nouvel_appui_replanifie(self):
+        """Un nouvel appui repart du délai initial, l'ancienne échéance est ignorée."""
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.0)
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_RELACHE, self.moteur, 0.05)
+        self.gestionnaire.traiter_evenement_clavier("Left", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.08)
+
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 0.17)
+        self.assertEqual(self.repetitions, [])
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 0.18)
+        self.assertEqual(self.repetitions, [ToucheClavier.GAUCHE])
+
+    def test_retard_excessif_non_rattrape(self):
+        """Après un long blocage, une seule répétition puis le rythme normal."""
+        self.gestionnaire.traiter_evenement_clavier("Down", TypeEvenement.CLAVIER_APPUI, self.moteur, 0.0)
+
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 2.0)
+        self.assertEqual(len(self.repetitions), 1)
+        self.gestionnaire.mettre_a_jour_repetition(self.moteur, 2.05)
+        self.assertEqual(len(self.repetitions), 2)
+
+    def test_delai_repetition_invalide(self):
+        """Un délai de répétition nul est refusé."""
+        with self.assertRaises(ValueError):
+            self.gestionnaire.configurer_delais_repetition(0.1, 0)
+
+
 class TestPersonnalisationMapping(unittest.TestCase):
     """Tests pour la personnalisation du mapping des touches."""
     
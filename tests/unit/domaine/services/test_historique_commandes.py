@@ -0,0 +1,137 @@
+"""
+Tests de l'historique d'annulation / rétablissement des commandes.
+"""
+
+import tracemalloc
+import unittest
+
+from src.adapters.entree.joueur_automatique import JoueurAutomatique
+from src.domaine.exceptions.exception_collision import ExceptionCollision
+from src.domaine.services.commandes import (
+    Commande, CommandeChuteRapidePartie, CommandeDeplacerDroitePartie,
+    CommandeDeplacerGauchePartie, CommandeTournerPartie, HistoriqueCommandes
+)
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class CommandeBloquee(Commande):
+    """Commande qui échoue sans rien modifier."""
+
+    def execute(self, moteur) -> bool:
+        raise ExceptionCollision("bloquée")
+
+
+class CommandeDecisionAutomatique(Commande):
+    """Une décision entière du joueur automatique (pièce jouée et posée)."""
+
+    def __init__(self):
+        self.joueur = JoueurAutomatique()
+
+    def execute(self, moteur) -> bool:
+        return self.joueur.traiter_evenements(moteur, 0.0)
+
+
+class TestHistoriqueCommandes(unittest.TestCase):
+    """Tests des piles d'annulation et de rétablissement."""
+
+    def setUp(self):
+        self.moteur = MoteurPartie.creer_headless(graine=6)
+        self.moteur.avancer(120)
+        self.historique = HistoriqueCommandes(self.moteur)
+
+    def test_annuler_puis_retablir(self):
+        """Test : Annuler remet l'état d'avant, rétablir celui d'après."""
+        etats = [self.moteur.capturer()]
+        for commande in (CommandeTournerPartie(), CommandeDeplacerGauchePartie(),
+                         CommandeChuteRapidePartie()):
+            self.assertTrue(self.historique.executer(commande))
+            etats.append(self.moteur.capturer())
+
+        for etat in reversed(etats[:-1]):
+            self.assertTrue(self.historique.annuler())
+            self.assertEqual(self.moteur.capturer(), etat)
+        self.assertFalse(self.historique.annuler())
+
+        for etat in etats[1:]:
+            self.assertTrue(self.historique.retablir())
+            self.assertEqual(self.moteur.capturer(), etat)
+        self.assertFalse(self.historique.peut_retablir)
+
+    def test_nouvelle_commande_efface_les_retablissements(self):
+        """Test : Exécuter après une annulation abandonne la branche annulée."""
+        self.historique.executer(CommandeDeplacerDroitePartie())
+        self.historique.annuler()
+
+        self.historique.executer(CommandeDeplacerGauchePartie())
+
+        self.assertFalse(self.historique.peut_retablir)
+        self.assertTrue(self.historique.peut_annuler)
+
+    def test_commandes_sans_effet_non_enregistrees(self):
+        """Test : Un mouvement refusé ou une collision n'ajoute rien à l'historique."""
+        for _ in range(10):
+            self.historique.executer(CommandeDeplacerGauchePartie())
+        nb_annulations = len(self.historique._annulations)
+
+        with self.assertRaises(ExceptionCollision):
+            self.historique.executer(CommandeBloquee())
+
+        self.assertLess(nb_annulations, 10)
+        self.assertEqual(len(self.historique._annulations), nb_annulations)
+
+    def test_historique_borne_et_structure_partagee(self):
+        """Test : Taille bornée, et les lignes inchangées sont partagées entre états."""
+        historique = HistoriqueCommandes(self.moteur, taille_max=50)
+        for i in range(200):
+            historique.executer(CommandeDeplacerGauchePartie() if i % 2 else CommandeDeplacerDroitePartie())
+
+        annulations = historique._annulations
+        self.assertEqual(len(annulations), 50)
+        self.assertIs(annulations[0].lignes, annulations[-1].lignes)
+        self.assertIs(annulations[0].generateur, annulations[-1].generateur)
+
+        # Après un placement, les lignes restées identiques gardent le même objet
+        decision = CommandeDecisionAutomatique()
+        for _ in range(12):
+            historique.executer(decision)
+        historique.executer(decision)
+        avant, apres = historique._annulations[-1].lignes, historique._capturer().lignes
+        self.assertIsNot(avant, apres)
+        communes = [ligne for ligne in apres if ligne in avant]
+        self.assertTrue(communes)
+        self.assertTrue(all(any(ligne is ancienne for ancienne in avant) for ligne in communes))
+
+    def test_memoire_plate_sur_des_milliers_de_coups(self):
+        """Test : Un déplacement enregistré coûte quelques centaines d'octets."""
+        historique = HistoriqueCommandes(self.moteur, taille_max=5000)
+        gauche, droite = CommandeDeplacerGauchePartie(), CommandeDeplacerDroitePartie()
+        historique.executer(droite)
+
+        tracemalloc.start()
+        try:
+            for i in range(2000):
+                historique.executer(gauche if i % 2 else droite)
+            memoire, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLess(memoire / 2000, 1024)
+
+    def test_pas_a_pas_dans_les_decisions_du_joueur_automatique(self):
+        """Test : Les décisions de l'IA s'annulent et se rejouent une à une."""
+        decision = CommandeDecisionAutomatique()
+        for _ in range(20):
+            self.historique.executer(decision)
+        final = self.moteur.capturer()
+
+        for _ in range(20):
+            self.historique.annuler()
+        self.assertEqual(self.moteur.stats.pieces_placees, 0)
+
+        for _ in range(20):
+            self.historique.retablir()
+        self.assertEqual(self.moteur.capturer(), final)
+
+
+if __name__ == '__main__':
+    unittest.main()
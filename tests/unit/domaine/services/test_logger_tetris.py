@@ -0,0 +1,67 @@
+"""
+Tests unitaires du formatage paresseux de LoggerTetris.
+"""
+
+import logging
+import unittest
+
+from src.domaine.services.logger_tetris import LoggerTetris
+
+
+class CompteurFormatage:
+    """Objet qui compte combien de fois il est converti en texte."""
+
+    def __init__(self):
+        self.nb_formatages = 0
+
+    def __str__(self):
+        self.nb_formatages += 1
+        return "compteur"
+
+
+class TestLoggerTetris(unittest.TestCase):
+    """Tests des gardes de niveau et du formatage différé."""
+
+    def setUp(self):
+        """Logger dédié, en mode silencieux comme au démarrage du jeu."""
+        self.logger = LoggerTetris("tetris.test")
+        self.logger.set_silent_mode(True)
+
+    def tearDown(self):
+        """Remettre le logger en mode silencieux."""
+        self.logger.set_debug_mode(False)
+        self.logger.set_silent_mode(True)
+
+    def test_arguments_non_formates_si_debug_desactive(self):
+        """Test : Un message debug non émis ne formate pas ses arguments."""
+        compteur = CompteurFormatage()
+
+        self.logger.debug("[DICE] Pièce: %s", compteur)
+
+        self.assertEqual(compteur.nb_formatages, 0)
+
+    def test_message_emis_avec_arguments_si_debug_active(self):
+        """Test : En mode debug, le message est formaté avec ses arguments."""
+        self.logger.set_debug_mode(True)
+
+        with self.assertLogs("tetris.test", level=logging.DEBUG) as capture:
+            self.logger.debug("[DICE] Pièce: %s en (%d, %d)", "T", 4, 1)
+
+        self.assertEqual(capture.records[0].getMessage(), "[DICE] Pièce: T en (4, 1)")
+
+    def test_est_actif_suit_les_modes(self):
+        """Test : est_actif() reflète set_debug_mode() et set_silent_mode()."""
+        self.assertFalse(self.logger.est_actif())
+        self.assertFalse(self.logger.est_actif(logging.INFO))
+        self.assertTrue(self.logger.est_actif(logging.ERROR))
+
+        self.logger.set_debug_mode(True)
+        self.assertTrue(self.logger.debug_actif)
+        self.assertTrue(self.logger.est_actif(logging.DEBUG))
+
+        self.logger.set_debug_mode(False)
+        self.assertFalse(self.logger.est_actif(logging.ERROR))
+
+
+if __name__ == '__main__':
+    unittest.main()
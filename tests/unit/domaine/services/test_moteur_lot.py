@@ -0,0 +1,93 @@
+"""
+Tests de MoteurLot - N parties jouées en parallèle avec NumPy.
+"""
+
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau_lot import TYPES_PIECES
+from src.domaine.services.moteur_lot import MoteurLot
+
+
+@unittest.skipUnless(np is not None, "NumPy non installé")
+class TestMoteurLot(unittest.TestCase):
+    """Tests du moteur de parties vectorisé."""
+
+    def _jouer_jusqu_a_la_fin(self, moteur: MoteurLot, graine: int) -> int:
+        """Joue des coups aléatoires jusqu'à la fin de toutes les parties."""
+        generateur = np.random.default_rng(graine)
+        coups = 0
+        while not moteur.tous_termines():
+            moteur.placer(generateur.integers(0, 4, moteur.nb_parties),
+                          generateur.integers(2, 8, moteur.nb_parties))
+            coups += 1
+        return coups
+
+    def test_chute_rapide_comptee_dans_le_score(self):
+        """Test : Un coup sur plateau vide rapporte la distance de chute x niveau."""
+        moteur = MoteurLot(2, graine=0)
+        moteur.types_actifs[:] = TYPES_PIECES.index(TypePiece.O)
+
+        lignes = moteur.placer([0, 0], [0, 4])
+
+        self.assertEqual(lignes.tolist(), [0, 0])
+        self.assertEqual(moteur.score.tolist(), [18, 18])
+        self.assertEqual(moteur.pieces_placees.tolist(), [1, 1])
+        self.assertEqual(int(moteur.plateaux.lignes[0, 19]), 0b11)
+        self.assertEqual(int(moteur.plateaux.lignes[1, 19]), 0b110000)
+
+    def test_lignes_completees_et_score(self):
+        """Test : Compléter deux lignes rapporte 300 x niveau."""
+        moteur = MoteurLot(1, graine=0)
+        moteur.plateaux.lignes[0, 18:] = 0b1111111100
+        moteur.types_actifs[:] = TYPES_PIECES.index(TypePiece.O)
+
+        lignes = moteur.placer([0], [0])
+
+        self.assertEqual(lignes.tolist(), [2])
+        self.assertEqual(moteur.lignes_completees.tolist(), [2])
+        self.assertEqual(moteur.score.tolist(), [18 + 300])
+        self.assertFalse(moteur.plateaux.lignes.any())
+
+    def test_coup_impossible_termine_la_partie(self):
+        """Test : Une colonne hors du plateau termine uniquement la partie concernée."""
+        moteur = MoteurLot(2, graine=0)
+        moteur.types_actifs[:] = TYPES_PIECES.index(TypePiece.O)
+
+        moteur.placer([0, 0], [9, 4])
+
+        self.assertEqual(moteur.termine.tolist(), [True, False])
+        self.assertEqual(moteur.pieces_placees.tolist(), [0, 1])
+
+    def test_lot_seede_reproductible(self):
+        """Test : Deux lots de même graine jouant les mêmes coups sont identiques."""
+        resultats = []
+        for _ in range(2):
+            moteur = MoteurLot(64, graine=5)
+            self._jouer_jusqu_a_la_fin(moteur, graine=9)
+            resultats.append((moteur.score.tolist(), moteur.pieces_par_type.tolist()))
+
+        self.assertEqual(resultats[0], resultats[1])
+
+    def test_reinitialiser_parties_terminees(self):
+        """Test : Seules les parties terminées sont redémarrées."""
+        moteur = MoteurLot(32, graine=3)
+        self._jouer_jusqu_a_la_fin(moteur, graine=4)
+        moteur.termine[0] = False
+        score_conserve = int(moteur.score[0])
+
+        moteur.reinitialiser(moteur.termine.copy())
+
+        self.assertFalse(moteur.termine.any())
+        self.assertEqual(int(moteur.score[0]), score_conserve)
+        self.assertFalse(moteur.score[1:].any())
+        self.assertFalse(moteur.plateaux.lignes[1:].any())
+
+
+if __name__ == '__main__':
+    unittest.main()
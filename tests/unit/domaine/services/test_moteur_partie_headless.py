@@ -0,0 +1,211 @@
+"""
+Tests du mode headless de MoteurPartie.
+
+Vérifie l'horloge injectable, l'avance par ticks fixes avancer(n_ticks)
+et la reproductibilité d'une partie seedée, sans aucun import pygame.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.services.horloge_simulee import HorlogeSimulee
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestHorlogeSimulee(unittest.TestCase):
+    """Tests de l'horloge simulée."""
+
+    def test_horloge_avance_uniquement_sur_demande(self):
+        """Test : Le temps ne change que via avancer()."""
+        horloge = HorlogeSimulee(10.0)
+        self.assertEqual(horloge(), 10.0)
+
+        horloge.avancer(0.5)
+
+        self.assertEqual(horloge(), 10.5)
+
+    def test_horloge_refuse_duree_negative(self):
+        """Test : Remonter le temps est interdit."""
+        with self.assertRaises(ValueError):
+            HorlogeSimulee().avancer(-1.0)
+
+
+class TestMoteurPartieHeadless(unittest.TestCase):
+    """Tests de la simulation par ticks fixes."""
+
+    def test_creer_headless_configure_le_moteur(self):
+        """Test : Le moteur headless est hors pause, sans audio, sur bitboard."""
+        moteur = MoteurPartie.creer_headless(graine=1)
+
+        self.assertFalse(moteur.en_pause)
+        self.assertIsNone(moteur.obtenir_audio())
+        self.assertIsInstance(moteur.plateau, PlateauBitboard)
+
+    def test_avancer_une_seconde_fait_tomber_la_piece_d_une_ligne(self):
+        """Test : 60 ticks au niveau 1 = une chute d'une ligne."""
+        moteur = MoteurPartie.creer_headless(graine=1)
+        pivot_initial = moteur.piece_active.position_pivot
+
+        self.assertEqual(moteur.avancer(59), 59)
+        self.assertEqual(moteur.piece_active.position_pivot, pivot_initial)
+
+        moteur.avancer(1)
+
+        self.assertEqual(moteur.piece_active.position_pivot.y, pivot_initial.y + 1)
+        self.assertEqual(moteur.ticks, 60)
+        self.assertAlmostEqual(moteur._horloge(), 1.0)
+
+    def test_intervalle_raccourci_en_cours_d_attente(self):
+        """Test : Une montée de niveau qui rend la chute déjà due la fait tomber au tick suivant."""
+        moteur = MoteurPartie.creer_headless(graine=1)
+        pivot_initial = moteur.piece_active.position_pivot
+        moteur.avancer(50)
+
+        moteur.intervalle_chute = 0.5  # 30 ticks : la chute est en retard de 20 ticks
+
+        self.assertEqual(moteur.avancer(1), 1)
+        self.assertEqual(moteur.piece_active.position_pivot.y, pivot_initial.y + 1)
+        self.assertEqual(moteur.ticks, 51)
+
+    def test_avancer_ne_fait_rien_en_pause(self):
+        """Test : Aucun tick n'est simulé en pause."""
+        moteur = MoteurPartie.creer_headless(graine=1)
+        moteur.basculer_pause()
+
+        self.assertEqual(moteur.avancer(600), 0)
+        self.assertEqual(moteur.ticks, 0)
+
+    def test_partie_complete_simulee_jusqu_au_game_over(self):
+        """Test : Une partie entière se joue en un seul appel."""
+        moteur = MoteurPartie.creer_headless(graine=7)
+
+        ticks = moteur.avancer(10_000_000)
+
+        self.assertTrue(moteur.est_game_over())
+        self.assertLess(ticks, 10_000_000)
+        self.assertGreater(moteur.stats.pieces_placees, 0)
+
+    def test_partie_seedee_reproductible(self):
+        """Test : Deux parties de même graine sont identiques."""
+        resultats = []
+        for _ in range(2):
+            moteur = MoteurPartie.creer_headless(graine=123)
+            moteur.avancer(10_000_000)
+            resultats.append((moteur.ticks, moteur.stats.pieces_placees,
+                              dict(moteur.stats.pieces_par_type),
+                              moteur.plateau.lignes))
+
+        self.assertEqual(resultats[0], resultats[1])
+
+    def test_horloge_injectee_pilote_la_chute_automatique(self):
+        """Test : mettre_a_jour_chute_automatique lit l'horloge injectée."""
+        horloge = HorlogeSimulee()
+        moteur = MoteurPartie(horloge=horloge)
+        moteur.basculer_pause()
+        pivot_initial = moteur.piece_active.position_pivot
+
+        moteur.mettre_a_jour_chute_automatique()
+        self.assertEqual(moteur.piece_active.position_pivot, pivot_initial)
+
+        horloge.avancer(1.0)
+        moteur.mettre_a_jour_chute_automatique()
+
+        self.assertEqual(moteur.piece_active.position_pivot.y, pivot_initial.y + 1)
+
+    def test_moteur_n_importe_pas_pygame(self):
+        """Test : Le moteur headless ne charge pas pygame."""
+        code = (
+            "import sys\n"
+            "from src.domaine.services.moteur_partie import MoteurPartie\n"
+            "MoteurPartie.creer_headless(graine=0).avancer(600)\n"
+            "sys.exit(1 if 'pygame' in sys.modules else 0)\n"
+        )
+        racine_projet = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+        resultat = subprocess.run([sys.executable, "-c", code], capture_output=True, cwd=racine_projet)
+
+        self.assertEqual(resultat.returncode, 0, resultat.stderr.decode())
+
+
+class TestInstantaneMoteur(unittest.TestCase):
+    """Tests de capturer() / restaurer()."""
+
+    @staticmethod
+    def _etat(moteur):
+        """Empreinte indépendante de l'instantané : cellules, pièce, statistiques."""
+        return (moteur.plateau.positions_occupees,
+                frozenset(moteur.piece_active.positions),
+                moteur.piece_suivante.type_piece,
+                moteur.file_pieces.apercu(),
+                dict(moteur.stats.pieces_par_type),
+                moteur.stats.score, moteur.ticks)
+
+    def test_instantane_immuable_et_hachable(self):
+        """Test : L'instantané est un tuple d'immuables, égal d'une capture à l'autre."""
+        moteur = MoteurPartie.creer_headless(graine=5)
+        moteur.avancer(3_000)
+
+        instantane = moteur.capturer()
+
+        self.assertEqual(instantane, moteur.capturer())
+        self.assertEqual(hash(instantane), hash(moteur.capturer()))
+        with self.assertRaises(AttributeError):
+            instantane.ticks = 0
+
+    def test_restaurer_revient_a_l_etat_capture(self):
+        """Test : Après des coups joués, restaurer() rend l'état exact, plusieurs fois."""
+        moteur = MoteurPartie.creer_headless(graine=11)
+        moteur.avancer(2_000)
+        moteur.tourner_piece_active()
+        instantane = moteur.capturer()
+        etat = self._etat(moteur)
+
+        for _ in range(3):
+            moteur.chute_rapide()
+            moteur.avancer(5_000)
+            self.assertNotEqual(self._etat(moteur), etat)
+
+            moteur.restaurer(instantane)
+
+            self.assertEqual(self._etat(moteur), etat)
+            self.assertEqual(moteur.capturer(), instantane)
+
+    def test_aller_retour_de_chaque_piece_et_orientation(self):
+        """Test : Chaque type et orientation revient aux mêmes cellules (I compris)."""
+        for type_piece in TypePiece:
+            for orientation in range(4):
+                with self.subTest(type_piece=type_piece, orientation=orientation):
+                    moteur = MoteurPartie.creer_headless(graine=1)
+                    piece = moteur.fabrique.creer(type_piece, 4, 6)
+                    piece.appliquer_etat(piece.etat_apres(rotation=orientation))
+                    moteur.piece_active = piece
+                    positions = frozenset(piece.positions)
+                    instantane = moteur.capturer()
+
+                    autre = MoteurPartie.creer_headless(graine=2)
+                    autre.restaurer(instantane)
+
+                    self.assertEqual(frozenset(autre.piece_active.positions), positions)
+                    self.assertEqual(autre.capturer(), instantane)
+
+    def test_partie_restauree_se_poursuit_a_l_identique(self):
+        """Test : Le générateur est restauré, la suite de la partie est la même."""
+        moteur = MoteurPartie.creer_headless(graine=42)
+        moteur.avancer(4_000)
+        instantane = moteur.capturer()
+        moteur.avancer(10_000_000)
+        reference = moteur.capturer()
+
+        autre = MoteurPartie.creer_headless(graine=0)
+        autre.restaurer(instantane)
+        autre.avancer(10_000_000)
+
+        self.assertTrue(autre.est_game_over())
+        self.assertEqual(autre.capturer(), reference)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests de l'ordonnanceur des frames (pas de simulation fixe, cadence du rendu).
+
+L'horloge est une HorlogeSimulee : le temps n'avance que lorsque le test
+(ou l'attente de l'ordonnanceur) le demande.
+"""
+
+import unittest
+
+from src.domaine.services.horloge_simulee import HorlogeSimulee
+from src.domaine.services.moteur_partie import MoteurPartie
+from src.domaine.services.ordonnanceur_frames import OrdonnanceurFrames
+
+
+class TestOrdonnanceurFrames(unittest.TestCase):
+    """Tests de l'accumulateur et de l'attente."""
+
+    def setUp(self):
+        """Horloge simulée, l'attente fait avancer le temps."""
+        self.horloge = HorlogeSimulee(100.0)
+        self.attentes = []
+
+        def dormir(duree):
+            self.attentes.append(duree)
+            self.horloge.avancer(duree)
+
+        self.dormir = dormir
+
+    def _creer(self, **options):
+        return OrdonnanceurFrames(horloge=self.horloge, dormir=self.dormir, **options)
+
+    def test_un_pas_par_frame_a_la_cadence_de_la_simulation(self):
+        """Test : À 60 FPS, chaque frame exécute exactement un pas de 1/60 s."""
+        ordonnanceur = self._creer()
+        pas = []
+        for _ in range(120):
+            ordonnanceur.attendre_frame()
+            pas.append(ordonnanceur.demarrer_frame())
+
+        self.assertEqual(pas, [1] * 120)
+        self.assertAlmostEqual(ordonnanceur.fps, 60.0)
+
+    def test_simulation_plus_rapide_que_l_affichage(self):
+        """Test : Avec un rendu à 30 FPS, deux pas de simulation par frame."""
+        ordonnanceur = self._creer(fps_affichage=30)
+
+        pas = []
+        for _ in range(30):
+            ordonnanceur.attendre_frame()
+            pas.append(ordonnanceur.demarrer_frame())
+
+        self.assertEqual(sum(pas), 60)
+
+    def test_frame_en_retard_rattrape_ses_pas(self):
+        """Test : Une frame de 50 ms rattrape trois pas, sans attente ensuite."""
+        ordonnanceur = self._creer()
+        self.horloge.avancer(0.05)
+
+        self.assertEqual(ordonnanceur.demarrer_frame(), 3)
+        ordonnanceur.attendre_frame()
+        self.assertEqual(self.attentes, [])
+
+    def test_fractions_de_pas_accumulees(self):
+        """Test : Des frames plus courtes qu'un pas s'accumulent jusqu'à un pas."""
+        ordonnanceur = self._creer(fps_affichage=None)
+
+        pas = []
+        for _ in range(4):
+            self.horloge.avancer(1 / 240)
+            pas.append(ordonnanceur.demarrer_frame())
+
+        self.assertEqual(pas, [0, 0, 0, 1])
+
+    def test_retard_excessif_abandonne(self):
+        """Test : Au-delà du plafond, le retard n'est pas rattrapé."""
+        ordonnanceur = self._creer(pas_max_par_frame=8)
+        self.horloge.avancer(5.0)
+
+        self.assertEqual(ordonnanceur.demarrer_frame(), 8)
+        self.horloge.avancer(1 / 60)
+        self.assertEqual(ordonnanceur.demarrer_frame(), 1)
+
+    def test_reprendre_ignore_l_attente(self):
+        """Test : Après reprendre(), l'attente du mode repos n'est ni simulée ni comptée."""
+        ordonnanceur = self._creer()
+        for _ in range(10):
+            ordonnanceur.attendre_frame()
+            ordonnanceur.demarrer_frame()
+        self.horloge.avancer(30.0)
+
+        ordonnanceur.reprendre()
+        self.assertEqual(ordonnanceur.demarrer_frame(), 0)
+        ordonnanceur.attendre_frame()
+        self.assertEqual(ordonnanceur.demarrer_frame(), 1)
+        self.assertAlmostEqual(ordonnanceur.fps, 60.0)
+
+    def test_rendu_non_plafonne_ne_dort_pas(self):
+        """Test : Sans cadence d'affichage, attendre_frame ne dort jamais."""
+        ordonnanceur = self._creer(fps_affichage=None)
+
+        ordonnanceur.attendre_frame()
+
+        self.assertEqual(self.attentes, [])
+
+    def test_parametres_invalides(self):
+        """Test : Pas et cadence doivent être positifs."""
+        with self.assertRaises(ValueError):
+            self._creer(pas=0)
+        with self.assertRaises(ValueError):
+            self._creer(fps_affichage=0)
+
+    def test_gravite_independante_de_la_cadence_du_rendu(self):
+        """Test : Une seconde de jeu fait tomber la pièce autant à 60 qu'à 20 FPS."""
+        lignes = []
+        for fps in (60, 20):
+            horloge = HorlogeSimulee()
+            moteur = MoteurPartie(horloge=horloge, graine=1)
+            moteur.en_pause = False
+            y_depart = moteur.piece_active.position_pivot.y
+            ordonnanceur = OrdonnanceurFrames(fps_affichage=fps, horloge=horloge, dormir=horloge.avancer)
+            for _ in range(fps * 3):
+                ordonnanceur.attendre_frame()
+                moteur.avancer(ordonnanceur.demarrer_frame())
+            lignes.append(moteur.piece_active.position_pivot.y - y_depart)
+
+        self.assertEqual(lignes, [3, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
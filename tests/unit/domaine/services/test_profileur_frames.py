@@ -0,0 +1,104 @@
+"""
+Tests du profileur des frames de la boucle de jeu.
+"""
+
+import csv
+import io
+import unittest
+from unittest.mock import patch
+
+from src.domaine.services.profileur_frames import FRAME, PHASES_PARTIE, ProfileurFrames
+
+
+class TestProfileurFrames(unittest.TestCase):
+    """Tests des tampons circulaires, des centiles et de l'export CSV."""
+
+    def _enregistrer(self, profileur, durees_phases):
+        """Enregistre une frame dont les phases durent les durées données (ns)."""
+        instants = [0]
+        for duree in durees_phases:
+            instants.append(instants[-1] + duree)
+        with patch('time.perf_counter_ns', side_effect=instants):
+            profileur.debut_frame()
+            for phase in profileur.phases:
+                profileur.marquer(phase)
+        profileur.fin_frame()
+
+    def test_durees_des_phases_et_de_la_frame(self):
+        """Test : Chaque phase reçoit le temps écoulé depuis la marque précédente."""
+        profileur = ProfileurFrames(('a', 'b'), taille=4)
+
+        self._enregistrer(profileur, (100, 250))
+
+        self.assertEqual(profileur.durees('a'), [100])
+        self.assertEqual(profileur.durees('b'), [250])
+        self.assertEqual(profileur.durees(FRAME), [350])
+        self.assertEqual(profileur.nb_frames, 1)
+
+    def test_frame_exclut_l_attente(self):
+        """Test : Le sommeil du plafond de FPS n'est pas compté dans la durée de la frame."""
+        profileur = ProfileurFrames(PHASES_PARTIE, taille=4)
+
+        self._enregistrer(profileur, (1, 2, 3, 4, 16_000))
+
+        self.assertEqual(profileur.durees('attente'), [16_000])
+        self.assertEqual(profileur.durees(FRAME), [10])
+
+    def test_frame_abandonnee_non_enregistree(self):
+        """Test : Une frame abandonnée (mode repos) n'apparaît ni dans les durées ni dans le compte."""
+        profileur = ProfileurFrames(('a', 'b'), taille=4)
+        self._enregistrer(profileur, (100, 250))
+
+        with patch('time.perf_counter_ns', side_effect=[0, 5, 500_000_000]):
+            profileur.debut_frame()
+            profileur.marquer('a')
+            profileur.marquer('b')
+        profileur.abandonner_frame()
+        self._enregistrer(profileur, (7, 8))
+
+        self.assertEqual(profileur.durees('b'), [250, 8])
+        self.assertEqual(profileur.durees(FRAME), [350, 15])
+        self.assertEqual(profileur.nb_frames, 2)
+
+    def test_tampon_circulaire_garde_les_dernieres_frames(self):
+        """Test : Au-delà de la taille, les frames les plus anciennes sont oubliées."""
+        profileur = ProfileurFrames(('a',), taille=3)
+
+        for duree in (1, 2, 3, 4, 5):
+            self._enregistrer(profileur, (duree,))
+
+        self.assertEqual(profileur.durees('a'), [3, 4, 5])
+        self.assertEqual(profileur.nb_frames, 5)
+
+    def test_centiles(self):
+        """Test : p50, p95 et p99 en millisecondes."""
+        profileur = ProfileurFrames(('a',), taille=100)
+        for i in range(1, 101):
+            self._enregistrer(profileur, (i * 1_000_000,))
+
+        self.assertEqual(profileur.centiles('a'), (51.0, 96.0, 100.0))
+        self.assertEqual(ProfileurFrames().centiles(), (0.0, 0.0, 0.0))
+        self.assertEqual(list(profileur.resume()), ['a', FRAME])
+
+    def test_export_csv(self):
+        """Test : Une ligne par frame conservée, numérotée depuis le début de la partie."""
+        profileur = ProfileurFrames(('a', 'b'), taille=2)
+        for duree in (10, 20, 30):
+            self._enregistrer(profileur, (duree, 1))
+        sortie = io.StringIO()
+
+        nb_frames = profileur.exporter_csv(sortie)
+
+        lignes = list(csv.reader(io.StringIO(sortie.getvalue())))
+        self.assertEqual(nb_frames, 2)
+        self.assertEqual(lignes[0], ['numero', 'a_ns', 'b_ns', 'frame_ns'])
+        self.assertEqual(lignes[1:], [['1', '20', '1', '21'], ['2', '30', '1', '31']])
+
+    def test_taille_invalide(self):
+        """Test : Un tampon vide est refusé."""
+        with self.assertRaises(ValueError):
+            ProfileurFrames(taille=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Tests des replays : format binaire, enregistrement et relecture headless.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from src.domaine.entites.fabriques.generateurs_pieces import GenerateurSac7
+from src.domaine.services.gestionnaire_evenements import (
+    GestionnaireEvenements, ToucheClavier, TypeEvenement, creer_commandes_partie
+)
+from src.domaine.services.horloge_simulee import HorlogeSimulee
+from src.domaine.services.moteur_partie import MoteurPartie
+from src.domaine.services.replay_partie import (
+    EnregistreurPartie, EvenementReplay, LecteurReplay, Replay, TypeEvenementReplay,
+    _encoder_instantane
+)
+
+
+def jouer_partie_enregistree(graine: int, nb_images: int = 3000):
+    """Partie « réelle » (Plateau, horloge à 60 images/s) avec des touches aléatoires."""
+    horloge = HorlogeSimulee()
+    moteur = MoteurPartie(horloge=horloge, graine=graine)
+    gestionnaire = GestionnaireEvenements(commandes=creer_commandes_partie())
+    enregistreur = EnregistreurPartie(moteur, gestionnaire, horloge())
+    aleatoire = random.Random(graine)
+    touches = ["Left", "Right", "Up", "Down", "space"]
+    maintenues = set()
+
+    def appuyer(nom):
+        gestionnaire.traiter_evenement_clavier(nom, TypeEvenement.CLAVIER_APPUI, moteur, horloge())
+        if nom == "p":
+            moteur.basculer_pause()
+
+    appuyer("p")
+    for _ in range(nb_images):
+        horloge.avancer(1 / 60)
+        if not moteur.en_pause and not moteur.jeu_termine:
+            moteur.mettre_a_jour_chute_automatique()
+        tirage = aleatoire.random()
+        if tirage < 0.08:
+            nom = aleatoire.choice(touches)
+            appuyer(nom)
+            maintenues.add(nom)
+        elif tirage < 0.14 and maintenues:
+            nom = maintenues.pop()
+            gestionnaire.traiter_evenement_clavier(nom, TypeEvenement.CLAVIER_RELACHE, moteur, horloge())
+        elif moteur.jeu_termine and tirage < 0.2:
+            appuyer("r")
+            appuyer("p")
+        gestionnaire.mettre_a_jour_repetition(moteur, horloge())
+    return moteur, enregistreur.terminer()
+
+
+class TestReplayPartie(unittest.TestCase):
+    """Tests de bout en bout des replays."""
+
+    def test_format_binaire_aller_retour(self):
+        """Test : Sérialisation puis lecture rendent le même replay."""
+        replay = Replay(graine=-12345, generateur=GenerateurSac7, en_pause_initiale=False, evenements=[
+            EvenementReplay(0, TypeEvenementReplay.APPUI, ToucheClavier.PAUSE),
+            EvenementReplay(3, TypeEvenementReplay.CHUTE),
+            EvenementReplay(520, TypeEvenementReplay.REPETITION, ToucheClavier.RESTART),
+            EvenementReplay(100000, TypeEvenementReplay.RELACHE, ToucheClavier.GAUCHE),
+        ])
+
+        relu = Replay.depuis_octets(replay.en_octets())
+
+        self.assertEqual(relu.graine, -12345)
+        self.assertIs(relu.generateur, GenerateurSac7)
+        self.assertFalse(relu.en_pause_initiale)
+        self.assertEqual(relu.evenements, replay.evenements)
+
+    def test_quelques_octets_par_evenement(self):
+        """Test : Un événement proche du précédent tient en un ou deux octets."""
+        evenements = [EvenementReplay(16 * i, TypeEvenementReplay.CHUTE) for i in range(1000)]
+        taille = len(Replay(graine=1, evenements=evenements).en_octets())
+        self.assertLess(taille, 2 * len(evenements) + 16)
+
+    def test_donnees_invalides(self):
+        """Test : Un fichier étranger ou tronqué est refusé."""
+        with self.assertRaises(ValueError):
+            Replay.depuis_octets(b"PNG...")
+        donnees = Replay(graine=1, evenements=[EvenementReplay(1000, TypeEvenementReplay.CHUTE)]).en_octets()
+        with self.assertRaises(ValueError):
+            Replay.depuis_octets(donnees[:-1])
+
+    def test_relecture_headless_identique_a_la_partie(self):
+        """Test : La relecture reproduit plateau, pièce active et statistiques."""
+        for graine in (1, 7, 2024):
+            with self.subTest(graine=graine):
+                moteur, replay = jouer_partie_enregistree(graine)
+                self.assertGreater(len(replay.evenements), 200)
+
+                with tempfile.TemporaryDirectory() as dossier:
+                    chemin = os.path.join(dossier, "partie.trpl")
+                    replay.sauvegarder(chemin)
+                    rejoue = LecteurReplay.rejouer_headless(Replay.charger(chemin))
+
+                self.assertEqual(rejoue.plateau.positions_occupees, moteur.plateau.positions_occupees)
+                self.assertEqual(rejoue.piece_active.positions, moteur.piece_active.positions)
+                self.assertEqual((rejoue.stats.score, rejoue.stats.lignes_completees, rejoue.stats.pieces_placees),
+                                 (moteur.stats.score, moteur.stats.lignes_completees, moteur.stats.pieces_placees))
+                self.assertEqual(rejoue.jeu_termine, moteur.jeu_termine)
+
+    def test_relecture_progressive(self):
+        """Test : appliquer_jusqu_a n'applique que les événements échus."""
+        _, replay = jouer_partie_enregistree(3, nb_images=600)
+        lecteur = LecteurReplay(replay, LecteurReplay.creer_moteur(replay))
+
+        appliques = lecteur.appliquer_jusqu_a(5000)
+
+        self.assertEqual(appliques, sum(1 for e in replay.evenements if e.temps_ms <= 5000))
+        self.assertFalse(lecteur.termine)
+        lecteur.appliquer_tout()
+        self.assertTrue(lecteur.termine)
+
+    def test_deplacement_par_images_cles(self):
+        """Test : Un déplacement restaure l'image clé précédente et rejoint la simulation linéaire."""
+        _, replay = jouer_partie_enregistree(11, nb_images=6000)
+        replay.indexer(intervalle=250)
+        replay = Replay.depuis_octets(replay.en_octets())
+        self.assertGreater(len(replay.images_cles), 3)
+
+        lineaire = LecteurReplay(replay, LecteurReplay.creer_moteur(replay))
+        lecteur = LecteurReplay(replay, LecteurReplay.creer_moteur(replay))
+        aleatoire = random.Random(0)
+        for cible in sorted(aleatoire.sample(range(len(replay.evenements)), 6)):
+            lineaire.aller_a(cible)
+            # Aller-retour : le lecteur revient en arrière par les images clés
+            for position in (len(replay.evenements), cible):
+                simules = lecteur.aller_a(position)
+            self.assertLess(simules, 250)
+            self.assertEqual(_encoder_instantane(lecteur.moteur.capturer()),
+                             _encoder_instantane(lineaire.moteur.capturer()))
+            self.assertEqual(lecteur.moteur.plateau.positions_occupees,
+                             lineaire.moteur.plateau.positions_occupees)
+
+    def test_deplacement_au_temps(self):
+        """Test : aller_au_temps s'arrête après le dernier événement échu."""
+        _, replay = jouer_partie_enregistree(4, nb_images=1200)
+        lecteur = LecteurReplay(replay, LecteurReplay.creer_moteur(replay))
+
+        lecteur.aller_au_temps(10000)
+
+        self.assertEqual(lecteur.position, sum(1 for e in replay.evenements if e.temps_ms <= 10000))
+
+    def test_lecture_format_version_1(self):
+        """Test : Les replays sans images clés (version 1) restent lisibles."""
+        replay = Replay(graine=9, evenements=[EvenementReplay(5, TypeEvenementReplay.CHUTE)])
+        donnees = bytearray(replay.en_octets()[:-1])  # sans le nombre d'images clés
+        donnees[4] = 1
+
+        relu = Replay.depuis_octets(bytes(donnees))
+
+        self.assertEqual(relu.evenements, replay.evenements)
+        self.assertEqual(relu.images_cles, [])
+
+    def test_partie_sans_graine_refusee(self):
+        """Test : Une partie non seedée ne peut pas être enregistrée."""
+        moteur = MoteurPartie(horloge=HorlogeSimulee())
+        with self.assertRaises(ValueError):
+            EnregistreurPartie(moteur, GestionnaireEvenements(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
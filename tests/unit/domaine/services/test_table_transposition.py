@@ -0,0 +1,89 @@
+"""
+Tests de la table de transposition et de la clé Zobrist du moteur.
+"""
+
+import unittest
+
+from src.domaine.services.moteur_partie import MoteurPartie
+from src.domaine.services.table_transposition import TableTransposition
+
+
+class TestTableTransposition(unittest.TestCase):
+    """Tests du cache LRU borné."""
+
+    def test_obtenir_et_compteurs(self):
+        """Test : Succès et échecs sont comptés."""
+        table = TableTransposition(4)
+        table.enregistrer(1, "plan")
+
+        self.assertEqual(table.obtenir(1), "plan")
+        self.assertIsNone(table.obtenir(2))
+        self.assertEqual(table.obtenir(3, "defaut"), "defaut")
+        self.assertEqual((table.succes, table.echecs), (1, 2))
+        self.assertAlmostEqual(table.taux_succes, 1 / 3)
+
+    def test_eviction_de_la_moins_recemment_utilisee(self):
+        """Test : Au-delà de la taille max, l'entrée la plus ancienne est oubliée."""
+        table = TableTransposition(3)
+        for cle in (1, 2, 3):
+            table.enregistrer(cle, cle)
+        table.obtenir(1)
+
+        table.enregistrer(4, 4)
+
+        self.assertEqual(len(table), 3)
+        self.assertNotIn(2, table)
+        self.assertIn(1, table)
+
+    def test_taille_invalide(self):
+        """Test : Une table sans place est refusée."""
+        with self.assertRaises(ValueError):
+            TableTransposition(0)
+
+
+class TestCleZobristMoteur(unittest.TestCase):
+    """Tests de la clé plateau + pièce active du moteur."""
+
+    def test_ordres_d_entrees_differents_meme_cle(self):
+        """Test : Gauche puis rotation et rotation puis gauche donnent la même position."""
+        cles = []
+        for ordre in ((lambda m: m.deplacer_piece_active(-1, 0), lambda m: m.tourner_piece_active()),
+                      (lambda m: m.tourner_piece_active(), lambda m: m.deplacer_piece_active(-1, 0))):
+            moteur = MoteurPartie.creer_headless(graine=2)
+            moteur.avancer(180)
+            for action in ordre:
+                self.assertTrue(action(moteur))
+            cles.append(moteur.cle_zobrist)
+
+        self.assertEqual(cles[0], cles[1])
+
+    def test_cle_suit_les_mouvements_et_les_placements(self):
+        """Test : Chaque mouvement change la clé, le retour au même état la restitue."""
+        moteur = MoteurPartie.creer_headless(graine=2)
+        moteur.avancer(120)
+        cle_initiale = moteur.cle_zobrist
+        cle_plateau = moteur.plateau.cle_zobrist
+
+        moteur.deplacer_piece_active(1, 0)
+        self.assertNotEqual(moteur.cle_zobrist, cle_initiale)
+        moteur.deplacer_piece_active(-1, 0)
+        self.assertEqual(moteur.cle_zobrist, cle_initiale)
+
+        moteur.chute_rapide()
+        moteur.placer_piece_et_generer_nouvelle()
+        self.assertNotEqual(moteur.plateau.cle_zobrist, cle_plateau)
+
+    def test_restaurer_restitue_la_cle(self):
+        """Test : La clé fait partie de l'état restauré."""
+        moteur = MoteurPartie.creer_headless(graine=4)
+        moteur.avancer(3_000)
+        instantane, cle = moteur.capturer(), moteur.cle_zobrist
+
+        moteur.avancer(3_000)
+        moteur.restaurer(instantane)
+
+        self.assertEqual(moteur.cle_zobrist, cle)
+
+
+if __name__ == '__main__':
+    unittest.main()
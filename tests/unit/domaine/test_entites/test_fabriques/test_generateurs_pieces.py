@@ -0,0 +1,84 @@
+"""
+Tests des générateurs de pièces seedés et de la file d'aperçu.
+"""
+
+import unittest
+
+from src.domaine.entites.fabriques.generateurs_pieces import (
+    FilePieces, GenerateurClassique, GenerateurSac7
+)
+from src.domaine.entites.piece import TypePiece
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestGenerateursPieces(unittest.TestCase):
+    """Tests des politiques classique et 7-bag."""
+
+    def _tirer(self, generateur, nombre):
+        return [generateur.suivant() for _ in range(nombre)]
+
+    def test_meme_graine_meme_sequence(self):
+        """Test : Deux générateurs de même graine produisent la même suite."""
+        for classe in (GenerateurClassique, GenerateurSac7):
+            with self.subTest(classe=classe.__name__):
+                self.assertEqual(self._tirer(classe(42), 100), self._tirer(classe(42), 100))
+                self.assertNotEqual(self._tirer(classe(42), 100), self._tirer(classe(43), 100))
+
+    def test_sac7_contient_chaque_type_une_fois_par_sac(self):
+        """Test : Chaque groupe de 7 pièces consécutives est une permutation des 7 types."""
+        sequence = self._tirer(GenerateurSac7(graine=3), 70)
+
+        for debut in range(0, 70, 7):
+            self.assertEqual(sorted(sequence[debut:debut + 7], key=lambda t: t.value),
+                             sorted(TypePiece, key=lambda t: t.value))
+
+    def test_generateur_independant_du_random_global(self):
+        """Test : Le module random global n'influence pas une partie seedée."""
+        import random
+        random.seed(0)
+        premiere = self._tirer(GenerateurClassique(7), 20)
+        random.seed(1)
+        seconde = self._tirer(GenerateurClassique(7), 20)
+
+        self.assertEqual(premiere, seconde)
+
+
+class TestFilePieces(unittest.TestCase):
+    """Tests de la file d'aperçu remplie à l'avance."""
+
+    def test_apercu_annonce_les_prochains_tirages(self):
+        """Test : Les types annoncés par l'aperçu sont ceux tirés ensuite."""
+        file = FilePieces(GenerateurSac7(graine=5), profondeur=4)
+
+        annonces = file.apercu()
+        tires = tuple(file.tirer() for _ in range(4))
+
+        self.assertEqual(len(annonces), 4)
+        self.assertEqual(annonces, tires)
+        self.assertEqual(len(file), 4)
+
+    def test_file_ne_change_pas_la_sequence(self):
+        """Test : La profondeur de la file ne modifie pas l'ordre des pièces."""
+        sans_apercu = FilePieces(GenerateurSac7(graine=9), profondeur=0)
+        avec_apercu = FilePieces(GenerateurSac7(graine=9), profondeur=6)
+
+        self.assertEqual([sans_apercu.tirer() for _ in range(30)],
+                         [avec_apercu.tirer() for _ in range(30)])
+
+    def test_moteur_fait_apparaitre_les_pieces_annoncees(self):
+        """Test : MoteurPartie fait apparaître les pièces dans l'ordre de son aperçu."""
+        moteur = MoteurPartie.creer_headless(generateur=GenerateurSac7(graine=11))
+        annonces = moteur.apercu_pieces()
+
+        apparues = []
+        for _ in range(len(annonces)):
+            moteur.chute_rapide()
+            moteur.placer_piece_et_generer_nouvelle()
+            apparues.append(moteur.piece_active.type_piece)
+
+        self.assertEqual(len(annonces), MoteurPartie.PROFONDEUR_APERCU)
+        self.assertEqual(tuple(apparues), annonces)
+
+
+if __name__ == '__main__':
+    unittest.main()
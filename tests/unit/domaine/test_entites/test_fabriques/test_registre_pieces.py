@@ -79,6 +79,52 @@ class TestRegistrePieces(unittest.TestCase):
         self.assertIn("Z", stats)
         self.assertIn("J", stats)
         self.assertIn("L", stats)
+    
+    def test_table_formes_construite_pour_chaque_piece(self):
+        """Test : Le registre détient une table de formes pour les 7 pièces."""
+        nb_orientations_attendues = {
+            TypePiece.I: 2, TypePiece.O: 1, TypePiece.T: 4, TypePiece.S: 2,
+            TypePiece.Z: 2, TypePiece.J: 4, TypePiece.L: 4
+        }
+        
+        for type_piece, attendu in nb_orientations_attendues.items():
+            table = RegistrePieces.obtenir_table_formes(type_piece)
+            self.assertEqual(table.nb_orientations, attendu)
+            self.assertIs(RegistrePieces.obtenir_classe_piece(type_piece)._table_formes, table)
+    
+    def test_table_formes_coherente_avec_positions_initiales(self):
+        """Test : L'orientation 0 de la table reproduit les positions de creer()."""
+        for type_piece in RegistrePieces.obtenir_types_supportes():
+            piece = RegistrePieces.obtenir_classe_piece(type_piece).creer(x_pivot=5, y_pivot=3)
+            table = RegistrePieces.obtenir_table_formes(type_piece)
+            
+            pivot, positions = table.obtenir(0, piece.position_pivot.x, piece.position_pivot.y)
+            
+            self.assertEqual(pivot, piece.position_pivot)
+            self.assertEqual(list(positions), piece.positions)
+    
+    def test_rotation_reutilise_les_positions_precalculees(self):
+        """Test : Un tour complet réutilise les mêmes objets Position (aucune construction)."""
+        piece = PieceT.creer(x_pivot=5, y_pivot=5)
+        for _ in range(4):
+            piece.tourner()
+        positions_tour_1 = piece.positions
+        
+        for _ in range(4):
+            piece.tourner()
+        
+        for avant, apres in zip(positions_tour_1, piece.positions):
+            self.assertIs(avant, apres)
+    
+    def test_table_formes_absente_leve_erreur(self):
+        """Test : Demander la table d'un type inconnu lève ValueError."""
+        from enum import Enum
+        
+        class FakeType(Enum):
+            INCONNU = "inconnu"
+        
+        with self.assertRaises(ValueError):
+            RegistrePieces.obtenir_table_formes(FakeType.INCONNU)
 
 
 if __name__ == '__main__':
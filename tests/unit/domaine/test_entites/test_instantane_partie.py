@@ -0,0 +1,38 @@
+"""
+Tests du codage compact des instantanés de partie.
+"""
+
+import unittest
+
+from src.domaine.entites.instantane_partie import (
+    TYPES_PIECES, compacter_piece, decompacter_piece
+)
+
+
+class TestCompactagePiece(unittest.TestCase):
+    """Tests de compacter_piece / decompacter_piece."""
+
+    def test_aller_retour_sur_toutes_les_valeurs(self):
+        """Test : Type, orientation et pivot (y négatif compris) sont conservés."""
+        codes = set()
+        for type_piece in TYPES_PIECES:
+            for orientation in range(4):
+                for x in range(-2, 12):
+                    for y in range(-4, 22):
+                        code = compacter_piece(type_piece, orientation, x, y)
+                        self.assertEqual(tuple(decompacter_piece(code)),
+                                         (type_piece, orientation, x, y))
+                        codes.add(code)
+
+        self.assertEqual(len(codes), len(TYPES_PIECES) * 4 * 14 * 26)
+
+    def test_code_est_un_entier_positif_compact(self):
+        """Test : Le code tient sur 17 bits."""
+        code = compacter_piece(TYPES_PIECES[-1], 3, 11, 21)
+
+        self.assertGreaterEqual(code, 0)
+        self.assertLess(code, 1 << 17)
+
+
+if __name__ == '__main__':
+    unittest.main()
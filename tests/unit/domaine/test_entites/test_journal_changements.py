@@ -0,0 +1,108 @@
+"""
+Tests du versionnement et du journal des changements (plateau et pièce active).
+"""
+
+import unittest
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.journal_changements import JournalChangements, TypeChangement
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestJournalChangements(unittest.TestCase):
+    """Tests du journal borné."""
+
+    def test_version_et_changements_depuis(self):
+        """Test : depuis() rend les changements postérieurs, dans l'ordre."""
+        journal = JournalChangements()
+        journal.enregistrer(TypeChangement.LIGNES_SUPPRIMEES, (19,))
+        version_vue = journal.version
+        journal.enregistrer(TypeChangement.PIECE_DEPLACEE, "a")
+        journal.enregistrer(TypeChangement.PIECE_DEPLACEE, "b")
+
+        self.assertEqual(journal.version, 3)
+        self.assertEqual([c.donnees for c in journal.depuis(version_vue)], ["a", "b"])
+        self.assertEqual(journal.depuis(journal.version), [])
+
+    def test_journal_borne(self):
+        """Test : Une version sortie du journal impose un recalcul complet (None)."""
+        journal = JournalChangements(taille_max=2)
+        for i in range(5):
+            journal.enregistrer(TypeChangement.PIECE_DEPLACEE, i)
+
+        self.assertIsNone(journal.depuis(1))
+        self.assertEqual([c.version for c in journal.depuis(3)], [4, 5])
+        self.assertIsNone(journal.depuis(99))
+
+
+class TestVersionsPlateauEtPiece(unittest.TestCase):
+    """Tests des versions tenues par le plateau et le moteur."""
+
+    def test_plateau_journalise_placement_et_suppression(self):
+        """Test : Placer puis compléter une ligne produit deux changements journalisés."""
+        fabrique = FabriquePieces()
+        for classe in (Plateau, PlateauBitboard):
+            with self.subTest(plateau=classe.__name__):
+                plateau = classe(4, 6)
+                plateau.placer_piece_et_supprimer_lignes(
+                    fabrique.creer(TypePiece.O, x_pivot=0, y_pivot=5))
+                version_vue = plateau.version
+
+                piece = fabrique.creer(TypePiece.O, x_pivot=2, y_pivot=5)
+                plateau.placer_piece_et_supprimer_lignes(piece)
+
+                changements = plateau.journal.depuis(version_vue)
+                self.assertEqual([c.type_changement for c in changements],
+                                 [TypeChangement.CELLULES_AJOUTEES, TypeChangement.LIGNES_SUPPRIMEES])
+                self.assertEqual(changements[0].donnees, tuple(piece.positions))
+                self.assertEqual(changements[1].donnees, (4, 5))
+
+    def test_placement_refuse_ne_change_pas_la_version(self):
+        """Test : Un placement impossible laisse la version inchangée."""
+        plateau = Plateau(10, 20)
+        piece = FabriquePieces().creer(TypePiece.O, x_pivot=4, y_pivot=19)
+        plateau.placer_piece_et_supprimer_lignes(piece)
+        version = plateau.version
+
+        self.assertEqual(plateau.placer_piece_et_supprimer_lignes(piece), -1)
+        self.assertEqual(plateau.version, version)
+
+    def test_version_piece_suit_les_mouvements_legaux(self):
+        """Test : Seuls les mouvements réussis de la pièce active changent sa version."""
+        moteur = MoteurPartie()
+        moteur.en_pause = False
+        version = moteur.version_piece
+
+        self.assertTrue(moteur.deplacer_piece_active(0, 1))
+        self.assertEqual(moteur.version_piece, version + 1)
+        self.assertEqual(moteur.journal_piece.depuis(version)[0].donnees.positions,
+                         tuple(moteur.piece_active.positions))
+
+        while moteur.deplacer_piece_active(-1, 0):
+            pass
+        version = moteur.version_piece
+        self.assertFalse(moteur.deplacer_piece_active(-1, 0))
+        self.assertEqual(moteur.version_piece, version)
+
+    def test_redemarrage_garde_la_version_du_plateau_croissante(self):
+        """Test : Redémarrer vide le plateau sans faire revenir sa version en arrière."""
+        moteur = MoteurPartie()
+        moteur.en_pause = False
+        moteur.placer_piece_et_generer_nouvelle()
+        plateau = moteur.plateau
+        version = plateau.version
+
+        moteur.redemarrer_partie()
+
+        self.assertIs(moteur.plateau, plateau)
+        self.assertTrue(plateau.est_vide())
+        self.assertGreater(plateau.version, version)
+        self.assertEqual([c.type_changement for c in plateau.journal.depuis(version)],
+                         [TypeChangement.PLATEAU_REMPLACE])
+
+
+if __name__ == '__main__':
+    unittest.main()
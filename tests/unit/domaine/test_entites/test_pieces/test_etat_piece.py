@@ -0,0 +1,90 @@
+"""
+Tests de l'API de mouvement candidat : Piece.etat_apres / appliquer_etat.
+
+Un mouvement est calculé sans toucher à la pièce, vérifié sur le
+plateau, puis appliqué seulement s'il est légal.
+"""
+
+import unittest
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.position import Position
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+class TestEtatPiece(unittest.TestCase):
+    """Tests des états candidats de pièces."""
+
+    def setUp(self):
+        """Préparer une fabrique."""
+        self.fabrique = FabriquePieces()
+
+    def test_etat_apres_ne_modifie_pas_la_piece(self):
+        """Test : Calculer un état candidat laisse la pièce intacte."""
+        piece = self.fabrique.creer(TypePiece.T, x_pivot=5, y_pivot=5)
+        positions, pivot = list(piece.positions), piece.position_pivot
+
+        piece.etat_apres(2, 1, rotation=1)
+
+        self.assertEqual(piece.positions, positions)
+        self.assertEqual(piece.position_pivot, pivot)
+        self.assertEqual(piece._orientation, 0)
+
+    def test_etat_apres_equivaut_aux_mouvements_mutants(self):
+        """Test : Appliquer etat_apres donne le même résultat que tourner() puis deplacer()."""
+        for type_piece in TypePiece:
+            with self.subTest(type_piece=type_piece.value):
+                reference = self.fabrique.creer(type_piece, x_pivot=5, y_pivot=5)
+                piece = self.fabrique.creer(type_piece, x_pivot=5, y_pivot=5)
+
+                for _ in range(5):
+                    reference.tourner()
+                    reference.deplacer(-1, 1)
+                    piece.appliquer_etat(piece.etat_apres(-1, 1, rotation=1))
+
+                    self.assertEqual(piece.positions, reference.positions)
+                    self.assertEqual(piece.position_pivot, reference.position_pivot)
+
+    def test_etats_partages_par_la_table(self):
+        """Test : Un même état candidat n'est construit qu'une fois."""
+        piece = self.fabrique.creer(TypePiece.L, x_pivot=4, y_pivot=4)
+
+        self.assertIs(piece.etat_apres(1, 0), piece.etat_apres(1, 0))
+
+    def test_peut_placer_positions(self):
+        """Test : Les deux plateaux valident les positions candidates de la même façon."""
+        for classe in (Plateau, PlateauBitboard):
+            with self.subTest(plateau=classe.__name__):
+                plateau = classe(10, 20)
+                piece = self.fabrique.creer(TypePiece.O, x_pivot=4, y_pivot=19)
+                plateau.placer_piece_et_supprimer_lignes(piece)
+
+                self.assertTrue(plateau.peut_placer_positions(piece.etat_apres(2, 0).positions))
+                self.assertFalse(plateau.peut_placer_positions(piece.etat_apres(1, 0).positions))
+                self.assertFalse(plateau.peut_placer_positions([Position(-1, 0)]))
+
+
+class TestMoteurMouvementsCandidats(unittest.TestCase):
+    """Tests des mouvements du moteur vérifiés avant mutation."""
+
+    def test_mouvement_refuse_ne_touche_pas_la_piece(self):
+        """Test : Un déplacement ou une rotation refusé laisse la pièce strictement identique."""
+        moteur = MoteurPartie()
+        moteur.en_pause = False
+        while moteur.deplacer_piece_active(-1, 0):
+            pass
+        piece = moteur.piece_active
+        positions, pivot, orientation = piece.positions, piece.position_pivot, piece._orientation
+
+        self.assertFalse(moteur.deplacer_piece_active(-1, 0))
+
+        self.assertIs(piece.positions, positions)
+        self.assertIs(piece.position_pivot, pivot)
+        self.assertEqual(piece._orientation, orientation)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests pour PlateauBitboard - Plateau stocké avec un masque de bits par ligne.
+
+Le PlateauBitboard doit se comporter exactement comme le Plateau
+à base de Set[Position] : même API, mêmes résultats.
+"""
+
+import random
+import unittest
+
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.position import Position
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+
+
+class TestPlateauBitboard(unittest.TestCase):
+    """Tests du moteur de stockage par masques de bits."""
+
+    def setUp(self):
+        """Préparer un plateau vide et une fabrique."""
+        self.plateau = PlateauBitboard(10, 20)
+        self.fabrique = FabriquePieces()
+
+    def _remplir_ligne(self, y: int, sauf_x: int = None) -> None:
+        """Remplit directement les bits d'une ligne (sauf la colonne sauf_x)."""
+        for x in range(10):
+            if x != sauf_x:
+                self.plateau._lignes[y] |= 1 << x
+
+    def test_plateau_bitboard_est_vide_a_la_creation(self):
+        """Test : Un plateau neuf est vide et toutes les lignes valent 0."""
+        self.assertTrue(self.plateau.est_vide())
+        self.assertEqual(self.plateau.lignes, (0,) * 20)
+        self.assertEqual(self.plateau.positions_occupees, set())
+
+    def test_placer_piece_met_a_jour_les_bits(self):
+        """Test : Placer une pièce O allume les bits correspondants."""
+        piece = self.fabrique.creer(TypePiece.O, x_pivot=0, y_pivot=19)
+
+        resultat = self.plateau.placer_piece_et_supprimer_lignes(piece)
+
+        self.assertEqual(resultat, 0)
+        self.assertEqual(self.plateau.lignes[18], 0b11)
+        self.assertEqual(self.plateau.lignes[19], 0b11)
+        self.assertEqual(self.plateau.positions_occupees, set(piece.positions))
+
+    def test_collision_detectee_sur_cellule_occupee(self):
+        """Test : Une pièce ne peut pas chevaucher une cellule occupée."""
+        premiere = self.fabrique.creer(TypePiece.O, x_pivot=4, y_pivot=19)
+        self.plateau.placer_piece_et_supprimer_lignes(premiere)
+
+        seconde = self.fabrique.creer(TypePiece.O, x_pivot=4, y_pivot=19)
+
+        self.assertFalse(self.plateau.peut_placer_piece(seconde))
+        self.assertEqual(self.plateau.placer_piece_et_supprimer_lignes(seconde), -1)
+
+    def test_collision_avec_les_bords(self):
+        """Test : Les bords gauche, droit et bas bloquent la pièce, pas le haut."""
+        self.assertFalse(self.plateau.est_position_libre(Position(-1, 5)))
+        self.assertFalse(self.plateau.est_position_libre(Position(10, 5)))
+        self.assertFalse(self.plateau.est_position_libre(Position(5, 20)))
+        self.assertTrue(self.plateau.est_position_libre(Position(5, -2)))
+
+    def test_ligne_complete_supprimee_et_lignes_descendues(self):
+        """Test : Une ligne complétée disparaît et le contenu au-dessus descend."""
+        self._remplir_ligne(19, sauf_x=0)
+        self.plateau._lignes[18] = 0b100
+        piece_i = self.fabrique.creer(TypePiece.I, x_pivot=1, y_pivot=18)
+        piece_i.tourner()  # Verticale en x=0, y de 16 à 19
+
+        resultat = self.plateau.placer_piece_et_supprimer_lignes(piece_i)
+
+        self.assertEqual(resultat, 1)
+        self.assertEqual(self.plateau.lignes[19], 0b101)
+        self.assertEqual(self.plateau.lignes[18], 0b1)
+        self.assertEqual(self.plateau.lignes[0], 0)
+
+    def test_supprimer_lignes_multiples_non_contigues(self):
+        """Test : Suppression de lignes non contiguës sans effet en cascade."""
+        self._remplir_ligne(19)
+        self._remplir_ligne(17)
+        self.plateau._lignes[18] = 0b10
+        self.plateau._lignes[16] = 0b1000
+
+        self.assertEqual(self.plateau.obtenir_lignes_completes(), [17, 19])
+        self.assertEqual(self.plateau.supprimer_lignes([17, 19]), 2)
+
+        self.assertEqual(self.plateau.lignes[19], 0b10)
+        self.assertEqual(self.plateau.lignes[18], 0b1000)
+        self.assertEqual(sum(1 for ligne in self.plateau.lignes if ligne), 2)
+
+    def test_zone_invisible_descend_avec_les_lignes(self):
+        """Test : Les cellules figées en zone invisible descendent lors d'une suppression."""
+        self._remplir_ligne(19)
+        self.plateau._lignes_invisibles[-1] = 0b1
+
+        self.plateau.supprimer_lignes([19])
+
+        self.assertEqual(self.plateau.lignes[0], 0b1)
+        self.assertEqual(self.plateau._lignes_invisibles, {})
+
+    def test_comportement_identique_au_plateau_set(self):
+        """Test : Sur une partie aléatoire, les deux moteurs restent identiques."""
+        generateur = random.Random(42)
+        plateau_set = Plateau(10, 20)
+        plateau_bits = PlateauBitboard(10, 20)
+        types = list(TypePiece)
+
+        for _ in range(400):
+            type_piece = generateur.choice(types)
+            x = generateur.randint(1, 8)
+            rotations = generateur.randint(0, 3)
+            piece_set = self.fabrique.creer(type_piece, x_pivot=x, y_pivot=1)
+            piece_bits = self.fabrique.creer(type_piece, x_pivot=x, y_pivot=1)
+            for _ in range(rotations):
+                piece_set.tourner()
+                piece_bits.tourner()
+
+            # Descendre tant que possible sur les deux plateaux
+            while True:
+                piece_set.deplacer(0, 1)
+                piece_bits.deplacer(0, 1)
+                peut_set = plateau_set.peut_placer_piece(piece_set)
+                self.assertEqual(peut_set, plateau_bits.peut_placer_piece(piece_bits))
+                if not peut_set:
+                    piece_set.deplacer(0, -1)
+                    piece_bits.deplacer(0, -1)
+                    break
+
+            self.assertEqual(
+                plateau_set.placer_piece_et_supprimer_lignes(piece_set),
+                plateau_bits.placer_piece_et_supprimer_lignes(piece_bits)
+            )
+            self.assertEqual(plateau_set.positions_occupees, plateau_bits.positions_occupees)
+
+            if plateau_set.est_ligne_superieure_occupee():
+                plateau_set = Plateau(10, 20)
+                plateau_bits = PlateauBitboard(10, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Tests de l'index des sommets de colonnes et de distance_de_chute.
+
+L'index est tenu à jour au placement et après suppression de lignes,
+pour les deux moteurs de stockage (Plateau et PlateauBitboard).
+"""
+
+import copy
+import random
+import unittest
+
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.position import Position
+from src.domaine.entites.zobrist import cle_cellule
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+
+
+def distance_pas_a_pas(plateau, piece) -> int:
+    """Distance de chute de référence : une ligne à la fois."""
+    essai = copy.deepcopy(piece)
+    distance = 0
+    while True:
+        essai.deplacer(0, 1)
+        if not plateau.peut_placer_piece(essai):
+            return distance
+        distance += 1
+
+
+class TestPlateauIndexColonnes(unittest.TestCase):
+    """Tests des hauteurs de colonnes, du remplissage et de la distance de chute."""
+
+    def setUp(self):
+        """Préparer une fabrique."""
+        self.fabrique = FabriquePieces()
+
+    def test_plateau_vide(self):
+        """Test : Colonnes à hauteur 0 et chute jusqu'au fond sur un plateau vide."""
+        for classe in (Plateau, PlateauBitboard):
+            with self.subTest(plateau=classe.__name__):
+                plateau = classe(10, 20)
+                piece = self.fabrique.creer(TypePiece.T, x_pivot=4, y_pivot=1)
+
+                self.assertEqual(plateau.hauteurs_colonnes, (0,) * 10)
+                self.assertEqual(plateau.distance_de_chute(piece), 18)
+
+    def test_index_mis_a_jour_au_placement_et_a_la_suppression(self):
+        """Test : Les hauteurs suivent les placements puis la suppression d'une ligne."""
+        for classe in (Plateau, PlateauBitboard):
+            with self.subTest(plateau=classe.__name__):
+                plateau = classe(4, 6)
+                piece_o = self.fabrique.creer(TypePiece.O, x_pivot=0, y_pivot=5)
+                plateau.placer_piece_et_supprimer_lignes(piece_o)
+
+                self.assertEqual(plateau.hauteurs_colonnes, (2, 2, 0, 0))
+                self.assertEqual(plateau.remplissage_lignes, (0, 0, 0, 0, 2, 2))
+
+                piece_o = self.fabrique.creer(TypePiece.O, x_pivot=2, y_pivot=5)
+                self.assertEqual(plateau.placer_piece_et_supprimer_lignes(piece_o), 2)
+
+                self.assertEqual(plateau.hauteurs_colonnes, (0, 0, 0, 0))
+                self.assertEqual(plateau.remplissage_lignes, (0,) * 6)
+
+    def test_chute_rapide_depuis_le_dessus_du_plateau(self):
+        """Test : Une pièce apparue à y=-2 tombe jusqu'au fond d'un plateau vide."""
+        for classe in (Plateau, PlateauBitboard):
+            with self.subTest(plateau=classe.__name__):
+                plateau = classe(10, 20)
+                piece_i = self.fabrique.creer(TypePiece.I, x_pivot=4, y_pivot=-2)
+                distance = plateau.distance_de_chute(piece_i)
+
+                self.assertEqual(distance, distance_pas_a_pas(plateau, piece_i))
+                piece_i.deplacer(0, distance)
+                self.assertEqual(max(p.y for p in piece_i.positions), 19)
+
+    def test_index_reconstruit_apres_modification_directe(self):
+        """Test : Un échange de cellules à nombre constant est détecté par le plateau."""
+        plateau = Plateau(10, 20)
+        plateau._positions_occupees.add(Position(0, 19))
+        self.assertEqual(plateau.hauteurs_colonnes[:2], (1, 0))
+
+        plateau._positions_occupees.discard(Position(0, 19))
+        plateau._positions_occupees.add(Position(1, 19))
+
+        self.assertEqual(plateau.hauteurs_colonnes[:2], (0, 1))
+        self.assertEqual(plateau.cle_zobrist, Plateau(10, 20).cle_zobrist ^ cle_cellule(1, 19))
+
+    def test_piece_sous_un_surplomb(self):
+        """Test : Sous un surplomb, la chute s'arrête sur le sol et non sur le sommet."""
+        plateau = Plateau(10, 20)
+        for x in range(3):
+            plateau._positions_occupees.add(Position(x, 10))
+        piece_i = self.fabrique.creer(TypePiece.I, x_pivot=1, y_pivot=12)
+
+        self.assertEqual(plateau.hauteurs_colonnes[:3], (10, 10, 10))
+        self.assertEqual(plateau.distance_de_chute(piece_i), distance_pas_a_pas(plateau, piece_i))
+
+    def test_distance_identique_a_la_chute_pas_a_pas(self):
+        """Test : distance_de_chute donne le même résultat que la descente ligne par ligne."""
+        generateur = random.Random(2024)
+        for classe in (Plateau, PlateauBitboard):
+            plateau = classe(10, 20)
+            for _ in range(150):
+                piece = self.fabrique.creer(generateur.choice(list(TypePiece)),
+                                            x_pivot=generateur.randint(1, 8),
+                                            y_pivot=generateur.randint(-1, 12))
+                for _ in range(generateur.randint(0, 3)):
+                    piece.tourner()
+                if not plateau.peut_placer_piece(piece):
+                    continue
+
+                distance = plateau.distance_de_chute(piece)
+                self.assertEqual(distance, distance_pas_a_pas(plateau, piece))
+
+                piece.deplacer(0, distance)
+                plateau.placer_piece_et_supprimer_lignes(piece)
+
+
+if __name__ == '__main__':
+    unittest.main()
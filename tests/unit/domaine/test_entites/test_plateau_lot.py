@@ -0,0 +1,135 @@
+"""
+Tests pour PlateauLot - N plateaux manipulés en un seul appel NumPy.
+
+Chaque opération vectorisée doit donner, plateau par plateau,
+le même résultat que PlateauBitboard.
+"""
+
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.plateau_lot import PlateauLot, TYPES_PIECES
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+
+
+@unittest.skipUnless(np is not None, "NumPy non installé")
+class TestPlateauLot(unittest.TestCase):
+    """Tests du lot de plateaux vectorisé."""
+
+    def setUp(self):
+        """Préparer un lot de 3 plateaux vides."""
+        self.lot = PlateauLot(3)
+        self.fabrique = FabriquePieces()
+
+    def _tableaux(self, *valeurs):
+        """Convertit des listes en tableaux d'entiers NumPy."""
+        return tuple(np.array(v, dtype=np.int64) for v in valeurs)
+
+    def test_lot_vide_a_la_creation(self):
+        """Test : Un lot neuf a toutes ses lignes à 0."""
+        self.assertEqual(self.lot.lignes.shape, (3, 20))
+        self.assertFalse(self.lot.lignes.any())
+
+    def test_collisions_bords_et_cellules(self):
+        """Test : Collision détectée par plateau (bord gauche, cellule occupée, aucune)."""
+        index_o = TYPES_PIECES.index(TypePiece.O)
+        self.lot.lignes[1, 19] = 0b110000
+        types, orientations, xs, ys = self._tableaux([index_o] * 3, [0] * 3, [-1, 4, 4], [18] * 3)
+
+        collisions = self.lot.collisions(types, orientations, xs, ys)
+
+        # O : pivot = coin supérieur gauche, cellules y=18 et y=19
+        self.assertEqual(collisions.tolist(), [True, True, False])
+
+    def test_distances_de_chute_par_plateau(self):
+        """Test : La distance de chute tient compte du contenu de chaque plateau."""
+        index_o = TYPES_PIECES.index(TypePiece.O)
+        self.lot.lignes[1, 10] = 0b10000
+        types, orientations, xs, ys = self._tableaux([index_o] * 3, [0] * 3, [4] * 3, [1] * 3)
+
+        distances = self.lot.distances_de_chute(types, orientations, xs, ys)
+
+        # Cellules basses de la pièce O en y=2
+        self.assertEqual(distances.tolist(), [17, 7, 17])
+
+    def test_supprimer_lignes_completes_vectorise(self):
+        """Test : Lignes complètes supprimées et lignes restantes descendues, par plateau."""
+        plein = self.lot.masque_plein
+        self.lot.lignes[0, 19] = plein
+        self.lot.lignes[0, 18] = 0b1
+        self.lot.lignes[2, 17] = plein
+        self.lot.lignes[2, 19] = plein
+        self.lot.lignes[2, 18] = 0b10
+        self.lot.lignes[2, 16] = 0b100
+
+        nb_lignes = self.lot.supprimer_lignes_completes()
+
+        self.assertEqual(nb_lignes.tolist(), [1, 0, 2])
+        self.assertEqual(self.lot.lignes[0, 19], 0b1)
+        self.assertEqual(self.lot.lignes[2, 19], 0b10)
+        self.assertEqual(self.lot.lignes[2, 18], 0b100)
+        self.assertEqual(int(np.count_nonzero(self.lot.lignes)), 3)
+
+    def test_comportement_identique_au_plateau_bitboard(self):
+        """Test : Sur des chutes aléatoires, chaque plateau du lot suit son PlateauBitboard."""
+        generateur = random.Random(42)
+        nb = 8
+        lot = PlateauLot(nb)
+        plateaux = [PlateauBitboard(10, 20) for _ in range(nb)]
+
+        for _ in range(60):
+            types, orientations, colonnes = [], [], []
+            for plateau in plateaux:
+                types.append(generateur.randrange(len(TYPES_PIECES)))
+                orientations.append(generateur.randint(0, 3))
+                colonnes.append(generateur.randint(2, 7))
+            types, orientations, colonnes, ys = self._tableaux(types, orientations, colonnes, [1] * nb)
+
+            collisions = lot.collisions(types, orientations, colonnes, ys)
+            distances = lot.distances_de_chute(types, orientations, colonnes, ys)
+            jouables = ~collisions
+            lot.placer(types, orientations, colonnes, ys + distances, masque=jouables)
+            nb_lignes = lot.supprimer_lignes_completes()
+
+            for i, plateau in enumerate(plateaux):
+                piece = self.fabrique.creer(TYPES_PIECES[types[i]], x_pivot=int(colonnes[i]), y_pivot=1)
+                piece.deplacer(int(colonnes[i]) - piece.position_pivot.x, 1 - piece.position_pivot.y)
+                for _ in range(int(orientations[i])):
+                    piece.tourner()
+                self.assertEqual(bool(collisions[i]), not plateau.peut_placer_piece(piece))
+                if collisions[i]:
+                    continue
+                piece.deplacer(0, int(distances[i]))
+                self.assertTrue(plateau.peut_placer_piece(piece))
+                piece.deplacer(0, 1)
+                self.assertFalse(plateau.peut_placer_piece(piece))
+                piece.deplacer(0, -1)
+                self.assertEqual(plateau.placer_piece_et_supprimer_lignes(piece), nb_lignes[i])
+                self.assertEqual(tuple(int(l) for l in lot.lignes[i]), plateau.lignes)
+
+            # Repartir de plateaux vides quand le haut est atteint
+            for i, plateau in enumerate(plateaux):
+                if plateau.lignes[2]:
+                    plateaux[i] = PlateauBitboard(10, 20)
+                    lot.lignes[i] = 0
+
+    def test_hauteurs_colonnes(self):
+        """Test : Hauteur de colonne = hauteur moins la première cellule occupée."""
+        self.lot.lignes[0, 15] = 0b1
+        self.lot.lignes[0, 19] = 0b11
+
+        hauteurs = self.lot.hauteurs_colonnes()
+
+        self.assertEqual(hauteurs[0, :3].tolist(), [5, 1, 0])
+        self.assertFalse(hauteurs[1].any())
+
+
+if __name__ == '__main__':
+    unittest.main()
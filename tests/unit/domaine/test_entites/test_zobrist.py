@@ -0,0 +1,104 @@
+"""
+Tests des clés Zobrist du plateau.
+
+La clé tenue à jour par XOR doit toujours égaler la clé recalculée à
+partir des cellules occupées, quel que soit le moteur de stockage.
+"""
+
+import random
+import unittest
+
+from src.domaine.entites.fabriques.fabrique_pieces import FabriquePieces
+from src.domaine.entites.piece import TypePiece
+from src.domaine.entites.plateau import Plateau
+from src.domaine.entites.plateau_bitboard import PlateauBitboard
+from src.domaine.entites.zobrist import cle_cellule, cle_ligne, cle_piece
+
+
+def cle_recalculee(plateau: Plateau) -> int:
+    """Clé calculée de zéro à partir des positions occupées."""
+    cle = 0
+    for position in plateau.positions_occupees:
+        cle ^= cle_cellule(position.x, position.y)
+    return cle
+
+
+class TestCles(unittest.TestCase):
+    """Tests des fonctions de clés."""
+
+    def test_cle_ligne_est_le_xor_des_cellules(self):
+        """Test : La clé d'une ligne (y négatif compris) est le XOR de ses cellules."""
+        generateur = random.Random(3)
+        for y in (-2, 0, 19):
+            masque = generateur.getrandbits(10)
+            attendue = 0
+            for x in range(10):
+                if (masque >> x) & 1:
+                    attendue ^= cle_cellule(x, y)
+            self.assertEqual(cle_ligne(y, masque), attendue)
+        self.assertEqual(cle_ligne(5, 0), 0)
+
+    def test_cles_distinctes(self):
+        """Test : Cellules et états de pièce ont des clés 64 bits distinctes."""
+        cles = {cle_cellule(x, y) for x in range(10) for y in range(-4, 20)}
+        cles |= {cle_piece(t, o, x, 1) for t in TypePiece for o in range(4) for x in range(10)}
+
+        self.assertEqual(len(cles), 10 * 24 + 7 * 4 * 10)
+        self.assertTrue(all(0 <= cle < 1 << 64 for cle in cles))
+
+
+class TestClePlateau(unittest.TestCase):
+    """Tests de la clé Zobrist incrémentale des plateaux."""
+
+    def test_cle_incrementale_sur_partie_aleatoire(self):
+        """Test : Après chaque placement et suppression, la clé égale la clé recalculée."""
+        generateur = random.Random(7)
+        fabrique = FabriquePieces()
+        plateaux = [Plateau(10, 20), PlateauBitboard(10, 20)]
+        lignes_supprimees = 0
+
+        for _ in range(400):
+            # Beaucoup de O alignés sur les colonnes paires : des lignes se complètent
+            if generateur.random() < 0.7:
+                type_piece, x = TypePiece.O, 2 * generateur.randint(0, 4)
+            else:
+                type_piece, x = generateur.choice(list(TypePiece)), generateur.randint(1, 8)
+            for plateau in plateaux:
+                piece = fabrique.creer(type_piece, x_pivot=x, y_pivot=1)
+                piece.deplacer(0, plateau.distance_de_chute(piece))
+                lignes_supprimees += max(0, plateau.placer_piece_et_supprimer_lignes(piece))
+
+            self.assertEqual(plateaux[0].cle_zobrist, cle_recalculee(plateaux[0]))
+            self.assertEqual(plateaux[1].cle_zobrist, plateaux[0].cle_zobrist)
+
+            if plateaux[0].est_ligne_superieure_occupee():
+                plateaux = [Plateau(10, 20), PlateauBitboard(10, 20)]
+
+        self.assertGreater(lignes_supprimees, 0)
+
+    def test_ligne_supprimee_fait_descendre_les_cles(self):
+        """Test : Après suppression, la clé est celle des cellules descendues."""
+        fabrique = FabriquePieces()
+        for plateau in (Plateau(10, 20), PlateauBitboard(10, 20)):
+            # Deux I couvrent les colonnes 0 à 7 de la ligne 19, le O complète la ligne
+            for x in (2, 6):
+                plateau.placer_piece_et_supprimer_lignes(fabrique.creer(TypePiece.I, x_pivot=x, y_pivot=20))
+            nb_lignes = plateau.placer_piece_et_supprimer_lignes(
+                fabrique.creer(TypePiece.O, x_pivot=8, y_pivot=19))
+
+            self.assertEqual(nb_lignes, 1)
+            self.assertEqual(plateau.cle_zobrist, cle_ligne(19, 0b11 << 8))
+
+    def test_charger_masques_recalcule_la_cle(self):
+        """Test : Un plateau restauré a la clé de l'original."""
+        original = Plateau(10, 20)
+        fabrique = FabriquePieces()
+        original.placer_piece_et_supprimer_lignes(fabrique.creer(TypePiece.T, x_pivot=4, y_pivot=18))
+
+        for copie in (Plateau(10, 20), PlateauBitboard(10, 20)):
+            copie.charger_masques(*original.obtenir_masques())
+            self.assertEqual(copie.cle_zobrist, original.cle_zobrist)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Tournoi Tetris : K parties headless simulées en parallèle.
+
+Chaque partie est un MoteurPartie headless seedé (graine_initiale + i),
+jouée par une politique (voir JOUEURS) jusqu'au game over, ou jusqu'au
+nombre maximal de pièces, dans un processus du ProcessPoolExecutor. Le
+générateur de pièces et le joueur se choisissent par leur nom, ce qui
+permet de comparer deux générateurs ou deux barèmes de score sur les
+mêmes graines ; par défaut, le JoueurAutomatique joue à vitesse maximale
+et son débit est mesuré (placements évalués par seconde, parties par
+minute). Les résultats sont affichés au fil de l'eau, dans l'ordre de
+fin des parties, puis agrégés en un résumé final.
+
+Usage :
+    python tournoi_tetris.py --parties 200 --processus 8
+    python tournoi_tetris.py --parties 50 --graine-initiale 1000 --generateur sac7 --json
+    python tournoi_tetris.py --parties 10 --joueur aleatoire
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.adapters.entree.joueur_automatique import JoueurAutomatique
+from src.domaine.entites.fabriques.generateurs_pieces import GenerateurClassique, GenerateurSac7
+from src.domaine.services.moteur_partie import MoteurPartie
+
+
+# Limite de sécurité : une partie headless dépassant ce nombre de ticks est arrêtée
+TICKS_MAX_DEFAUT = 10_000_000
+
+# Limite de sécurité : une bonne heuristique peut jouer très longtemps
+PIECES_MAX_DEFAUT = 10_000
+
+# Politique de jeu : appelée avant chaque tick, elle agit sur la pièce active
+JoueurHeadless = Callable[[MoteurPartie], None]
+
+
+class JoueurAleatoire:
+    """Politique de référence : rotation et colonne tirées au hasard, puis chute rapide."""
+
+    # Aucun placement évalué : les coups sont tirés au hasard
+    placements_evalues = 0
+
+    def __init__(self, graine: Optional[int] = None):
+        """
+        Initialise le tirage des coups.
+
+        Args:
+            graine: Graine des coups joués (partie reproductible)
+        """
+        self._aleatoire = random.Random(graine)
+
+    def __call__(self, moteur: MoteurPartie) -> None:
+        """Joue et pose la pièce active."""
+        for _ in range(self._aleatoire.randrange(4)):
+            moteur.tourner_piece_active()
+        decalage = self._aleatoire.randint(-5, 5)
+        sens = 1 if decalage > 0 else -1
+        for _ in range(abs(decalage)):
+            if not moteur.deplacer_piece_active(sens, 0):
+                break
+        moteur.chute_rapide()
+        moteur.placer_piece_et_generer_nouvelle()
+
+
+class JoueurHeuristique:
+    """Le JoueurAutomatique en mode instantané : une pièce choisie et posée par appel."""
+
+    def __init__(self, graine: Optional[int] = None):
+        """Initialise le joueur (l'heuristique est déterministe : la graine est ignorée)."""
+        self.joueur = JoueurAutomatique()
+
+    @property
+    def placements_evalues(self) -> int:
+        """Nombre de placements évalués depuis le début de la partie."""
+        return self.joueur.evaluateur.nb_evaluations
+
+    def __call__(self, moteur: MoteurPartie) -> None:
+        """Joue et pose la pièce active."""
+        self.joueur.traiter_evenements(moteur, moteur.ticks * moteur.DUREE_TICK)
+
+
+# Politiques de génération des pièces, par nom
+GENERATEURS = {
+    'classique': GenerateurClassique,
+    'sac7': GenerateurSac7,
+}
+
+# Fabriques des joueurs à partir de la graine de la partie ('gravite' : aucune entrée)
+JOUEURS: Dict[str, Callable[[int], Optional[JoueurHeadless]]] = {
+    'gravite': lambda graine: None,
+    'aleatoire': JoueurAleatoire,
+    'auto': JoueurHeuristique,
+}
+
+
+def jouer_partie_headless(graine: int, ticks_max: int = TICKS_MAX_DEFAUT,
+                          generateur: str = 'classique', joueur: str = 'auto',
+                          pieces_max: int = PIECES_MAX_DEFAUT) -> Dict:
+    """
+    Joue une partie headless complète et retourne ses statistiques.
+
+    Fonction de module (et non méthode) pour pouvoir être envoyée
+    aux processus du pool : générateur et joueur sont donc désignés
+    par leur nom.
+
+    Args:
+        graine: Graine du générateur de pièces et du joueur
+        ticks_max: Nombre maximal de ticks simulés
+        generateur: Nom de la politique de génération (voir GENERATEURS)
+        joueur: Nom de la politique de jeu (voir JOUEURS)
+        pieces_max: Nombre maximal de pièces posées
+
+    Returns:
+        Dictionnaire sérialisable des résultats et du débit de la partie
+    """
+    moteur = MoteurPartie.creer_headless(graine=graine, generateur=GENERATEURS[generateur](graine))
+    politique = JOUEURS[joueur](graine)
+    stats = moteur.stats
+
+    debut = time.perf_counter()
+    if politique is None:
+        moteur.avancer(ticks_max)
+    else:
+        while (not moteur.est_game_over() and moteur.ticks < ticks_max
+               and stats.pieces_placees < pieces_max):
+            politique(moteur)
+            moteur.avancer(1)
+    duree = time.perf_counter() - debut
+    placements = politique.placements_evalues if politique is not None else 0
+
+    return {
+        'graine': graine,
+        'generateur': generateur,
+        'joueur': joueur,
+        'score': stats.score,
+        'lignes': stats.lignes_completees,
+        'pieces': stats.pieces_placees,
+        'niveau': stats.niveau,
+        'ticks': moteur.ticks,
+        'termine': moteur.est_game_over(),
+        'pieces_par_type': {type_piece.value: nombre
+                            for type_piece, nombre in stats.pieces_par_type.items()},
+        'placements_evalues': placements,
+        'duree': duree,
+    }
+
+
+def executer_tournoi(graines: Iterable[int], nb_processus: Optional[int] = None,
+                     ticks_max: int = TICKS_MAX_DEFAUT, generateur: str = 'classique',
+                     joueur: str = 'auto', pieces_max: int = PIECES_MAX_DEFAUT) -> Iterator[Dict]:
+    """
+    Lance les parties dans un pool de processus et les rend au fil de l'eau.
+
+    Args:
+        graines: Graines des parties à jouer (une partie par graine)
+        nb_processus: Nombre de processus (défaut : nombre de cœurs)
+        ticks_max: Nombre maximal de ticks par partie
+        generateur: Nom de la politique de génération (voir GENERATEURS)
+        joueur: Nom de la politique de jeu (voir JOUEURS)
+        pieces_max: Nombre maximal de pièces par partie
+
+    Yields:
+        Résultat de chaque partie, dans l'ordre de fin
+    """
+    with ProcessPoolExecutor(max_workers=nb_processus) as pool:
+        futures = [pool.submit(jouer_partie_headless, graine, ticks_max, generateur, joueur,
+                               pieces_max)
+                   for graine in graines]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def agreger_resultats(resultats: List[Dict]) -> Dict:
+    """
+    Agrège les résultats de plusieurs parties.
+
+    Args:
+        resultats: Résultats retournés par jouer_partie_headless
+
+    Returns:
+        Résumé : nombre de parties, score min/moyen/max, lignes et pièces
+        moyennes, total des pièces par type, placements évalués par seconde
+        et parties par minute (sur la durée de jeu cumulée, par processus)
+    """
+    nb_parties = len(resultats)
+    if nb_parties == 0:
+        return {'parties': 0}
+
+    scores = [r['score'] for r in resultats]
+    duree = sum(r['duree'] for r in resultats)
+    placements = sum(r['placements_evalues'] for r in resultats)
+    pieces_par_type: Dict[str, int] = {}
+    for resultat in resultats:
+        for type_piece, nombre in resultat['pieces_par_type'].items():
+            pieces_par_type[type_piece] = pieces_par_type.get(type_piece, 0) + nombre
+
+    return {
+        'parties': nb_parties,
+        'score_min': min(scores),
+        'score_moyen': sum(scores) / nb_parties,
+        'score_max': max(scores),
+        'lignes_moyennes': sum(r['lignes'] for r in resultats) / nb_parties,
+        'pieces_moyennes': sum(r['pieces'] for r in resultats) / nb_parties,
+        'pieces_par_type': pieces_par_type,
+        'placements_par_seconde': placements / duree if duree else 0.0,
+        'parties_par_minute': 60 * nb_parties / duree if duree else 0.0,
+    }
+
+
+def _formater_resultat(resultat: Dict) -> str:
+    """Ligne lisible pour une partie terminée."""
+    ligne = (f"graine={resultat['graine']:>6}  score={resultat['score']:>8}  "
+             f"lignes={resultat['lignes']:>5}  pieces={resultat['pieces']:>6}")
+    if resultat['placements_evalues'] and resultat['duree']:
+        ligne += f"  placements/s={resultat['placements_evalues'] / resultat['duree']:>9.0f}"
+    return ligne
+
+
+def _formater_resume(resume: Dict) -> str:
+    """Bloc lisible pour le résumé du tournoi."""
+    if resume['parties'] == 0:
+        return "Aucune partie jouée"
+    repartition = "  ".join(f"{t}={n}" for t, n in sorted(resume['pieces_par_type'].items()))
+    return "\n".join([
+        "=" * 50,
+        f"Parties            : {resume['parties']}",
+        f"Score min/moy/max  : {resume['score_min']} / {resume['score_moyen']:.1f} / {resume['score_max']}",
+        f"Lignes moyennes    : {resume['lignes_moyennes']:.2f}",
+        f"Pièces moyennes    : {resume['pieces_moyennes']:.2f}",
+        f"Pièces par type    : {repartition}",
+        f"Placements/s       : {resume['placements_par_seconde']:.0f}",
+        f"Parties/minute     : {resume['parties_par_minute']:.2f}",
+    ])
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande du tournoi."""
+    parser = argparse.ArgumentParser(description="Tournoi de parties Tetris headless en parallèle")
+    parser.add_argument('--parties', type=int, default=100, help="Nombre de parties (K)")
+    parser.add_argument('--graine-initiale', type=int, default=0,
+                        help="Graine de la première partie (les suivantes : +1, +2...)")
+    parser.add_argument('--processus', type=int, default=None,
+                        help="Nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument('--ticks-max', type=int, default=TICKS_MAX_DEFAUT,
+                        help="Nombre maximal de ticks par partie")
+    parser.add_argument('--generateur', choices=sorted(GENERATEURS), default='classique',
+                        help="Politique de génération des pièces")
+    parser.add_argument('--joueur', choices=sorted(JOUEURS), default='auto',
+                        help="Politique de jeu ('auto' : heuristique, 'gravite' : aucune entrée)")
+    parser.add_argument('--pieces-max', type=int, default=PIECES_MAX_DEFAUT,
+                        help="Nombre maximal de pièces par partie")
+    parser.add_argument('--json', action='store_true',
+                        help="Une ligne JSON par partie, puis le résumé en JSON")
+    options = parser.parse_args(arguments)
+
+    graines = range(options.graine_initiale, options.graine_initiale + options.parties)
+    resultats = []
+    for resultat in executer_tournoi(graines, options.processus, options.ticks_max,
+                                     options.generateur, options.joueur, options.pieces_max):
+        resultats.append(resultat)
+        print(json.dumps(resultat) if options.json else _formater_resultat(resultat), flush=True)
+
+    resume = agreger_resultats(resultats)
+    print(json.dumps({'resume': resume}) if options.json else _formater_resume(resume))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())